@@ -103,6 +103,9 @@ class Model(ScalarBlock):
     ): ...
     def preprocess(self, preprocessor=None) -> None: ...
     def load(self, arg, namespaces=[None], profile_memory: int = 0) -> None: ...
+    def _initialize_component(
+        self, modeldata, namespaces, component_name, profile_memory
+    ) -> None: ...
 
 class ConcreteModel(Model):
     def __init__(self, *args, **kwds) -> None: ...
@@ -4,33 +4,73 @@ An open source framework for energy systems optimization modeling
 
 This module provides backward compatibility imports for the refactored TEMOA structure.
 New code should import directly from temoa.core and temoa._internal as appropriate.
+
+The names below are imported on first access, so that importing a submodule (e.g. for the
+command line interface) does not pull in Pyomo, pandas, the solvers and every extension.
 """
 
-# Core API - public interface
-# Internal modules - for backward compatibility
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 # Version information
 from temoa.__about__ import TEMOA_MAJOR, TEMOA_MINOR, __version__
-from temoa._internal.data_brick import DataBrick, data_brick_factory
-from temoa._internal.exchange_tech_cost_ledger import CostType, ExchangeTechCostLedger
-from temoa._internal.run_actions import (
-    build_instance,
-    handle_results,
-    save_lp,
-    solve_instance,
-)
-from temoa._internal.table_data_puller import (
-    loan_costs,
-    poll_capacity_results,
-    poll_cost_results,
-    poll_emissions,
-    poll_flow_results,
-)
-from temoa._internal.table_writer import TableWriter
-from temoa._internal.temoa_sequencer import TemoaSequencer
-from temoa.core.config import TemoaConfig
-from temoa.core.model import TemoaModel
-from temoa.core.modes import TemoaMode
-from temoa.data_io.hybrid_loader import HybridLoader
+
+if TYPE_CHECKING:
+    # Core API - public interface
+    # Internal modules - for backward compatibility
+    from temoa._internal.data_brick import DataBrick, data_brick_factory
+    from temoa._internal.exchange_tech_cost_ledger import CostType, ExchangeTechCostLedger
+    from temoa._internal.run_actions import (
+        build_instance,
+        handle_results,
+        save_lp,
+        solve_instance,
+    )
+    from temoa._internal.table_data_puller import (
+        loan_costs,
+        poll_capacity_results,
+        poll_cost_results,
+        poll_emissions,
+        poll_flow_results,
+    )
+    from temoa._internal.table_writer import TableWriter
+    from temoa._internal.temoa_sequencer import TemoaSequencer
+    from temoa.core.config import TemoaConfig
+    from temoa.core.model import TemoaModel
+    from temoa.core.modes import TemoaMode
+    from temoa.data_io.hybrid_loader import HybridLoader
+
+# name -> module providing it, for the lazily imported names
+_LAZY_IMPORTS = {
+    'TemoaModel': 'temoa.core.model',
+    'TemoaConfig': 'temoa.core.config',
+    'TemoaMode': 'temoa.core.modes',
+    'DataBrick': 'temoa._internal.data_brick',
+    'data_brick_factory': 'temoa._internal.data_brick',
+    'CostType': 'temoa._internal.exchange_tech_cost_ledger',
+    'ExchangeTechCostLedger': 'temoa._internal.exchange_tech_cost_ledger',
+    'HybridLoader': 'temoa.data_io.hybrid_loader',
+    'build_instance': 'temoa._internal.run_actions',
+    'solve_instance': 'temoa._internal.run_actions',
+    'handle_results': 'temoa._internal.run_actions',
+    'save_lp': 'temoa._internal.run_actions',
+    'loan_costs': 'temoa._internal.table_data_puller',
+    'poll_capacity_results': 'temoa._internal.table_data_puller',
+    'poll_emissions': 'temoa._internal.table_data_puller',
+    'poll_flow_results': 'temoa._internal.table_data_puller',
+    'poll_cost_results': 'temoa._internal.table_data_puller',
+    'TableWriter': 'temoa._internal.table_writer',
+    'TemoaSequencer': 'temoa._internal.temoa_sequencer',
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value  # later lookups skip this hook
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 # Maintain backward compatibility for common imports
 __all__ = [
@@ -0,0 +1,188 @@
+"""
+Opt-in profiling of model construction.
+
+While a profiler is active (see `profile_build`), `TemoaModel` reports the construction of each
+of its components (Sets, Params, BuildActions, Vars, Constraints, ...) to it, recording:
+
+    - the wall time to construct the component
+    - the peak and net change in (Python) memory allocated during construction, as traced by
+      `tracemalloc`
+    - the number of indices (or set members) generated
+    - for Constraints, Objectives and Expressions, the number of top-level terms generated
+
+The report is written as a CSV table (sortable in any spreadsheet) and as a table in the log.
+Note that tracing memory slows the build down noticeably, so profiled build times are inflated,
+but their relative sizes are what matter for locating hot spots.
+"""
+
+from __future__ import annotations
+
+import csv
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import getLogger
+from time import perf_counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from pyomo.environ import BuildAction, BuildCheck, Constraint, Expression, Objective, Param
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from pyomo.core.base.indexed_component import IndexedComponent
+
+    from temoa.core.config import TemoaConfig
+
+logger = getLogger(__name__)
+
+_active_profiler: ContextVar[BuildProfiler | None] = ContextVar('_active_profiler', default=None)
+
+REPORT_COLUMNS = ('component', 'type', 'seconds', 'peak_mem_mib', 'net_mem_mib', 'indices', 'terms')
+
+
+class ComponentRecord(NamedTuple):
+    component: str
+    type: str
+    seconds: float
+    peak_mem_mib: float
+    net_mem_mib: float
+    indices: int | None
+    terms: int | None
+
+
+def _count_indices(component: IndexedComponent) -> int | None:
+    """The number of indices (set members, for a Set) generated for a component, if it has any."""
+    if component.ctype in (BuildAction, BuildCheck):
+        return None
+    if isinstance(component, Param):
+        # only the stored values, not the (possibly infinite) default-filled domain
+        return sum(1 for _ in component.sparse_keys())
+    try:
+        return len(component)
+    except OverflowError:  # a non-finite Set
+        return None
+
+
+def _count_terms(component: IndexedComponent) -> int | None:
+    """The number of top-level terms in the expressions of a component, if it has any."""
+    if component.ctype is Constraint:
+        exprs = (c.body for c in component.values())
+    elif component.ctype in (Objective, Expression):
+        exprs = (e.expr for e in component.values())
+    else:
+        return None
+    return sum(getattr(expr, 'nargs', lambda: 1)() for expr in exprs)
+
+
+class BuildProfiler:
+    """Collects a `ComponentRecord` for each component constructed while it is active."""
+
+    def __init__(self) -> None:
+        self.records: list[ComponentRecord] = []
+
+    @contextmanager
+    def measure(self, component: IndexedComponent) -> Generator[None, None, None]:
+        """Measure the construction of a single component."""
+        mem_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        start = perf_counter()
+        yield
+        seconds = perf_counter() - start
+        mem_after, mem_peak = tracemalloc.get_traced_memory()
+
+        self.records.append(
+            ComponentRecord(
+                component=component.name,
+                type=component.ctype.__name__,
+                seconds=seconds,
+                peak_mem_mib=(mem_peak - mem_before) / 2**20,
+                net_mem_mib=(mem_after - mem_before) / 2**20,
+                indices=_count_indices(component),
+                terms=_count_terms(component),
+            )
+        )
+
+    def sorted_records(self) -> list[ComponentRecord]:
+        """The records, slowest first."""
+        return sorted(self.records, key=lambda rec: rec.seconds, reverse=True)
+
+    def write_csv(self, path: Path) -> None:
+        """Write the records (slowest first) to a CSV file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(REPORT_COLUMNS)
+            for rec in self.sorted_records():
+                writer.writerow(
+                    (
+                        rec.component,
+                        rec.type,
+                        f'{rec.seconds:.6f}',
+                        f'{rec.peak_mem_mib:.3f}',
+                        f'{rec.net_mem_mib:.3f}',
+                        '' if rec.indices is None else rec.indices,
+                        '' if rec.terms is None else rec.terms,
+                    )
+                )
+
+    def format_table(self) -> str:
+        """The records (slowest first) as a fixed-width text table."""
+        width = max((len(rec.component) for rec in self.records), default=9)
+        lines = [
+            f'{"component":<{width}}  {"type":<12} {"seconds":>10} {"peak MiB":>10} '
+            f'{"net MiB":>10} {"indices":>10} {"terms":>10}'
+        ]
+        for rec in self.sorted_records():
+            indices = '' if rec.indices is None else rec.indices
+            terms = '' if rec.terms is None else rec.terms
+            lines.append(
+                f'{rec.component:<{width}}  {rec.type:<12} {rec.seconds:>10.3f} '
+                f'{rec.peak_mem_mib:>10.2f} {rec.net_mem_mib:>10.2f} {indices:>10} {terms:>10}'
+            )
+        total = sum(rec.seconds for rec in self.records)
+        lines.append(f'{"TOTAL":<{width}}  {"":<12} {total:>10.3f}')
+        return '\n'.join(lines)
+
+
+def report_path(config: TemoaConfig, label: str | None = None) -> Path | None:
+    """
+    The file for a build profile report in the output folder, or None if profiling is off.
+
+    :param config: the run configuration
+    :param label: distinguishes the reports of runs that build several models
+    """
+    if not config.profile_build:
+        return None
+    suffix = f'_{label}' if label else ''
+    return config.output_path / f'build_profile{suffix}.csv'
+
+
+def active_profiler() -> BuildProfiler | None:
+    """The profiler currently collecting records, if any."""
+    return _active_profiler.get()
+
+
+@contextmanager
+def profile_build(report_path: Path) -> Generator[BuildProfiler, None, None]:
+    """
+    Profile the construction of any model built within this context and write the report.
+
+    :param report_path: the CSV file to write the report to
+    """
+    profiler = BuildProfiler()
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    token = _active_profiler.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _active_profiler.reset(token)
+        if started_tracing:
+            tracemalloc.stop()
+    profiler.write_csv(report_path)
+    logger.info(
+        'Model construction profile (also written to %s):\n%s', report_path, profiler.format_table()
+    )
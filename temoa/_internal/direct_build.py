@@ -0,0 +1,202 @@
+"""
+The direct assembly of the core constraint families and the cost objective for HiGHS.
+
+The capacity, commodity balance and demand constraints and the cost objective are the bulk of a
+Temoa model.  Under ``direct_build`` the instance declares them without expressions (see
+TemoaModel), and their rows and costs are assembled here instead: the index sets of the instance
+are walked and the (variable, coefficient) terms of each row are taken from the same term
+functions the Pyomo rules sum (e.g. `commodity_balance_terms`), straight into COO arrays.  Pyomo
+neither builds nor compiles their expression trees, which removes most of the build time and the
+peak memory of those families.  The rest of the model is compiled as usual and the two parts are
+passed to HiGHS together (see highs_direct).
+
+The rows are signed as Pyomo normalizes the relational expressions of the rules, so the duals
+match those of a regular build.
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+from pyomo.core.base.component_namer import index_repr
+from pyomo.environ import value
+
+from temoa.components.capacity import capacity_constraint_terms
+from temoa.components.commodities import (
+    commodity_balance_constraint_error_check,
+    commodity_balance_terms,
+    demand_constraint_error_check,
+    demand_terms,
+)
+from temoa.components.costs import period_cost_terms
+from temoa.components.utils import negated
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from pyomo.core.base.var import VarData
+
+    from temoa.core.model import TemoaModel
+    from temoa.types import LinearTerms
+
+logger = getLogger(__name__)
+
+_INF = float('inf')
+
+
+class DirectRow(NamedTuple):
+    """The label of an assembled row, which stands in for its (undeclared) ConstraintData."""
+
+    component: str
+    key: tuple[object, ...]
+
+    @property
+    def name(self) -> str:
+        """The name the ConstraintData of the row would have, as used for the duals"""
+        return self.component + index_repr(self.key)
+
+
+class DirectAssembly(NamedTuple):
+    """The assembled rows (in COO form) and objective of a direct build."""
+
+    rows: list[DirectRow]
+    row_lower: np.ndarray
+    row_upper: np.ndarray
+    a_row: np.ndarray
+    a_col: np.ndarray
+    a_value: np.ndarray
+    cost_col: np.ndarray
+    cost_value: np.ndarray
+    offset: float
+
+
+# a row: its terms and bounds, or None for an index without a row
+_Row = tuple['LinearTerms', float, float] | None
+
+
+def _capacity_row(model: TemoaModel, index: tuple[Any, ...]) -> _Row:
+    r, p, s, d, t, v = index
+    capacity, activity = capacity_constraint_terms(model, r, p, s, d, t, v)
+    if t in model.tech_curtailment:
+        # capacity == activity + curtailment
+        return capacity + negated(activity), 0.0, 0.0
+    # capacity >= activity
+    return activity + negated(capacity), -_INF, 0.0
+
+
+def _demand_row(model: TemoaModel, index: tuple[Any, ...]) -> _Row:
+    r, p, dem = index
+    if (r, p, dem) in model.singleton_demands:
+        return None
+    terms = demand_terms(model, r, p, dem)
+    if not terms:
+        demand_constraint_error_check(0, r, p, dem)
+    demand = value(model.demand[r, p, dem])
+    return terms, demand, demand
+
+
+def _commodity_balance_row(model: TemoaModel, index: tuple[Any, ...]) -> _Row:
+    r, p, s, d, c = index
+    produced, consumed = commodity_balance_terms(model, r, p, s, d, c)
+    if not produced and not consumed:
+        commodity_balance_constraint_error_check(0, 0, r, p, s, d, c)
+    if c in model.commodity_waste:
+        # produced >= consumed
+        return consumed + negated(produced), -_INF, 0.0
+    return produced + negated(consumed), 0.0, 0.0
+
+
+# the rows of each family in DIRECT_FAMILIES (see temoa.core.model)
+_ROW_BUILDERS: dict[str, Callable[[TemoaModel, tuple[Any, ...]], _Row]] = {
+    'capacity_constraint': _capacity_row,
+    'demand_constraint': _demand_row,
+    'commodity_balance_constraint': _commodity_balance_row,
+}
+
+
+def _collect(
+    terms: LinearTerms,
+    columns: list[VarData],
+    column_index: dict[int, int],
+    cols: list[int],
+    coefs: list[float],
+) -> float:
+    """
+    Append the columns and coefficients of the free variables of the terms, mapping variables
+    without a column to new ones.  As in the Pyomo compiler, fixed variables are folded into the
+    returned constant and zero terms are dropped.
+    """
+    constant = 0.0
+    for var, coef in terms:
+        if not coef:
+            continue
+        if var.fixed:
+            constant += coef * var.value
+            continue
+        col = column_index.get(id(var))
+        if col is None:
+            col = column_index[id(var)] = len(columns)
+            columns.append(var)
+        cols.append(col)
+        coefs.append(coef)
+    return constant
+
+
+def assemble(
+    instance: TemoaModel, columns: list[VarData], column_index: dict[int, int]
+) -> DirectAssembly:
+    """
+    Assemble the rows of the core families and the cost objective of a direct build.
+
+    :param instance: a built Temoa instance declared with direct_build
+    :param columns: the variables of the columns so far, extended with those of new columns
+    :param column_index: the column of each variable (by id), extended likewise
+    :return: the rows and the objective
+    """
+    rows: list[DirectRow] = []
+    lower: list[float] = []
+    upper: list[float] = []
+    row_starts = [0]
+    cols: list[int] = []
+    coefs: list[float] = []
+    for name, row_builder in _ROW_BUILDERS.items():
+        indices: Iterable[tuple[Any, ...]] = instance.component(name).index_set()
+        for index in indices:
+            row = row_builder(instance, index)
+            if row is None:
+                continue
+            terms, row_lower, row_upper = row
+            constant = _collect(terms, columns, column_index, cols, coefs)
+            rows.append(DirectRow(name, index))
+            lower.append(row_lower - constant)
+            upper.append(row_upper - constant)
+            row_starts.append(len(cols))
+
+    cost_cols: list[int] = []
+    cost_coefs: list[float] = []
+    offset = 0.0
+    for p in instance.time_optimize:
+        offset += _collect(
+            period_cost_terms(instance, p), columns, column_index, cost_cols, cost_coefs
+        )
+
+    a_row = np.repeat(np.arange(len(rows), dtype=np.int32), np.diff(row_starts))
+    logger.info(
+        'Assembled %d rows (%d non-zeros) and %d cost terms directly',
+        len(rows),
+        len(cols),
+        len(cost_cols),
+    )
+    return DirectAssembly(
+        rows=rows,
+        row_lower=np.asarray(lower, dtype=float),
+        row_upper=np.asarray(upper, dtype=float),
+        a_row=a_row,
+        a_col=np.asarray(cols, dtype=np.int32),
+        a_value=np.asarray(coefs, dtype=float),
+        cost_col=np.asarray(cost_cols, dtype=np.int32),
+        cost_value=np.asarray(cost_coefs, dtype=float),
+        offset=offset,
+    )
@@ -0,0 +1,330 @@
+"""
+A direct hand-off of a built Temoa instance to HiGHS (via highspy).
+
+The instance is compiled to sparse (CSC) matrix form by Pyomo's linear standard form compiler and
+the arrays are passed to HiGHS in a single call.  This skips the per-constraint solver interface
+(and its copy of the model) that the 'appsi_highs' path maintains, which cuts both the hand-off
+time and the peak memory on large models.
+
+The solution is loaded back into the Pyomo variables (and, if requested, the duals are placed in
+a results object), so the post-processing in `table_data_puller` and `TableWriter` work unchanged.
+
+Select it with ``solver_name = "highs_direct"`` in the config file.  For sequential solves of one
+instance (e.g. SVMGA), `HighsDirectSolver` keeps the HiGHS model and only passes the changes.
+
+An instance declared with ``direct_build`` has no expressions for its core families and
+objective.  Their rows and costs are assembled by `direct_build.assemble` and stacked onto the
+compiled arrays, so they never pass through the compiler.
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, cast
+
+import highspy
+import numpy as np
+from pyomo.environ import value
+from pyomo.opt import Solution, SolverResults, SolverStatus, TerminationCondition
+from pyomo.repn import generate_standard_repn
+from pyomo.repn.plugins.standard_form import LinearStandardFormCompiler
+from scipy.sparse import coo_array  # type: ignore[import-untyped]
+
+from temoa._internal.direct_build import DirectAssembly, DirectRow, assemble
+
+if TYPE_CHECKING:
+    from pyomo.core import Constraint
+    from pyomo.core.base.constraint import ConstraintData
+    from pyomo.core.base.objective import ObjectiveData
+    from pyomo.core.base.var import VarData
+    from pyomo.repn.plugins.standard_form import LinearStandardFormInfo
+
+    from temoa.core.model import TemoaModel
+
+logger = getLogger(__name__)
+
+HIGHS_DIRECT = 'highs_direct'
+"""The solver name that selects the direct HiGHS hand-off."""
+
+# map of HiGHS model status -> pyomo termination condition
+_TERMINATION = {
+    highspy.HighsModelStatus.kOptimal: TerminationCondition.optimal,
+    highspy.HighsModelStatus.kInfeasible: TerminationCondition.infeasible,
+    highspy.HighsModelStatus.kUnbounded: TerminationCondition.unbounded,
+    highspy.HighsModelStatus.kUnboundedOrInfeasible: TerminationCondition.infeasibleOrUnbounded,
+    highspy.HighsModelStatus.kTimeLimit: TerminationCondition.maxTimeLimit,
+    highspy.HighsModelStatus.kIterationLimit: TerminationCondition.maxIterations,
+}
+
+
+def compile_instance(instance: TemoaModel) -> LinearStandardFormInfo:
+    """
+    Compile the instance to sparse matrix form.  Ranged constraints produce two rows (one per
+    bound), equalities one row.
+
+    :param instance: a built Temoa instance
+    :return: the compiled standard form
+    """
+    return LinearStandardFormCompiler().write(instance, mixed_form=True, set_sense=None)
+
+
+def make_highs_lp(
+    info: LinearStandardFormInfo,
+    columns: list[VarData] | None = None,
+    direct: DirectAssembly | None = None,
+) -> highspy.HighsLp:
+    """
+    Build a HiGHS LP from the compiled standard form.
+
+    :param info: the compiled standard form of the instance
+    :param columns: all columns, if the directly assembled rows added columns to those compiled
+    :param direct: the directly assembled rows and costs, placed after the compiled rows
+    :return: the LP, ready to pass to HiGHS
+    """
+    if len(info.objectives) != 1:
+        raise ValueError(f'Expected a single active objective, found {len(info.objectives)}')
+    inf = highspy.kHighsInf
+    if columns is None:
+        columns = info.columns
+    num_col = len(columns)
+    num_compiled_col = len(info.columns)
+    num_compiled_row = len(info.rows)
+
+    lp = highspy.HighsLp()
+    lp.num_col_ = num_col
+    lp.sense_ = (
+        highspy.ObjSense.kMinimize
+        if info.objectives[0].is_minimizing()
+        else highspy.ObjSense.kMaximize
+    )
+    cost = np.zeros(num_col)
+    cost[:num_compiled_col] = info.c[[0], :].toarray().ravel()
+    lp.offset_ = float(info.c_offset[0])
+    lp.col_lower_ = np.array([-inf if v.lb is None else v.lb for v in columns], dtype=float)
+    lp.col_upper_ = np.array([inf if v.ub is None else v.ub for v in columns], dtype=float)
+    if any(not v.is_continuous() for v in columns):
+        lp.integrality_ = [
+            highspy.HighsVarType.kContinuous if v.is_continuous() else highspy.HighsVarType.kInteger
+            for v in columns
+        ]
+
+    # bound_type: 0 -> equality, 1 -> upper bound, -1 -> lower bound
+    rhs = np.asarray(info.rhs, dtype=float)
+    bound_types = np.fromiter(
+        (row.bound_type for row in info.rows), dtype=np.int8, count=num_compiled_row
+    )
+    row_lower = np.where(bound_types == 1, -inf, rhs)
+    row_upper = np.where(bound_types == -1, inf, rhs)
+
+    if direct is None:
+        a = info.A.tocsc()
+    else:
+        np.add.at(cost, direct.cost_col, direct.cost_value)
+        lp.offset_ += direct.offset
+        row_lower = np.concatenate((row_lower, direct.row_lower))
+        row_upper = np.concatenate((row_upper, direct.row_upper))
+        compiled = info.A.tocoo()
+        # duplicate entries (a variable in several terms of a row) are summed by the conversion
+        a = coo_array(
+            (
+                np.concatenate((compiled.data, direct.a_value)),
+                (
+                    np.concatenate((compiled.row, direct.a_row + num_compiled_row)),
+                    np.concatenate((compiled.col, direct.a_col)),
+                ),
+            ),
+            shape=(len(row_lower), num_col),
+        ).tocsc()
+    lp.col_cost_ = cost
+    lp.num_row_ = len(row_lower)
+    lp.row_lower_ = row_lower
+    lp.row_upper_ = row_upper
+
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+    lp.a_matrix_.num_col_ = num_col
+    lp.a_matrix_.num_row_ = len(row_lower)
+    lp.a_matrix_.start_ = a.indptr
+    lp.a_matrix_.index_ = a.indices
+    lp.a_matrix_.value_ = a.data
+    return lp
+
+
+class HighsDirectSolver:
+    """
+    The HiGHS model of an instance, kept across solves.
+
+    Constraints added to the instance and a new objective are compiled and passed to HiGHS as
+    changes to its model, so a re-solve does not re-compile the instance and HiGHS starts from
+    the basis of the previous solve.
+    """
+
+    def __init__(
+        self,
+        instance: TemoaModel,
+        silent: bool = False,
+        options: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        :param instance: a built Temoa instance
+        :param silent: suppress the solver log on the console
+        :param options: HiGHS options (by their HiGHS names) to set on the model
+        """
+        info = compile_instance(instance)
+        logger.info(
+            'Compiled instance for HiGHS: %d columns, %d rows, %d non-zeros',
+            len(info.columns),
+            len(info.rows),
+            info.A.nnz,
+        )
+        # the matrices will live in HiGHS, only the maps of the columns and rows are kept
+        self.columns: list[VarData] = list(info.columns)
+        self.row_constraints: list[ConstraintData | DirectRow] = [
+            row.constraint for row in info.rows
+        ]
+        self._column_index = {id(var): n for n, var in enumerate(self.columns)}
+        # the objective of a direct build, which is set to the optimal cost after a solve
+        self._direct_objective: ObjectiveData | None = None
+        direct = None
+        if instance.direct_build:
+            direct = assemble(instance, self.columns, self._column_index)
+            self.row_constraints.extend(direct.rows)
+            self._direct_objective = cast('ObjectiveData', instance.total_cost)
+        self.highs = highspy.Highs()
+        self.highs.setOptionValue('output_flag', not silent)
+        self.set_options(options or {})
+        self.highs.passModel(make_highs_lp(info, self.columns, direct))
+
+    def set_options(self, options: dict[str, Any]) -> None:
+        """
+        Set options of the HiGHS model.  They hold for this and the later solves.
+
+        :param options: the options, by their HiGHS names
+        :raises ValueError: if HiGHS rejects an option (unknown name or bad value)
+        """
+        for name, option_value in options.items():
+            if self.highs.setOptionValue(name, option_value) != highspy.HighsStatus.kOk:
+                logger.error('HiGHS rejected the solver option %s = %r', name, option_value)
+                raise ValueError(f'HiGHS rejected the solver option {name} = {option_value!r}')
+
+    def _column(self, var: VarData) -> int:
+        """The column of a variable, added to the HiGHS model if it is not in it yet"""
+        col = self._column_index.get(id(var))
+        if col is None:
+            inf = highspy.kHighsInf
+            self.highs.addVar(-inf if var.lb is None else var.lb, inf if var.ub is None else var.ub)
+            col = len(self.columns)
+            self.columns.append(var)
+            self._column_index[id(var)] = col
+        return col
+
+    def _linear_terms(self, expr: object) -> tuple[float, np.ndarray, np.ndarray]:
+        """The constant, and the columns and coefficients of the variables, of an expression"""
+        repn = generate_standard_repn(expr, quadratic=False)
+        if not repn.is_linear():
+            raise ValueError('Only linear expressions can be passed to HiGHS')
+        cols = np.fromiter((self._column(v) for v in repn.linear_vars), dtype=np.int32)
+        coefs = np.asarray(repn.linear_coefs, dtype=float)
+        return float(value(repn.constant)), cols, coefs
+
+    def add_constraint(self, constraint: Constraint) -> None:
+        """
+        Add the rows of a constraint (added to the instance since the compile) to HiGHS.
+
+        :param constraint: the new constraint component
+        """
+        inf = highspy.kHighsInf
+        for con in constraint.values():
+            if not con.active:
+                continue
+            constant, cols, coefs = self._linear_terms(con.body)
+            lower = -inf if con.lb is None else con.lb - constant
+            upper = inf if con.ub is None else con.ub - constant
+            self.highs.addRow(lower, upper, len(cols), cols, coefs)
+            self.row_constraints.append(con)
+
+    def set_objective(self, objective: ObjectiveData) -> None:
+        """
+        Replace the objective of the HiGHS model.
+
+        :param objective: the new (active) objective of the instance
+        """
+        self._direct_objective = None
+        constant, cols, coefs = self._linear_terms(objective.expr)
+        costs = np.zeros(len(self.columns))
+        np.add.at(costs, cols, coefs)
+        self.highs.changeColsCost(
+            len(costs), np.arange(len(costs), dtype=np.int32), costs.astype(float)
+        )
+        self.highs.changeObjectiveSense(
+            highspy.ObjSense.kMinimize if objective.is_minimizing() else highspy.ObjSense.kMaximize
+        )
+        self.highs.changeObjectiveOffset(constant)
+
+    def solve(self, load_duals: bool = False, warm_start: bool = False) -> SolverResults:
+        """
+        Solve and load the solution into the variables of the instance.
+
+        :param load_duals: place the constraint duals in the returned results (as the suffix
+        handling of the other solvers does)
+        :param warm_start: pass the current values of the variables to HiGHS as a starting point
+        :return: a results object with the solver status and (optionally) the duals
+        """
+        if warm_start and any(var.value is not None for var in self.columns):
+            start = highspy.HighsSolution()
+            start.col_value = [var.value or 0.0 for var in self.columns]
+            start.value_valid = True
+            self.highs.setSolution(start)
+        self.highs.run()
+
+        model_status = self.highs.getModelStatus()
+        results = SolverResults()
+        results.solver.name = HIGHS_DIRECT
+        results.solver.termination_condition = _TERMINATION.get(
+            model_status, TerminationCondition.unknown
+        )
+        results.solver.message = self.highs.modelStatusToString(model_status)
+        if model_status != highspy.HighsModelStatus.kOptimal:
+            results.solver.status = SolverStatus.warning
+            return results
+        results.solver.status = SolverStatus.ok
+        objective_value = self.highs.getInfo().objective_function_value
+        results.problem.lower_bound = objective_value
+        results.problem.upper_bound = objective_value
+
+        solution = self.highs.getSolution()
+        for var, col_value in zip(self.columns, solution.col_value, strict=True):
+            var.set_value(col_value, skip_validation=True)
+        if self._direct_objective is not None:
+            # the objective has no expression to evaluate, so it reports the optimal cost
+            self._direct_objective.expr = objective_value
+
+        if load_duals:
+            soln = Solution()
+            # a ranged constraint is split over two rows, at most one of which is binding
+            duals: dict[str, float] = {}
+            for con, dual in zip(self.row_constraints, solution.row_dual, strict=True):
+                name = con.name
+                duals[name] = duals.get(name, 0.0) + dual
+            for name, dual in duals.items():
+                soln.constraint[name] = {'Dual': dual}
+            results.solution.insert(soln)
+        return results
+
+
+def solve_highs_direct(
+    instance: TemoaModel,
+    silent: bool = False,
+    load_duals: bool = False,
+    options: dict[str, Any] | None = None,
+) -> SolverResults:
+    """
+    Solve the instance with HiGHS and load the solution into its variables.
+
+    :param instance: a built Temoa instance
+    :param silent: suppress the solver log on the console
+    :param load_duals: place the constraint duals in the returned results (as the suffix
+    handling of the other solvers does)
+    :param options: HiGHS options (by their HiGHS names) to set on the model
+    :return: a results object with the solver status and (optionally) the duals
+    """
+    return HighsDirectSolver(instance, silent=silent, options=options).solve(load_duals=load_duals)
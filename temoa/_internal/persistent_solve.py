@@ -0,0 +1,177 @@
+"""
+A solver kept across the solves of one instance, for the sequencers (SVMGA, MGA) that modify a
+solved instance (adding a constraint, swapping the objective) and solve it again.
+
+`run_actions.solve_instance` makes a new solver object and sends it the whole model on each call.
+Here the solver keeps its copy of the model, so a re-solve only sends the changes and the solver
+starts from the basis of its previous solve.  With `warm_start`, the current values of the
+variables (i.e. the previous solution) are also passed to the solver as a starting point.
+
+    - appsi_highs:  the appsi interface is persistent, and detects the changes itself
+    - highs_direct:  the new rows and objective are compiled and passed to the HiGHS model
+    - gurobi, cplex, xpress:  through their pyomo persistent interfaces ('<name>_persistent')
+
+Other solvers fall back to a fresh solve each time.
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import TYPE_CHECKING, Any
+
+from pyomo.environ import SolverFactory, check_optimal_termination
+
+from temoa._internal.highs_direct import HIGHS_DIRECT, HighsDirectSolver
+from temoa._internal.run_actions import (
+    configure_solver,
+    screen_suffixes,
+    solve_instance,
+    task_timer,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyomo.core import Constraint, Objective
+    from pyomo.opt import SolverResults
+
+    from temoa.core.model import TemoaModel
+
+logger = getLogger(__name__)
+
+PERSISTENT_INTERFACES = {
+    'gurobi': 'gurobi_persistent',
+    'cplex': 'cplex_persistent',
+    'xpress': 'xpress_persistent',
+}
+"""solvers with a pyomo persistent interface that needs to be told of the changes"""
+
+
+class PersistentSolve:
+    """
+    Solves an instance repeatedly with one solver object.  Changes made to the instance between
+    the solves must be reported with `add_constraint` and `set_objective`.
+    """
+
+    def __init__(
+        self,
+        instance: TemoaModel,
+        solver_name: str,
+        silent: bool = False,
+        solver_suffixes: Iterable[str] | None = None,
+        warm_start: bool = False,
+        solver_options: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        :param instance: the instance to solve
+        :param solver_name: the name of the solver (as in the config)
+        :param silent: Run silently
+        :param solver_suffixes: iterable of string names for suffixes (see `solve_instance`)
+        :param warm_start: pass the values of the variables to the solver as a starting point
+        :param solver_options: options to pass to the solver on each solve (may be updated
+        between solves)
+        """
+        self.instance = instance
+        self.solver_name = solver_name
+        self.silent = silent
+        self.solver_suffixes = screen_suffixes(solver_suffixes)
+        self.warm_start = warm_start
+        self.solver_options: dict[str, Any] = dict(solver_options or {})
+
+        self._highs: HighsDirectSolver | None = None
+        self._optimizer: Any = None
+        self._loaded = False  # the instance has been passed to the solver
+        if solver_name == HIGHS_DIRECT:
+            return
+        if solver_name == 'appsi_highs' or solver_name in PERSISTENT_INTERFACES:
+            self._optimizer = SolverFactory(PERSISTENT_INTERFACES.get(solver_name, solver_name))
+            configure_solver(self._optimizer, solver_name)
+        else:
+            logger.info(
+                'Solver %s has no persistent interface.  Each solve will re-send the model.',
+                solver_name,
+            )
+
+    @property
+    def persistent(self) -> bool:
+        return self.solver_name == HIGHS_DIRECT or self._optimizer is not None
+
+    def add_constraint(self, constraint: Constraint) -> None:
+        """
+        Report a constraint added to the instance since the last solve.
+
+        :param constraint: the new constraint component
+        """
+        if not self._loaded:
+            return  # it will be part of the model when it is loaded
+        if self._highs is not None:
+            self._highs.add_constraint(constraint)
+        elif self.solver_name in PERSISTENT_INTERFACES:
+            for con in constraint.values():
+                self._optimizer.add_constraint(con)
+        # appsi detects new constraints itself
+
+    def set_objective(self, objective: Objective) -> None:
+        """
+        Report the new (active) objective of the instance.  The previous objective must have been
+        deleted or deactivated.
+
+        :param objective: the new (scalar) objective
+        """
+        if not self._loaded:
+            return
+        if self._highs is not None:
+            for objective_data in objective.values():
+                self._highs.set_objective(objective_data)
+        elif self.solver_name in PERSISTENT_INTERFACES:
+            self._optimizer.set_objective(objective)
+        # appsi detects a new objective itself
+
+    def solve(self) -> SolverResults:
+        """
+        Solve the instance (as modified since the last solve) and load the solution into it.
+
+        :return: the results of the solve
+        """
+        if not self.persistent:
+            _, fresh_result = solve_instance(
+                self.instance,
+                self.solver_name,
+                self.silent,
+                self.solver_suffixes,
+                options=self.solver_options,
+            )
+            return fresh_result
+
+        with task_timer(f'Solving model {self.instance.name}', silent=self.silent):
+            if self.solver_name == HIGHS_DIRECT:
+                if self._highs is None:
+                    self._highs = HighsDirectSolver(
+                        self.instance, silent=self.silent, options=self.solver_options
+                    )
+                else:
+                    self._highs.set_options(self.solver_options)
+                self._loaded = True
+                result = self._highs.solve(
+                    load_duals='dual' in self.solver_suffixes, warm_start=self.warm_start
+                )
+                logger.debug('Solver results: \n %s', result.solver)
+                return result
+
+            self._optimizer.options.update(self.solver_options)
+            if self.solver_name == 'appsi_highs':
+                # the appsi interface does not take suffixes (see solve_instance)
+                result = self._optimizer.solve(self.instance, warmstart=self.warm_start)
+            else:
+                if not self._loaded:
+                    self._optimizer.set_instance(self.instance)
+                result = self._optimizer.solve(
+                    suffixes=self.solver_suffixes, warmstart=self.warm_start
+                )
+            self._loaded = True
+
+        if check_optimal_termination(result) and self.solver_suffixes:
+            # Needed to capture the duals/suffixes from the Solutions obj
+            self.instance.solutions.store_to(result)
+        logger.debug('Solver results: \n %s', result.solver)
+        return result
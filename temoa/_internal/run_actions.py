@@ -9,6 +9,7 @@ from logging import getLogger
 from pathlib import Path
 from sys import version_info
 from time import perf_counter
+from typing import Any
 
 from pyomo.environ import (
     Constraint,
@@ -22,10 +23,12 @@ from pyomo.environ import (
 )
 from pyomo.opt import SolverResults
 
+from temoa._internal.build_profiler import profile_build
+from temoa._internal.highs_direct import HIGHS_DIRECT, solve_highs_direct
 from temoa._internal.table_writer import TableWriter
 from temoa.core.config import TemoaConfig
-from temoa.core.model import TemoaModel
-from temoa.data_processing.db_to_excel import make_excel
+from temoa.core.model import TemoaModel, abstract_model
+from temoa.core.modes import TemoaMode
 
 logger = getLogger(__name__)
 
@@ -124,9 +127,18 @@ def build_instance(
     silent: bool = False,
     keep_lp_file: bool = False,
     lp_path: Path | None = None,
+    profile_path: Path | None = None,
+    validate_elements: bool = True,
+    direct_build: bool = False,
 ) -> TemoaModel:
     """
     Build a Temoa Instance from data
+    :param direct_build: True to leave the core constraint families and the objective to the
+    direct assembly of the HiGHS hand-off (see direct_build), which must then solve the instance
+    :param validate_elements: False to skip the element validators of the model components, if
+    the data was validated in bulk by the loader
+    :param profile_path: if provided, profile the construction of each model component and write
+    the report to this (CSV) file and the log
     :param lp_path: the path to save the LP file to
     :param keep_lp_file: True to keep the LP file
     :param loaded_portal: a DataPortal instance
@@ -134,18 +146,29 @@ def build_instance(
     :param model_name: Optional name for this instance
     :return: a built TemoaModel
     """
-    model = TemoaModel()
-
-    model.dual = Suffix(direction=Suffix.IMPORT)
-    # self.model.rc = Suffix(direction=Suffix.IMPORT)
-    # self.model.slack = Suffix(direction=Suffix.IMPORT)
+    # the shared declaration is not touched:  create_instance() builds on a copy of it
+    model = abstract_model(validate_elements, direct_build)
 
     with task_timer('Creating model instance', silent=silent):
-        instance = model.create_instance(loaded_portal, name=model_name)
+        if profile_path is None:
+            instance = model.create_instance(loaded_portal, name=model_name)
+        else:
+            with profile_build(profile_path):
+                instance = model.create_instance(loaded_portal, name=model_name)
+
+    instance.dual = Suffix(direction=Suffix.IMPORT)
+    # instance.rc = Suffix(direction=Suffix.IMPORT)
+    # instance.slack = Suffix(direction=Suffix.IMPORT)
 
     # save LP if requested
     if keep_lp_file and lp_path is not None:
-        save_lp(instance, lp_path)
+        if direct_build:
+            logger.warning(
+                'The LP file is not saved for a direct build, which has no Pyomo expressions for '
+                'its core constraints and objective'
+            )
+        else:
+            save_lp(instance, lp_path)
 
     # gather some stats...
     c_count = sum(len(c) for c in instance.component_objects(ctype=Constraint))
@@ -168,16 +191,67 @@ def save_lp(instance: TemoaModel, lp_path: Path) -> None:
         instance.write(str(filename), format='lp', io_options={'symbolic_solver_labels': True})
 
 
+def configure_solver(optimizer: Any, solver_name: str) -> None:
+    """
+    Set the Temoa default options of a solver
+    :param optimizer: the solver object
+    :param solver_name: the name of the solver (persistent variants share the options)
+    """
+    if solver_name == 'cbc':
+        pass
+
+    elif solver_name == 'cplex':
+        # Note: these parameter values match mip-dev / PyPSA
+        # (see: https://pypsa-eur.readthedocs.io/en/latest/configuration.html)
+        optimizer.options['lpmethod'] = 4  # barrier
+        optimizer.options['solutiontype'] = 2  # non basic solution, ie no crossover
+        optimizer.options['barrier convergetol'] = 1.0e-3
+        optimizer.options['feasopt tolerance'] = 1.0e-4
+
+    elif solver_name == 'gurobi':
+        # Note: these parameter values match mip-dev / PyPSA (see: https://pypsa-eur.readthedocs.io/en/latest/configuration.html)
+        optimizer.options['Method'] = 2  # barrier
+        optimizer.options['Crossover'] = 0  # non basic solution, ie no crossover
+        optimizer.options['BarConvTol'] = 1.0e-3
+        optimizer.options['FeasibilityTol'] = 1.0e-4
+        optimizer.options['BarOrder'] = -1  # auto ordering; 2-4x faster than AMD on large models
+
+    elif solver_name == 'appsi_highs':
+        pass
+
+
+def screen_suffixes(solver_suffixes: Iterable[str] | None) -> list[str]:
+    """
+    Screen the requested suffixes against the pyomo standards
+    :param solver_suffixes: iterable of string names for suffixes
+    :return: the legitimate suffixes
+    """
+    if not solver_suffixes:
+        return []
+    solver_suffixes_set = set(solver_suffixes)
+    legit_suffixes = {'dual', 'slack', 'rc'}
+    bad_apples = solver_suffixes_set - legit_suffixes
+    solver_suffixes_set &= legit_suffixes
+    if bad_apples:
+        logger.warning(
+            'Solver suffix %s is not in pyomo standards (see pyomo dox).  Removed',
+            bad_apples,
+        )
+    return list(solver_suffixes_set)
+
+
 def solve_instance(
     instance: TemoaModel,
     solver_name: str,
     silent: bool = False,
     solver_suffixes: Iterable[str] | None = None,
+    options: dict[str, Any] | None = None,
 ) -> tuple[TemoaModel, SolverResults]:
     """
     Solve the instance and return a loaded instance
     :param solver_suffixes: iterable of string names for suffixes.  See pyomo dox.  right now, only
     'duals' is supported in the Temoa Framework.  Some solvers may not support duals.
+    :param options: solver options, set over the defaults of `configure_solver`
     :param silent: Run silently
     :param solver_name: The name of the solver to request from the SolverFactory
     :param instance: the instance to solve
@@ -189,6 +263,19 @@ def solve_instance(
         logger.error('No solver specified in solve sequence')
         raise TypeError('Error occurred during solve, see log')
 
+    if solver_name == HIGHS_DIRECT:
+        with task_timer(f'Solving model {instance.name}', silent=silent):
+            direct_result = solve_highs_direct(
+                instance,
+                silent=silent,
+                load_duals='dual' in set(solver_suffixes or ()),
+                options=options,
+            )
+        logger.debug('Solver results: \n %s', direct_result.solver)
+        return instance, direct_result
+    if instance.direct_build:
+        raise ValueError(f'A direct build can only be solved with {HIGHS_DIRECT}')
+
     optimizer = SolverFactory(solver_name)
     if isinstance(optimizer, UnknownSolver):
         logger.error(
@@ -201,42 +288,10 @@ def solve_instance(
     if solver_name == 'neos':
         raise NotImplementedError('Neos based solve is not currently supported')
 
-    # Solver Configuration
-    if solver_name == 'cbc':
-        pass
-
-    elif solver_name == 'cplex':
-        # Note: these parameter values match mip-dev / PyPSA
-        # (see: https://pypsa-eur.readthedocs.io/en/latest/configuration.html)
-        optimizer.options['lpmethod'] = 4  # barrier
-        optimizer.options['solutiontype'] = 2  # non basic solution, ie no crossover
-        optimizer.options['barrier convergetol'] = 1.0e-3
-        optimizer.options['feasopt tolerance'] = 1.0e-4
-
-    elif solver_name == 'gurobi':
-        # Note: these parameter values match mip-dev / PyPSA (see: https://pypsa-eur.readthedocs.io/en/latest/configuration.html)
-        optimizer.options['Method'] = 2  # barrier
-        optimizer.options['Crossover'] = 0  # non basic solution, ie no crossover
-        optimizer.options['BarConvTol'] = 1.0e-3
-        optimizer.options['FeasibilityTol'] = 1.0e-4
-        optimizer.options['BarOrder'] = -1  # auto ordering; 2-4x faster than AMD on large models
-
-    elif solver_name == 'appsi_highs':
-        pass
-
-    # Suffix Handling
-    solver_suffixes_list: list[str] = []
-    if solver_suffixes:
-        solver_suffixes_set = set(solver_suffixes)
-        legit_suffixes = {'dual', 'slack', 'rc'}
-        bad_apples = solver_suffixes_set - legit_suffixes
-        solver_suffixes_set &= legit_suffixes
-        if bad_apples:
-            logger.warning(
-                'Solver suffix %s is not in pyomo standards (see pyomo dox).  Removed',
-                bad_apples,
-            )
-        solver_suffixes_list = list(solver_suffixes_set)
+    configure_solver(optimizer, solver_name)
+    if options:
+        optimizer.options.update(options)
+    solver_suffixes_list = screen_suffixes(solver_suffixes)
 
     result: SolverResults | None = None
 
@@ -344,6 +399,9 @@ def handle_results(
                 save_storage_levels=config.save_storage_levels,
                 append=append,
                 iteration=iteration,
+                # the other modes re-solve or re-use the instance
+                release_model_constraints=config.release_constraints
+                and config.scenario_mode == TemoaMode.PERFECT_FORESIGHT,
             )
 
     if config.save_excel:
@@ -352,7 +410,15 @@ def handle_results(
         )
         temp_scenario = {scenario_name}
         excel_filename = config.output_path / scenario_name
-        make_excel(str(config.output_database), excel_filename, temp_scenario)
+        from temoa.data_processing.db_to_excel import make_excel
+
+        make_excel(
+            str(config.output_database),
+            excel_filename,
+            temp_scenario,
+            output_format=config.spreadsheet_format,
+            workers=config.spreadsheet_workers,
+        )
 
     # normal (non-MGA) run will have a total_cost as the OBJ:
     if hasattr(instance, 'total_cost'):
@@ -379,10 +445,9 @@ def handle_results(
                 # Get periods from the model instance
                 periods = sorted(instance.time_optimize)
 
-                for period in periods:
-                    # Generate main results diagram for the period
-                    # We pass None for region to generate for all/default
-                    graph_gen.create_main_results_diagram(period=period, region=None)
+                # Generate main results diagrams for all periods at once
+                # We pass None for region to generate for all/default
+                graph_gen.create_main_results_diagrams(periods=periods, region=None)
             except Exception as e:
                 logger.error('Failed to generate Graphviz plots: %s', e, exc_info=True)
             finally:
@@ -12,19 +12,32 @@ from __future__ import annotations
 import functools
 import logging
 from collections import defaultdict
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
 from pyomo.common.numeric_types import value
 from pyomo.core import Objective
 
 from temoa._internal.exchange_tech_cost_ledger import CostType, ExchangeTechCostLedger
 from temoa.components import costs
-from temoa.components.utils import get_variable_efficiency
 from temoa.types.model_types import EI, FI, SLI, CapData, FlowType
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from numpy.typing import NDArray
+    from pyomo.core import Var
+
     from temoa.core.model import TemoaModel
-    from temoa.types.core_types import Commodity, Period, Region, Technology, Vintage
+    from temoa.types.core_types import (
+        Commodity,
+        Period,
+        Region,
+        Season,
+        Technology,
+        TimeOfDay,
+        Vintage,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -128,124 +141,245 @@ def poll_capacity_results(model: TemoaModel, epsilon: float = 1e-5) -> CapData:
     return CapData(built=built, net=net, retired=ret)
 
 
-def poll_flow_results(model: TemoaModel, epsilon: float = 1e-5) -> dict[FI, dict[FlowType, float]]:
+def _var_arrays(var: Var) -> tuple[list[tuple[Any, ...]], NDArray[np.float64]]:
     """
-    Poll a solved model for flow results.
-    :param M: A solved Model
+    Extract the keys and current values of an indexed Var in a single pass.
+    Unset values (stale variables) are returned as 0.
+    """
+    keys = []
+    vals = []
+    for key, var_data in var.items():
+        keys.append(key)
+        vals.append(var_data.value)
+    arr = np.array(vals, dtype=np.float64)  # None -> nan
+    return keys, np.nan_to_num(arr, nan=0.0)
+
+
+def _time_slices(model: TemoaModel) -> tuple[list[tuple[Season, TimeOfDay]], NDArray[np.float64]]:
+    """The (season, time of day) slices in model order and their segment fractions."""
+    slices = [(s, d) for s in model.time_season for d in model.time_of_day]
+    seg_frac = np.array([value(model.segment_fraction[s, d]) for s, d in slices], dtype=np.float64)
+    return slices, seg_frac
+
+
+def _rows_by_period(
+    keys: Sequence[tuple[Any, ...]], rows: Iterable[int], position: int = 1
+) -> dict[Period, list[int]]:
+    """Group the rows (positions in keys) by the period found at the given position of the key."""
+    grouped: dict[Period, list[int]] = defaultdict(list)
+    for n in rows:
+        grouped[keys[n][position]].append(int(n))
+    return grouped
+
+
+def iter_flow_results(
+    model: TemoaModel, epsilon: float = 1e-5
+) -> Iterator[tuple[Period, dict[FI, dict[FlowType, float]]]]:
+    """
+    Poll a solved model for flow results, one period at a time.
+
+    Variable values are pulled into arrays once per variable and the rows passing the epsilon
+    filter are grouped by period.  The flow dictionary of a period is only built when that period
+    is reached, so a consumer that writes and drops each period holds a single period of flows.
+    The annual flows are spread over the time slices by multiplying with a (key x slice)
+    distribution matrix, so that only the entries surviving the epsilon filter are touched
+    element-wise.
+    :param model: A solved Model
     :param epsilon: epsilon (default 1e-5)
-    :return: nested dictionary of FlowIndex, FlowType : value
+    :return: an iterator of (period, nested dictionary of FlowIndex, FlowType : value), in period
+    order
     """
     dd: functools.partial[dict[FlowType, float]] = functools.partial(defaultdict, float)
-    res: dict[FI, dict[FlowType, float]] = defaultdict(dd)
 
-    # ---- NON-annual ----
+    efficiency = dict(model.efficiency.sparse_items())
 
+    def variable_efficiency(fi: FI) -> float:
+        # same as utils.get_variable_efficiency, w/o the per-call Param lookup of efficiency
+        process = cast('tuple[Region, Commodity, Technology, Vintage, Commodity]', ritvo(fi))
+        eff = efficiency[process]
+        if model.is_efficiency_variable[process]:
+            return eff * value(model.efficiency_variable[fi.r, fi.s, fi.d, fi.i, fi.t, fi.v, fi.o])
+        return eff
+
+    tech_storage = set(model.tech_storage)
+    slices, seg_frac = _time_slices(model)
+    num_slices = len(slices)
+
+    # ---- NON-annual ----
     # Storage, which has a unique v_flow_in (non-storage techs do not have this variable)
-    for key in model.v_flow_in.keys():
-        fi = FI(*key)
-        flow = value(model.v_flow_in[fi])
-        if abs(flow) < epsilon:
-            continue
-        res[fi][FlowType.IN] = flow
-        res[fi][FlowType.LOST] = (1 - get_variable_efficiency(model, *key)) * flow
-
-    # regular flows
-    for key in model.v_flow_out.keys():
-        fi = FI(*key)
-        flow = value(model.v_flow_out[fi])
-        if abs(flow) < epsilon:
-            continue
-        res[fi][FlowType.OUT] = flow
+    in_keys, in_vals = _var_arrays(model.v_flow_in)
+    in_rows = _rows_by_period(in_keys, np.flatnonzero(np.abs(in_vals) >= epsilon))
+    out_keys, out_vals = _var_arrays(model.v_flow_out)
+    out_rows = _rows_by_period(out_keys, np.flatnonzero(np.abs(out_vals) >= epsilon))
+    curtail_keys, curtail_vals = _var_arrays(model.v_curtailment)
+    curtail_rows = _rows_by_period(curtail_keys, np.flatnonzero(np.abs(curtail_vals) >= epsilon))
+    flex_keys, flex_vals = _var_arrays(model.v_flex)
+    flex_rows = _rows_by_period(flex_keys, np.flatnonzero(np.abs(flex_vals) >= epsilon))
 
-        if fi.t not in model.tech_storage:  # we can get the flow in by out/eff...
-            flow = value(model.v_flow_out[fi]) / get_variable_efficiency(model, *key)
-            res[fi][FlowType.IN] = flow
-            res[fi][FlowType.LOST] = (1 - get_variable_efficiency(model, *key)) * flow
+    # ---- annual ----
+    # (filtered after the spread over the time slices)
+    annual_keys, annual_vals = _var_arrays(model.v_flow_out_annual)
+    # Make sure this isn't just a non-annual demand tech
+    tech_annual = set(model.tech_annual)
+    annual_rows = _rows_by_period(
+        annual_keys,
+        (n for n, key in enumerate(annual_keys) if key[3] in tech_annual) if num_slices else (),
+    )
+    flex_annual_keys, flex_annual_vals = _var_arrays(model.v_flex_annual)
+    flex_annual_rows = _rows_by_period(
+        flex_annual_keys, range(len(flex_annual_keys)) if num_slices else ()
+    )
 
-    # curtailment flows
-    for key in model.v_curtailment.keys():
-        fi = FI(*key)
-        val = value(model.v_curtailment[fi])
-        if abs(val) < epsilon:
-            continue
-        res[fi][FlowType.CURTAIL] = val
+    # construction flows are in the vintage period
+    construction_keys = list(model.construction_input.sparse_keys())
+    construction_rows = _rows_by_period(
+        construction_keys, range(len(construction_keys)) if num_slices else (), position=3
+    )
 
-    # flex techs.  This will subtract the flex from their output flow IOT make OUT the "net"
-    for key in model.v_flex.keys():
-        fi = FI(*key)
-        flow = value(model.v_flex[fi])
-        if abs(flow) < epsilon:
+    # end of life flows
+    eol_keys = []
+    eol_annual = []
+    for r, t, v, o in model.end_of_life_output.sparse_keys():
+        if (r, t, v) not in model.retirement_periods:
             continue
-        res[fi][FlowType.FLEX] = flow
-        res[fi][FlowType.OUT] -= flow
+        for p in model.retirement_periods[r, t, v]:
+            eol_keys.append((r, p, t, v, o))
+            eol_annual.append(
+                value(model.end_of_life_output[r, t, v, o])
+                * value(model.v_annual_retirement[r, p, t, v])
+            )
+    eol_rows = _rows_by_period(eol_keys, range(len(eol_keys)) if num_slices else ())
+    eol_vals = np.array(eol_annual, dtype=np.float64)
+
+    demand_comms = set(model.commodity_demand)
+    dsd = dict(model.demand_specific_distribution.sparse_items())
+    dsd_default = model.demand_specific_distribution.default()
+    demand_distributions: dict[tuple[Any, ...], NDArray[np.float64]] = {}
+
+    all_rows = (
+        in_rows,
+        out_rows,
+        curtail_rows,
+        flex_rows,
+        annual_rows,
+        flex_annual_rows,
+        construction_rows,
+        eol_rows,
+    )
+    for period in sorted(set().union(*all_rows)):
+        res: dict[FI, dict[FlowType, float]] = defaultdict(dd)
 
-    # ---- annual ----
+        for n in in_rows.get(period, ()):
+            fi = FI(*in_keys[n])
+            flow = float(in_vals[n])
+            res[fi][FlowType.IN] = flow
+            res[fi][FlowType.LOST] = (1 - variable_efficiency(fi)) * flow
 
-    # basic annual flows
-    for r, p, i, t, v, o in model.v_flow_out_annual.keys():
-        # Make sure this isn't just a non-annual demand tech
-        if t not in model.tech_annual:
-            continue
-        for s in model.time_season:
-            for d in model.time_of_day:
-                if o in model.commodity_demand:
-                    distribution = value(model.demand_specific_distribution[r, p, s, d, o])
+        # regular flows
+        for n in out_rows.get(period, ()):
+            fi = FI(*out_keys[n])
+            flow = float(out_vals[n])
+            res[fi][FlowType.OUT] = flow
+
+            if fi.t not in tech_storage:  # we can get the flow in by out/eff...
+                eff = variable_efficiency(fi)
+                flow = flow / eff
+                res[fi][FlowType.IN] = flow
+                res[fi][FlowType.LOST] = (1 - eff) * flow
+
+        # curtailment flows
+        for n in curtail_rows.get(period, ()):
+            res[FI(*curtail_keys[n])][FlowType.CURTAIL] = float(curtail_vals[n])
+
+        # flex techs.  This will subtract the flex from their output flow IOT make OUT the "net"
+        for n in flex_rows.get(period, ()):
+            fi = FI(*flex_keys[n])
+            flow = float(flex_vals[n])
+            res[fi][FlowType.FLEX] = flow
+            res[fi][FlowType.OUT] -= flow
+
+        # basic annual flows
+        rows = annual_rows.get(period)
+        if rows:
+            distribution = np.empty((len(rows), num_slices), dtype=np.float64)
+            for row, key_idx in enumerate(rows):
+                r, p, _i, _t, _v, o = annual_keys[key_idx]
+                if o in demand_comms:
+                    if (r, p, o) not in demand_distributions:
+                        demand_distributions[r, p, o] = np.array(
+                            [value(dsd.get((r, p, s, d, o), dsd_default)) for s, d in slices],
+                            dtype=np.float64,
+                        )
+                    distribution[row] = demand_distributions[r, p, o]
                 else:
-                    distribution = value(model.segment_fraction[s, d])
+                    distribution[row] = seg_frac
+            flows = annual_vals[rows][:, None] * distribution
+            for row, col in zip(*np.nonzero(np.abs(flows) >= epsilon), strict=True):
+                r, p, i, t, v, o = annual_keys[rows[row]]
+                s, d = slices[col]
                 fi = FI(r, p, s, d, i, t, v, o)
-                flow = value(model.v_flow_out_annual[r, p, i, t, v, o]) * distribution
-                if abs(flow) < epsilon:
-                    continue
+                flow = float(flows[row, col])
+                eff = efficiency[r, i, t, v, o]
                 res[fi][FlowType.OUT] = flow
-                res[fi][FlowType.IN] = flow / value(model.efficiency[ritvo(fi)])
-                res[fi][FlowType.LOST] = (1 - value(model.efficiency[ritvo(fi)])) * res[fi][
-                    FlowType.IN
-                ]
-
-    # flex annual
-    for r, p, i, t, v, o in model.v_flex_annual.keys():
-        for s in model.time_season:
-            for d in model.time_of_day:
+                res[fi][FlowType.IN] = flow / eff
+                res[fi][FlowType.LOST] = (1 - eff) * res[fi][FlowType.IN]
+
+        # flex annual
+        rows = flex_annual_rows.get(period)
+        if rows:
+            flows = flex_annual_vals[rows][:, None] * seg_frac[None, :]
+            for row, col in zip(*np.nonzero(np.abs(flows) >= epsilon), strict=True):
+                r, p, i, t, v, o = flex_annual_keys[rows[row]]
+                s, d = slices[col]
                 fi = FI(r, p, s, d, i, t, v, o)
-                flow = value(model.v_flex_annual[r, p, i, t, v, o]) * value(
-                    model.segment_fraction[s, d]
-                )
-                if abs(flow) < epsilon:
-                    continue
+                flow = float(flows[row, col])
                 res[fi][FlowType.FLEX] = flow
                 res[fi][FlowType.OUT] -= flow
 
-    # construction flows
-    for r, i, t, v in model.construction_input.sparse_keys():
-        annual = (
-            value(model.construction_input[r, i, t, v])
-            * value(model.v_new_capacity[r, t, v])
-            / value(model.period_length[v])
-        )
-        for s in model.time_season:
-            for d in model.time_of_day:
+        # construction flows
+        rows = construction_rows.get(period)
+        if rows:
+            annual = np.array(
+                [
+                    value(model.construction_input[r, i, t, v])
+                    * value(model.v_new_capacity[r, t, v])
+                    / value(model.period_length[v])
+                    for r, i, t, v in (construction_keys[n] for n in rows)
+                ],
+                dtype=np.float64,
+            )
+            flows = annual[:, None] * seg_frac[None, :]
+            for row, col in zip(*np.nonzero(np.abs(flows) >= epsilon), strict=True):
+                r, i, t, v = construction_keys[rows[row]]
+                s, d = slices[col]
                 fi = FI(r, v, s, d, i, t, v, cast('Commodity', None))
-                flow = annual * value(model.segment_fraction[s, d])
-                if abs(flow) < epsilon:
-                    continue
-                res[fi][FlowType.IN] = flow
+                res[fi][FlowType.IN] = float(flows[row, col])
 
-    # end of life flows
-    for r, t, v, o in model.end_of_life_output.sparse_keys():
-        if (r, t, v) not in model.retirement_periods:
-            continue
-        for p in model.retirement_periods[r, t, v]:
-            annual = value(model.end_of_life_output[r, t, v, o]) * value(
-                model.v_annual_retirement[r, p, t, v]
-            )
-            for s in model.time_season:
-                for d in model.time_of_day:
-                    fi = FI(r, p, s, d, cast('Commodity', None), t, v, o)
-                    flow = annual * value(model.segment_fraction[s, d])
-                    if abs(flow) < epsilon:
-                        continue
-                    res[fi][FlowType.OUT] = flow
+        # end of life flows
+        rows = eol_rows.get(period)
+        if rows:
+            flows = eol_vals[rows][:, None] * seg_frac[None, :]
+            for row, col in zip(*np.nonzero(np.abs(flows) >= epsilon), strict=True):
+                r, p, t, v, o = eol_keys[rows[row]]
+                s, d = slices[col]
+                fi = FI(r, p, s, d, cast('Commodity', None), t, v, o)
+                res[fi][FlowType.OUT] = float(flows[row, col])
 
+        if res:
+            yield period, res
+
+
+def poll_flow_results(model: TemoaModel, epsilon: float = 1e-5) -> dict[FI, dict[FlowType, float]]:
+    """
+    Poll a solved model for flow results (of all periods, see iter_flow_results).
+    :param model: A solved Model
+    :param epsilon: epsilon (default 1e-5)
+    :return: nested dictionary of FlowIndex, FlowType : value
+    """
+    dd: functools.partial[dict[FlowType, float]] = functools.partial(defaultdict, float)
+    res: dict[FI, dict[FlowType, float]] = defaultdict(dd)
+    for _, flows in iter_flow_results(model, epsilon):
+        res.update(flows)
     return res
 
 
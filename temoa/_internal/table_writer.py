@@ -8,11 +8,13 @@ import math
 import sqlite3
 import sys
 from collections import defaultdict
+from contextlib import contextmanager
 from importlib import resources
+from itertools import batched
 from logging import getLogger
 from typing import TYPE_CHECKING, Any
 
-from pyomo.core import value
+from pyomo.core import Constraint, Suffix, value
 
 from temoa._internal.exchange_tech_cost_ledger import CostType
 from temoa._internal.table_data_puller import (
@@ -20,6 +22,7 @@ from temoa._internal.table_data_puller import (
     FI,
     CapData,
     FlowType,
+    iter_flow_results,
     poll_capacity_results,
     poll_cost_results,
     poll_emissions,
@@ -30,7 +33,7 @@ from temoa._internal.table_data_puller import (
 from temoa.core.modes import TemoaMode
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator, Sequence
     from pathlib import Path
     from types import TracebackType
 
@@ -39,6 +42,7 @@ if TYPE_CHECKING:
     from temoa._internal.data_brick import DataBrick
     from temoa.core.config import TemoaConfig
     from temoa.core.model import TemoaModel
+    from temoa.extensions.modeling_to_generate_alternatives.worker import MgaResult
     from temoa.extensions.monte_carlo.mc_run import ChangeRecord
     from temoa.model_checking.unit_checking.unit_propagator import UnitPropagator
     from temoa.types.core_types import Period, Region, Technology, Vintage
@@ -72,6 +76,26 @@ OUTPUT_THRESHOLD_DEFAULTS = {
     'cost': 1e-2,
 }
 
+# Indexes maintained on the output tables so that clearing a scenario (or the periods after a
+# myopic base year) is a range scan rather than a full table scan
+OUTPUT_TABLE_INDEXES: dict[str, tuple[str, ...]] = {
+    'output_built_capacity': ('scenario', 'vintage'),
+    'output_cost': ('scenario', 'period'),
+    'output_curtailment': ('scenario', 'period'),
+    'output_dual_variable': ('scenario',),
+    'output_emission': ('scenario', 'period'),
+    'output_flow_in': ('scenario', 'period'),
+    'output_flow_out': ('scenario', 'period'),
+    'output_mc_delta': ('scenario',),
+    'output_net_capacity': ('scenario', 'period'),
+    'output_objective': ('scenario',),
+    'output_retired_capacity': ('scenario', 'period'),
+    'output_storage_level': ('scenario', 'period'),
+}
+
+# max rows handed to sqlite per executemany call when streaming inserts
+INSERT_CHUNK_SIZE = 50_000
+
 FLOW_SUMMARY_FILE_LOC = (
     resources.files('temoa.extensions.modeling_to_generate_alternatives')
     / 'make_flow_summary_table.sql'
@@ -79,6 +103,40 @@ FLOW_SUMMARY_FILE_LOC = (
 MC_TWEAKS_FILE_LOC = resources.files('temoa.extensions.monte_carlo') / 'make_deltas_table.sql'
 
 
+def output_index_name(table: str) -> str:
+    """The name of the index on an output table (see OUTPUT_TABLE_INDEXES)."""
+    return f'{table}_{"_".join(OUTPUT_TABLE_INDEXES[table])}'
+
+
+def iteration_scenario_bounds(scenario: str) -> tuple[str, str]:
+    """
+    The bounds on the names of the iterative runs of a scenario ('<scenario>-<iteration>').
+
+    Used as ``scenario >= ? AND scenario < ?`` this selects the same rows as
+    ``LIKE '<scenario>-%'`` (case-sensitively, and without treating '_' in the name as a
+    wildcard) while allowing sqlite to do a range scan on the scenario index.
+    """
+    # '.' is the character following '-'
+    return f'{scenario}-', f'{scenario}.'
+
+
+def release_constraints(model: TemoaModel) -> None:
+    """
+    Delete the constraints of a solved model (and their duals and the solver symbol maps that
+    refer to them) to free their expressions.
+
+    The results are polled from the variables, the parameters and the objective, so the
+    constraints are no longer needed once the duals are captured in the solver results.  The
+    model cannot be re-solved afterwards.
+    """
+    dual = getattr(model, 'dual', None)
+    if isinstance(dual, Suffix):
+        dual.clear()
+    model.solutions.clear()
+    for constraint in list(model.component_objects(Constraint, descend_into=True)):
+        constraint.parent_block().del_component(constraint)
+
+
 class TableWriter:
     con: sqlite3.Connection | None
 
@@ -91,6 +149,8 @@ class TableWriter:
 
         # Cache for table columns to avoid repeated PRAGMA calls
         self._table_columns_cache: dict[str, set[str]] = {}
+        # the output table indexes are in place on the connection (see ensure_output_indexes)
+        self._output_indexes_ensured = False
 
         try:
             self.con = sqlite3.connect(config.output_database)
@@ -220,31 +280,47 @@ class TableWriter:
         if not records:
             return
 
-        valid_columns = self._get_table_columns(table_name)
-
         # Determine the columns we will actually write to based on the first record
-        # and the valid schema columns.
-        data_keys = set(records[0].keys())
+        target_columns = sorted(records[0].keys())  # Sort to ensure consistent order
+        self._stream_insert(
+            table_name,
+            target_columns,
+            (tuple(rec[col] for col in target_columns) for rec in records),
+        )
 
-        # Intersection: keys present in data AND present in database table
-        target_columns = list(data_keys.intersection(valid_columns))
-        target_columns.sort()  # Sort to ensure consistent order
+    def _stream_insert(
+        self,
+        table_name: str,
+        columns: Sequence[str],
+        rows: Iterable[tuple[Any, ...]],
+        chunk_size: int = INSERT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Inserts column-ordered rows into a table, consuming them in bounded chunks.
 
-        if not target_columns:
+        Columns not present in the table schema (e.g. 'units' in older databases) are dropped
+        from each row, so memory use is set by the chunk size and not by the number of rows.
+
+        :param table_name: the table to insert into
+        :param columns: the column names, in the order of the values in each row
+        :param rows: an iterable (typically a generator) of row tuples
+        :param chunk_size: the max number of rows passed to each executemany call
+        """
+        valid_columns = self._get_table_columns(table_name)
+        # keys present in data AND present in database table
+        positions = [n for n, col in enumerate(columns) if col in valid_columns]
+        if not positions:
             logger.warning('No matching columns found for table %s. Skipping insert.', table_name)
             return
+        if len(positions) < len(columns):
+            rows = (tuple(row[n] for n in positions) for row in rows)
 
-        # Prepare SQL statement
-        cols_str = ', '.join(target_columns)
-        placeholders = ', '.join(['?'] * len(target_columns))
+        cols_str = ', '.join(columns[n] for n in positions)
+        placeholders = ', '.join(['?'] * len(positions))
         query = f'INSERT INTO {table_name} ({cols_str}) VALUES ({placeholders})'
 
-        # Prepare values tuple generator
-        rows_to_insert = []
-        for rec in records:
-            rows_to_insert.append(tuple(rec[col] for col in target_columns))
-
-        self.connection.executemany(query, rows_to_insert)
+        for chunk in batched(rows, chunk_size):
+            self.connection.executemany(query, chunk)
 
     @staticmethod
     def _validate_threshold(
@@ -283,64 +359,81 @@ class TableWriter:
         save_storage_levels: bool = False,
         append: bool = False,
         iteration: int | None = None,
+        release_model_constraints: bool = False,
     ) -> None:
+        """
+        Write the results of a solved model.  The result families are polled, written and
+        released one at a time (the flows one period at a time), so that only one of them is
+        held in memory alongside the model.
+
+        :param model: the solved model
+        :param results_with_duals: the solver results holding the duals to write, if any
+        :param save_storage_levels: write the storage levels by time slice
+        :param append: keep the existing results of the scenario
+        :param iteration: the iteration number of iterative runs (appended to the scenario)
+        :param release_model_constraints: delete the model constraints once the duals are
+            written (see release_constraints)
+        """
+        self.ensure_output_indexes()
         try:
             if not append:
                 self.clear_scenario()
 
-            if not self.tech_sectors:
-                self._set_tech_sectors()
+            with self.bulk_load():
+                if not self.tech_sectors:
+                    self._set_tech_sectors()
 
-            self.write_objective(model, iteration=iteration)
-            self.write_capacity_tables(model, iteration=iteration)
+                if results_with_duals:
+                    self.write_dual_variables(results_with_duals, iteration=iteration)
+                if release_model_constraints:
+                    release_constraints(model)
 
-            # Poll and Write Emissions
-            if self.config.scenario_mode == TemoaMode.MYOPIC:
-                p_0 = model.myopic_discounting_year
-            else:
-                p_0 = None
+                self.write_objective(model, iteration=iteration)
+                self.write_capacity_tables(model, iteration=iteration)
 
-            e_costs, e_flows = poll_emissions(
-                model=model,
-                p_0=value(p_0),
-                epsilon=self.output_threshold_emission,
-            )
-            self.emission_register = e_flows
-            self.write_emissions(iteration=iteration)
+                # Poll and Write Emissions
+                if self.config.scenario_mode == TemoaMode.MYOPIC:
+                    p_0 = model.myopic_discounting_year
+                else:
+                    p_0 = None
 
-            # Costs and Flows
-            self.write_costs(model, emission_entries=e_costs, iteration=iteration)
+                e_costs, self.emission_register = poll_emissions(
+                    model=model,
+                    p_0=value(p_0),
+                    epsilon=self.output_threshold_emission,
+                )
+                self.write_emissions(iteration=iteration)
+                self.emission_register = None
 
-            self.flow_register = self.calculate_flows(model)
-            self.check_flow_balance(model)
-            self.write_flow_tables(iteration=iteration)
+                # Costs and Flows
+                self.write_costs(model, emission_entries=e_costs, iteration=iteration)
+                del e_costs
 
-            if results_with_duals:
-                self.write_dual_variables(results_with_duals, iteration=iteration)
+                self.write_flows(model, iteration=iteration)
 
-            if save_storage_levels:
-                self.write_storage_level(model, iteration=iteration)
+                if save_storage_levels:
+                    self.write_storage_level(model, iteration=iteration)
 
         finally:
             self._validate_foreign_keys()
             self.connection.commit()
 
-    def write_mm_results(self, model: TemoaModel, iteration: int) -> None:
+    def write_mm_results(
+        self, obj_data: list[tuple[str, float]], emission_flows: dict[EI, float], iteration: int
+    ) -> None:
+        self.ensure_output_indexes()
         try:
             if not self.tech_sectors:
                 self._set_tech_sectors()
-            self.write_objective(model, iteration=iteration)
-            _e_costs, e_flows = poll_emissions(
-                model=model,
-                epsilon=self.output_threshold_emission,
-            )
-            self.emission_register = e_flows
+            self._insert_objective_results(obj_data, iteration=iteration)
+            self.emission_register = emission_flows
             self.write_emissions(iteration=iteration)
         finally:
             self._validate_foreign_keys()
             self.connection.commit()
 
     def write_mc_results(self, brick: DataBrick, iteration: int) -> None:
+        self.ensure_output_indexes()
         try:
             if not self.tech_sectors:
                 self._set_tech_sectors()
@@ -362,6 +455,16 @@ class TableWriter:
             self._validate_foreign_keys()
             self.connection.commit()
 
+    def write_mga_results(self, result: MgaResult, iteration: int) -> None:
+        self.ensure_output_indexes()
+        try:
+            if not self.tech_sectors:
+                self._set_tech_sectors()
+            self._insert_capacity_results(result.capacity_data, iteration=iteration)
+            self._insert_summary_flow_results(flow_data=result.flow_data, iteration=iteration)
+        finally:
+            self.connection.commit()
+
     def _set_tech_sectors(self) -> None:
         qry = 'SELECT tech, sector FROM Technology'
         data = self.connection.execute(qry).fetchall()
@@ -373,6 +476,7 @@ class TableWriter:
         return self.config.scenario
 
     def clear_scenario(self) -> None:
+        self.ensure_output_indexes()
         cur = self.connection.cursor()
         for table in BASIC_OUTPUT_TABLES:
             cur.execute(f'DELETE FROM {table} WHERE scenario == ?', (self.config.scenario,))
@@ -385,16 +489,68 @@ class TableWriter:
         self.clear_iterative_runs()
 
     def clear_iterative_runs(self) -> None:
-        target = self.config.scenario + '-%'
+        self.ensure_output_indexes()
+        low, high = iteration_scenario_bounds(self.config.scenario)
         cur = self.connection.cursor()
         tables = BASIC_OUTPUT_TABLES + OPTIONAL_OUTPUT_TABLES
         for table in tables:
             try:
-                cur.execute(f'DELETE FROM {table} WHERE scenario like ?', (target,))
+                cur.execute(
+                    f'DELETE FROM {table} WHERE scenario >= ? AND scenario < ?', (low, high)
+                )
             except sqlite3.OperationalError:
                 pass
         self.connection.commit()
 
+    # -------------------------------------------------------------------------
+    # OUTPUT TABLE INDEXES
+    # -------------------------------------------------------------------------
+
+    def ensure_output_indexes(self) -> None:
+        """
+        Create the output table indexes on the first write to (or clear of) the output database
+        through this writer.  Databases created before the indexes were added to the schema pick
+        them up here.
+        """
+        if not self._output_indexes_ensured:
+            self.create_output_indexes()
+
+    def create_output_indexes(self) -> None:
+        """Create the output table indexes, if missing.  Tables not in the db are skipped."""
+        for table, columns in OUTPUT_TABLE_INDEXES.items():
+            try:
+                self.connection.execute(
+                    f'CREATE INDEX IF NOT EXISTS {output_index_name(table)} '
+                    f'ON {table} ({", ".join(columns)})'
+                )
+            except sqlite3.OperationalError:
+                pass
+        self.connection.commit()
+        self._output_indexes_ensured = True
+
+    def drop_output_indexes(self) -> None:
+        """Drop the output table indexes."""
+        for table in OUTPUT_TABLE_INDEXES:
+            self.connection.execute(f'DROP INDEX IF EXISTS {output_index_name(table)}')
+        self.connection.commit()
+        self._output_indexes_ensured = False
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """
+        Context for writing a large amount of results.  If selected in the config
+        ([sqlite] rebuild_output_indexes), the output table indexes are dropped on entry and
+        re-created on exit, which is faster than maintaining them row by row.
+        """
+        if not self.config.sqlite_rebuild_output_indexes:
+            yield
+            return
+        self.drop_output_indexes()
+        try:
+            yield
+        finally:
+            self.create_output_indexes()
+
     # -------------------------------------------------------------------------
     # WRITE IMPLEMENTATIONS
     # -------------------------------------------------------------------------
@@ -543,59 +699,82 @@ class TableWriter:
 
         self.connection.commit()
 
+    def write_flows(self, model: TemoaModel, iteration: int | None = None) -> None:
+        """
+        Poll, check and write the flows one period at a time.  Each period replaces the last in
+        the flow register, so a single period of flows is held in memory.
+        """
+        for _, flows in iter_flow_results(model, self.output_threshold_activity):
+            self.flow_register = flows
+            self.check_flow_balance(model)
+            self.write_flow_tables(iteration=iteration)
+        self.flow_register = {}
+
     def write_flow_tables(self, iteration: int | None = None) -> None:
         if not self.tech_sectors or not self.flow_register:
             raise RuntimeError('Dependencies missing (tech_sectors or flow_register)')
 
         scenario = self._get_scenario_name(iteration)
 
-        # Structure to hold list of dicts for each table type
-        table_data: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        flow_columns = (
+            'scenario',
+            'region',
+            'sector',
+            'period',
+            'season',
+            'tod',
+            'input_comm',
+            'tech',
+            'vintage',
+            'output_comm',
+            'units',
+        )
+        tables = (
+            ('output_flow_out', 'flow', (FlowType.OUT,)),
+            ('output_flow_in', 'flow', (FlowType.IN,)),
+            ('output_curtailment', 'curtailment', (FlowType.CURTAIL, FlowType.FLEX)),
+        )
+        for table_name, value_column, flow_types in tables:
+            self._stream_insert(
+                table_name,
+                (*flow_columns, value_column),
+                self._flow_rows(scenario, flow_types),
+            )
 
-        map_flow_to_table = {
-            FlowType.OUT: 'output_flow_out',
-            FlowType.IN: 'output_flow_in',
-            FlowType.CURTAIL: 'output_curtailment',
-            FlowType.FLEX: 'output_curtailment',
-        }
+        self.connection.commit()
 
-        for fi, flows in self.flow_register.items():
-            sector = self.tech_sectors.get(fi.t)
+    def _flow_rows(
+        self, scenario: str, flow_types: tuple[FlowType, ...]
+    ) -> Iterator[tuple[Any, ...]]:
+        """
+        Generate the column-ordered rows for the given flow types from the flow register.
 
+        Units are resolved once per flow type and commodity pair, not per row.
+        """
+        tech_sectors = self.tech_sectors or {}
+        threshold = self.output_threshold_activity
+        units: dict[tuple[FlowType, str | None, str | None], str | None] = {}
+        for fi, flows in self.flow_register.items():
             for flow_type, val in flows.items():
-                if abs(val) < self.output_threshold_activity:
-                    continue
-
-                table_name = map_flow_to_table.get(flow_type)
-                if not table_name:
+                if flow_type not in flow_types or abs(val) < threshold:
                     continue
-
-                row: dict[str, Any] = {
-                    'scenario': scenario,
-                    'region': fi.r,
-                    'sector': sector,
-                    'period': fi.p,
-                    'season': fi.s,
-                    'tod': fi.d,
-                    'input_comm': fi.i,
-                    'tech': fi.t,
-                    'vintage': fi.v,
-                    'output_comm': fi.o,
-                    'units': self._get_flow_units(flow_type, fi.i, fi.o),
-                }
-
-                # Assign value to correct column name based on table/type
-                if table_name == 'output_curtailment':
-                    row['curtailment'] = val
-                else:
-                    row['flow'] = val
-
-                table_data[table_name].append(row)
-
-        for table_name, records in table_data.items():
-            self._bulk_insert(table_name, records)
-
-        self.connection.commit()
+                unit_key = (flow_type, fi.i, fi.o)
+                if unit_key not in units:
+                    units[unit_key] = self._get_flow_units(flow_type, fi.i, fi.o)
+                yield (
+                    scenario,
+                    fi.r,
+                    tech_sectors.get(fi.t),
+                    fi.p,
+                    fi.s,
+                    fi.d,
+                    fi.i,
+                    fi.t,
+                    fi.v,
+                    fi.o,
+                    units[unit_key],
+                    val,
+                )
 
     def _get_flow_units(
         self, flow_type: FlowType, input_comm: str | None, output_comm: str | None
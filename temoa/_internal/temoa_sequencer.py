@@ -16,6 +16,7 @@ from temoa.__about__ import (
     MIN_PYTHON_MAJOR,
     MIN_PYTHON_MINOR,
 )
+from temoa._internal import build_profiler
 from temoa._internal.run_actions import (
     build_instance,
     check_database_version,
@@ -27,18 +28,17 @@ from temoa._internal.run_actions import (
 from temoa.core.config import TemoaConfig
 from temoa.core.model import TemoaModel
 from temoa.core.modes import TemoaMode
+from temoa.data_io.build_cache import BuildCache, make_key
 from temoa.data_io.hybrid_loader import HybridLoader
-from temoa.extensions.method_of_morris.morris_sequencer import MorrisSequencer
-from temoa.extensions.modeling_to_generate_alternatives.mga_sequencer import MgaSequencer
-from temoa.extensions.monte_carlo.mc_sequencer import MCSequencer
-from temoa.extensions.myopic.myopic_sequencer import MyopicSequencer
-from temoa.extensions.single_vector_mga.sv_mga_sequencer import SvMgaSequencer
-from temoa.extensions.stochastics.stochastic_sequencer import StochasticSequencer
+from temoa.model_checking.commodity_network_manager import report_findings
 from temoa.model_checking.pricing_check import price_checker
 from temoa.utilities.sqlite_utils import tune_sqlite_connection
 
 if TYPE_CHECKING:
     import pyomo.opt
+    from pyomo.dataportal import DataPortal
+
+    from temoa.extensions.stochastics.stochastic_sequencer import StochasticSequencer
 
 logger = getLogger(__name__)
 
@@ -138,9 +138,13 @@ class TemoaSequencer:
 
             with contextlib.closing(sqlite3.connect(self.config.input_database)) as con:
                 tune_sqlite_connection(con, self.config)
-                hybrid_loader = HybridLoader(db_connection=con, config=self.config)
-                data_portal = hybrid_loader.load_data_portal(myopic_index=None)
-                instance = build_instance(data_portal, silent=self.config.silent)
+                data_portal = self._load_data_portal(con)
+                instance = build_instance(
+                    data_portal,
+                    silent=self.config.silent,
+                    profile_path=build_profiler.report_path(self.config),
+                    validate_elements=not self.config.bulk_validation,
+                )
 
             logger.info('Model build process complete.')
             return instance
@@ -177,18 +181,28 @@ class TemoaSequencer:
                 self._run_perfect_foresight()
 
             case TemoaMode.MYOPIC:
+                from temoa.extensions.myopic.myopic_sequencer import MyopicSequencer
+
                 myopic_sequencer = MyopicSequencer(config=self.config)
                 myopic_sequencer.start()
 
             case TemoaMode.MGA:
+                from temoa.extensions.modeling_to_generate_alternatives.mga_sequencer import (
+                    MgaSequencer,
+                )
+
                 mga_sequencer = MgaSequencer(config=self.config)
                 mga_sequencer.start()
 
             case TemoaMode.SVMGA:
+                from temoa.extensions.single_vector_mga.sv_mga_sequencer import SvMgaSequencer
+
                 sv_mga_sequencer = SvMgaSequencer(config=self.config)
                 sv_mga_sequencer.start()
 
             case TemoaMode.METHOD_OF_MORRIS:
+                from temoa.extensions.method_of_morris.morris_sequencer import MorrisSequencer
+
                 mm_sequencer = MorrisSequencer(config=self.config)
                 mm_sequencer.start()
 
@@ -196,6 +210,10 @@ class TemoaSequencer:
                 self._run_monte_carlo()
 
             case TemoaMode.STOCHASTIC:
+                from temoa.extensions.stochastics.stochastic_sequencer import (
+                    StochasticSequencer,
+                )
+
                 self.stochastic_sequencer = StochasticSequencer(config=self.config)
                 self.stochastic_sequencer.start()
 
@@ -220,24 +238,56 @@ class TemoaSequencer:
                 silent=self.config.silent,
                 keep_lp_file=self.config.save_lp_file,
                 lp_path=self.config.output_path,
+                profile_path=build_profiler.report_path(self.config),
+                validate_elements=not self.config.bulk_validation,
             )
             if not self.config.price_check:
                 logger.warning('Price check is automatically enabled for CHECK mode.')
             price_checker(instance)
 
+    def _load_data_portal(self, con: sqlite3.Connection) -> 'DataPortal':
+        """
+        Load the (non-myopic) model data, going through the build cache if one is configured.
+        On a cache hit, the data load and source trace are skipped entirely and the findings of
+        the cached trace are logged again.  Runs that plot the commodity network always load
+        (and trace) the data, as the graphs are drawn by the trace.
+        """
+        hybrid_loader = HybridLoader(db_connection=con, config=self.config)
+        if self.config.build_cache_dir is None:
+            return hybrid_loader.load_data_portal(myopic_index=None)
+
+        cache = BuildCache(self.config.build_cache_dir)
+        key = make_key(con, self.config)
+        plotting = self.config.source_trace and self.config.plot_commodity_network
+        entry = None if plotting else cache.load(key)
+        if entry is None:
+            data = hybrid_loader.create_data_dict(myopic_index=None)
+            manager = hybrid_loader.manager
+            cache.store(key, data, trace_results=manager.results if manager else None)
+            return HybridLoader.data_portal_from_data(data)
+
+        if not self.config.silent:
+            print('Model data loaded from build cache')
+        if entry.trace_results is not None:
+            if not report_findings(entry.trace_results) and not self.config.silent:
+                print('\nWarning:  Orphaned processes detected.  See log file for details.')
+        return HybridLoader.data_portal_from_data(entry.data)
+
     def _run_perfect_foresight(self) -> None:
         """Encapsulated logic for the PERFECT_FORESIGHT mode."""
         import contextlib
 
         with contextlib.closing(sqlite3.connect(self.config.input_database)) as con:
             tune_sqlite_connection(con, self.config)
-            hybrid_loader = HybridLoader(db_connection=con, config=self.config)
-            data_portal = hybrid_loader.load_data_portal(myopic_index=None)
+            data_portal = self._load_data_portal(con)
             instance = build_instance(
                 data_portal,
                 silent=self.config.silent,
                 keep_lp_file=self.config.save_lp_file,
                 lp_path=self.config.output_path,
+                profile_path=build_profiler.report_path(self.config),
+                validate_elements=not self.config.bulk_validation,
+                direct_build=self.config.direct_build,
             )
             if self.config.price_check:
                 price_checker(instance)
@@ -278,5 +328,7 @@ class TemoaSequencer:
             self.config.save_duals = False
             logger.warning('Saving of duals disabled for MONTE_CARLO mode.')
 
+        from temoa.extensions.monte_carlo.mc_sequencer import MCSequencer
+
         mc_sequencer = MCSequencer(config=self.config)
         mc_sequencer.start()
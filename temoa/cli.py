@@ -3,7 +3,7 @@ import shutil
 from datetime import UTC, datetime
 from importlib import resources
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import rich
 import tomlkit
@@ -12,12 +12,14 @@ from rich.logging import RichHandler
 from rich.text import Text
 
 from temoa.__about__ import __version__
-from temoa._internal.temoa_sequencer import TemoaSequencer
 from temoa.core.config import TemoaConfig
 from temoa.core.modes import TemoaMode
 from temoa.utilities import master_migration
 from temoa.utilities.run_all_v4_migrations import run_migrations
 
+if TYPE_CHECKING:
+    from temoa._internal.temoa_sequencer import TemoaSequencer
+
 # =============================================================================
 # Logging & Helper Setup
 # =============================================================================
@@ -84,8 +86,12 @@ def _setup_sequencer(
     silent: bool,
     debug: bool,
     mode_override: TemoaMode | None = None,
-) -> tuple[TemoaSequencer, Path]:
+    profile_build: bool = False,
+) -> tuple['TemoaSequencer', Path]:
     """Handles the common setup logic for creating and configuring the sequencer."""
+    # imported here so that commands that don't build a model skip importing Pyomo, etc.
+    from temoa._internal.temoa_sequencer import TemoaSequencer
+
     final_output_path = output_path if output_path else _create_output_folder()
     final_output_path.mkdir(parents=True, exist_ok=True)
 
@@ -95,6 +101,8 @@ def _setup_sequencer(
     config = TemoaConfig.build_config(
         config_file=config_file, output_path=final_output_path, silent=silent
     )
+    if profile_build:
+        config.profile_build = True
     sequencer = TemoaSequencer(config=config, mode_override=mode_override)
     return sequencer, final_output_path
 
@@ -253,6 +261,14 @@ def run(
     debug: Annotated[
         bool, typer.Option('--debug', '-d', help='Enable debug-level logging.')
     ] = False,
+    profile_build: Annotated[
+        bool,
+        typer.Option(
+            '--profile-build',
+            help='Profile the construction of each model component (time, memory, size) and '
+            'write the report to the output folder and the log.',
+        ),
+    ] = False,
 ) -> None:
     """
     Builds and solves a Temoa model based on the provided configuration.
@@ -265,6 +281,7 @@ def run(
             silent=silent,
             debug=debug,
             mode_override=mode_override,
+            profile_build=profile_build,
         )
         if not silent:
             rich.print(ts.config)
@@ -18,12 +18,13 @@ from typing import TYPE_CHECKING
 from deprecated import deprecated
 from pyomo.environ import value
 
-from .utils import get_capacity_factor
+from .utils import get_capacity_factor, linear_sum
 
 if TYPE_CHECKING:
     from temoa.core.model import TemoaModel
     from temoa.types import (
         ExprLike,
+        LinearTerms,
         Period,
         Region,
         Season,
@@ -245,6 +246,51 @@ def capacity_factor_process_indices(
     }
 
 
+def capacity_constraint_terms(
+    model: TemoaModel, r: Region, p: Period, s: Season, d: TimeOfDay, t: Technology, v: Vintage
+) -> tuple[LinearTerms, LinearTerms]:
+    """
+    The terms of the available capacity of a process in a time slice and of the activity
+    (including any curtailment) that it must cover in the capacity_constraint.
+    """
+    capacity: LinearTerms = [
+        (
+            model.v_capacity[r, p, t, v],
+            get_capacity_factor(model, r, s, d, t, v)
+            * value(model.capacity_to_activity[r, t])
+            * value(model.segment_fraction[s, d]),
+        )
+    ]
+
+    if t in model.tech_annual:
+        # Annual demand technology
+        activity: LinearTerms = [
+            (
+                model.v_flow_out_annual[r, p, S_i, t, v, S_o],
+                value(model.demand_specific_distribution[r, p, s, d, S_o])
+                if S_o in model.commodity_demand
+                else value(model.segment_fraction[s, d]),
+            )
+            for S_i in model.process_inputs[r, p, t, v]
+            for S_o in model.process_outputs_by_input[r, p, t, v, S_i]
+        ]
+    else:
+        activity = [
+            (model.v_flow_out[r, p, s, d, S_i, t, v, S_o], 1.0)
+            for S_i in model.process_inputs[r, p, t, v]
+            for S_o in model.process_outputs_by_input[r, p, t, v, S_i]
+        ]
+
+    if t in model.tech_curtailment:
+        activity.extend(
+            (model.v_curtailment[r, p, s, d, S_i, t, v, S_o], 1.0)
+            for S_i in model.process_inputs[r, p, t, v]
+            for S_o in model.process_outputs_by_input[r, p, t, v, S_i]
+        )
+
+    return capacity, activity
+
+
 # ============================================================================
 # PYOMO CONSTRAINT RULES
 # ============================================================================
@@ -429,48 +475,16 @@ def capacity_constraint(
        \\
        \forall \{r, p, s, d, t, v\} \in \Theta_{\text{FO}}
     """
-    # The expressions below are defined in-line to minimize the amount of
-    # expression cloning taking place with Pyomo.
-
-    if t in model.tech_annual:
-        # Annual demand technology
-        useful_activity = sum(
-            (
-                value(model.demand_specific_distribution[r, p, s, d, S_o])
-                if S_o in model.commodity_demand
-                else value(model.segment_fraction[s, d])
-            )
-            * model.v_flow_out_annual[r, p, S_i, t, v, S_o]
-            for S_i in model.process_inputs[r, p, t, v]
-            for S_o in model.process_outputs_by_input[r, p, t, v, S_i]
-        )
-    else:
-        useful_activity = sum(
-            model.v_flow_out[r, p, s, d, S_i, t, v, S_o]
-            for S_i in model.process_inputs[r, p, t, v]
-            for S_o in model.process_outputs_by_input[r, p, t, v, S_i]
-        )
+    capacity_terms, activity_terms = capacity_constraint_terms(model, r, p, s, d, t, v)
+    capacity = linear_sum(capacity_terms)
+    activity = linear_sum(activity_terms)
 
     if t in model.tech_curtailment:
         # If technologies are present in the curtailment set, then enough
         # capacity must be available to cover both activity and curtailment.
-        return get_capacity_factor(model, r, s, d, t, v) * value(
-            model.capacity_to_activity[r, t]
-        ) * value(model.segment_fraction[s, d]) * model.v_capacity[
-            r, p, t, v
-        ] == useful_activity + sum(
-            model.v_curtailment[r, p, s, d, S_i, t, v, S_o]
-            for S_i in model.process_inputs[r, p, t, v]
-            for S_o in model.process_outputs_by_input[r, p, t, v, S_i]
-        )
+        return capacity == activity
     else:
-        return (
-            get_capacity_factor(model, r, s, d, t, v)
-            * value(model.capacity_to_activity[r, t])
-            * value(model.segment_fraction[s, d])
-            * model.v_capacity[r, p, t, v]
-            >= useful_activity
-        )
+        return capacity >= activity
 
 
 def adjusted_capacity_constraint(
@@ -20,9 +20,9 @@ if TYPE_CHECKING:
     from temoa.core.model import TemoaModel
     from temoa.types.core_types import Season, Technology, TimeOfDay, Vintage
 
-    from ..types import Commodity, ExprLike, Period, Region
+    from ..types import Commodity, ExprLike, LinearTerms, Period, Region
 
-from .utils import get_variable_efficiency
+from .utils import get_variable_efficiency, linear_sum
 
 logger = getLogger(name=__name__)
 
@@ -92,6 +92,146 @@ def demand_constraint_error_check(supply: Any, r: Region, p: Period, dem: Commod
         raise Exception(msg.format(dem, r, p))
 
 
+def commodity_balance_terms(
+    model: TemoaModel, r: Region, p: Period, s: Season, d: TimeOfDay, c: Commodity
+) -> tuple[LinearTerms, LinearTerms]:
+    """
+    The terms of the production and of the consumption of commodity c in a time slice, as
+    balanced by the commodity_balance_constraint.
+    """
+    produced: LinearTerms = []
+    consumed: LinearTerms = []
+    segment = value(model.segment_fraction[s, d])
+
+    if (r, p, c) in model.commodity_down_stream_process:
+        # Only storage techs have a flow in variable
+        # For other techs, it would be redundant as in = out / eff
+        consumed.extend(
+            (model.v_flow_in[r, p, s, d, c, s_t, s_v, s_o], 1.0)
+            for s_t, s_v in model.commodity_down_stream_process[r, p, c]
+            if s_t in model.tech_storage
+            for s_o in model.process_outputs_by_input[r, p, s_t, s_v, c]
+        )
+
+        # Into flows
+        consumed.extend(
+            (
+                model.v_flow_out[r, p, s, d, c, s_t, s_v, s_o],
+                1 / get_variable_efficiency(model, r, p, s, d, c, s_t, s_v, s_o),
+            )
+            for s_t, s_v in model.commodity_down_stream_process[r, p, c]
+            if s_t not in model.tech_storage and s_t not in model.tech_annual
+            for s_o in model.process_outputs_by_input[r, p, s_t, s_v, c]
+        )
+
+        # Into annual flows
+        consumed.extend(
+            (
+                model.v_flow_out_annual[r, p, c, s_t, s_v, s_o],
+                (
+                    value(model.demand_specific_distribution[r, p, s, d, s_o])
+                    if s_o in model.commodity_demand
+                    else segment
+                )
+                / get_variable_efficiency(model, r, p, s, d, c, s_t, s_v, s_o),
+            )
+            for s_t, s_v in model.commodity_down_stream_process[r, p, c]
+            if s_t in model.tech_annual
+            for s_o in model.process_outputs_by_input[r, p, s_t, s_v, c]
+        )
+
+    if (r, p, c) in model.capacity_consumption_techs:
+        # Consumed by building capacity
+        # Assume evenly distributed over a year
+        consumed.extend(
+            (
+                model.v_new_capacity[r, s_t, p],
+                segment
+                * value(model.construction_input[r, c, s_t, p])
+                / value(model.period_length[p]),
+            )
+            for s_t in model.capacity_consumption_techs[r, p, c]
+        )
+
+    if (r, p, c) in model.commodity_up_stream_process:
+        # From flows including output from storage
+        produced.extend(
+            (model.v_flow_out[r, p, s, d, s_i, s_t, s_v, c], 1.0)
+            for s_t, s_v in model.commodity_up_stream_process[r, p, c]
+            if s_t not in model.tech_annual
+            for s_i in model.process_inputs_by_output[r, p, s_t, s_v, c]
+        )
+
+        # From annual flows
+        produced.extend(
+            (model.v_flow_out_annual[r, p, s_i, s_t, s_v, c], segment)
+            for s_t, s_v in model.commodity_up_stream_process[r, p, c]
+            if s_t in model.tech_annual
+            for s_i in model.process_inputs_by_output[r, p, s_t, s_v, c]
+        )
+
+        if c in model.commodity_flex:
+            # Wasted by flex flows
+            consumed.extend(
+                (model.v_flex[r, p, s, d, s_i, s_t, s_v, c], 1.0)
+                for s_t, s_v in model.commodity_up_stream_process[r, p, c]
+                if s_t not in model.tech_annual and s_t in model.tech_flex
+                for s_i in model.process_inputs_by_output[r, p, s_t, s_v, c]
+            )
+            # Wasted by annual flex flows
+            consumed.extend(
+                (model.v_flex_annual[r, p, s_i, s_t, s_v, c], segment)
+                for s_t, s_v in model.commodity_up_stream_process[r, p, c]
+                if s_t in model.tech_annual and s_t in model.tech_flex
+                for s_i in model.process_inputs_by_output[r, p, s_t, s_v, c]
+            )
+
+    if (r, p, c) in model.retirement_production_processes:
+        # Produced by retiring capacity
+        # Assume evenly distributed over a year
+        produced.extend(
+            (
+                model.v_annual_retirement[r, p, s_t, s_v],
+                segment * value(model.end_of_life_output[r, s_t, s_v, c]),
+            )
+            for s_t, s_v in model.retirement_production_processes[r, p, c]
+        )
+
+    # export of commodity c from region r to other regions
+    if (r, p, c) in model.export_regions:
+        for reg, s_t, s_v, s_o in model.export_regions[r, p, c]:
+            r_reg = cast('Region', r + '-' + reg)
+            efficiency = get_variable_efficiency(model, r_reg, p, s, d, c, s_t, s_v, s_o)
+            if s_t in model.tech_annual:
+                consumed.append(
+                    (model.v_flow_out_annual[r_reg, p, c, s_t, s_v, s_o], segment / efficiency)
+                )
+            else:
+                consumed.append(
+                    (model.v_flow_out[r_reg, p, s, d, c, s_t, s_v, s_o], 1 / efficiency)
+                )
+
+    # import of commodity c from other regions into region r
+    if (r, p, c) in model.import_regions:
+        for reg, s_t, s_v, s_i in model.import_regions[r, p, c]:
+            reg_r = reg + '-' + r
+            if s_t in model.tech_annual:
+                produced.append((model.v_flow_out_annual[reg_r, p, s_i, s_t, s_v, c], segment))
+            else:
+                produced.append((model.v_flow_out[reg_r, p, s, d, s_i, s_t, s_v, c], 1.0))
+
+    return produced, consumed
+
+
+def demand_terms(model: TemoaModel, r: Region, p: Period, dem: Commodity) -> LinearTerms:
+    """The terms of the annual supply of demand commodity dem, as met by the demand_constraint."""
+    return [
+        (model.v_flow_out_annual[r, p, s_i, s_t, s_v, dem], 1.0)
+        for s_t, s_v in model.commodity_up_stream_process[r, p, dem]
+        for s_i in model.process_inputs_by_output[r, p, s_t, s_v, dem]
+    ]
+
+
 def check_singleton_demands(model: TemoaModel) -> None:
     """
     Check for demand commodities that are only produced by a single
@@ -211,11 +351,7 @@ def demand_constraint(model: TemoaModel, r: Region, p: Period, dem: Commodity) -
     if (r, p, dem) in model.singleton_demands:
         return Constraint.Skip
 
-    supply_annual = sum(
-        model.v_flow_out_annual[r, p, s_i, s_t, s_v, dem]
-        for s_t, s_v in model.commodity_up_stream_process[r, p, dem]
-        for s_i in model.process_inputs_by_output[r, p, s_t, s_v, dem]
-    )
+    supply_annual = linear_sum(demand_terms(model, r, p, dem))
 
     demand_constraint_error_check(supply_annual, r, p, dem)
 
@@ -389,129 +525,9 @@ def commodity_balance_constraint(
 
     """
 
-    produced = 0
-    consumed = 0
-
-    if (r, p, c) in model.commodity_down_stream_process:
-        # Only storage techs have a flow in variable
-        # For other techs, it would be redundant as in = out / eff
-        consumed += sum(
-            model.v_flow_in[r, p, s, d, c, s_t, s_v, s_o]
-            for s_t, s_v in model.commodity_down_stream_process[r, p, c]
-            if s_t in model.tech_storage
-            for s_o in model.process_outputs_by_input[r, p, s_t, s_v, c]
-        )
-
-        # Into flows
-        consumed += sum(
-            model.v_flow_out[r, p, s, d, c, s_t, s_v, s_o]
-            / get_variable_efficiency(model, r, p, s, d, c, s_t, s_v, s_o)
-            for s_t, s_v in model.commodity_down_stream_process[r, p, c]
-            if s_t not in model.tech_storage and s_t not in model.tech_annual
-            for s_o in model.process_outputs_by_input[r, p, s_t, s_v, c]
-        )
-
-        # Into annual flows
-        consumed += sum(
-            (
-                value(model.demand_specific_distribution[r, p, s, d, s_o])
-                if s_o in model.commodity_demand
-                else value(model.segment_fraction[s, d])
-            )
-            * model.v_flow_out_annual[r, p, c, s_t, s_v, s_o]
-            / get_variable_efficiency(model, r, p, s, d, c, s_t, s_v, s_o)
-            for s_t, s_v in model.commodity_down_stream_process[r, p, c]
-            if s_t in model.tech_annual
-            for s_o in model.process_outputs_by_input[r, p, s_t, s_v, c]
-        )
-
-    if (r, p, c) in model.capacity_consumption_techs:
-        # Consumed by building capacity
-        # Assume evenly distributed over a year
-        consumed += (
-            value(model.segment_fraction[s, d])
-            * sum(
-                value(model.construction_input[r, c, s_t, p]) * model.v_new_capacity[r, s_t, p]
-                for s_t in model.capacity_consumption_techs[r, p, c]
-            )
-            / model.period_length[p]
-        )
-
-    if (r, p, c) in model.commodity_up_stream_process:
-        # From flows including output from storage
-        produced += sum(
-            model.v_flow_out[r, p, s, d, s_i, s_t, s_v, c]
-            for s_t, s_v in model.commodity_up_stream_process[r, p, c]
-            if s_t not in model.tech_annual
-            for s_i in model.process_inputs_by_output[r, p, s_t, s_v, c]
-        )
-
-        # From annual flows
-        produced += value(model.segment_fraction[s, d]) * sum(
-            model.v_flow_out_annual[r, p, s_i, s_t, s_v, c]
-            for s_t, s_v in model.commodity_up_stream_process[r, p, c]
-            if s_t in model.tech_annual
-            for s_i in model.process_inputs_by_output[r, p, s_t, s_v, c]
-        )
-
-        if c in model.commodity_flex:
-            # Wasted by flex flows
-            consumed += sum(
-                model.v_flex[r, p, s, d, s_i, s_t, s_v, c]
-                for s_t, s_v in model.commodity_up_stream_process[r, p, c]
-                if s_t not in model.tech_annual and s_t in model.tech_flex
-                for s_i in model.process_inputs_by_output[r, p, s_t, s_v, c]
-            )
-            # Wasted by annual flex flows
-            consumed += value(model.segment_fraction[s, d]) * sum(
-                model.v_flex_annual[r, p, s_i, s_t, s_v, c]
-                for s_t, s_v in model.commodity_up_stream_process[r, p, c]
-                if s_t in model.tech_annual and s_t in model.tech_flex
-                for s_i in model.process_inputs_by_output[r, p, s_t, s_v, c]
-            )
-
-    if (r, p, c) in model.retirement_production_processes:
-        # Produced by retiring capacity
-        # Assume evenly distributed over a year
-        produced += value(model.segment_fraction[s, d]) * sum(
-            value(model.end_of_life_output[r, s_t, s_v, c])
-            * model.v_annual_retirement[r, p, s_t, s_v]
-            for s_t, s_v in model.retirement_production_processes[r, p, c]
-        )
-
-    # export of commodity c from region r to other regions
-    if (r, p, c) in model.export_regions:
-        consumed += sum(
-            model.v_flow_out[r + '-' + reg, p, s, d, c, s_t, s_v, S_o]
-            / get_variable_efficiency(
-                model, cast('Region', r + '-' + reg), p, s, d, c, s_t, s_v, S_o
-            )
-            for reg, s_t, s_v, S_o in model.export_regions[r, p, c]
-            if s_t not in model.tech_annual
-        )
-        consumed += sum(
-            value(model.segment_fraction[s, d])
-            * model.v_flow_out_annual[r + '-' + reg, p, c, s_t, s_v, S_o]
-            / get_variable_efficiency(
-                model, cast('Region', r + '-' + reg), p, s, d, c, s_t, s_v, S_o
-            )
-            for reg, s_t, s_v, S_o in model.export_regions[r, p, c]
-            if s_t in model.tech_annual
-        )
-
-    # import of commodity c from other regions into region r
-    if (r, p, c) in model.import_regions:
-        produced += sum(
-            model.v_flow_out[reg + '-' + r, p, s, d, s_i, s_t, s_v, c]
-            for reg, s_t, s_v, s_i in model.import_regions[r, p, c]
-            if s_t not in model.tech_annual
-        )
-        produced += sum(
-            value(model.segment_fraction[s, d])
-            * model.v_flow_out_annual[reg + '-' + r, p, s_i, s_t, s_v, c]
-            for reg, s_t, s_v, s_i in model.import_regions[r, p, c]
-            if s_t in model.tech_annual
-        )
+    produced_terms, consumed_terms = commodity_balance_terms(model, r, p, s, d, c)
+    produced = linear_sum(produced_terms)
+    consumed = linear_sum(consumed_terms)
 
     commodity_balance_constraint_error_check(
         produced,
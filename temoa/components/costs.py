@@ -23,10 +23,13 @@ if TYPE_CHECKING:
     from pyomo.core.base.component import ComponentData
 
     from temoa.core.model import TemoaModel
+    from temoa.types import LinearTerms
     from temoa.types.core_types import Period, Region, Technology, Vintage
 
 from logging import getLogger
 
+from .utils import linear_sum
+
 logger = getLogger(name=__name__)
 
 
@@ -305,92 +308,101 @@ def fixed_or_variable_cost(
 # ============================================================================
 
 
-def period_cost_rule(model: TemoaModel, p: int) -> float | Expression:
+def period_cost_terms(model: TemoaModel, p: int) -> LinearTerms:
+    """
+    The terms of the discounted costs incurred in period p, which sum to the period cost
+    (see period_cost_rule).  Their coefficients are the cost functions evaluated at a unit
+    capacity or flow.
+    """
     p_0 = min(model.time_optimize)
     p_e = model.time_future.last()  # End point of modeled horizon
     global_discount_rate = value(model.global_discount_rate)
+    period_length = value(model.period_length[p])
     # MPL = M.ModelProcessLife
 
     if value(model.myopic_discounting_year) != 0:
         p_0 = value(model.myopic_discounting_year)
 
-    loan_costs = quicksum(
-        loan_cost(
-            model.v_new_capacity[r, S_t, S_v],
-            value(model.cost_invest[r, S_t, S_v]),
-            value(model.loan_annualize[r, S_t, S_v]),
-            value(model.loan_lifetime_process[r, S_t, S_v]),
-            value(model.lifetime_process[r, S_t, S_v]),
-            p_0,
-            p_e,
-            global_discount_rate,
-            vintage=S_v,
-        )
-        for r, S_t, S_v in model.cost_invest.sparse_keys()
-        if S_v == p and not model.is_survival_curve_process[r, S_t, S_v]
-    )
-    loan_costs += quicksum(
-        loan_cost_survival_curve(
-            model,
-            r,
-            S_t,
-            S_v,
-            model.v_new_capacity[r, S_t, S_v],
-            value(model.cost_invest[r, S_t, S_v]),
-            value(model.loan_annualize[r, S_t, S_v]),
-            value(model.loan_lifetime_process[r, S_t, S_v]),
-            p_0,
-            p_e,
-            global_discount_rate,
-        )
-        for r, S_t, S_v in model.cost_invest.sparse_keys()
-        if S_v == p and model.is_survival_curve_process[r, S_t, S_v]
-    )
-
-    fixed_costs = quicksum(
-        fixed_or_variable_cost(
-            model.v_capacity[r, p, S_t, S_v],
-            value(model.cost_fixed[r, p, S_t, S_v]),
-            value(model.period_length[p]),
-            global_discount_rate,
-            p_0,
-            p=p,
-        )
-        for r, S_p, S_t, S_v in model.cost_fixed.sparse_keys()
-        if S_p == p
-    )
-
-    variable_costs = quicksum(
-        fixed_or_variable_cost(
-            model.v_flow_out[r, p, s, d, S_i, S_t, S_v, S_o],
-            value(model.cost_variable[r, p, S_t, S_v]),
-            value(model.period_length[p]),
-            global_discount_rate,
-            p_0,
-            p,
+    terms: LinearTerms = []
+
+    for r, s_t, s_v in model.cost_invest.sparse_keys():
+        if s_v != p:
+            continue
+        if model.is_survival_curve_process[r, s_t, s_v]:
+            unit_loan_cost = value(
+                loan_cost_survival_curve(
+                    model,
+                    r,
+                    s_t,
+                    s_v,
+                    1.0,
+                    value(model.cost_invest[r, s_t, s_v]),
+                    value(model.loan_annualize[r, s_t, s_v]),
+                    value(model.loan_lifetime_process[r, s_t, s_v]),
+                    p_0,
+                    p_e,
+                    global_discount_rate,
+                )
+            )
+        else:
+            unit_loan_cost = value(
+                loan_cost(
+                    1.0,
+                    value(model.cost_invest[r, s_t, s_v]),
+                    value(model.loan_annualize[r, s_t, s_v]),
+                    value(model.loan_lifetime_process[r, s_t, s_v]),
+                    value(model.lifetime_process[r, s_t, s_v]),
+                    p_0,
+                    p_e,
+                    global_discount_rate,
+                    vintage=s_v,
+                )
+            )
+        terms.append((model.v_new_capacity[r, s_t, s_v], unit_loan_cost))
+
+    terms.extend(
+        (
+            model.v_capacity[r, p, s_t, s_v],
+            value(
+                fixed_or_variable_cost(
+                    1.0,
+                    value(model.cost_fixed[r, p, s_t, s_v]),
+                    period_length,
+                    global_discount_rate,
+                    p_0,
+                    p=p,
+                )
+            ),
         )
-        for r, S_p, S_t, S_v in model.cost_variable.sparse_keys()
-        if S_p == p and S_t not in model.tech_annual
-        for S_i in model.process_inputs[r, S_p, S_t, S_v]
-        for S_o in model.process_outputs_by_input[r, S_p, S_t, S_v, S_i]
-        for s in model.time_season
-        for d in model.time_of_day
+        for r, s_p, s_t, s_v in model.cost_fixed.sparse_keys()
+        if s_p == p
     )
 
-    variable_costs_annual = quicksum(
-        fixed_or_variable_cost(
-            model.v_flow_out_annual[r, p, S_i, S_t, S_v, S_o],
-            value(model.cost_variable[r, p, S_t, S_v]),
-            value(model.period_length[p]),
-            global_discount_rate,
-            p_0,
-            p,
+    for r, s_p, s_t, s_v in model.cost_variable.sparse_keys():
+        if s_p != p:
+            continue
+        unit_variable_cost = value(
+            fixed_or_variable_cost(
+                1.0,
+                value(model.cost_variable[r, p, s_t, s_v]),
+                period_length,
+                global_discount_rate,
+                p_0,
+                p,
+            )
         )
-        for r, S_p, S_t, S_v in model.cost_variable.sparse_keys()
-        if S_p == p and S_t in model.tech_annual
-        for S_i in model.process_inputs[r, S_p, S_t, S_v]
-        for S_o in model.process_outputs_by_input[r, S_p, S_t, S_v, S_i]
-    )
+        for s_i in model.process_inputs[r, s_p, s_t, s_v]:
+            for s_o in model.process_outputs_by_input[r, s_p, s_t, s_v, s_i]:
+                if s_t in model.tech_annual:
+                    terms.append(
+                        (model.v_flow_out_annual[r, p, s_i, s_t, s_v, s_o], unit_variable_cost)
+                    )
+                else:
+                    terms.extend(
+                        (model.v_flow_out[r, p, s, d, s_i, s_t, s_v, s_o], unit_variable_cost)
+                        for s in model.time_season
+                        for d in model.time_of_day
+                    )
 
     # The emissions costs occur over the five possible emission sources.
     # to do any/all of them we need 2 baseline sets:  The regular and annual sets
@@ -406,106 +418,84 @@ def period_cost_rule(model: TemoaModel, p: int) -> float | Expression:
     # either
     # Earlier versions of this code had accounting for flex & curtailment that have been removed.
 
-    base = [
-        (r, p, e, i, t, v, o)
-        for (r, e, i, t, v, o) in model.emission_activity.sparse_keys()
-        if (r, p, e) in model.cost_emission  # tightest filter first
-        and (r, p, t, v) in model.process_inputs
-    ]
-
-    # then expand the base for the normal (season/tod) set and annual separately:
-    normal = [
-        (r, p, e, s, d, i, t, v, o)
-        for (r, p, e, i, t, v, o) in base
-        for s in model.time_season
-        for d in model.time_of_day
-        if t not in model.tech_annual
-    ]
-
-    annual = [(r, p, e, i, t, v, o) for (r, p, e, i, t, v, o) in base if t in model.tech_annual]
-
-    # 1. variable emissions
-    var_emissions = quicksum(
-        fixed_or_variable_cost(
-            cap_or_flow=model.v_flow_out[r, p, s, d, i, t, v, o]
-            * value(model.emission_activity[r, e, i, t, v, o]),
-            cost_factor=value(model.cost_emission[r, p, e]),
-            cost_years=value(model.period_length[p]),
-            global_discount_rate=global_discount_rate,
-            p_0=p_0,
-            p=p,
-        )
-        for (r, p, e, s, d, i, t, v, o) in normal
-    )
-
-    # 2. flex emissions -- removed (double counting, flex wastes are SUBTRACTIVE from flowout)
-
-    # 3. curtailment emissions -- removed (curtailment is no-flow, for accounting only, so no
-    # emissions)
-
-    # 4. annual emissions
-    var_annual_emissions = quicksum(
-        fixed_or_variable_cost(
-            cap_or_flow=model.v_flow_out_annual[r, p, i, t, v, o]
-            * value(model.emission_activity[r, e, i, t, v, o]),
-            cost_factor=value(model.cost_emission[r, p, e]),
-            cost_years=value(model.period_length[p]),
-            global_discount_rate=global_discount_rate,
-            p_0=p_0,
-            p=p,
+    # the emission sources are grouped by (r, p, e), so only the taxed emissions in p are visited
+    taxed = [(r, s_p, e) for (r, s_p, e) in model.cost_emission.sparse_keys() if s_p == p]
+
+    for r, s_p, e in taxed:
+        cost_emission = value(model.cost_emission[r, p, e])
+        for i, t, v, o in model.emission_activity_processes.get((r, s_p, e), ()):
+            unit_emission_cost = value(
+                fixed_or_variable_cost(
+                    cap_or_flow=value(model.emission_activity[r, e, i, t, v, o]),
+                    cost_factor=cost_emission,
+                    cost_years=period_length,
+                    global_discount_rate=global_discount_rate,
+                    p_0=p_0,
+                    p=p,
+                )
+            )
+            if t not in model.tech_annual:
+                # 1. variable emissions
+                terms.extend(
+                    (model.v_flow_out[r, p, s, d, i, t, v, o], unit_emission_cost)
+                    for s in model.time_season
+                    for d in model.time_of_day
+                )
+            elif t not in model.tech_flex:
+                # 4. annual emissions
+                terms.append((model.v_flow_out_annual[r, p, i, t, v, o], unit_emission_cost))
+
+        # 2. flex emissions -- removed (double counting, flex wastes are SUBTRACTIVE from flowout)
+
+        # 3. curtailment emissions -- removed (curtailment is no-flow, for accounting only, so no
+        # emissions)
+
+        # 5. flex annual emissions -- removed (double counting, flex wastes are SUBTRACTIVE from
+        # flowout)
+
+        # 6. embodied - treated as a fixed cost distributed over the deployment period (vintage)
+        terms.extend(
+            (
+                model.v_new_capacity[r, t, v],
+                value(
+                    fixed_or_variable_cost(
+                        cap_or_flow=value(model.emission_embodied[r, e, t, v]) / period_length,
+                        cost_factor=cost_emission,
+                        cost_years=value(model.period_length[v]),
+                        # We assume the embodied emissions are emitted in the same year as the
+                        # capacity is installed.
+                        global_discount_rate=global_discount_rate,
+                        p_0=p_0,
+                        p=p,
+                    )
+                ),
+            )
+            for (t, v) in model.emission_embodied_processes.get((r, s_p, e), ())
         )
-        for (r, p, e, i, t, v, o) in annual
-        if t not in model.tech_flex
-    )
 
-    # 5. flex annual emissions -- removed (double counting, flex wastes are SUBTRACTIVE from
-    # flowout)
-
-    # 6. embodied - treated as a fixed cost distributed over the deployment period (vintage)
-    embodied_emissions = quicksum(
-        fixed_or_variable_cost(
-            cap_or_flow=model.v_new_capacity[r, t, v]
-            * value(model.emission_embodied[r, e, t, v])
-            / value(model.period_length[p]),
-            cost_factor=value(model.cost_emission[r, p, e]),
-            cost_years=value(model.period_length[v]),
-            # We assume the embodied emissions are emitted in the same year as the capacity is
-            # installed.
-            global_discount_rate=global_discount_rate,
-            p_0=p_0,
-            p=p,
+        # 6. endoflife - treated as a fixed cost distributed over the retirement period
+        terms.extend(
+            (
+                model.v_annual_retirement[r, p, t, v],
+                value(
+                    fixed_or_variable_cost(
+                        cap_or_flow=value(model.emission_end_of_life[r, e, t, v]),
+                        cost_factor=cost_emission,
+                        cost_years=period_length,
+                        global_discount_rate=global_discount_rate,
+                        p_0=p_0,
+                        p=p,
+                    )
+                ),
+            )
+            for (t, v) in model.emission_end_of_life_processes.get((r, s_p, e), ())
         )
-        for (r, e, t, v) in model.emission_embodied.sparse_keys()
-        if (r, p, e) in model.cost_emission
-        if v == p
-    )
 
-    # 6. endoflife - treated as a fixed cost distributed over the retirement period
-    endoflife_emissions = quicksum(
-        fixed_or_variable_cost(
-            cap_or_flow=model.v_annual_retirement[r, p, t, v]
-            * value(model.emission_end_of_life[r, e, t, v]),
-            cost_factor=value(model.cost_emission[r, p, e]),
-            cost_years=value(model.period_length[p]),
-            # We assume the embodied emissions are emitted in the same year as the capacity is
-            # installed.
-            global_discount_rate=global_discount_rate,
-            p_0=p_0,
-            p=p,
-        )
-        for (r, e, t, v) in model.emission_end_of_life.sparse_keys()
-        if (r, p, e) in model.cost_emission
-        if (r, t, v) in model.retirement_periods and p in model.retirement_periods[r, t, v]
-    )
+    return terms
 
-    period_emission_cost = (
-        var_emissions + var_annual_emissions + embodied_emissions + endoflife_emissions
-    )
 
-    period_costs = (
-        loan_costs + fixed_costs + variable_costs + variable_costs_annual + period_emission_cost
-    )
-    return period_costs
+def period_cost_rule(model: TemoaModel, p: int) -> float | Expression:
+    return linear_sum(period_cost_terms(model, p))
 
 
 # ---------------------------------------------------------------
@@ -30,6 +30,36 @@ if TYPE_CHECKING:
     )
 
 
+# ============================================================================
+# SPARSE INDEX CREATION
+# ============================================================================
+
+
+def create_emission_indices(model: TemoaModel) -> None:
+    """
+    Group the emission sources by (region, period, emission) so that the emission limit and
+    emission cost rules only visit their own terms instead of scanning the full emission tables.
+
+    Populates:
+        - M.emission_activity_processes: {(r, p, e): [(i, t, v, o)]} for processes active in p
+        - M.emission_embodied_processes: {(r, p, e): [(t, v)]} for new capacity of vintage v=p
+        - M.emission_end_of_life_processes: {(r, p, e): [(t, v)]} for processes that may retire
+          in p
+    """
+    for r, e, i, t, v, o in model.emission_activity.sparse_keys():
+        for p in model.process_periods.get((r, t, v), ()):
+            # emission_activity is not indexed by p, so make sure (r, p, t, v) combos are valid
+            if (r, p, t, v) in model.process_inputs:
+                model.emission_activity_processes.setdefault((r, p, e), []).append((i, t, v, o))
+
+    for r, e, t, v in model.emission_embodied.sparse_keys():
+        model.emission_embodied_processes.setdefault((r, v, e), []).append((t, v))
+
+    for r, e, t, v in model.emission_end_of_life.sparse_keys():
+        for p in model.retirement_periods.get((r, t, v), ()):
+            model.emission_end_of_life_processes.setdefault((r, p, e), []).append((t, v))
+
+
 # ============================================================================
 # PYOMO INDEX SET FUNCTIONS
 # ============================================================================
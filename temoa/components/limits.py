@@ -894,10 +894,8 @@ def limit_emission_constraint(
         model.v_flow_out[reg, p, S_s, S_d, S_i, S_t, S_v, S_o]
         * value(model.emission_activity[reg, e, S_i, S_t, S_v, S_o])
         for reg in regions
-        for tmp_r, tmp_e, S_i, S_t, S_v, S_o in model.emission_activity.sparse_keys()
-        if tmp_e == e and tmp_r == reg and S_t not in model.tech_annual
-        # EmissionsActivity not indexed by p, so make sure (r,p,t,v) combos valid
-        if (reg, p, S_t, S_v) in model.process_inputs
+        for S_i, S_t, S_v, S_o in model.emission_activity_processes.get((reg, p, e), ())
+        if S_t not in model.tech_annual
         for S_s in model.time_season
         for S_d in model.time_of_day
     )
@@ -906,10 +904,8 @@ def limit_emission_constraint(
         model.v_flow_out_annual[reg, p, S_i, S_t, S_v, S_o]
         * value(model.emission_activity[reg, e, S_i, S_t, S_v, S_o])
         for reg in regions
-        for tmp_r, tmp_e, S_i, S_t, S_v, S_o in model.emission_activity.sparse_keys()
-        if tmp_e == e and tmp_r == reg and S_t in model.tech_annual
-        # EmissionsActivity not indexed by p, so make sure (r,p,t,v) combos valid
-        if (reg, p, S_t, S_v) in model.process_inputs
+        for S_i, S_t, S_v, S_o in model.emission_activity_processes.get((reg, p, e), ())
+        if S_t in model.tech_annual
     )
 
     embodied_emissions = quicksum(
@@ -917,16 +913,13 @@ def limit_emission_constraint(
         * value(model.emission_embodied[reg, e, t, v])
         / value(model.period_length[v])
         for reg in regions
-        for (S_r, S_e, t, v) in model.emission_embodied.sparse_keys()
-        if v == p and S_r == reg and S_e == e
+        for t, v in model.emission_embodied_processes.get((reg, p, e), ())
     )
 
     retirement_emissions = quicksum(
         model.v_annual_retirement[reg, p, t, v] * value(model.emission_end_of_life[reg, e, t, v])
         for reg in regions
-        for (S_r, S_e, t, v) in model.emission_end_of_life.sparse_keys()
-        if (reg, t, v) in model.retirement_periods and p in model.retirement_periods[reg, t, v]
-        if S_r == reg and S_e == e
+        for t, v in model.emission_end_of_life_processes.get((reg, p, e), ())
     )
 
     lhs = (
@@ -13,7 +13,7 @@ of technologies across time slices, including:
 from __future__ import annotations
 
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from pyomo.environ import Constraint, value
 
@@ -202,6 +202,9 @@ def create_operational_vintage_sets(model: TemoaModel) -> None:
           M.ramp_up_vintages, M.ramp_down_vintages: Dictionaries mapping (r, p, t)
           to a set of vintages `v`.
         - M.process_reserve_periods: Dictionary mapping (r, p) to a set of (t, v) tuples.
+        - M.reserve_exchange_imports, M.reserve_exchange_exports: Dictionaries mapping
+          (r, p) to the exchange regions "r1-r2" that are reserve providers in p, importing
+          into (r2 == r) or exporting from (r1 == r) region r.
         - M.is_seasonal_storage: A boolean lookup for seasonal storage technologies.
     """
     logger.debug('Creating vintage sets for operational constraints.')
@@ -223,6 +226,15 @@ def create_operational_vintage_sets(model: TemoaModel) -> None:
             if t in model.tech_reserve:
                 model.process_reserve_periods.setdefault(key_rp, set()).add((t, v))
 
+    # Exchange reserve providers by the regions they connect, so the reserve margin rules do not
+    # need to scan all of M.regional_indices for each constraint
+    for r1r2, p in sorted(model.process_reserve_periods):
+        if '-' not in r1r2:
+            continue
+        r1, r2 = (cast('Region', reg) for reg in r1r2.split('-'))
+        model.reserve_exchange_exports.setdefault((r1, p), []).append(r1r2)
+        model.reserve_exchange_imports.setdefault((r2, p), []).append(r1r2)
+
     # A dictionary of whether a storage tech is seasonal, just to speed things up
     for t in model.tech_storage:
         model.is_seasonal_storage[t] = t in model.tech_seasonal_storage
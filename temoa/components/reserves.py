@@ -134,39 +134,28 @@ def reserve_margin_dynamic(
 
     # First, determine the amount of firm capacity each exchange tech
     # contributes.
-    for r1r2 in model.regional_indices:
-        if '-' not in r1r2:
-            continue
-        if (
-            r1r2,
-            p,
-        ) not in model.process_reserve_periods:  # ensure r1r2 is a valid reserve provider in p
-            continue
-        r1, r2 = r1r2.split('-')
-
-        # Only consider exchange technologies connecting to this region
-        if r2 == r:
-            # Add the firm capacity commitment TO this region
-            # (this region was guaranteed an import of power)
-            available += sum(
-                model.v_capacity[r1r2, p, t, v]
-                * value(model.reserve_capacity_derate[r1r2, s, t, v])
-                * get_capacity_factor(model, r1r2, s, d, t, v)
-                * value(model.capacity_to_activity[r1r2, t])
-                * value(model.segment_fraction[s, d])
-                for (t, v) in model.process_reserve_periods[r1r2, p]
-            )
-        elif r1 == r:
-            # Subtract the firm capacity commitment FROM this region
-            # (this region guaranteed an export of power)
-            available -= sum(
-                model.v_capacity[r1r2, p, t, v]
-                * value(model.reserve_capacity_derate[r1r2, s, t, v])
-                * get_capacity_factor(model, r1r2, s, d, t, v)
-                * value(model.capacity_to_activity[r1r2, t])
-                * value(model.segment_fraction[s, d])
-                for (t, v) in model.process_reserve_periods[r1r2, p]
-            )
+    # Add the firm capacity commitment TO this region
+    # (this region was guaranteed an import of power)
+    available += sum(
+        model.v_capacity[r1r2, p, t, v]
+        * value(model.reserve_capacity_derate[r1r2, s, t, v])
+        * get_capacity_factor(model, r1r2, s, d, t, v)
+        * value(model.capacity_to_activity[r1r2, t])
+        * value(model.segment_fraction[s, d])
+        for r1r2 in model.reserve_exchange_imports.get((r, p), ())
+        for (t, v) in model.process_reserve_periods[r1r2, p]
+    )
+    # Subtract the firm capacity commitment FROM this region
+    # (this region guaranteed an export of power)
+    available -= sum(
+        model.v_capacity[r1r2, p, t, v]
+        * value(model.reserve_capacity_derate[r1r2, s, t, v])
+        * get_capacity_factor(model, r1r2, s, d, t, v)
+        * value(model.capacity_to_activity[r1r2, t])
+        * value(model.segment_fraction[s, d])
+        for r1r2 in model.reserve_exchange_exports.get((r, p), ())
+        for (t, v) in model.process_reserve_periods[r1r2, p]
+    )
 
     return available
 
@@ -241,37 +230,26 @@ def reserve_margin_static(
 
     # First, determine the amount of firm capacity each exchange tech
     # contributes.
-    for r1r2 in model.regional_indices:
-        if '-' not in r1r2:
-            continue
-        if (
-            r1r2,
-            p,
-        ) not in model.process_reserve_periods:  # ensure r1r2 is a valid reserve provider in p
-            continue
-        r1, r2 = r1r2.split('-')
-
-        # Only consider exchange technologies connecting to this region
-        if r2 == r:
-            # Add the firm capacity commitment TO this region
-            # (this region was guaranteed an import of power)
-            available += sum(
-                value(model.capacity_credit[r1r2, p, t, v])
-                * model.v_capacity[r1r2, p, t, v]
-                * value(model.capacity_to_activity[r1r2, t])
-                * value(model.segment_fraction[s, d])
-                for (t, v) in model.process_reserve_periods[r1r2, p]
-            )
-        elif r1 == r:
-            # Subtract the firm capacity commitment FROM this region
-            # (this region guaranteed an export of power)
-            available -= sum(
-                value(model.capacity_credit[r1r2, p, t, v])
-                * model.v_capacity[r1r2, p, t, v]
-                * value(model.capacity_to_activity[r1r2, t])
-                * value(model.segment_fraction[s, d])
-                for (t, v) in model.process_reserve_periods[r1r2, p]
-            )
+    # Add the firm capacity commitment TO this region
+    # (this region was guaranteed an import of power)
+    available += sum(
+        value(model.capacity_credit[r1r2, p, t, v])
+        * model.v_capacity[r1r2, p, t, v]
+        * value(model.capacity_to_activity[r1r2, t])
+        * value(model.segment_fraction[s, d])
+        for r1r2 in model.reserve_exchange_imports.get((r, p), ())
+        for (t, v) in model.process_reserve_periods[r1r2, p]
+    )
+    # Subtract the firm capacity commitment FROM this region
+    # (this region guaranteed an export of power)
+    available -= sum(
+        value(model.capacity_credit[r1r2, p, t, v])
+        * model.v_capacity[r1r2, p, t, v]
+        * value(model.capacity_to_activity[r1r2, t])
+        * value(model.segment_fraction[s, d])
+        for r1r2 in model.reserve_exchange_exports.get((r, p), ())
+        for (t, v) in model.process_reserve_periods[r1r2, p]
+    )
 
     return available
 
@@ -337,34 +315,25 @@ def reserve_margin_constraint(
 
     # Electricity imports and exports via exchange techs are accounted
     # for below:
-    for r1r2 in model.regional_indices:  # ensure the region is of the form r1-r2
-        if '-' not in r1r2:
-            continue
-        if (
-            r1r2,
-            p,
-        ) not in model.process_reserve_periods:  # ensure r1r2 is a valid reserve provider in p
-            continue
-        r1, r2 = r1r2.split('-')
-        # First, determine the exports, and subtract this value from the
-        # total generation.
-        if r1 == r:
-            total_generation -= sum(
-                model.v_flow_out[r1r2, p, s, d, S_i, t, S_v, S_o]
-                / get_variable_efficiency(model, r1r2, p, s, d, S_i, t, S_v, S_o)
-                for (t, S_v) in model.process_reserve_periods[r1r2, p]
-                for S_i in model.process_inputs[r1r2, p, t, S_v]
-                for S_o in model.process_outputs_by_input[r1r2, p, t, S_v, S_i]
-            )
-        # Second, determine the imports, and add this value from the
-        # total generation.
-        elif r2 == r:
-            total_generation += sum(
-                model.v_flow_out[r1r2, p, s, d, S_i, t, S_v, S_o]
-                for (t, S_v) in model.process_reserve_periods[r1r2, p]
-                for S_i in model.process_inputs[r1r2, p, t, S_v]
-                for S_o in model.process_outputs_by_input[r1r2, p, t, S_v, S_i]
-            )
+    # First, determine the exports, and subtract this value from the
+    # total generation.
+    total_generation -= sum(
+        model.v_flow_out[r1r2, p, s, d, S_i, t, S_v, S_o]
+        / get_variable_efficiency(model, r1r2, p, s, d, S_i, t, S_v, S_o)
+        for r1r2 in model.reserve_exchange_exports.get((r, p), ())
+        for (t, S_v) in model.process_reserve_periods[r1r2, p]
+        for S_i in model.process_inputs[r1r2, p, t, S_v]
+        for S_o in model.process_outputs_by_input[r1r2, p, t, S_v, S_i]
+    )
+    # Second, determine the imports, and add this value from the
+    # total generation.
+    total_generation += sum(
+        model.v_flow_out[r1r2, p, s, d, S_i, t, S_v, S_o]
+        for r1r2 in model.reserve_exchange_imports.get((r, p), ())
+        for (t, S_v) in model.process_reserve_periods[r1r2, p]
+        for S_i in model.process_inputs[r1r2, p, t, S_v]
+        for S_o in model.process_outputs_by_input[r1r2, p, t, S_v, S_i]
+    )
 
     requirement = total_generation * (1 + value(model.planning_reserve_margin[r]))
     return available >= requirement
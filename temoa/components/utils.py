@@ -12,7 +12,7 @@ from enum import StrEnum
 from logging import getLogger
 from typing import TYPE_CHECKING
 
-from pyomo.environ import value
+from pyomo.environ import quicksum, value
 
 if TYPE_CHECKING:
     from pyomo.core import Expression
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from temoa.types import (
         Commodity,
         ExprLike,
+        LinearTerms,
         Period,
         Region,
         Season,
@@ -50,6 +51,15 @@ def operator_expression(lhs: Expression, operator: Operator, rhs: Expression) ->
     raise ValueError(f'Invalid operator: {operator!r}')
 
 
+def linear_sum(terms: LinearTerms) -> Expression:
+    """The Pyomo expression of linear terms, which is the int 0 if there are none."""
+    return quicksum(coef * var for var, coef in terms)
+
+
+def negated(terms: LinearTerms) -> LinearTerms:
+    return [(var, -coef) for var, coef in terms]
+
+
 def get_variable_efficiency(
     model: TemoaModel,
     r: Region,
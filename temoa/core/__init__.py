@@ -2,12 +2,33 @@
 TEMOA Core API
 
 This module provides the main public API for the TEMOA energy systems modeling library.
+The names are imported on first access, so that using the configuration alone does not import
+the model (and Pyomo).
 """
 
-from .config import TemoaConfig
-from .model import TemoaModel
-from .modes import TemoaMode
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import TemoaConfig
+    from .model import TemoaModel
+    from .modes import TemoaMode
 
 __version__ = '4.0.0a1'
 
+_LAZY_IMPORTS = {
+    'TemoaModel': '.model',
+    'TemoaConfig': '.config',
+    'TemoaMode': '.modes',
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value  # later lookups skip this hook
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 __all__ = ['TemoaModel', 'TemoaConfig', 'TemoaMode', '__version__']
@@ -44,9 +44,14 @@ class TemoaConfig:
         solver_name: str,
         neos: bool = False,
         save_excel: bool = False,
+        spreadsheet_format: str = 'xlsx',
+        spreadsheet_workers: int = 1,
         save_duals: bool = False,
         save_storage_levels: bool = False,
         save_lp_file: bool = False,
+        release_constraints: bool = False,
+        bulk_validation: bool = False,
+        direct_build: bool = False,
         time_sequencing: str | None = None,
         days_per_period: int = 365,
         reserve_margin: str | None = None,
@@ -66,6 +71,10 @@ class TemoaConfig:
         graphviz_output: bool = False,
         cycle_count_limit: int = 100,
         cycle_length_limit: int = 1,
+        source_trace_workers: int = 1,
+        source_trace_cache: bool = False,
+        build_cache_dir: Path | str | None = None,
+        profile_build: bool = False,
         output_threshold_capacity: float | None = None,
         output_threshold_activity: float | None = None,
         output_threshold_emission: float | None = None,
@@ -130,9 +139,31 @@ class TemoaConfig:
         self.solver_name = solver_name
 
         self.save_excel = save_excel
+        if spreadsheet_format not in ('xlsx', 'csv', 'parquet'):
+            raise ValueError('spreadsheet_format must be one of xlsx, csv or parquet')
+        self.spreadsheet_format = spreadsheet_format
+        if not isinstance(spreadsheet_workers, int) or spreadsheet_workers < 1:
+            raise ValueError('spreadsheet_workers must be an integer >= 1')
+        self.spreadsheet_workers = spreadsheet_workers
         self.save_duals = save_duals
         self.save_storage_levels = save_storage_levels
         self.save_lp_file = save_lp_file
+        self.release_constraints = release_constraints
+        self.bulk_validation = bulk_validation
+        # the core families are assembled directly only by the HiGHS hand-off of a perfect
+        # foresight run (see _internal.direct_build)
+        from temoa._internal.highs_direct import HIGHS_DIRECT
+
+        if direct_build and (
+            solver_name != HIGHS_DIRECT or self.scenario_mode != TemoaMode.PERFECT_FORESIGHT
+        ):
+            logger.warning(
+                'direct_build applies to perfect foresight runs with solver_name = "%s" and is '
+                'ignored for this run',
+                HIGHS_DIRECT,
+            )
+            direct_build = False
+        self.direct_build = direct_build
         self.time_sequencing = time_sequencing
         self.days_per_period = days_per_period
         self.reserve_margin = reserve_margin
@@ -204,6 +235,11 @@ class TemoaConfig:
         else:
             self.sqlite_cache_size = -512000
 
+        # drop and re-create the output table indexes around bulk result writes
+        self.sqlite_rebuild_output_indexes = bool(
+            self.sqlite_inputs.get('rebuild_output_indexes', False)
+        )
+
         # Cycle detection limits
         if not isinstance(cycle_count_limit, int) or cycle_count_limit < -1:
             raise ValueError('cycle_count_limit must be an integer >= -1')
@@ -212,6 +248,18 @@ class TemoaConfig:
         self.cycle_count_limit = cycle_count_limit
         self.cycle_length_limit = cycle_length_limit
 
+        if not isinstance(source_trace_workers, int) or source_trace_workers < 1:
+            raise ValueError('source_trace_workers must be an integer >= 1')
+        self.source_trace_workers = source_trace_workers
+        # re-use the source trace of unchanged region-periods within the process
+        self.source_trace_cache = source_trace_cache
+
+        # on-disk cache of loaded model data (disabled if None)
+        self.build_cache_dir = Path(build_cache_dir) if build_cache_dir else None
+
+        # per-component construction profile, written to the output folder
+        self.profile_build = profile_build
+
         self.sqlite_settings = sqlite or {}
 
         # warn if output db != input db
@@ -236,6 +284,12 @@ class TemoaConfig:
         Returns:
             Tuple of (is_available, location_or_message)
         """
+        # the direct HiGHS hand-off is not a Pyomo solver, and highspy is a core dependency
+        from temoa._internal.highs_direct import HIGHS_DIRECT
+
+        if solver_name == HIGHS_DIRECT:
+            return True, 'direct hand-off via highspy'
+
         # First, try to check if it's available through Pyomo (works for Python-based solvers)
         try:
             import pyomo.environ as pyo
@@ -339,6 +393,12 @@ class TemoaConfig:
         msg += '{:>{}s}: {}\n'.format('Graphviz output', width, self.graphviz_output)
         msg += '{:>{}s}: {}\n'.format('Cycle count limit', width, self.cycle_count_limit)
         msg += '{:>{}s}: {}\n'.format('Cycle length limit', width, self.cycle_length_limit)
+        msg += '{:>{}s}: {}\n'.format('Source trace workers', width, self.source_trace_workers)
+        msg += '{:>{}s}: {}\n'.format('Source trace cache', width, self.source_trace_cache)
+        msg += '{:>{}s}: {}\n'.format('Build cache', width, self.build_cache_dir)
+        msg += '{:>{}s}: {}\n'.format('Build profiling', width, self.profile_build)
+        msg += '{:>{}s}: {}\n'.format('Bulk validation', width, self.bulk_validation)
+        msg += '{:>{}s}: {}\n'.format('Direct build', width, self.direct_build)
 
         msg += spacer
         msg += '{:>{}s}: {}\n'.format('Selected solver', width, self.solver_name)
@@ -346,9 +406,14 @@ class TemoaConfig:
 
         msg += spacer
         msg += '{:>{}s}: {}\n'.format('Spreadsheet output', width, self.save_excel)
+        msg += '{:>{}s}: {}\n'.format('Spreadsheet format', width, self.spreadsheet_format)
+        msg += '{:>{}s}: {}\n'.format('Spreadsheet workers', width, self.spreadsheet_workers)
         msg += '{:>{}s}: {}\n'.format('Pyomo LP write status', width, self.save_lp_file)
         msg += '{:>{}s}: {}\n'.format('Save duals to output db', width, self.save_duals)
         msg += '{:>{}s}: {}\n'.format('Save storage to output db', width, self.save_storage_levels)
+        msg += '{:>{}s}: {}\n'.format(
+            'Release constraints after solve', width, self.release_constraints
+        )
 
         msg += spacer
         msg += '{:>{}s}: {}\n'.format('SQLite journal mode', width, self.sqlite_journal_mode)
@@ -358,6 +423,9 @@ class TemoaConfig:
         msg += '{:>{}s}: {}\n'.format(
             'SQLite cache size (pages or KiB if negative)', width, self.sqlite_cache_size
         )
+        msg += '{:>{}s}: {}\n'.format(
+            'SQLite rebuild output indexes', width, self.sqlite_rebuild_output_indexes
+        )
 
         msg += spacer
         msg += '{:>{}s}: {}\n'.format('Time sequencing', width, self.time_sequencing)
@@ -393,6 +461,9 @@ class TemoaConfig:
             )
             msg += '{:>{}s}: {}\n'.format('MGA Axis:', width, self.mga_inputs.get('axis'))
             msg += '{:>{}s}: {}\n'.format('MGA Weighting', width, self.mga_inputs.get('weighting'))
+            msg += '{:>{}s}: {}\n'.format(
+                'MGA Warm start', width, self.mga_inputs.get('warm_start', False)
+            )
 
         if self.scenario_mode == TemoaMode.METHOD_OF_MORRIS and self.morris_inputs is not None:
             msg += spacer
@@ -411,6 +482,12 @@ class TemoaConfig:
             msg += '{:>{}s}: {}\n'.format(
                 'Morris CPU Cores Requested', width, self.morris_inputs.get('cores')
             )
+            msg += '{:>{}s}: {}\n'.format(
+                'Morris Emission Labels', width, self.morris_inputs.get('emission_labels', ['co2'])
+            )
+            msg += '{:>{}s}: {}\n'.format(
+                'Morris Write Results', width, self.morris_inputs.get('write_results', True)
+            )
 
         if self.scenario_mode == TemoaMode.SVMGA and self.svmga_inputs is not None:
             msg += spacer
@@ -426,5 +503,8 @@ class TemoaConfig:
             msg += '{:>{}s}: {}\n'.format(
                 'Activity Labels', width, self.svmga_inputs.get('activity_labels')
             )
+            msg += '{:>{}s}: {}\n'.format(
+                'SVMGA Warm start', width, self.svmga_inputs.get('warm_start', False)
+            )
 
         return msg
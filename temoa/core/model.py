@@ -9,6 +9,7 @@ SPDX-License-Identifier: MIT
 """
 
 import logging
+from functools import cache
 from typing import TYPE_CHECKING
 
 from pyomo.core import BuildCheck, Set, Var
@@ -24,6 +25,7 @@ from pyomo.environ import (
     minimize,
 )
 
+from temoa._internal.build_profiler import active_profiler
 from temoa.components import (
     capacity,
     commodities,
@@ -50,6 +52,8 @@ from temoa.model_checking.validators import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from temoa import types as t
     from temoa.types.core_types import Technology
 
@@ -99,8 +103,28 @@ class TemoaModel(AbstractModel):
     # this is used in several places outside this class, and this provides no-build access to it
     default_lifetime_tech = 40
 
-    def __init__(self, *args: object, **kwargs: object) -> None:
+    def __init__(
+        self,
+        *args: object,
+        validate_elements: bool = True,
+        direct_build: bool = False,
+        **kwargs: object,
+    ) -> None:
+        """
+        :param validate_elements: False to declare the components without their element
+            validators, for data already validated in bulk (see data_io.bulk_validation)
+        :param direct_build: True to declare the core families (see DIRECT_FAMILIES) and the
+            objective without their expressions, for instances whose rows are assembled
+            directly for HiGHS (see temoa._internal.direct_build)
+        """
         AbstractModel.__init__(self, *args, **kwargs)
+        self.direct_build = direct_build
+
+        def checked(validator: 'Callable[..., bool]') -> 'Callable[..., bool] | None':
+            return validator if validate_elements else None
+
+        def direct(rule: 'Callable[..., t.ExprLike]') -> 'Callable[..., t.ExprLike]':
+            return assembled_directly if direct_build else rule
 
         ################################################
         #       Internally used Data Containers        #
@@ -149,9 +173,17 @@ class TemoaModel(AbstractModel):
         self.capacity_consumption_techs: t.CapacityConsumptionTechsDict = {}
         # Retired capacity producing a commodity during a period [r,p,c] -> t,v
         self.retirement_production_processes: t.RetirementProductionProcessesDict = {}
+        # Emission sources by [r, p, e], restricted to processes active in p
+        # (built once the emission params are constructed)
+        self.emission_activity_processes: t.EmissionActivityProcessesDict = {}  # -> i, t, v, o
+        self.emission_embodied_processes: t.EmissionCapacityProcessesDict = {}  # -> t, v=p
+        self.emission_end_of_life_processes: t.EmissionCapacityProcessesDict = {}  # -> t, v
         self.process_inputs_by_output: t.ProcessInputsByOutputDict = {}
         self.process_outputs_by_input: t.ProcessOutputsByInputDict = {}
         self.process_reserve_periods: t.ProcessReservePeriodsDict = {}
+        # {(r, p): [r1-r2]} exchange reserve providers importing into / exporting from region r
+        self.reserve_exchange_imports: t.ReserveExchangeRegionsDict = {}
+        self.reserve_exchange_exports: t.ReserveExchangeRegionsDict = {}
         self.process_periods: t.ProcessPeriodsDict = {}  # {(r, t, v): set(p)}
         # {(r, t, v): set(p)} periods in which a process can economically or naturally retire
         self.retirement_periods: t.RetirementPeriodsDict = {}
@@ -219,9 +251,9 @@ class TemoaModel(AbstractModel):
         self.validate_time = BuildAction(rule=time.validate_time)
 
         # Define the model time slices
-        self.time_season = Set(ordered=True, validate=no_slash_or_pipe)
-        self.time_season_sequential = Set(ordered=True, validate=no_slash_or_pipe)
-        self.time_of_day = Set(ordered=True, validate=no_slash_or_pipe)
+        self.time_season = Set(ordered=True, validate=checked(no_slash_or_pipe))
+        self.time_season_sequential = Set(ordered=True, validate=checked(no_slash_or_pipe))
+        self.time_of_day = Set(ordered=True, validate=checked(no_slash_or_pipe))
 
         # This is just to get the TimeStorageSeason table sequentially.
         # There must be a better way but this works for now
@@ -232,17 +264,17 @@ class TemoaModel(AbstractModel):
         )
 
         # Define regions
-        self.regions = Set(validate=region_check)
+        self.regions = Set(validate=checked(region_check))
         # regional_indices is the set of all the possible combinations of interregional exchanges
         # plus original region indices. If tech_exchange is empty, RegionalIndices =regions.
         self.regional_indices = Set(initialize=geography.create_regional_indices)
-        self.regional_global_indices = Set(validate=region_group_check)
+        self.regional_global_indices = Set(validate=checked(region_group_check))
 
         # Define technology-related sets
         # M.tech_resource = Set() # not actually used by
         self.tech_production = Set()
         self.tech_all = Set(
-            initialize=self.tech_production, validate=no_slash_or_pipe
+            initialize=self.tech_production, validate=checked(no_slash_or_pipe)
         )  # was M.tech_resource | M.tech_production
         self.tech_baseload = Set(within=self.tech_all)
         self.tech_annual = Set(within=self.tech_all)
@@ -299,7 +331,7 @@ class TemoaModel(AbstractModel):
         self.commodity_carrier = Set(initialize=self.commodity_physical | self.commodity_sink)
         self.commodity_all = Set(
             initialize=self.commodity_carrier | self.commodity_emissions,
-            validate=no_slash_or_pipe,
+            validate=checked(no_slash_or_pipe),
         )
 
         ################################################
@@ -329,8 +361,12 @@ class TemoaModel(AbstractModel):
 
         # These need to come before validate_season_sequential as they tell us whether
         # we need sequential seasons
-        self.ramp_up_hourly = Param(self.regions, self.tech_upramping, validate=validate_0to1)
-        self.ramp_down_hourly = Param(self.regions, self.tech_downramping, validate=validate_0to1)
+        self.ramp_up_hourly = Param(
+            self.regions, self.tech_upramping, validate=checked(validate_0to1)
+        )
+        self.ramp_down_hourly = Param(
+            self.regions, self.tech_downramping, validate=checked(validate_0to1)
+        )
 
         # Define time-related parameters
         # Basic period construction
@@ -413,7 +449,7 @@ class TemoaModel(AbstractModel):
             self.vintage_all,
             self.commodity_carrier,
             within=PositiveReals,
-            validate=validate_efficiency,
+            validate=checked(validate_efficiency),
         )
         self.validate_used_efficiency_indices = BuildAction(
             rule=technology.check_efficiency_indices
@@ -446,7 +482,7 @@ class TemoaModel(AbstractModel):
             self.tech_all,
             self.vintage_all,
             default=technology.get_default_survival,
-            validate=validate_0to1,
+            validate=checked(validate_0to1),
             mutable=True,
         )
         self.create_survival_curve = BuildAction(rule=technology.create_survival_curve)
@@ -470,7 +506,7 @@ class TemoaModel(AbstractModel):
             self.commodity_physical,
             self.tech_all,
             self.operator,
-            validate=validate_0to1,
+            validate=checked(validate_0to1),
         )
         self.limit_tech_input_split_annual = Param(
             self.regions,
@@ -478,7 +514,7 @@ class TemoaModel(AbstractModel):
             self.commodity_physical,
             self.tech_all,
             self.operator,
-            validate=validate_0to1,
+            validate=checked(validate_0to1),
         )
 
         self.limit_tech_output_split = Param(
@@ -487,7 +523,7 @@ class TemoaModel(AbstractModel):
             self.tech_all,
             self.commodity_carrier,
             self.operator,
-            validate=validate_0to1,
+            validate=checked(validate_0to1),
         )
         self.limit_tech_output_split_annual = Param(
             self.regions,
@@ -495,14 +531,14 @@ class TemoaModel(AbstractModel):
             self.tech_all,
             self.commodity_carrier,
             self.operator,
-            validate=validate_0to1,
+            validate=checked(validate_0to1),
         )
 
         self.renewable_portfolio_standard_constraint_rpg = Set(
             within=self.regions * self.time_optimize * self.tech_group_names
         )
         self.renewable_portfolio_standard = Param(
-            self.renewable_portfolio_standard_constraint_rpg, validate=validate_0to1
+            self.renewable_portfolio_standard_constraint_rpg, validate=checked(validate_0to1)
         )
 
         # The method below creates a series of helper functions that are used to
@@ -514,7 +550,7 @@ class TemoaModel(AbstractModel):
 
         self.capacity_factor_rsdt = Set(dimen=4, initialize=capacity.capacity_factor_tech_indices)
         self.capacity_factor_tech = Param(
-            self.capacity_factor_rsdt, default=1, validate=validate_0to1
+            self.capacity_factor_rsdt, default=1, validate=checked(validate_0to1)
         )
 
         # Dev note:  using a default function below alleviates need to make this set.
@@ -527,7 +563,7 @@ class TemoaModel(AbstractModel):
             self.vintage_all,
             # validate=validate_capacity_factor_process,
             # opting for a quicker validation, just 0->1
-            validate=validate_0to1,
+            validate=checked(validate_0to1),
             # slow but only called if a value is missing
             default=capacity.get_default_capacity_factor,
         )
@@ -598,7 +634,7 @@ class TemoaModel(AbstractModel):
 
         self.limit_seasonal_capacity_factor_constraint_rst = Set()
         self.limit_seasonal_capacity_factor = Param(
-            self.limit_seasonal_capacity_factor_constraint_rst, validate=validate_0to1
+            self.limit_seasonal_capacity_factor_constraint_rst, validate=checked(validate_0to1)
         )
         self.limit_seasonal_capacity_factor_constraint_rpst = Set(
             within=self.regional_global_indices
@@ -617,7 +653,7 @@ class TemoaModel(AbstractModel):
             * self.operator
         )
         self.limit_annual_capacity_factor = Param(
-            self.limit_annual_capacity_factor_constraint_rtvo, validate=validate_0to1
+            self.limit_annual_capacity_factor_constraint_rtvo, validate=checked(validate_0to1)
         )
 
         self.limit_growth_capacity = Param(
@@ -687,7 +723,7 @@ class TemoaModel(AbstractModel):
             Set()
         )  # populated by hybrid_loader with (r, s, d, t, op) keys
         self.limit_storage_fraction = Param(
-            self.limit_storage_fraction_param_rsdt, validate=validate_0to1
+            self.limit_storage_fraction_param_rsdt, validate=checked(validate_0to1)
         )
         self.limit_storage_fraction_constraint_rpsdtv = Set(
             within=(self.storage_constraints_rpsdtv | self.seasonal_storage_constraints_rpsdtv)
@@ -708,7 +744,7 @@ class TemoaModel(AbstractModel):
             self.tech_reserve,
             self.vintage_all,
             default=0,
-            validate=validate_0to1,
+            validate=checked(validate_0to1),
         )
         self.reserve_capacity_derate = Param(
             self.regional_indices,
@@ -716,7 +752,7 @@ class TemoaModel(AbstractModel):
             self.tech_reserve,
             self.vintage_all,
             default=1,
-            validate=validate_0to1,
+            validate=checked(validate_0to1),
         )
         self.planning_reserve_margin = Param(self.regions)
 
@@ -727,6 +763,8 @@ class TemoaModel(AbstractModel):
             self.vintage_optimize,
         )
 
+        self.create_emission_indices = BuildAction(rule=emissions.create_emission_indices)
+
         self.myopic_discounting_year = Param(default=0)
 
         ################################################
@@ -814,7 +852,9 @@ class TemoaModel(AbstractModel):
         #             (minimize total cost)            #
         ################################################
 
-        self.total_cost = Objective(rule=costs.total_cost_rule, sense=minimize)
+        self.total_cost = Objective(
+            rule=zero_cost if direct_build else costs.total_cost_rule, sense=minimize
+        )
 
         ################################################
         #                   Constraints                #
@@ -825,7 +865,7 @@ class TemoaModel(AbstractModel):
 
         # Declare constraints to calculate derived decision variables
         self.capacity_constraint = Constraint(
-            self.capacity_constraint_rpsdtv, rule=capacity.capacity_constraint
+            self.capacity_constraint_rpsdtv, rule=direct(capacity.capacity_constraint)
         )
 
         self.capacity_annual_constraint_rptv = Set(
@@ -863,7 +903,7 @@ class TemoaModel(AbstractModel):
 
         self.check_singleton_demands = BuildAction(rule=commodities.check_singleton_demands)
         self.demand_constraint = Constraint(
-            self.demand_constraint_rpc, rule=commodities.demand_constraint
+            self.demand_constraint_rpc, rule=direct(commodities.demand_constraint)
         )
 
         # devnote: testing a workaround
@@ -878,7 +918,8 @@ class TemoaModel(AbstractModel):
             dimen=5, initialize=commodities.commodity_balance_constraint_indices
         )
         self.commodity_balance_constraint = Constraint(
-            self.commodity_balance_constraint_rpsdc, rule=commodities.commodity_balance_constraint
+            self.commodity_balance_constraint_rpsdc,
+            rule=direct(commodities.commodity_balance_constraint),
         )
 
         self.annual_commodity_balance_constraint_rpc = Set(
@@ -1146,6 +1187,52 @@ class TemoaModel(AbstractModel):
 
         self.progress_marker_9 = BuildAction(['Finished Constraints'], rule=progress_check)
 
+    def _initialize_component(
+        self, modeldata: object, namespaces: object, component_name: str, profile_memory: int
+    ) -> None:
+        """
+        Construct a single component during create_instance().  Extends the Pyomo hook to
+        report each construction to the build profiler, when one is active.
+        """
+        profiler = active_profiler()
+        if profiler is None:
+            super()._initialize_component(modeldata, namespaces, component_name, profile_memory)
+            return
+        with profiler.measure(self.component(component_name)):
+            super()._initialize_component(modeldata, namespaces, component_name, profile_memory)
+
+
+# The constraints whose rows a direct build assembles outside of Pyomo, with the objective
+DIRECT_FAMILIES = ('capacity_constraint', 'demand_constraint', 'commodity_balance_constraint')
+
+
+def assembled_directly(model: TemoaModel, *index: object) -> object:
+    """The rule of a constraint in DIRECT_FAMILIES under a direct build: no Pyomo rows."""
+    return Constraint.Skip
+
+
+def zero_cost(model: TemoaModel) -> float:
+    """
+    The objective rule under a direct build, whose cost terms are assembled outside of Pyomo.
+    The solver sets the expression to the optimal cost after the solve.
+    """
+    return 0.0
+
+
+@cache
+def abstract_model(validate_elements: bool = True, direct_build: bool = False) -> TemoaModel:
+    """
+    The (unconstructed) model declaration, shared by all users within the process.
+
+    Declaring the model is not free, so code that only needs to look up components, or that
+    creates instances from it (create_instance() works on a copy), should use this rather than
+    declaring a new TemoaModel.  It must not be modified or constructed in place.
+
+    :param validate_elements: False for the declaration without the element validators
+    :param direct_build: True for the declaration of a direct build (see TemoaModel)
+    """
+    return TemoaModel(validate_elements=validate_elements, direct_build=direct_build)
+
 
 def progress_check(model: TemoaModel, checkpoint: str) -> None:
     """A quick widget which is called by BuildAction in order to log creation progress"""
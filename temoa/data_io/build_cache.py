@@ -0,0 +1,142 @@
+"""
+An on-disk cache of loaded model data, so that re-running an unchanged input database (e.g. with
+different solver settings) can skip the data load and source trace.
+
+The cache key is a hash of:
+    - the schema and content of every input table in the database (everything except the
+      output tables and the myopic working tables), which covers all tables referenced by the
+      loading manifest, the custom loaders and the source trace
+    - the config fields that affect the data that is loaded
+    - the Temoa version (the manifest and loaders may change between versions)
+
+so any change to the input tables automatically produces a new key.  The cached product is the
+data dictionary produced by `HybridLoader.create_data_dict`, along with the findings of its source
+trace (orphans and unsupported demands), which are logged again on a hit.  The Pyomo instance
+itself is still constructed on each run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from logging import getLogger
+from typing import TYPE_CHECKING, NamedTuple
+
+from temoa.__about__ import __version__
+
+if TYPE_CHECKING:
+    import sqlite3
+    from pathlib import Path
+
+    from temoa.core.config import TemoaConfig
+    from temoa.model_checking.commodity_network_manager import RegionPeriodResult
+
+logger = getLogger(__name__)
+
+# bump when the format of the cached product changes
+CACHE_FORMAT_VERSION = 2
+
+# config fields that alter the content of the data dictionary (or whether it was validated)
+KEY_CONFIG_FIELDS = (
+    'scenario_mode',
+    'source_trace',
+    'time_sequencing',
+    'days_per_period',
+    'reserve_margin',
+    'bulk_validation',
+)
+
+# tables written during runs, which do not feed the build
+NON_INPUT_TABLE_PREFIXES = ('output_', 'myopic_', 'sqlite_')
+
+
+def input_tables(con: sqlite3.Connection) -> list[tuple[str, str]]:
+    """The (name, create statement) of each input table in the database, sorted by name."""
+    rows = con.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'table' ORDER BY name"
+    ).fetchall()
+    return [(name, sql) for name, sql in rows if not name.startswith(NON_INPUT_TABLE_PREFIXES)]
+
+
+def make_key(con: sqlite3.Connection, config: TemoaConfig) -> str:
+    """
+    Compute the cache key for loading the given database with the given config.
+
+    :param con: connection to the input database
+    :param config: the run configuration
+    :return: a hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(f'format={CACHE_FORMAT_VERSION};temoa={__version__};'.encode())
+    for field in KEY_CONFIG_FIELDS:
+        digest.update(f'{field}={getattr(config, field, None)!r};'.encode())
+    for name, sql in input_tables(con):
+        digest.update(f'table={name};{sql};'.encode())
+        cur = con.execute(f'SELECT * FROM main."{name}"')
+        while rows := cur.fetchmany(10_000):
+            digest.update(repr(rows).encode())
+    return digest.hexdigest()
+
+
+class CacheEntry(NamedTuple):
+    data: dict[str, object]
+    trace_results: list[RegionPeriodResult] | None  # the source trace findings, if traced
+
+
+class BuildCache:
+    """A directory of pickled data dictionaries, one file per cache key."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.pkl'
+
+    def load(self, key: str) -> CacheEntry | None:
+        """
+        Fetch the data dictionary (and source trace findings) for a key.
+
+        :return: the entry, or None on a cache miss (or unreadable entry)
+        """
+        path = self._path(key)
+        if not path.is_file():
+            logger.info('Build cache miss: %s', key)
+            return None
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            logger.warning('Could not read build cache entry %s.  Ignoring it.', path)
+            return None
+        if not isinstance(entry, CacheEntry):
+            logger.warning('Build cache entry %s is not in the current format.  Ignoring it.', path)
+            return None
+        logger.info('Build cache hit: %s', key)
+        return entry
+
+    def store(
+        self,
+        key: str,
+        data: dict[str, object],
+        trace_results: list[RegionPeriodResult] | None = None,
+    ) -> None:
+        """
+        Store the data dictionary for a key.  Failures are logged, not raised.
+
+        :param key: the cache key
+        :param data: the data dictionary
+        :param trace_results: the results of the source trace of the load, if it was traced
+        """
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(CacheEntry(data, trace_results), f, protocol=pickle.HIGHEST_PROTOCOL)
+            # atomic, so a concurrent or interrupted run never sees a partial entry
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning('Could not write build cache entry %s', path, exc_info=True)
+            return
+        logger.info('Stored model data in build cache: %s', path)
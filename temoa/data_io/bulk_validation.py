@@ -0,0 +1,201 @@
+# temoa/data_io/bulk_validation.py
+"""
+Validates the loaded model data in bulk, in place of the per-element `validate` rules of the
+model components.
+
+Pyomo calls the `validate` rule of a Set or Param once for every element as the instance is
+built, which is slow for the big tables (efficiency, capacity factors, ...).  The checks here
+apply the same rules to the whole data dictionary produced by the `HybridLoader`:  the numeric
+checks with numpy and the membership checks on the distinct values of each index column, so
+only the elements in violation are looked at individually.  A failure raises the same error
+that Pyomo would raise for the first offending element.
+
+With `bulk_validation` in the config, the loader runs this pass and the model is built without
+its element validators (see `TemoaModel`).
+"""
+
+from __future__ import annotations
+
+import re
+from itertools import chain, islice
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from temoa.model_checking.validators import (
+    is_region_group,
+    no_slash_or_pipe,
+    region_check,
+    region_group_check,
+    validate_0to1,
+    validate_efficiency,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = getLogger(__name__)
+
+# the components of the model with an element validator (in declaration order)
+ELEMENT_VALIDATORS: dict[str, Callable[..., bool]] = {
+    'time_season': no_slash_or_pipe,
+    'time_season_sequential': no_slash_or_pipe,
+    'time_of_day': no_slash_or_pipe,
+    'regions': region_check,
+    'regional_global_indices': region_group_check,
+    'tech_all': no_slash_or_pipe,
+    'commodity_all': no_slash_or_pipe,
+    'ramp_up_hourly': validate_0to1,
+    'ramp_down_hourly': validate_0to1,
+    'efficiency': validate_efficiency,
+    'lifetime_survival_curve': validate_0to1,
+    'limit_tech_input_split': validate_0to1,
+    'limit_tech_input_split_annual': validate_0to1,
+    'limit_tech_output_split': validate_0to1,
+    'limit_tech_output_split_annual': validate_0to1,
+    'renewable_portfolio_standard': validate_0to1,
+    'capacity_factor_tech': validate_0to1,
+    'capacity_factor_process': validate_0to1,
+    'limit_seasonal_capacity_factor': validate_0to1,
+    'limit_annual_capacity_factor': validate_0to1,
+    'limit_storage_fraction': validate_0to1,
+    'capacity_credit': validate_0to1,
+    'reserve_capacity_derate': validate_0to1,
+}
+
+# sets that the model initializes from other sets, rather than from the data
+DERIVED_SETS = {
+    'tech_all': ('tech_production',),
+    'commodity_all': (
+        'commodity_physical',
+        'commodity_demand',
+        'commodity_waste',
+        'commodity_emissions',
+    ),
+    'commodity_carrier': ('commodity_physical', 'commodity_demand', 'commodity_waste'),
+    'vintage_all': ('time_exist', 'time_optimize'),
+}
+
+
+def _set_values(data: dict[str, object], name: str) -> list[object]:
+    """The members of a set in the data (or of the sets it is made from)"""
+    sources = DERIVED_SETS.get(name, (name,))
+    return list(chain.from_iterable(_as_list(data.get(source)) for source in sources))
+
+
+def _as_list(values: object) -> list[object]:
+    return list(values) if isinstance(values, list) else []
+
+
+def _param_error(name: str, index: object, value: object) -> RuntimeError:
+    """The error of Pyomo for a param value (from data) failing its validation rule"""
+    source_msg = (
+        f"Invalid parameter value: {name}[{index}] = '{value}', value type={type(value)}.\n"
+        '\tValue failed parameter validation rule'
+    )
+    return RuntimeError(
+        f'Failed to set value for param={name}, index={index}, value={value}.\n'
+        f'\tsource error message={source_msg}'
+    )
+
+
+def _set_error(name: str, value: object) -> ValueError:
+    """The error of Pyomo for a set member failing its validation rule"""
+    return ValueError(f'The value={value} violates the validation rule of Set {name}')
+
+
+def _check_no_slash_or_pipe(data: dict[str, object], name: str) -> None:
+    for element in _set_values(data, name):
+        if isinstance(element, int | float):
+            continue
+        if '/' in str(element) or '|' in str(element):
+            logger.error('no slash "/" or pipe "|" character is allowed in: %s', str(element))
+            raise _set_error(name, element)
+
+
+def _check_regions(data: dict[str, object], name: str) -> None:
+    for region in _set_values(data, name):
+        if region == 'global' or not re.match(r'[a-zA-Z0-9_]+\Z', str(region)):
+            raise _set_error(name, region)
+
+
+def _check_region_groups(data: dict[str, object], name: str) -> None:
+    regions = {str(r) for r in _set_values(data, 'regions')}
+    for rg in _set_values(data, name):
+        if not is_region_group(str(rg), regions):
+            raise _set_error(name, rg)
+
+
+def _check_0to1(data: dict[str, object], name: str) -> None:
+    values = data.get(name)
+    if not isinstance(values, dict) or not values:
+        return
+    array = np.fromiter(values.values(), dtype=float, count=len(values))
+    # NaN fails the check, as it does in validate_0to1
+    bad = np.flatnonzero(~((array >= 0.0) & (array <= 1.0)))
+    if bad.size:
+        index = next(islice(values, int(bad[0]), None))
+        raise _param_error(name, index, values[index])
+
+
+def _check_efficiency(data: dict[str, object], name: str) -> None:
+    values = data.get(name)
+    if not isinstance(values, dict) or not values:
+        return
+    regions = [str(r) for r in _set_values(data, 'regions')]
+    # the regions and region pairs (see geography.create_regional_indices)
+    regional_indices: set[object] = {
+        f'{r_i}-{r_j}' if r_i != r_j else r_i for r_i in regions for r_j in regions
+    }
+    domains: Sequence[set[object]] = (
+        regional_indices,
+        set(_set_values(data, 'commodity_physical')),
+        set(_set_values(data, 'tech_all')),
+        set(_set_values(data, 'vintage_all')),
+        set(_set_values(data, 'commodity_carrier')),
+    )
+
+    # the distinct members of each index column that are outside its domain
+    columns = zip(*values, strict=True)
+    unknown = [set(column) - domain for column, domain in zip(columns, domains, strict=True)]
+    bad = {k for k, v in values.items() if not (isinstance(v, float) and v > 0)}
+    if any(unknown):
+        bad.update(k for k in values if any(m in unknown[n] for n, m in enumerate(k)))
+    if not bad:
+        return
+
+    first = next(k for k in values if k in bad)
+    r, si, t, v, so = first
+    logger.error(
+        'Element Validations:\nregion %s\ninput_commodity %s\ntech %s\nvintage %s\n'
+        'output_commodity %s',
+        r in domains[0],
+        si in domains[1],
+        t in domains[2],
+        v in domains[3],
+        so in domains[4],
+    )
+    raise _param_error(name, first, values[first])
+
+
+BULK_CHECKS: dict[Callable[..., bool], Callable[[dict[str, object], str], None]] = {
+    no_slash_or_pipe: _check_no_slash_or_pipe,
+    region_check: _check_regions,
+    region_group_check: _check_region_groups,
+    validate_0to1: _check_0to1,
+    validate_efficiency: _check_efficiency,
+}
+
+
+def validate_data(data: dict[str, object]) -> None:
+    """
+    Apply the element validators of the model to the whole data dictionary.
+
+    :param data: the data dictionary of the model (as made by the `HybridLoader`)
+    :raises ValueError: for the first set member failing a validator
+    :raises RuntimeError: for the first param value failing a validator
+    """
+    for name, validator in ELEMENT_VALIDATORS.items():
+        BULK_CHECKS[validator](data, name)
+    logger.debug('Model data validated in bulk')
@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import time
 from collections import defaultdict
+from functools import cache
 from logging import getLogger
 from sqlite3 import Connection, Cursor, OperationalError
 from typing import TYPE_CHECKING, cast
@@ -30,11 +31,12 @@ from typing import TYPE_CHECKING, cast
 from pyomo.core import Param, Set
 from pyomo.dataportal import DataPortal
 
-from temoa.core.model import TemoaModel
+from temoa.core.model import abstract_model
 from temoa.core.modes import TemoaMode
+from temoa.data_io import bulk_validation
 from temoa.data_io.component_manifest import build_manifest
 from temoa.extensions.myopic.myopic_index import MyopicIndex
-from temoa.model_checking import element_checker, network_model_data
+from temoa.model_checking import element_checker, network_model_data, trace_cache
 from temoa.model_checking.commodity_network_manager import CommodityNetworkManager
 from temoa.model_checking.element_checker import ValidationPrimitive, ViableSet
 
@@ -67,6 +69,13 @@ tables_with_regional_groups = {
 }
 
 
+@cache
+def _loading_manifest() -> tuple[list[LoadItem], dict[str, LoadItem]]:
+    """The loading manifest and a map of it by component name, built once per process."""
+    manifest = build_manifest(abstract_model())
+    return manifest, {item.component.name: item for item in manifest}
+
+
 class HybridLoader:
     """
     Drives the loading of model data from a SQLite database into a format
@@ -77,22 +86,32 @@ class HybridLoader:
     of what to load from the procedural logic of how to load it.
     """
 
-    def __init__(self, db_connection: Connection, config: TemoaConfig) -> None:
+    def __init__(
+        self, db_connection: Connection, config: TemoaConfig, cache_static_data: bool = False
+    ) -> None:
         """
         Initializes the loader.
 
         :param db_connection: An active SQLite database connection.
         :param config: The Temoa configuration object.
+        :param cache_static_data: If True, data that does not depend on the myopic window
+            (non period-filtered manifest items and the static network data) is fetched once
+            and re-used by subsequent calls to `create_data_dict`.  Only safe if the input
+            tables are not modified between calls.
         """
         self.debugging = False
         self.con = db_connection
         self.config = config
         self.myopic_index: MyopicIndex | None = None
 
-        # Build the data loading manifest and a name-based map for quick lookup
-        model = TemoaModel()
-        self.manifest = build_manifest(model)
-        self.manifest_map = {item.component.name: item for item in self.manifest}
+        # --- Window-independent data retained across calls (if caching) ---
+        self.cache_static_data = cache_static_data
+        self._static_data_cache: dict[str, list[tuple[object, ...]]] = {}
+        self._table_exists_cache: dict[str, bool] = {}
+        self._static_network_data: network_model_data.StaticNetworkData | None = None
+
+        # The data loading manifest and a name-based map for quick lookup (shared, read-only)
+        self.manifest, self.manifest_map = _loading_manifest()
 
         # --- Data containers and filters populated during loading ---
         self.manager: CommodityNetworkManager | None = None
@@ -201,7 +220,7 @@ class HybridLoader:
 
         data: dict[str, object] = {}
         cur = self.con.cursor()
-        model = TemoaModel()
+        model = abstract_model()
 
         # Load critical time sets first, as they index other components
         if myopic_index:
@@ -278,6 +297,12 @@ class HybridLoader:
         # Create derived index sets for parameters now that all base data is loaded
         set_data = self.load_param_idx_sets(data=data)
         data.update(set_data)
+
+        # Validate the data in bulk, in place of the element validators of the model
+        if self.config.bulk_validation:
+            tic = time.time()
+            bulk_validation.validate_data(data)
+            logger.debug('Bulk validation time: %0.5f seconds', time.time() - tic)
         self.data = data
 
         return data
@@ -293,12 +318,27 @@ class HybridLoader:
         :param cur: The database cursor.
         :param item: The LoadItem describing what to fetch.
         :param mi: The MyopicIndex for period filtering, if applicable.
-        :return: A list of tuples containing the raw data.
+        :return: A list of tuples containing the raw data.  Callers must not modify it, as it
+            may be shared across calls when caching static data.
         """
         # If this is a custom loader and no columns are specified, no fetch is needed.
         if item.custom_loader_name and not item.columns:
             return []
 
+        # only the period-filtered items vary between myopic windows
+        cacheable = self.cache_static_data and not (item.is_period_filtered and mi)
+        if cacheable and item.component.name in self._static_data_cache:
+            return self._static_data_cache[item.component.name]
+
+        rows = self._query_data(cur, item, mi)
+        if cacheable:
+            self._static_data_cache[item.component.name] = rows
+        return rows
+
+    def _query_data(
+        self, cur: Cursor, item: LoadItem, mi: MyopicIndex | None
+    ) -> list[tuple[object, ...]]:
+        """Builds and runs the query for a manifest item."""
         if not self.table_exists(item.table):
             if item.is_table_required:
                 raise FileNotFoundError(f"Required table '{item.table}' not found in the database.")
@@ -400,11 +440,15 @@ class HybridLoader:
         :param table_name: The name of the table to check.
         :return: True if the table exists, False otherwise.
         """
+        if self.cache_static_data and table_name in self._table_exists_cache:
+            return self._table_exists_cache[table_name]
         table_name_check = (
             self.con.cursor()
             .execute("SELECT name FROM sqlite_master WHERE type='table' AND name= ?", (table_name,))
             .fetchone()
         )
+        if self.cache_static_data:
+            self._table_exists_cache[table_name] = bool(table_name_check)
         return bool(table_name_check)
 
     # =================================================================================
@@ -413,9 +457,16 @@ class HybridLoader:
 
     def _source_trace(self, myopic_index: MyopicIndex | None = None) -> None:
         """
-        Performs the source-trace analysis to identify viable components.
+        Performs the source-trace analysis to identify viable components.  The analyses of the
+        region-periods whose network is unchanged since an earlier trace in this process (e.g.
+        the periods carried over from the previous myopic window) are re-used.
         """
-        network_data = network_model_data.build(self.con, myopic_index)
+        static_data = None
+        if self.cache_static_data:
+            if self._static_network_data is None:
+                self._static_network_data = network_model_data.fetch_static_data(self.con)
+            static_data = self._static_network_data
+        network_data = network_model_data.build(self.con, myopic_index, static_data)
         cur = self.con.cursor()
         periods = set(
             [
@@ -431,7 +482,12 @@ class HybridLoader:
                 p for p in periods if myopic_index.base_year <= p <= myopic_index.last_demand_year
             }
 
-        self.manager = CommodityNetworkManager(periods=periods, network_data=network_data)
+        self.manager = CommodityNetworkManager(
+            periods=periods,
+            network_data=network_data,
+            num_workers=self.config.source_trace_workers,
+            cache=trace_cache.shared_cache() if self.config.source_trace_cache else None,
+        )
         if not self.manager.analyze_network() and not self.config.silent:
             print('\nWarning:  Orphaned processes detected.  See log file for details.')
         self.manager.analyze_graphs(self.config)
@@ -517,7 +573,7 @@ class HybridLoader:
         """
         Aggregates region and group names from the Region table and all Limit tables.
         """
-        model = TemoaModel()
+        model = abstract_model()
         cur = self.con.cursor()
         regions_and_groups: set[str] = set()
 
@@ -545,7 +601,7 @@ class HybridLoader:
         filtered_data: Sequence[tuple[object, ...]],
     ) -> None:
         """Loads members into the indexed set `tech_group_members`."""
-        model = TemoaModel()
+        model = abstract_model()
         validator = self.viable_techs.members if self.viable_techs else None
         for group_name, tech in filtered_data:
             if validator is None or tech in validator:
@@ -563,7 +619,7 @@ class HybridLoader:
         """
         Loads time_season as a flat ordered set of season names.
         """
-        model = TemoaModel()
+        model = abstract_model()
         if not filtered_data:
             logger.warning('No time_season table found. Loading a single filler season "S".')
             seasons_to_load: list[tuple[object, ...]] = [('S',)]
@@ -580,7 +636,7 @@ class HybridLoader:
         """
         Composite loader for time_season_sequential and its associated index sets.
         """
-        model = TemoaModel()
+        model = abstract_model()
         if filtered_data:
             seg_frac_data = [
                 (row[0], row[2]) for row in filtered_data
@@ -604,7 +660,7 @@ class HybridLoader:
         Handles different queries for myopic vs. standard runs and also
         populates the `tech_exist` set.
         """
-        model = TemoaModel()
+        model = abstract_model()
         cur = self.con.cursor()
         mi = self.myopic_index
 
@@ -638,7 +694,7 @@ class HybridLoader:
         filtered_data: Sequence[tuple[object, ...]],
     ) -> None:
         """Loads the required singleton global_discount_rate."""
-        model = TemoaModel()
+        model = abstract_model()
         if filtered_data:
             data[model.global_discount_rate.name] = {None: cast('float', filtered_data[0][0])}
         else:
@@ -654,7 +710,7 @@ class HybridLoader:
         filtered_data: Sequence[tuple[object, ...]],
     ) -> None:
         """Loads the optional singleton default_loan_rate."""
-        model = TemoaModel()
+        model = abstract_model()
         if filtered_data:
             data[model.default_loan_rate.name] = {None: cast('float', filtered_data[0][0])}
 
@@ -666,7 +722,7 @@ class HybridLoader:
         filtered_data: Sequence[tuple[object, ...]],
     ) -> None:
         """Loads the main efficiency parameter, which is pre-calculated."""
-        model = TemoaModel()
+        model = abstract_model()
         self._load_component_data(data, model.efficiency, self.efficiency_values)
 
     def _load_linked_techs(
@@ -699,7 +755,7 @@ class HybridLoader:
         filtered_data: Sequence[tuple[object, ...]],
     ) -> None:
         """Composite loader for ramp_down_hourly and its index set `tech_downramping`."""
-        model = TemoaModel()
+        model = abstract_model()
         self._load_component_data(data, model.ramp_down_hourly, filtered_data)
         if filtered_data:
             tech_data = sorted({(row[1],) for row in filtered_data})
@@ -715,7 +771,7 @@ class HybridLoader:
         filtered_data: Sequence[tuple[object, ...]],
     ) -> None:
         """Composite loader for ramp_up_hourly and its index set `tech_upramping`."""
-        model = TemoaModel()
+        model = abstract_model()
         self._load_component_data(data, model.ramp_up_hourly, filtered_data)
         if filtered_data:
             tech_data = sorted({(row[1],) for row in filtered_data})
@@ -731,7 +787,7 @@ class HybridLoader:
         filtered_data: Sequence[tuple[object, ...]],
     ) -> None:
         """Handles deprecation warning for renewable_portfolio_standard."""
-        model = TemoaModel()
+        model = abstract_model()
         self._load_component_data(data, model.renewable_portfolio_standard, filtered_data)
         if filtered_data:
             logger.warning(
@@ -837,7 +893,7 @@ class HybridLoader:
         :param data: The main data dictionary.
         :return: A dictionary of the new index sets to be added.
         """
-        model = TemoaModel()
+        model = abstract_model()
         param_idx_sets = {
             model.cost_invest.name: model.cost_invest_rtv.name,
             model.cost_emission.name: model.cost_emission_rpe.name,
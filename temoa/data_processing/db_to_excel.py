@@ -7,238 +7,333 @@ The script extracts capacity, activity, emissions, and cost data for a
 specified scenario, formats it, and saves it to separate sheets in an
 Excel workbook. It also creates an aggregated IAMC-compatible Excel file.
 
+The aggregation and the pivot of the periods into columns are done in SQL, and the rows are
+streamed from the database into the files, so the output tables are never loaded in memory.
+The sheets may also be written to separate files (one per sheet) by several processes, or as
+CSV or Parquet files instead of Excel.
+
 Usage:
     python db_to_excel.py -i <input_file.db> -s <scenario_name> [-o <output_file_name>]
+        [-f <xlsx|csv|parquet>] [-w <workers>]
 """
 
+from __future__ import annotations
+
+import csv
 import getopt
-import itertools
+import importlib.util
 import re
 import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import pandas as pd
-from pandas import DataFrame
+import xlsxwriter  # type: ignore[import-untyped]
+
+SPREADSHEET_FORMATS = ('xlsx', 'csv', 'parquet')
+
+# the column widths of the leading columns of the sheets
+ID_COLUMN_WIDTH = 10
 
 
-def make_excel(ifile: str | None, ofile: Path | None, scenario: set[str]) -> None:
+class Sheet(NamedTuple):
     """
-    Processes a Temoa database to produce human-readable and IAMC-format
-    Excel files.
+    A sheet of the output: the header and the queries whose rows (in order) fill it
     """
-    if ifile is None:
-        raise ValueError("You did not specify the input file. Remember to use the '-i' option.")
 
-    file_match = re.search(r'(\w+)\.(\w+)\b', ifile)
-    if not file_match:
-        raise ValueError(f'The file type {ifile} is not recognized. Use a database file.')
-
-    if ofile is None:
-        ofile = Path(file_match.group(1))
-        print(f'Look for output in {ofile}_*.xlsx')
+    name: str
+    header: list[str | int]
+    queries: list[tuple[str, tuple[Any, ...]]]
+    widths: tuple[int, ...] = ()
 
-    con = sqlite3.connect(ifile)
-    scenario_name = scenario.pop()
-    ofile = ofile.with_suffix('.xlsx')
 
-    writer = pd.ExcelWriter(
-        ofile,
-        engine='xlsxwriter',
-        engine_kwargs={'options': {'strings_to_formulas': False}},
-    )
-    workbook = writer.book
-    header_format = workbook.add_format({'bold': True, 'text_wrap': True, 'align': 'left'})
+def _pivot_columns(value: str, periods: list[int]) -> tuple[str, tuple[int, ...]]:
+    """
+    The SQL select terms that pivot the value by period into one column per period
 
-    query_all_techs = """
-        SELECT DISTINCT efficiency.region, efficiency.tech, Technology.sector
-        FROM efficiency
-        INNER JOIN Technology ON efficiency.tech = Technology.tech
+    :param value: the qualified name of the value column
+    :param periods: the periods, in column order
+    :return: the select terms and their parameters
     """
-    all_techs = pd.read_sql_query(query_all_techs, con)
+    terms = ', '.join(f'SUM(CASE WHEN o.period = ? THEN {value} END)' for _ in periods)
+    return terms, tuple(periods)
+
 
-    query_capacity = """
-        SELECT region, tech, sector, period, SUM(capacity) as capacity
-        FROM output_net_capacity WHERE scenario = ?
-        GROUP BY region, tech, sector, period
+def _sector_sheets(
+    con: sqlite3.Connection, scenario: str, kind: str, table: str, value: str
+) -> list[Sheet]:
     """
-    df_capacity = pd.read_sql_query(query_capacity, con, params=(scenario_name,))
-    for sector in sorted(df_capacity['sector'].unique()):
-        df_sector = (
-            df_capacity[df_capacity['sector'] == sector]
-            .drop(columns=['sector'])
-            .pivot_table(values='capacity', index=['region', 'tech'], columns='period')
-            .reset_index()
-        )
-        sector_techs = all_techs[all_techs['sector'] == sector]
-        df_sector = pd.merge(
-            sector_techs[['region', 'tech']],
-            df_sector,
-            on=['region', 'tech'],
-            how='left',
-        )
-        df_sector.rename(columns={'region': 'Region', 'tech': 'Technology'}, inplace=True)
-        sheet_name = f'Capacity_{sector}'
-        df_sector.to_excel(writer, sheet_name=sheet_name, index=False, startrow=1, header=False)
-        worksheet = writer.sheets[sheet_name]
-        worksheet.set_column('A:A', 10)
-        worksheet.set_column('B:B', 10)
-        for col, val in enumerate(df_sector.columns.values):
-            worksheet.write(0, col, val, header_format)
-
-    query_activity = """
-        SELECT region, tech, sector, period, SUM(flow) as vflow_out
-        FROM output_flow_out WHERE scenario = ?
-        GROUP BY region, tech, sector, period
+    One sheet per sector of the (pivoted) output values of every technology in the sector
+
+    :param con: the connection to the database
+    :param scenario: the scenario name
+    :param kind: the name of the quantity, used as the sheet name prefix
+    :param table: the output table
+    :param value: the value column of the output table
+    :return: the sheets, by sector
     """
-    df_activity = pd.read_sql_query(query_activity, con, params=(scenario_name,))
-    for sector in sorted(df_activity['sector'].unique()):
-        df_sector = (
-            df_activity[df_activity['sector'] == sector]
-            .drop(columns=['sector'])
-            .pivot_table(values='vflow_out', index=['region', 'tech'], columns='period')
-            .reset_index()
+    sector_periods: dict[str, list[int]] = {}
+    for sector, period in con.execute(
+        f'SELECT DISTINCT sector, period FROM {table} WHERE scenario = ? ORDER BY sector, period',
+        (scenario,),
+    ):
+        sector_periods.setdefault(sector, []).append(period)
+
+    sheets = []
+    for sector, periods in sector_periods.items():
+        terms, params = _pivot_columns(f'o.{value}', periods)
+        query = f"""
+            SELECT t.region, t.tech, {terms}
+            FROM (
+                SELECT DISTINCT efficiency.region, efficiency.tech
+                FROM efficiency
+                INNER JOIN Technology ON efficiency.tech = Technology.tech
+                WHERE Technology.sector = ?
+            ) AS t
+            LEFT JOIN {table} AS o
+                ON o.region = t.region AND o.tech = t.tech
+                AND o.scenario = ? AND o.sector = ?
+            GROUP BY t.region, t.tech
+        """
+        sheets.append(
+            Sheet(
+                name=f'{kind}_{sector}',
+                header=['Region', 'Technology', *periods],
+                queries=[(query, (*params, sector, scenario, sector))],
+                widths=(ID_COLUMN_WIDTH, ID_COLUMN_WIDTH),
+            )
         )
-        sector_techs = all_techs[all_techs['sector'] == sector]
-        df_sector = pd.merge(
-            sector_techs[['region', 'tech']],
-            df_sector,
-            on=['region', 'tech'],
-            how='left',
-        )
-        df_sector.rename(columns={'region': 'Region', 'tech': 'Technology'}, inplace=True)
-        sheet_name = f'Activity_{sector}'
-        df_sector.to_excel(writer, sheet_name=sheet_name, index=False, startrow=1, header=False)
-        worksheet = writer.sheets[sheet_name]
-        worksheet.set_column('A:A', 10)
-        worksheet.set_column('B:B', 10)
-        for col, val in enumerate(df_sector.columns.values):
-            worksheet.write(0, col, val, header_format)
-
-    query_all_emis = """
-        SELECT DISTINCT ea.region, ea.tech, ea.emis_comm, t.sector
-        FROM emission_activity ea
-        INNER JOIN Technology t ON ea.tech = t.tech
+    return sheets
+
+
+def _emission_sheet(con: sqlite3.Connection, scenario: str) -> Sheet | None:
     """
-    try:
-        all_emis_techs = pd.read_sql_query(query_all_emis, con)
-    except sqlite3.OperationalError:
-        all_emis_techs = pd.DataFrame()
-
-    query_emissions = """
-        SELECT region, tech, sector, period, emis_comm, SUM(emission) as emissions
-        FROM output_emission WHERE scenario = ?
-        GROUP BY region, tech, sector, period, emis_comm
+    The sheet of the (pivoted) emissions of every emitting technology, if there are emissions
     """
-    df_emissions_raw = pd.read_sql_query(query_emissions, con, params=(scenario_name,))
-    if not df_emissions_raw.empty:
-        df_emissions = df_emissions_raw.pivot_table(
-            values='emissions',
-            index=['region', 'tech', 'sector', 'emis_comm'],
-            columns='period',
-        ).reset_index()
-        df_emissions = pd.merge(
-            all_emis_techs,
-            df_emissions,
-            on=['region', 'tech', 'sector', 'emis_comm'],
-            how='left',
+    periods = [
+        row[0]
+        for row in con.execute(
+            'SELECT DISTINCT period FROM output_emission WHERE scenario = ? ORDER BY period',
+            (scenario,),
         )
-        df_emissions.rename(
-            columns={
-                'region': 'Region',
-                'tech': 'Technology',
-                'emis_comm': 'Emission Commodity',
-                'sector': 'Sector',
-            },
-            inplace=True,
-        )
-        df_emissions.to_excel(writer, sheet_name='Emissions', index=False, startrow=1, header=False)
-        worksheet = writer.sheets['Emissions']
-        worksheet.set_column('A:A', 10)
-        worksheet.set_column('B:B', 10)
-        worksheet.set_column('C:C', 10)
-        worksheet.set_column('D:D', 20)
-        for col, val in enumerate(df_emissions.columns.values):
-            worksheet.write(0, col, val, header_format)
-
-    query_costs = """
+    ]
+    if not periods:
+        return None
+    terms, params = _pivot_columns('o.emission', periods)
+    query = f"""
+        SELECT a.region, a.tech, a.emis_comm, a.sector, {terms}
+        FROM (
+            SELECT DISTINCT ea.region, ea.tech, ea.emis_comm, t.sector
+            FROM emission_activity ea
+            INNER JOIN Technology t ON ea.tech = t.tech
+        ) AS a
+        LEFT JOIN output_emission AS o
+            ON o.region = a.region AND o.tech = a.tech AND o.sector = a.sector
+            AND o.emis_comm = a.emis_comm AND o.scenario = ?
+        GROUP BY a.region, a.tech, a.emis_comm, a.sector
+    """
+    return Sheet(
+        name='Emissions',
+        header=['Region', 'Technology', 'Emission Commodity', 'Sector', *periods],
+        queries=[(query, (*params, scenario))],
+        widths=(ID_COLUMN_WIDTH, ID_COLUMN_WIDTH, ID_COLUMN_WIDTH, 20),
+    )
+
+
+def _cost_sheet(scenario: str) -> Sheet:
+    query = """
         SELECT region, oc.tech, t.sector, vintage,
                d_invest + d_var + d_fixed + d_emiss as cost
         FROM output_cost oc
         JOIN Technology t ON oc.tech = t.tech
         WHERE scenario = ?
     """
-    df_costs = pd.read_sql_query(query_costs, con, params=(scenario_name,))
-    df_costs.columns = ['Region', 'Technology', 'Sector', 'Vintage', 'Cost']
-    df_costs.to_excel(writer, sheet_name='Costs', index=False, startrow=1, header=False)
-    worksheet = writer.sheets['Costs']
-    worksheet.set_column('A:A', 10)
-    worksheet.set_column('B:B', 10)
-    worksheet.set_column('C:C', 10)
-    worksheet.set_column('D:D', 30)
-    for col, val in enumerate(df_costs.columns):
-        worksheet.write(0, col, val, header_format)
-
-    writer.close()
-
-    df_emissions_raw['variable'] = (
-        'Emissions|' + df_emissions_raw['emis_comm'] + '|' + df_emissions_raw['tech']
+    return Sheet(
+        name='Costs',
+        header=['Region', 'Technology', 'Sector', 'Vintage', 'Cost'],
+        queries=[(query, (scenario,))],
+        widths=(ID_COLUMN_WIDTH, ID_COLUMN_WIDTH, ID_COLUMN_WIDTH, 30),
     )
-    df_emissions_iamc = df_emissions_raw.rename(columns={'period': 'year', 'emissions': 'value'})
-
-    df_capacity['variable'] = 'Capacity|' + df_capacity['sector'] + '|' + df_capacity['tech']
-    df_capacity_iamc = df_capacity.rename(columns={'period': 'year', 'capacity': 'value'})
-
-    df_activity['variable'] = 'Activity|' + df_activity['sector'] + '|' + df_activity['tech']
-    df_activity_iamc = df_activity.rename(columns={'period': 'year', 'vflow_out': 'value'})
-
-    iamc_columns = ['region', 'variable', 'year', 'value']
-    df_iamc = pd.concat(
-        [
-            df_emissions_iamc[iamc_columns],
-            df_activity_iamc[iamc_columns],
-            df_capacity_iamc[iamc_columns],
-        ],
-        ignore_index=True,
+
+
+def _iamc_sheet(scenario: str) -> Sheet:
+    """
+    The IAMC-format data: the values by technology followed by their aggregates by emission
+    commodity and by sector
+    """
+    select = "SELECT 'Temoa', ?, region, {variable}, '?', period, SUM({value}) FROM {table}"
+    # (variable, value, table, group by) for the technology values...
+    details = [
+        (
+            "'Emissions|' || emis_comm || '|' || tech",
+            'emission',
+            'output_emission',
+            'region, tech, sector, period, emis_comm',
+        ),
+        (
+            "'Activity|' || sector || '|' || tech",
+            'flow',
+            'output_flow_out',
+            'region, tech, sector, period',
+        ),
+        (
+            "'Capacity|' || sector || '|' || tech",
+            'capacity',
+            'output_net_capacity',
+            'region, tech, sector, period',
+        ),
+    ]
+    # ... and for their aggregates
+    aggregates = [
+        ("'Emissions|' || emis_comm", 'emission', 'output_emission', 'region, period, emis_comm'),
+        ("'Activity|' || sector", 'flow', 'output_flow_out', 'region, period, sector'),
+        ("'Capacity|' || sector", 'capacity', 'output_net_capacity', 'region, period, sector'),
+    ]
+    queries = []
+    for variable, value, table, group_by in details:
+        query = select.format(variable=variable, value=value, table=table)
+        query += f' WHERE scenario = ? GROUP BY {group_by}'
+        queries.append((query, (scenario, scenario)))
+    for variable, value, table, group_by in aggregates:
+        query = select.format(variable=variable, value=value, table=table)
+        query += ' WHERE scenario = ?'
+        if table != 'output_emission':
+            # the sector aggregates are for the sectors with capacity
+            query += ' AND sector IN (SELECT sector FROM output_net_capacity WHERE scenario = ?)'
+            params: tuple[Any, ...] = (scenario, scenario, scenario)
+        else:
+            params = (scenario, scenario)
+        queries.append((query + f' GROUP BY {group_by} ORDER BY {group_by}', params))
+    return Sheet(
+        name='Sheet1',
+        header=['model', 'scenario', 'region', 'variable', 'unit', 'year', 'value'],
+        queries=queries,
     )
-    df_iamc['unit'] = '?'
-    df_iamc['scenario'] = scenario_name
-
-    aggregates_to_add: list[DataFrame] = []
-    grouping_cols = ['scenario', 'region', 'year', 'unit']
-
-    emiss_types = df_emissions_raw['emis_comm'].unique()
-    for emiss in emiss_types:
-        new_variable_name = f'Emissions|{emiss}'
-        mask = df_iamc['variable'].str.startswith(f'{new_variable_name}|')
-        if mask.any():
-            agg = df_iamc[mask].groupby(grouping_cols, as_index=False).sum(numeric_only=True)
-            agg['variable'] = new_variable_name
-            aggregates_to_add.append(agg)
-
-    sector_types = df_capacity['sector'].unique()
-    for var_type, sector in itertools.product(['Activity', 'Capacity'], sector_types):
-        new_variable_name = f'{var_type}|{sector}'
-        mask = df_iamc['variable'].str.startswith(f'{new_variable_name}|')
-        if mask.any():
-            agg = df_iamc[mask].groupby(grouping_cols, as_index=False).sum(numeric_only=True)
-            agg['variable'] = new_variable_name
-            aggregates_to_add.append(agg)
-
-    if aggregates_to_add:
-        df_final_iamc = pd.concat([df_iamc, *aggregates_to_add], ignore_index=True)
-    else:
-        df_final_iamc = df_iamc
-
-    df_final_iamc['model'] = 'Temoa'
-    final_cols = ['model', 'scenario', 'region', 'variable', 'unit', 'year', 'value']
-    df_final_iamc = df_final_iamc[final_cols]
-
-    base_name = ofile.stem
-    excel_pyam_filename = ofile.with_name(f'{base_name}_pyam.xlsx')
-    df_final_iamc.to_excel(excel_pyam_filename, index=False)
-
-    con.close()
+
+
+def _rows(con: sqlite3.Connection, sheet: Sheet) -> Any:
+    for query, params in sheet.queries:
+        yield from con.execute(query, params)
+
+
+def _xlsx_options() -> dict[str, bool]:
+    # constant memory: each row is flushed to disk once the next row is started
+    return {'constant_memory': True, 'strings_to_formulas': False}
+
+
+def _write_worksheet(workbook: Any, con: sqlite3.Connection, sheet: Sheet) -> None:
+    header_format = workbook.add_format({'bold': True, 'text_wrap': True, 'align': 'left'})
+    worksheet = workbook.add_worksheet(sheet.name)
+    for col, width in enumerate(sheet.widths):
+        worksheet.set_column(col, col, width)
+    worksheet.write_row(0, 0, sheet.header, header_format)
+    for row_num, row in enumerate(_rows(con, sheet), start=1):
+        worksheet.write_row(row_num, 0, row)
+
+
+def _write_sheet(db_file: str, sheet: Sheet, path: Path, output_format: str) -> Path:
+    """
+    Write a sheet to its own file
+
+    :param db_file: the database to read the sheet from
+    :param sheet: the sheet to write
+    :param path: the path of the file
+    :param output_format: one of the SPREADSHEET_FORMATS
+    :return: the path of the file
+    """
+    with closing(sqlite3.connect(db_file)) as con:
+        if output_format == 'xlsx':
+            with xlsxwriter.Workbook(path, _xlsx_options()) as workbook:
+                _write_worksheet(workbook, con, sheet)
+        elif output_format == 'csv':
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(sheet.header)
+                writer.writerows(_rows(con, sheet))
+        elif output_format == 'parquet':
+            df = pd.DataFrame.from_records(
+                list(_rows(con, sheet)), columns=[str(col) for col in sheet.header]
+            )
+            df.to_parquet(path, index=False)
+        else:
+            raise ValueError(f'Unrecognized output format: {output_format}')
+    return path
+
+
+def make_excel(
+    ifile: str | None,
+    ofile: Path | None,
+    scenario: set[str],
+    output_format: str = 'xlsx',
+    workers: int = 1,
+) -> None:
+    """
+    Processes a Temoa database to produce human-readable and IAMC-format
+    Excel files.
+
+    With one worker, the Excel sheets are written to a single workbook <ofile>.xlsx.  With more
+    workers, or for the CSV and Parquet formats, each sheet is written to its own file
+    <ofile>_<sheet name>.<format>, by up to `workers` processes.  The IAMC-format data is
+    written to <ofile>_pyam.<format>.
+
+    :param ifile: the database file
+    :param ofile: the output file name (the suffix is replaced by the format)
+    :param scenario: the (single) scenario name
+    :param output_format: one of the SPREADSHEET_FORMATS
+    :param workers: the number of processes writing the files
+    """
+    if ifile is None:
+        raise ValueError("You did not specify the input file. Remember to use the '-i' option.")
+
+    file_match = re.search(r'(\w+)\.(\w+)\b', ifile)
+    if not file_match:
+        raise ValueError(f'The file type {ifile} is not recognized. Use a database file.')
+
+    if output_format not in SPREADSHEET_FORMATS:
+        raise ValueError(
+            f'The output format {output_format} is not one of {", ".join(SPREADSHEET_FORMATS)}'
+        )
+    if output_format == 'parquet' and not (
+        importlib.util.find_spec('pyarrow') or importlib.util.find_spec('fastparquet')
+    ):
+        raise ImportError('Parquet output requires pyarrow or fastparquet to be installed')
+
+    if ofile is None:
+        ofile = Path(file_match.group(1))
+        print(f'Look for output in {ofile}_*.{output_format}')
+
+    scenario_name = next(iter(scenario))
+
+    with closing(sqlite3.connect(ifile)) as con:
+        sheets = _sector_sheets(con, scenario_name, 'Capacity', 'output_net_capacity', 'capacity')
+        sheets += _sector_sheets(con, scenario_name, 'Activity', 'output_flow_out', 'flow')
+        emission_sheet = _emission_sheet(con, scenario_name)
+        if emission_sheet is not None:
+            sheets.append(emission_sheet)
+        sheets.append(_cost_sheet(scenario_name))
+
+        base_name = ofile.stem
+        iamc_path = ofile.with_name(f'{base_name}_pyam.{output_format}')
+        if output_format == 'xlsx' and workers == 1:
+            with xlsxwriter.Workbook(ofile.with_suffix('.xlsx'), _xlsx_options()) as workbook:
+                for sheet in sheets:
+                    _write_worksheet(workbook, con, sheet)
+            _write_sheet(ifile, _iamc_sheet(scenario_name), iamc_path, output_format)
+            return
+
+    jobs = [
+        (sheet, ofile.with_name(f'{base_name}_{sheet.name}.{output_format}')) for sheet in sheets
+    ]
+    jobs.append((_iamc_sheet(scenario_name), iamc_path))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_write_sheet, ifile, sheet, path, output_format) for sheet, path in jobs
+        ]
+        for future in futures:
+            future.result()
 
 
 def get_data(inputs: dict[str, str]) -> None:
@@ -247,19 +342,21 @@ def get_data(inputs: dict[str, str]) -> None:
     ofile_str = inputs.get('-o') or inputs.get('--output')
     ofile = Path(ofile_str) if ofile_str else None
     scenario = {s for k, s in inputs.items() if k in ('-s', '--scenario')}
+    output_format = inputs.get('-f') or inputs.get('--format') or 'xlsx'
+    workers = int(inputs.get('-w') or inputs.get('--workers') or 1)
 
     if not scenario:
         raise ValueError("You must specify a scenario with the '-s' option.")
 
-    make_excel(ifile, ofile, scenario)
+    make_excel(ifile, ofile, scenario, output_format=output_format, workers=workers)
 
 
 if __name__ == '__main__':
     try:
         opts, _ = getopt.getopt(
             sys.argv[1:],
-            'hi:o:s:',
-            ['help', 'input=', 'output=', 'scenario='],
+            'hi:o:s:f:w:',
+            ['help', 'input=', 'output=', 'scenario=', 'format=', 'workers='],
         )
     except getopt.GetoptError as err:
         print(err)
@@ -273,6 +370,6 @@ if __name__ == '__main__':
 
     try:
         get_data(opts_dict)
-    except (ValueError, FileNotFoundError) as e:
+    except (ValueError, FileNotFoundError, ImportError) as e:
         print(f'Error: {e}')
         sys.exit(2)
@@ -1070,5 +1070,18 @@ CREATE TABLE IF NOT EXISTS output_flow_out_summary
     PRIMARY KEY (scenario, region, period, input_comm, tech, vintage, output_comm)
 );
 
+-- for efficient clearing of results by scenario and period:
+CREATE INDEX IF NOT EXISTS output_built_capacity_scenario_vintage ON output_built_capacity (scenario, vintage);
+CREATE INDEX IF NOT EXISTS output_cost_scenario_period ON output_cost (scenario, period);
+CREATE INDEX IF NOT EXISTS output_curtailment_scenario_period ON output_curtailment (scenario, period);
+CREATE INDEX IF NOT EXISTS output_dual_variable_scenario ON output_dual_variable (scenario);
+CREATE INDEX IF NOT EXISTS output_emission_scenario_period ON output_emission (scenario, period);
+CREATE INDEX IF NOT EXISTS output_flow_in_scenario_period ON output_flow_in (scenario, period);
+CREATE INDEX IF NOT EXISTS output_flow_out_scenario_period ON output_flow_out (scenario, period);
+CREATE INDEX IF NOT EXISTS output_net_capacity_scenario_period ON output_net_capacity (scenario, period);
+CREATE INDEX IF NOT EXISTS output_objective_scenario ON output_objective (scenario);
+CREATE INDEX IF NOT EXISTS output_retired_capacity_scenario_period ON output_retired_capacity (scenario, period);
+CREATE INDEX IF NOT EXISTS output_storage_level_scenario_period ON output_storage_level (scenario, period);
+
 COMMIT;
 PRAGMA foreign_keys = ON;
@@ -5,20 +5,70 @@ This module contains the core "evaluation" function for Method Of Morris.  It ne
 from __future__ import annotations
 
 import logging
-import sqlite3
+import pickle
 import sys
 from logging.handlers import QueueHandler
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from pyomo.dataportal import DataPortal
 
 from temoa._internal import run_actions
-from temoa._internal.table_writer import TableWriter
+from temoa._internal.table_data_puller import poll_emissions, poll_objective
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from temoa.core.config import TemoaConfig
+    from temoa.types.model_types import EI
+
+
+class MorrisEvaluation(NamedTuple):
+    """The outcome of one MM evaluation, as returned from a worker to the sequencer"""
+
+    iteration: int
+    objective: float
+    emission_totals: dict[str, float]
+    """total emission of each analyzed emission commodity, keyed by commodity"""
+    obj_data: list[tuple[str, float]] | None
+    """the objective (name, value) records, if the detailed results are to be written"""
+    emission_flows: dict[EI, float] | None
+    """the emission flows, if the detailed results are to be written"""
+
+    @property
+    def outputs(self) -> list[float]:
+        """the values of the MM outputs:  the objective, then the emission totals, in order"""
+        return [self.objective, *self.emission_totals.values()]
 
 
+_base_data: dict[tuple[Path, int], dict[str, Any]] = {}
+"""the base data last loaded by this (worker) process, keyed by (file, modification time)"""
+
+
+def write_base_data(data: dict[str, Any], path: Path) -> None:
+    """
+    write the base data for the workers to a file, which each worker reads once
+    :param data: the data dictionary holding the base values for the model
+    :param path: the file to write
+    """
+    with open(path, 'wb') as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_base_data(path: Path) -> dict[str, Any]:
+    """
+    the base data written by write_base_data.  It is read from file on the first call in each
+    process (and again only if the file changes), so workers that joblib re-uses for many
+    evaluations read it once.  The data must not be modified.
+    :param path: the file written by write_base_data
+    :return: the base data
+    """
+    key = (path, path.stat().st_mtime_ns)
+    if key not in _base_data:
+        _base_data.clear()
+        with open(path, 'rb') as f:
+            _base_data[key] = pickle.load(f)
+    return _base_data[key]
+
 
 def configure_worker_logger(log_queue: Any, log_level: int) -> logging.Logger:
     """configure the logger"""
@@ -35,23 +85,37 @@ def configure_worker_logger(log_queue: Any, log_level: int) -> logging.Logger:
     return worker_logger
 
 
-def evaluate(param_info: dict[int, list[Any]], mm_sample: Any, data: dict[str, Any],
-            i: int, config: TemoaConfig, log_queue: Any, log_level: int) -> list[float]:
+def evaluate(param_info: dict[int, list[Any]], mm_sample: Any, base_data_path: Path,
+            i: int, config: TemoaConfig, log_queue: Any, log_level: int,
+            emission_labels: tuple[str, ...] = ('co2',), emission_threshold: float = 0.0,
+            keep_details: bool = True) -> MorrisEvaluation:
     """
-    Run model for params provided and return objective value and emission value
+    Run model for params provided and return objective value and emission values
     Note:  This function needs to be a static instance to enable the parallel
     processing, which requires parallelization of the parameters.  It cannot be
     a class or instance function, AFAIK
+
+    The outputs are taken from the solved instance in memory.  Nothing is written to the database
+    here:  if keep_details is True, the detailed results are returned for the sequencer to write,
+    so the workers do not contend for the database.
     :param param_info: The stack of parameter data to pull name/index from
     :param mm_sample: The values of the parameters to alter
-    :param data: Data used to build the Data Portal
+    :param base_data_path: the file holding the base data used to build the Data Portal (see
+    write_base_data)
     :param i: indexing number
     :param config: The config file to pull run data from
-    :return: list of objective value and CO2 emission value
+    :param emission_labels: the emission commodities to total
+    :param emission_threshold: emission flows smaller than this (in magnitude) are ignored, as they
+    are in the output tables
+    :param keep_details: return the detailed objective and emission results for writing
+    :return: the objective value and emission totals (and details, if requested)
     """
     # get the logger configured...
     logger = configure_worker_logger(log_queue, log_level)
     logger.info('Starting MM evaluation # %d', i + 1)
+    base_data = load_base_data(base_data_path)
+    # copy-on-write:  the perturbed parameters are copied, all others are shared with the base data
+    data = dict(base_data)
     log_entry = ['']
     for j in range(0, len(mm_sample)):
         param_name, *set_idx, _ = param_info[j]
@@ -61,6 +125,8 @@ def evaluate(param_info: dict[int, list[Any]], mm_sample: Any, data: dict[str, A
             raise ValueError(f'Unrecognized parameter: {param_name}')
         if data[param_name].get(set_idx_tuple) is None:
             raise ValueError('index mismatch from data read-in')
+        if data[param_name] is base_data[param_name]:
+            data[param_name] = base_data[param_name].copy()
         data[param_name][set_idx_tuple] = mm_sample[j]
         setting_entry = 'run # %d:  Setting param %s[%s] to value:  %f'
         log_entry.append(setting_entry)
@@ -74,39 +140,25 @@ def evaluate(param_info: dict[int, list[Any]], mm_sample: Any, data: dict[str, A
     status = run_actions.check_solve_status(res)
     if not status:
         raise RuntimeError('Bad solve during Method of Morris')
-    with TableWriter(config) as table_writer:
-        table_writer.write_mm_results(model=mdl, iteration=i)
-    import contextlib
-    with contextlib.closing(sqlite3.connect(config.input_database)) as con:
-        cur = con.cursor()
-        scenario_name = config.scenario + f'-{i}'
-        cur.execute(
-            'SELECT total_system_cost FROM output_objective where scenario = ?', (scenario_name,)
+    obj_data = poll_objective(mdl)
+    if len(obj_data) != 1:
+        raise RuntimeError(
+            f'Expected a single active objective in MM run, found {len(obj_data)}.  Coding error.'
         )
-        output_query = cur.fetchall()
-        if len(output_query) > 1:
-            raise RuntimeError(
-                'Multiple outputs found in Objective table matching scenario name.  Coding error.'
-            )
-        else:
-            y_of = output_query[0][0] if output_query[0][0] is not None else 0.0
-        cur.execute(
-            "SELECT SUM(emission) FROM output_emission WHERE emis_comm='co2' AND scenario=?",
-            (scenario_name,),
-        )
-        output_query = cur.fetchall()
-        if len(output_query) == 0:
-            y_cumulative_co2 = 0.0
-        elif len(output_query) > 1:
-            raise RuntimeError(
-                'Multiple outputs found in output_emissions table matching scenario name.  Coding '
-                'error.'
-            )
-        else:
-            y_cumulative_co2 = output_query[0][0] if output_query[0][0] is not None else 0.0
-    morris_objectives = [float(y_of), float(y_cumulative_co2)]
+    y_of = obj_data[0][1]
+    _e_costs, e_flows = poll_emissions(model=mdl, epsilon=emission_threshold)
+    emission_totals = dict.fromkeys(emission_labels, 0.0)
+    for ei, val in e_flows.items():
+        if ei.e in emission_totals and abs(val) >= emission_threshold:
+            emission_totals[ei.e] += val
     logger.info('Finished MM evaluation # %d with OBJ value: %0.2f ', i + 1, y_of)
     if not config.silent:
         sys.stdout.write(f'Completed MM run {i + 1}\n')
         sys.stdout.flush()
-    return morris_objectives
+    return MorrisEvaluation(
+        iteration=i,
+        objective=y_of,
+        emission_totals=emission_totals,
+        obj_data=obj_data if keep_details else None,
+        emission_flows=dict(e_flows) if keep_details else None,
+    )
@@ -22,7 +22,7 @@ from SALib.util import compute_groups_matrix, read_param_file  # type: ignore[im
 
 from temoa._internal.table_writer import TableWriter
 from temoa.data_io.hybrid_loader import HybridLoader
-from temoa.extensions.method_of_morris.morris_evaluate import evaluate
+from temoa.extensions.method_of_morris.morris_evaluate import evaluate, write_base_data
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -121,6 +121,20 @@ class MorrisSequencer:
         self.seed = int(cast('Any', seed)) if seed is not None else None
         logger.info('Morris Seed (None indicates system generated): %s', self.seed)
 
+        # the emission commodities whose totals are analyzed, along with the objective (cost)
+        labels = morris_inputs.get('emission_labels', ['co2'])
+        if not isinstance(labels, list) or not all(isinstance(e, str) for e in labels):
+            raise ValueError('Morris emission_labels must be a list of emission commodity names')
+        if 'cost' in labels:
+            raise ValueError("Morris emission_labels may not include 'cost' (the objective)")
+        self.emission_labels: tuple[str, ...] = tuple(dict.fromkeys(labels))
+        logger.info('Morris emission labels: %s', self.emission_labels)
+
+        # the objective and emission results of each run are written to the output tables (by
+        # this process, as the runs complete) unless switched off
+        self.write_results = bool(morris_inputs.get('write_results', True))
+        logger.info('Morris write results: %s', self.write_results)
+
         self.conf_level = 0.95  # confidence level for mu_star analysis
 
         self.num_cores = morris_inputs.get('cores', 0)
@@ -141,7 +155,7 @@ class MorrisSequencer:
         0.  clear any prior results with this scenario name.  this sequencer appends the DB, so
             start fresh
         1.  gather the parameters from items marked in the DB
-        2.  build a data portal as a basis
+        2.  load the base data and store it for the workers
         3.  use SALib to construct the sample
         4.  set up logging to cover the multiprocessing phase
         5.  run the evaluation of all instances in the mm_samples
@@ -156,10 +170,13 @@ class MorrisSequencer:
         # the 'problem'
         param_names = self.gather_parameters()
 
-        # 2.  Use the loader to get raw access to the model's data (dictionary)
+        # 2.  Use the loader to get raw access to the model's data (dictionary) and store it for
+        # the workers, which each read it once, rather than receive a copy with every sample
         loader = HybridLoader(db_connection=self.con, config=self.config)
-        loader.load_data_portal()
-        data = loader.data
+        data = loader.create_data_dict()
+        base_data_path = self.mm_output_folder / 'base_data.pkl'
+        write_base_data(data, base_data_path)
+        del data
 
         # 3.  Construct the MM Sample
         problem = read_param_file(str(self.param_file))
@@ -181,19 +198,42 @@ class MorrisSequencer:
         log_level = logger.getEffectiveLevel()
         log_listener.start()
 
-        # 5.  Run the processing:
+        # 5.  Run the processing.  The workers return their outputs (and detailed results) and
+        # this process is the only one writing to the database
         if not self.config.silent:
             msg = f'Starting {len(mm_samples)} MM runs on {self.num_cores} cores.\n'
             sys.stdout.write(msg)
             sys.stdout.write('=' * (len(msg) - 1) + '\n')
             sys.stdout.flush()
-        morris_results = Parallel(n_jobs=self.num_cores)(
-            delayed(evaluate)(
-                param_names, mm_samples[i, :], data, i, self.config, log_queue, log_level
-            )
-            for i in range(0, len(mm_samples))
-        )
-        log_listener.stop()
+        morris_results = []
+        try:
+            with TableWriter(config=self.config) as tw:
+                evaluations = Parallel(n_jobs=self.num_cores, return_as='generator')(
+                    delayed(evaluate)(
+                        param_names,
+                        mm_samples[i, :],
+                        base_data_path,
+                        i,
+                        self.config,
+                        log_queue,
+                        log_level,
+                        emission_labels=self.emission_labels,
+                        emission_threshold=tw.output_threshold_emission,
+                        keep_details=self.write_results,
+                    )
+                    for i in range(0, len(mm_samples))
+                )
+                for evaluation in evaluations:
+                    if evaluation.obj_data is not None and evaluation.emission_flows is not None:
+                        tw.write_mm_results(
+                            obj_data=evaluation.obj_data,
+                            emission_flows=evaluation.emission_flows,
+                            iteration=evaluation.iteration,
+                        )
+                    morris_results.append(evaluation.outputs)
+        finally:
+            log_listener.stop()
+            base_data_path.unlink(missing_ok=True)
 
         # 6.  Process results
         cost_mu_star = self.process_results(problem, mm_samples, morris_results)
@@ -207,32 +247,23 @@ class MorrisSequencer:
         Process the results of the runs on the mm_samples
         :param problem: the problem structure
         :param mm_samples: the n samples used for the runs
-        :param morris_results: n * 2 array of results for the 2 objectives tracked
+        :param morris_results: n * (1 + number of emission labels) array of results for the
+        objective and each of the emission totals tracked
         :return:
         """
         morris_objectives = array(morris_results)
         analysis = {}
-        analysis['cost'] = morris.analyze(
-            problem,
-            mm_samples,
-            morris_objectives[:, 0],
-            conf_level=self.conf_level,
-            print_to_console=False,
-            num_levels=self.num_levels,
-            num_resamples=1000,
-            seed=self.seed + 1 if self.seed else None,
-        )
-
-        analysis['co2'] = morris.analyze(
-            problem,
-            mm_samples,
-            morris_objectives[:, 1],
-            conf_level=self.conf_level,
-            print_to_console=False,
-            num_levels=self.num_levels,
-            num_resamples=1000,
-            seed=self.seed + 2 if self.seed else None,
-        )
+        for col, category in enumerate(('cost', *self.emission_labels)):
+            analysis[category] = morris.analyze(
+                problem,
+                mm_samples,
+                morris_objectives[:, col],
+                conf_level=self.conf_level,
+                print_to_console=False,
+                num_levels=self.num_levels,
+                num_resamples=1000,
+                seed=self.seed + col + 1 if self.seed else None,
+            )
         groups, unique_group_names = compute_groups_matrix(problem['groups'])
         number_of_groups = len(unique_group_names)
         mu_star_conf_label = f'Mu_Star_Conf[{self.conf_level}]'
@@ -18,12 +18,13 @@ from typing import TYPE_CHECKING, Any, cast
 if TYPE_CHECKING:
     from multiprocessing.process import BaseProcess
 
-    from pyomo.contrib.solver.common.results import Results
+    from pyomo.opt import SolverResults
     from pyomo.dataportal import DataPortal
 
     from temoa.core.config import TemoaConfig
     from temoa.core.model import TemoaModel
     from temoa.extensions.modeling_to_generate_alternatives.vector_manager import VectorManager
+    from temoa.extensions.modeling_to_generate_alternatives.worker import MgaResult
 
 
 
@@ -33,6 +34,8 @@ if TYPE_CHECKING:
 import pyomo.environ as pyo
 from pyomo.opt import check_optimal_termination
 
+from temoa._internal import build_profiler
+from temoa._internal.persistent_solve import PersistentSolve
 from temoa._internal.run_actions import build_instance
 from temoa._internal.table_writer import TableWriter
 from temoa.components.costs import total_cost_rule
@@ -53,7 +56,6 @@ solver_options_path = (
 class MgaSequencer:
     con: sqlite3.Connection
     config: TemoaConfig
-    opt: Any
     worker_solver_options: dict[str, Any]
     internal_stop: bool
     mga_axis: MgaAxis
@@ -103,8 +105,6 @@ class MgaSequencer:
             s_options = {}
             all_options = {}
 
-        # get handle on solver instance
-        self.opt = pyo.SolverFactory(self.config.solver_name)
         self.worker_solver_options = s_options
 
         # some defaults, etc.
@@ -132,6 +132,8 @@ class MgaSequencer:
         logger.info('Set MGA time limit hours to: %0.1f', self.time_limit_hrs)
         self.cost_epsilon = float(cast(str | float, mga_inputs.get('cost_epsilon', 0.05)))
         logger.info('Set MGA cost (relaxation) epsilon to: %0.3f', self.cost_epsilon)
+        # start each worker solve from the previous solution (the base solution, at first)
+        self.warm_start = bool(mga_inputs.get('warm_start', False))
 
         # internal records
         self.solve_count = 0
@@ -164,7 +166,11 @@ class MgaSequencer:
         hybrid_loader = HybridLoader(db_connection=self.con, config=self.config)
         data_portal: DataPortal = hybrid_loader.load_data_portal(myopic_index=None)
         instance: TemoaModel = build_instance(
-            loaded_portal=data_portal, model_name=self.config.scenario, silent=self.config.silent
+            loaded_portal=data_portal,
+            model_name=self.config.scenario,
+            silent=self.config.silent,
+            profile_path=build_profiler.report_path(self.config),
+            validate_elements=not self.config.bulk_validation,
         )
         if self.config.price_check:
             good_prices = price_checker(instance)
@@ -177,7 +183,9 @@ class MgaSequencer:
         tic = datetime.now()
         #   ============ First Solve ============
         #  Note:  We *exclude* the worker_solver_options here to get a more precise base cost
-        res: Results = self.opt.solve(instance)
+        res: SolverResults = PersistentSolve(
+            instance, solver_name=self.config.solver_name, silent=self.config.silent
+        ).solve()
         toc = datetime.now()
         elapsed = toc - tic
         self.solve_count += 1
@@ -217,9 +225,10 @@ class MgaSequencer:
             config=self.config,
         )
 
-        # 5.  Set up the Workers
+        # 5.  Set up the Workers.  Each worker gets a copy of the cost-capped base model when it
+        # starts, so the jobs are just objective vectors and the queue can hold one per worker
         num_workers = self.num_workers
-        work_queue: Queue[Any] = Queue(1)  # restrict the queue to hold just 1 models in it max
+        work_queue: Queue[Any] = Queue(num_workers)
         result_queue: Queue[Any] = Queue(
             num_workers + 1
         )  # must be able to hold a shutdown signal from all workers at once!
@@ -232,6 +241,8 @@ class MgaSequencer:
             s_path.mkdir()
         for _ in range(num_workers):
             w = Worker(
+                base_model=instance,
+                var_index=vector_manager.var_index(),
                 model_queue=work_queue,
                 results_queue=result_queue,
                 log_root_name=__name__,
@@ -240,19 +251,22 @@ class MgaSequencer:
                 solver_name=self.config.solver_name,
                 solver_options=self.worker_solver_options,
                 solver_log_path=s_path,
+                warm_start=self.warm_start,
+                capacity_epsilon=self.writer.output_threshold_capacity,
+                activity_epsilon=self.writer.output_threshold_activity,
             )
             w.start()
             workers.append(w)
         # workers now running and waiting for jobs...
 
         # 6.  Start the iterative solve process and let the manager run the show
-        instance_generator = vector_manager.model_generator()
-        instance = next(instance_generator)
+        vector_generator = vector_manager.vector_generator()
+        job = next(vector_generator)
         while not vector_manager.expired and not self.internal_stop:
             try:
-                work_queue.put(instance, block=False)  # put a log on the fire, if room
-                logger.info('Putting an instance in the work queue')
-                instance = next(instance_generator)
+                work_queue.put(job, block=False)  # put a log on the fire, if room
+                logger.info('Putting an objective vector in the work queue')
+                job = next(vector_generator)
             except queue.Full:
                 # print('work queue is full')
                 pass
@@ -263,7 +277,7 @@ class MgaSequencer:
                 next_result = None
                 # print('no result')
             if next_result is not None:
-                vector_manager.process_results(model=next_result)
+                vector_manager.process_activity(next_result.activity)
                 self.process_solve_results(next_result)
                 logger.info('Solve count: %d', self.solve_count)
                 self.solve_count += 1
@@ -307,7 +321,7 @@ class MgaSequencer:
                 next_result = None
             if next_result is not None and next_result != 'COYOTE':
                 logger.debug('bagged a result post-shutdown')
-                vector_manager.process_results(model=next_result)
+                vector_manager.process_activity(next_result.activity)
                 self.process_solve_results(next_result)
                 logger.info('Solve count: %d', self.solve_count)
                 self.solve_count += 1
@@ -345,7 +359,9 @@ class MgaSequencer:
 
     def solve_instance(self, instance: TemoaModel) -> bool:
         tic = datetime.now()
-        res = self.opt.solve(instance)
+        res = PersistentSolve(
+            instance, solver_name=self.config.solver_name, silent=self.config.silent
+        ).solve()
         toc = datetime.now()
         elapsed = toc - tic
         status = res['Solver'].termination_condition
@@ -358,20 +374,19 @@ class MgaSequencer:
         return status == pyo.TerminationCondition.optimal or \
             str(status) == 'convergenceCriteriaSatisfied'
 
-    def process_solve_results(self, instance: TemoaModel) -> None:
+    def process_solve_results(self, result: MgaResult) -> None:
         """write the results as required"""
         # get the instance number from the model name, if provided
-        if '-' not in instance.name:
+        if '-' not in result.name:
             raise ValueError(
                 'Instance name does not appear to contain a -idx value.  The manager should be '
                 'tagging/updating this'
             )
-        idx = int(instance.name.split('-')[-1])
+        idx = int(result.name.split('-')[-1])
         if idx in self.seen_instance_indices:
             raise ValueError('Instance index already seen.  Likely coding error')
         self.seen_instance_indices.add(idx)
-        self.writer.write_capacity_tables(model=instance, iteration=idx)
-        self.writer.write_summary_flow(instance, iteration=idx)
+        self.writer.write_mga_results(result, iteration=idx)
 
     def __del__(self) -> None:
         if hasattr(self, 'con') and self.con is not None:
@@ -150,27 +150,33 @@ class TechActivityVectorManager(VectorManager):
     def random_input_vector_model(self) -> TemoaModel:
         new_model = self.base_model.clone()
         new_model.name = self.new_model_name()
-        var_vec = self.var_vector(new_model)
-        coeffs = np.random.random(len(var_vec))
-        coeffs /= sum(coeffs)
-        obj_expr = quicksum(c * v for c, v in zip(coeffs, var_vec, strict=False))
-        new_model.obj = Objective(expr=obj_expr)
+        new_model.obj = Objective(
+            expr=self.objective_expression(new_model, self._random_coefficients())
+        )
         return new_model
 
     def model_generator(self) -> Iterator[TemoaModel]:
         """
-        Generate instances to solve.  Start with the basis vectors, then ...
+        Generate instances to solve by cloning the base model and applying each objective vector
         :return: a TemoaModel instance
         """
-        # traverse the basis vectors first
-        new_model = self.base_model.clone()
-        obj_vector = self._make_basis_objective_vector(new_model)
-        while obj_vector is not None:
-            new_model.obj = Objective(expr=obj_vector)
-            new_model.name = self.new_model_name()
-            yield new_model
+        for name, coeffs in self.vector_generator():
             new_model = self.base_model.clone()
-            obj_vector = self._make_basis_objective_vector(new_model)
+            new_model.name = name
+            new_model.obj = Objective(expr=self.objective_expression(new_model, coeffs))
+            yield new_model
+
+    def vector_generator(self) -> Iterator[tuple[str, np.ndarray]]:
+        """
+        Generate named objective coefficient vectors to solve.  Start with the basis vectors,
+        then ...
+        :return: tuple of the model name and the coefficient vector (in var_index order)
+        """
+        # traverse the basis vectors first
+        coeffs = self._next_basis_coefficients()
+        while coeffs is not None:
+            yield self.new_model_name(), coeffs
+            coeffs = self._next_basis_coefficients()
 
         # if asking for more, we *should* have enough data to create a good hull now...
         if len(self.category_mapping) > 0:
@@ -182,19 +188,17 @@ class TechActivityVectorManager(VectorManager):
                     'Adding random vectors to augment the basis.'
                     'Some basis solves may have crashed...'
                 )
-                yield self.random_input_vector_model()
+                yield self.new_model_name(), self._random_coefficients()
 
         logger.info('Generating hull points')
         self.regenerate_hull()
         # now we can run until told to quit or fail to make a new vector
         while True:
-            new_model = self.base_model.clone()
-            new_model.name = self.new_model_name()
-            v = self._next_objective_vector(model=new_model)
-            if v is None:
+            name = self.new_model_name()
+            coeffs = self._next_hull_coefficients()
+            if coeffs is None:
                 return
-            new_model.obj = Objective(expr=v)
-            yield new_model
+            yield name, coeffs
 
     def new_model_name(self) -> str:
         """produce a new name with updated index suffix"""
@@ -205,23 +209,27 @@ class TechActivityVectorManager(VectorManager):
 
     def process_results(self, model: TemoaModel) -> list[float]:
         """
-        retrieve the necessary variable values to make another hull point
-        :param M:
-        :return: None
+        retrieve the necessary variable values from a solved model to make another hull point
+        :param model: the solved model
+        :return: the hull point
+        """
+        return self.process_activity(np.array([value(v) for v in self.var_vector(model)]))
+
+    def process_activity(self, activity: Sequence[float] | np.ndarray) -> list[float]:
+        """
+        roll up an activity vector (in var_index order) from a solve to make another hull point
+        :param activity: the solved values of the variables in the objective vector
+        :return: the hull point
         """
         self.completed_solves += 1
+        activity = np.asarray(activity, dtype=float)
         res: list[float] = []
+        start = 0
         for cat in self.category_mapping:
-            element = 0
-            for tech in self.category_mapping[cat]:
-                for var_name in self.variable_index_mapping[tech]:
-                    model_var = model.find_component(var_name)
-                    if not isinstance(model_var, Var):
-                        raise RuntimeError('hooked a bad fish')
-                    element += sum(
-                        value(model_var[idx]) for idx in self.variable_index_mapping[tech][var_name]
-                    )
-            res.append(element)
+            # the variables of each category are contiguous in the vector
+            size = sum(self.technology_size[tech] for tech in self.category_mapping[cat])
+            res.append(float(np.sum(activity[start : start + size])))
+            start += size
 
         # add it to the hull points
         hull_point = np.array(res)
@@ -243,9 +251,8 @@ class TechActivityVectorManager(VectorManager):
     def group_members(self, group: str | DefaultItem) -> list[str]:
         return self.category_mapping.get(group, [])
 
-    # noinspection PyTypeChecker
-    def _make_basis_objective_vector(self, model: TemoaModel) -> Iterable[Expression] | None:
-        """generator for basis vectors which will be the coefficients in the obj expression in the
+    def _next_basis_coefficients(self) -> np.ndarray | None:
+        """supplier for basis vectors which will be the coefficients in the obj expression in the
         basis solves"""
         if self.basis_coefficients.empty():
             return None
@@ -254,16 +261,17 @@ class TechActivityVectorManager(VectorManager):
         except queue.Empty:
             return None
 
-        # now we need to roll out a vector of the variables and pair them with coefficients...
-        vars = self.var_vector(model)
-
         # verify a unit vector
         err = abs(abs(sum(coeffs)) - 1)
         assert err < 1e-6, 'unit vector size error'
-        expr = sum(c * v for v, c in zip(vars, coeffs, strict=False) if c != 0)
-        return expr
+        return coeffs
 
-    def _next_objective_vector(self, model: TemoaModel) -> Expression | None:
+    def _random_coefficients(self) -> np.ndarray:
+        coeffs = np.random.random(sum(self.technology_size.values()))
+        coeffs /= sum(coeffs)
+        return coeffs
+
+    def _next_hull_coefficients(self) -> np.ndarray | None:
         if self.coefficient_vector_queue.qsize() <= 3:
             logger.info('running low on input vectors...  refreshing the vectors with new hull')
             self.regenerate_hull()
@@ -282,26 +290,38 @@ class TechActivityVectorManager(VectorManager):
                 coeffs_list.extend(element)
         coeffs = np.array(coeffs_list)
         coeffs /= np.sum(coeffs)  # normalize
+        return coeffs
 
+    def objective_expression(self, model: TemoaModel, coeffs: np.ndarray) -> Expression:
+        """pair a coefficient vector with the variables of the model to make an obj expression"""
         obj_vars = self.var_vector(model)
-
         assert len(obj_vars) == len(coeffs)
-        return quicksum(c * v for v, c in zip(obj_vars, coeffs, strict=False))
+        return quicksum(c * v for v, c in zip(obj_vars, coeffs, strict=False) if c != 0)
+
+    def var_index(self) -> list[tuple[str, tuple[Any, ...]]]:
+        """Produce a properly sequenced list of the (variable name, index) pairs in the obj
+        vector"""
+        res: list[tuple[str, tuple[Any, ...]]] = []
+        for cat in self.category_mapping:
+            for tech in self.category_mapping[cat]:
+                for var_name, indices in self.variable_index_mapping[tech].items():
+                    res.extend((var_name, idx) for idx in indices)
+        return res
 
     def var_vector(self, model: TemoaModel) -> list[Any]:
         """Produce a properly sequenced array of variables from the current model for use in obj
         vector"""
         res = []
-        for cat in self.category_mapping:
-            for tech in self.category_mapping[cat]:
-                for var_name in self.variable_index_mapping[tech]:
-                    var = model.find_component(var_name)
-                    if not isinstance(var, Var):
-                        raise RuntimeError(
-                            'Failed to retrieve a named variable from the model: %s', var_name
-                        )
-                    for idx in self.variable_index_mapping[tech][var_name]:
-                        res.append(var[idx])
+        model_vars: dict[str, Var] = {}
+        for var_name, idx in self.var_index():
+            if var_name not in model_vars:
+                var = model.find_component(var_name)
+                if not isinstance(var, Var):
+                    raise RuntimeError(
+                        'Failed to retrieve a named variable from the model: %s', var_name
+                    )
+                model_vars[var_name] = var
+            res.append(model_vars[var_name][idx])
         return res
 
     def regenerate_hull(self) -> None:
@@ -8,7 +8,9 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     import sqlite3
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Iterable, Iterator, Sequence
+
+    import numpy as np
 
     from temoa.core.model import TemoaModel
 
@@ -66,10 +68,25 @@ class VectorManager(ABC):
         """generator for model instances to be solved"""
         raise NotImplementedError('the manager subclass must implement instance_generator')
 
+    @abstractmethod
+    def vector_generator(self) -> Iterator[tuple[str, np.ndarray]]:
+        """generator for (model name, objective coefficient vector) pairs to be solved"""
+        raise NotImplementedError('the manager subclass must implement vector_generator')
+
+    @abstractmethod
+    def var_index(self) -> list[tuple[str, tuple[Any, ...]]]:
+        """the (variable name, index) pairs that the objective coefficient vectors apply to"""
+        raise NotImplementedError('the manager subclass must implement var_index')
+
     @abstractmethod
     def process_results(self, model: TemoaModel) -> Any:
         raise NotImplementedError('the manager subclass must implement process_results')
 
+    @abstractmethod
+    def process_activity(self, activity: Sequence[float] | np.ndarray) -> Any:
+        """process the solved values of the variables (in var_index order) from a worker solve"""
+        raise NotImplementedError('the manager subclass must implement process_activity')
+
     @abstractmethod
     def finalize_tracker(self) -> None:
         """Finalize any tracker employed by the manager"""
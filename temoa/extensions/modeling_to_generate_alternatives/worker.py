@@ -1,5 +1,9 @@
 """
 Class to contain Workers that execute solves in separate processes
+
+Each worker holds its own copy of the (cost-capped) base model, which is handed over once when the
+worker process starts.  Jobs on the work queue are just a model name and an objective coefficient
+vector, and the worker sends back a lightweight MgaResult in lieu of the solved model.
 """
 from __future__ import annotations
 
@@ -8,16 +12,32 @@ from datetime import datetime
 from logging import getLogger
 from multiprocessing import Process, Queue
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+from pyomo.core import Objective, Var, quicksum, value
+from pyomo.opt import SolverResults, check_optimal_termination
 
-from pyomo.opt import SolverFactory, SolverResults, check_optimal_termination
+from temoa._internal.persistent_solve import PersistentSolve
+from temoa._internal.table_data_puller import poll_capacity_results, poll_flow_results
 
 if TYPE_CHECKING:
     from temoa.core.model import TemoaModel
+    from temoa.types.model_types import FI, CapData, FlowType
 
 verbose = False  # for T/S or monitoring...
 
 
+class MgaResult(NamedTuple):
+    """The results of a worker solve that are needed by the sequencer and the vector manager"""
+
+    name: str
+    activity: np.ndarray
+    """the solved values of the objective vector variables, in var_index order"""
+    capacity_data: CapData
+    flow_data: dict[FI, dict[FlowType, float]]
+
+
 class Worker(Process):
     worker_idx: int = 1
     worker_number: int
@@ -27,13 +47,20 @@ class Worker(Process):
     solver_name: str
     solver_options: dict[str, Any]
     solver_log_path: Path | None
-    opt: Any
+    opt: PersistentSolve | None
+    warm_start: bool
     log_root_name: str
     log_level: int
     solve_count: int
+    base_model: TemoaModel
+    var_index: list[tuple[str, tuple[Any, ...]]]
+    capacity_epsilon: float
+    activity_epsilon: float
 
     def __init__(
         self,
+        base_model: TemoaModel,
+        var_index: list[tuple[str, tuple[Any, ...]]],
         model_queue: Queue[Any],
         results_queue: Queue[Any],
         log_root_name: str,
@@ -42,7 +69,15 @@ class Worker(Process):
         solver_name: str = 'appsi_highs',
         solver_options: dict[str, Any] | None = None,
         solver_log_path: Path | None = None,
+        capacity_epsilon: float = 1e-5,
+        activity_epsilon: float = 1e-5,
+        warm_start: bool = False,
     ):
+        """
+        :param base_model: the cost-capped model (without objective) to re-solve
+        :param var_index: the (variable name, index) pairs that the coefficient vectors apply to
+        :param warm_start: start each solve from the previous solution of the worker
+        """
         super().__init__(daemon=True)
         self.worker_number = Worker.worker_idx
         Worker.worker_idx += 1
@@ -58,6 +93,12 @@ class Worker(Process):
         self.log_level = log_level
         self.solve_count = 0
 
+        self.base_model = base_model
+        self.var_index = var_index
+        self.capacity_epsilon = capacity_epsilon
+        self.activity_epsilon = activity_epsilon
+        self.warm_start = warm_start
+
     def run(self) -> None:
         logger: logging.Logger = getLogger('.'.join(
             (self.log_root_name, 'worker', str(self.worker_number))))
@@ -68,10 +109,20 @@ class Worker(Process):
         logger.addHandler(handler)
         logger.info('Worker %d spun up', self.worker_number)
 
-        # Initialize the solver here  in the child process to avoid pickling issues
-        # Note: We do not set the options here because appsi_highs does not accept options in
-        # __init__. We can set them later via self.opt.options
-        self.opt = SolverFactory(self.solver_name)
+        # Initialize the solver here  in the child process to avoid pickling issues.  It keeps the
+        # model between the jobs, so only the new objective is passed to it for each solve
+        model = self.base_model
+        self.opt = PersistentSolve(
+            model, solver_name=self.solver_name, silent=True, warm_start=self.warm_start
+        )
+
+        # sequence the objective vector variables once, they are re-used for every solve
+        model_vars: dict[str, Var] = {}
+        obj_vars = []
+        for var_name, idx in self.var_index:
+            if var_name not in model_vars:
+                model_vars[var_name] = model.find_component(var_name)
+            obj_vars.append(model_vars[var_name][idx])
 
         # update the solver options to pass in a log location
         while True:
@@ -90,19 +141,27 @@ class Worker(Process):
                     case _:
                         pass
 
-            self.opt.options = self.solver_options
+            self.opt.solver_options = self.solver_options
 
-            model: TemoaModel = self.model_queue.get()
-            if model == 'ZEBRA':  # shutdown signal
+            job = self.model_queue.get()
+            if job == 'ZEBRA':  # shutdown signal
                 if verbose:
                     print(f'worker {self.worker_number} got shutdown signal')
                 logger.info('Worker %d received shutdown signal', self.worker_number)
                 self.results_queue.put('COYOTE')
                 break
+            name, coeffs = job
+            model.name = name
+            if model.component('obj') is not None:
+                model.del_component('obj')
+            model.obj = Objective(
+                expr=quicksum(c * v for v, c in zip(obj_vars, coeffs, strict=True) if c != 0)
+            )
+            self.opt.set_objective(model.obj)
             tic = datetime.now()
             try:
                 self.solve_count += 1
-                solve_res: SolverResults | None = self.opt.solve(model)
+                solve_res: SolverResults | None = self.opt.solve()
 
             except Exception as e:
                 if verbose:
@@ -120,7 +179,13 @@ class Worker(Process):
             try:
                 good_solve = check_optimal_termination(solve_res)
                 if good_solve:
-                    self.results_queue.put(model)
+                    result = MgaResult(
+                        name=name,
+                        activity=np.array([value(v) for v in obj_vars]),
+                        capacity_data=poll_capacity_results(model, self.capacity_epsilon),
+                        flow_data=poll_flow_results(model, self.activity_epsilon),
+                    )
+                    self.results_queue.put(result)
                     logger.info(
                         'Worker %d solved a model in %0.2f minutes',
                         self.worker_number,
@@ -10,5 +10,6 @@ CREATE TABLE IF NOT EXISTS output_mc_delta
     new_val     REAL NOT NULL
 
 );
+CREATE INDEX IF NOT EXISTS output_mc_delta_scenario ON output_mc_delta (scenario);
 
 COMMIT;
@@ -9,11 +9,11 @@ from logging import getLogger
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
-from temoa.core.model import TemoaModel
+from temoa.core.model import TemoaModel, abstract_model
 from temoa.data_io.hybrid_loader import HybridLoader
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Generator, Iterable
 
     from pyomo.dataportal import DataPortal
 
@@ -27,6 +27,87 @@ ChangeRecord = namedtuple('ChangeRecord', ['param_name', 'param_index', 'old_val
 """a record of a data element change, for an element acted on by a Tweak"""
 
 
+def apply_change_records(
+    base_data: dict[str, Any], change_records: Iterable[ChangeRecord]
+) -> dict[str, Any]:
+    """
+    make a run data store from the base data and a set of change records.  Only the parameters
+    named in the change records are copied, all other entries are shared with the base data, so
+    the base data is never modified.
+    :param base_data: the data dictionary holding the base values for the model
+    :param change_records: the deltas to apply
+    :return: a new data dictionary with the deltas applied
+    """
+    run_data = dict(base_data)
+    copied: set[str] = set()
+    for record in change_records:
+        if record.param_name not in copied:
+            run_data[record.param_name] = base_data[record.param_name].copy()
+            copied.add(record.param_name)
+        run_data[record.param_name][record.param_index] = record.new_value
+    return run_data
+
+
+class IndexLookup:
+    """
+    A positional inverted index over the keys of the parameters in a data store, used to find the
+    keys matching a (possibly wildcard) search index by intersecting the sets of keys holding each
+    of the non-wildcard elements, rather than testing every key of the parameter.  A parameter is
+    indexed on its first search.  The keys of the data store must not change after that.
+    """
+
+    data_store: dict[str, Any]
+
+    def __init__(self, data_store: dict[str, Any]):
+        """
+        :param data_store: the data dictionary to search
+        """
+        self.data_store = data_store
+        # param -> (its keys, in data order; for each index position: element -> key positions)
+        self._index: dict[str, tuple[list[tuple[Any, ...]], list[dict[Any, set[int]]]]] = {}
+
+    def _param_index(
+        self, param: str
+    ) -> tuple[list[tuple[Any, ...]], list[dict[Any, set[int]]]] | None:
+        if param not in self._index:
+            param_data = self.data_store.get(param)
+            if not param_data:
+                return None
+            keys = list(param_data.keys())
+            positions: list[dict[Any, set[int]]] = [defaultdict(set) for _ in keys[0]]
+            for key_num, key in enumerate(keys):
+                for pos, element in enumerate(key):
+                    positions[pos][element].add(key_num)
+            self._index[param] = keys, positions
+        return self._index[param]
+
+    def matches(self, param: str, target_index: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        """
+        find the indices of a parameter that match the index, which may contain wildcards
+        :param param: the name of the parameter to search
+        :param target_index: the search criteria
+        :return: list of matching indices, in the order of the data
+        """
+        param_index = self._param_index(param)
+        if param_index is None:
+            return []
+        keys, positions = param_index
+        # check for correct index length (would be odd, but...)
+        if len(target_index) != len(keys[0]):
+            raise ValueError(
+                f'length of search index {target_index} for parameter {param} does not match data '
+                f'ex: {keys[0]}'
+            )
+        candidates = [
+            positions[pos].get(item, set())
+            for pos, item in enumerate(target_index)
+            if item != '*'
+        ]
+        if not candidates:  # all wildcards
+            return list(keys)
+        candidates.sort(key=len)
+        found = candidates[0].intersection(*candidates[1:])
+        return [keys[key_num] for key_num in sorted(found)]
 
 
 class Tweak:
@@ -191,20 +272,23 @@ class MCRun:
             res.extend(self.included_tweaks[k])
         return res
 
+    @property
+    def run_name(self) -> str:
+        """the indexed name for the scenario"""
+        return f'{self.scenario_name}-{self.run_index}'
+
     @property
     def model_dp(self) -> tuple[str, DataPortal]:
         """tuple of the indexed name for the scenario, and the DP"""
-        name = f'{self.scenario_name}-{self.run_index}'
         dp = HybridLoader.data_portal_from_data(self.data_store)
-        return name, dp
+        return self.run_name, dp
 
     @property
     def model(self) -> TemoaModel:
         dp = self.model_dp
-        model = TemoaModel()
-        instance = model.create_instance(data=dp)
+        instance = abstract_model().create_instance(data=dp)
         # update the name to indexed...
-        instance.name = f'{self.scenario_name}-{self.run_index}'
+        instance.name = self.run_name
         logger.info('Created model instance for run %d', self.run_index)
         return instance
 
@@ -219,12 +303,15 @@ class MCRunFactory:
     config: TemoaConfig
     data_store: dict[str, Any]
     tweak_factory: TweakFactory
+    index_lookup: IndexLookup
     settings_file: Path
 
     def __init__(self, config: TemoaConfig, data_store: dict[str, Any]):
         self.config = config
         self.data_store = data_store
         self.tweak_factory = TweakFactory(data_store)
+        # the tweaks only change values, so the base data keys serve every run
+        self.index_lookup = IndexLookup(data_store)
 
         if not config.monte_carlo_inputs:
             raise ValueError("Monte Carlo mode requires 'monte_carlo_inputs' in the configuration.")
@@ -307,34 +394,12 @@ class MCRunFactory:
     ) -> list[tuple[Any, ...]]:
         """
         find the associated indices that match the index, which may
-        contain wildcards
+        contain wildcards.  (For repeated searches, use an IndexLookup on the data store.)
         :param data_store: the data dictionary to search
         :param target_index: the search criteria
         :return: list of matching indices
         """
-        # locate non-wildcards
-        non_wildcard_locs = []
-        for idx, item in enumerate(target_index):
-            if item != '*':
-                non_wildcard_locs.append(idx)
-        # grab all the indices for the given parameter
-        param_data = data_store.get(param)
-        if not param_data:
-            return []
-        # check for correct index length (would be odd, but...)
-        first_index = tuple(param_data.keys())[0]
-        if len(target_index) != len(first_index):
-            raise ValueError(
-                f'length of search index {target_index} for parameter {param} does not match data '
-                f'ex: {first_index}'
-            )
-        raw_indices = param_data.keys()
-        matches = [
-            k
-            for k in raw_indices
-            if all(k[idx] == target_index[idx] for idx in non_wildcard_locs)
-        ]
-        return matches
+        return IndexLookup(data_store).matches(param, target_index)
 
     @staticmethod
     def _adjust_value(old_value: float, adjust_type: str, factor: float) -> float:
@@ -360,18 +425,23 @@ class MCRunFactory:
             logger.info('Making run %d from %d tweaks', run, len(tweaks))
             logger.debug('Run %d tweaks: %s', run, tweaks)
 
-            # need to make a DEEP copy of the orig, which holds other dictionaries...
-            data_store = {k: v.copy() for k, v in self.data_store.items()}
+            # copy-on-write:  the run shares the base data, except for the parameters it tweaks,
+            # which are copied when first touched, so the base data is never modified
+            data_store = dict(self.data_store)
+            copied: set[str] = set()
             failed_tweaks = []
             good_tweaks: dict[Tweak, list[ChangeRecord]] = defaultdict(list)
             for tweak in tweaks:
                 # locate the element
-                matching_indices = self.element_locator(data_store, tweak.param_name, tweak.indices)
+                matching_indices = self.index_lookup.matches(tweak.param_name, tweak.indices)
                 if not matching_indices:  # catalog as failure
                     failed_tweaks.append(tweak)
                 else:
+                    if tweak.param_name not in copied:
+                        data_store[tweak.param_name] = data_store[tweak.param_name].copy()
+                        copied.add(tweak.param_name)
+                    param_vals = data_store[tweak.param_name]
                     for index in matching_indices:
-                        param_vals = data_store[tweak.param_name]
                         old_value = param_vals[index]
                         new_value = self._adjust_value(old_value, tweak.adjustment, tweak.value)
                         param_vals[index] = new_value
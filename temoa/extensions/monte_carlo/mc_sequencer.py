@@ -18,7 +18,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from temoa._internal.table_writer import TableWriter
 from temoa.data_io.hybrid_loader import HybridLoader
-from temoa.extensions.monte_carlo.mc_run import MCRun, MCRunFactory
+from temoa.extensions.monte_carlo.mc_run import ChangeRecord, MCRun, MCRunFactory
 from temoa.extensions.monte_carlo.mc_worker import MCWorker
 
 if TYPE_CHECKING:
@@ -51,6 +51,7 @@ class MCSequencer:
     orig_label: str
     writer: TableWriter
     verbose: bool
+    delta_updates: bool
 
     def __init__(self, config: TemoaConfig):
         self.config = config
@@ -99,6 +100,13 @@ class MCSequencer:
         self.num_workers = all_options.get('num_workers', 1)
         self.worker_solver_options = s_options
 
+        # ship only the per-run deltas to the workers (which hold the base data) unless disabled
+        self.delta_updates = bool(
+            self.config.monte_carlo_inputs.get('delta_updates', True)
+            if self.config.monte_carlo_inputs
+            else True
+        )
+
         # internal records
         self.solve_count = 0
         self.seen_instance_indices = set()
@@ -115,7 +123,8 @@ class MCSequencer:
         #    before starting the long run
         # 3. make a queue for runs
         # 4. copy & modify the base data to make per-dataset runs
-        # 5. farm out the runs to workers
+        # 5. farm out the runs to workers.  In delta mode, the workers hold the base data and only
+        #    the change records for each run go on the queue
 
 
         # 0. Set up database for scenario
@@ -141,7 +150,7 @@ class MCSequencer:
         ctx = multiprocessing.get_context('spawn')
 
         num_workers = self.num_workers
-        work_queue: Queue[tuple[str, DataPortal] | str] = ctx.Queue(
+        work_queue: Queue[tuple[str, DataPortal | list[ChangeRecord]] | str] = ctx.Queue(
             num_workers + 1
         )  # must be able to hold all shutdowns at once (could be changed later to not lock on
         # insertion...)
@@ -169,6 +178,7 @@ class MCSequencer:
                 solver_options=self.worker_solver_options,
                 log_level=logging.INFO,
                 solver_log_path=s_path,
+                base_data=data_store if self.delta_updates else None,
             )
             p: BaseProcess = ctx.Process(target=w.run, daemon=True)
             p.start()
@@ -181,16 +191,16 @@ class MCSequencer:
         mc_run: MCRun = next(run_gen)
         # capture the "tweaks"
         self.writer.write_tweaks(iteration=mc_run.run_index, change_records=mc_run.change_records)
-        run_name, dp = mc_run.model_dp
+        run_name, job = self._make_job(mc_run)
         iter_counter = 0
         while more_runs:
             try:
                 tic = datetime.now()
-                work_queue.put((run_name, dp), block=False)  # put a log on the fire, if room
+                work_queue.put((run_name, job), block=False)  # put a log on the fire, if room
                 toc = datetime.now()
 
                 logger.info(
-                    'Put a DataPortal in the work queue in work queue in %0.2f seconds',
+                    'Put a job in the work queue in %0.2f seconds',
                     (toc - tic).total_seconds(),
                 )
                 try:
@@ -205,7 +215,7 @@ class MCSequencer:
                         iteration=mc_run.run_index, change_records=mc_run.change_records
                     )
                     # ready the next one
-                    run_name, dp = mc_run.model_dp
+                    run_name, job = self._make_job(mc_run)
                 except StopIteration:
                     logger.info('Pulled last DP from run generator')
                     more_runs = False
@@ -309,6 +319,12 @@ class MCSequencer:
         if self.verbose:
             print('result queue joined')
 
+    def _make_job(self, mc_run: MCRun) -> tuple[str, DataPortal | list[ChangeRecord]]:
+        """make the (name, payload) job for the work queue from an MCRun"""
+        if self.delta_updates:
+            return mc_run.run_name, mc_run.change_records
+        return mc_run.model_dp
+
     def process_solve_results(self, brick: DataBrick) -> None:
         """write the results as required"""
         # get the instance number from the model name, if provided
@@ -4,9 +4,12 @@ Class to contain Workers that execute solves in separate processes
 
 dev note:
 This class is derived from the original Worker class in MGA extension, but is just different enough
-that it is a separate class.  In future, it may make sense to re-combine these.  RN, this worker
-will ingest DataPortal objects to make new models.  The MGA will (in future) likely just take in
-new obj functions
+that it is a separate class.  In future, it may make sense to re-combine these.  The worker
+operates in one of two ways:
+- if it is handed the base data at construction, it holds that data for its lifetime and ingests
+  only the (name, change records) for each run, applying the deltas locally to make new models.
+- otherwise, it ingests full (name, DataPortal) objects to make new models.
+The MGA will (in future) likely just take in new obj functions
 
 """
 from __future__ import annotations
@@ -19,7 +22,9 @@ from typing import TYPE_CHECKING, Any
 from pyomo.opt import SolverFactory, SolverResults, check_optimal_termination
 
 from temoa._internal.data_brick import DataBrick, data_brick_factory
-from temoa.core.model import TemoaModel
+from temoa.core.model import TemoaModel, abstract_model
+from temoa.data_io.hybrid_loader import HybridLoader
+from temoa.extensions.monte_carlo.mc_run import apply_change_records
 
 verbose = False  # for T/S or monitoring...
 
@@ -42,6 +47,7 @@ class MCWorker:
     root_logger_name: str
     solver_log_path: Path | None
     solve_count: int
+    base_data: dict[str, Any] | None
 
     def __init__(
         self,
@@ -53,6 +59,7 @@ class MCWorker:
         solver_options: dict[str, Any],
         log_level: int = logging.INFO,
         solver_log_path: Path | None = None,
+        base_data: dict[str, Any] | None = None,
     ):
         self.worker_number = MCWorker.worker_idx
         MCWorker.worker_idx += 1
@@ -66,6 +73,9 @@ class MCWorker:
         self.root_logger_name = log_root_name
         self.solver_log_path = solver_log_path
         self.solve_count = 0
+        # when provided, the base data is shipped to the worker process once (when the worker is
+        # spawned) and each job only carries the change records for the run
+        self.base_data = base_data
 
     def run(self) -> None:
         msg = '.'.join((self.root_logger_name, 'worker', str(self.worker_number)))
@@ -83,15 +93,19 @@ class MCWorker:
         # __init__. We can set them later via self.opt.options
         self.opt = SolverFactory(self.solver_name)
 
+        # the abstract model is only declared once.  Each instance is created fresh from the data
+        # because the model rules fold parameter values into the expressions at build time
+        declaration = abstract_model()
+
         while True:
-            # wait for a DataPortal object to show up, then get to work
+            # wait for a job (DataPortal or change records) to show up, then get to work
             tic = datetime.now()
             data = self.dp_queue.get()
             toc = datetime.now()
 
             # log data pull
             logger.debug(
-                'Worker %d waited for and pulled a DataPortal from work queue in %0.2f seconds',
+                'Worker %d waited for and pulled a job from work queue in %0.2f seconds',
                 self.worker_number,
                 (toc - tic).total_seconds(),
             )
@@ -102,7 +116,12 @@ class MCWorker:
                 logger.debug('Worker %d received shutdown signal', self.worker_number)
                 self.results_queue.put('COYOTE')
                 break
-            name, dp = data
+            if self.base_data is not None:
+                name, change_records = data
+                run_data = apply_change_records(self.base_data, change_records)
+                dp = HybridLoader.data_portal_from_data(run_data)
+            else:
+                name, dp = data
 
             # update the solver options
             self.opt.options = self.solver_options
@@ -125,8 +144,7 @@ class MCWorker:
                     except (ValueError, AttributeError):
                         pass
 
-            abstract_model = TemoaModel()
-            model: TemoaModel = abstract_model.create_instance(data=dp)
+            model: TemoaModel = declaration.create_instance(data=dp)
             model.name = name  # set the name from the input
             tic = datetime.now()
             try:
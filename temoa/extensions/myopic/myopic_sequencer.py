@@ -12,8 +12,8 @@ from pathlib import Path
 from sqlite3 import Connection, Cursor
 from typing import Any, cast
 
-from temoa._internal import run_actions
-from temoa._internal.table_writer import TableWriter
+from temoa._internal import build_profiler, run_actions
+from temoa._internal.table_writer import TableWriter, iteration_scenario_bounds
 from temoa.core.config import TemoaConfig
 from temoa.core.model import TemoaModel
 from temoa.data_io.hybrid_loader import HybridLoader
@@ -190,6 +190,13 @@ class MyopicSequencer:
         last_base_year = None
         idx: MyopicIndex | None = None  # just a type-hint
 
+        # The input tables are static unless an evolution script is in play, so a single loader
+        # can hold the window-independent data and re-query only what changes between windows
+        assert self.output_con is not None
+        data_loader = HybridLoader(
+            self.output_con, self.config, cache_static_data=not self.evolving
+        )
+
         logger.info('Starting Myopic Sequence')
         # 1, 2, 3...
         while len(self.instance_queue) > 0:
@@ -239,9 +246,6 @@ class MyopicSequencer:
             self.update_myopic_efficiency_table(myopic_index=idx, prev_base=last_base_year)
 
             # 6. pull the data
-            assert self.output_con is not None
-            # make a data loader
-            data_loader = HybridLoader(self.output_con, self.config)
             data_portal = data_loader.load_data_portal(myopic_index=idx)
 
             # 7. build
@@ -252,6 +256,8 @@ class MyopicSequencer:
                 keep_lp_file=self.config.save_lp_file,
                 lp_path=self.config.output_path
                 / ''.join(('LP', str(idx.base_year))),  # base year folder
+                profile_path=build_profiler.report_path(self.config, str(idx.base_year)),
+                validate_elements=not self.config.bulk_validation,
             )
 
             # 8.  Run checks...
@@ -320,7 +326,13 @@ class MyopicSequencer:
             temp_scenario = set()
             temp_scenario.add(self.config.scenario)
             excel_filename = self.config.output_path / self.config.scenario
-            make_excel(str(self.config.output_database), excel_filename, temp_scenario)
+            make_excel(
+                str(self.config.output_database),
+                excel_filename,
+                temp_scenario,
+                output_format=self.config.spreadsheet_format,
+                workers=self.config.spreadsheet_workers,
+            )
 
     def get_current_total_cost(self, base_year: int) -> float:
         assert self.output_con is not None
@@ -633,13 +645,16 @@ class MyopicSequencer:
         """
         assert self.cursor is not None
         assert self.output_con is not None
+        assert self.table_writer is not None
         scenario_name = self.config.scenario if self.config else None
         logger.debug('Deleting old results for scenario name %s', scenario_name)
+        self.table_writer.ensure_output_indexes()
+        low, high = iteration_scenario_bounds(str(scenario_name))
         for table in self.tables_with_scenario_reference:
             try:
                 self.cursor.execute(
-                    f'DELETE FROM {table} WHERE scenario = ? OR scenario like ?',
-                    (scenario_name, f'{scenario_name}-%'),
+                    f'DELETE FROM {table} WHERE scenario = ? OR (scenario >= ? AND scenario < ?)',
+                    (scenario_name, low, high),
                 )
             except sqlite3.OperationalError as e:
                 sys.stderr.write(f'Could not clear scenario from table {table}.\n')
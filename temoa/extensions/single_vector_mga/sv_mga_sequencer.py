@@ -14,7 +14,9 @@ from typing import Any, cast, TYPE_CHECKING
 from pyomo.core import Constraint, Expression, Objective, value
 from pyomo.opt import check_optimal_termination
 
-from temoa._internal.run_actions import build_instance, handle_results, save_lp, solve_instance
+from temoa._internal import build_profiler
+from temoa._internal.persistent_solve import PersistentSolve
+from temoa._internal.run_actions import build_instance, handle_results, save_lp
 from temoa._internal.table_writer import TableWriter
 from temoa.components.costs import total_cost_rule
 from temoa.core.config import TemoaConfig
@@ -52,6 +54,8 @@ class SvMgaSequencer:
         svmga_inputs = config.svmga_inputs or {}
         self.cost_epsilon: float = float(svmga_inputs.get('cost_epsilon', 0.05))  # type: ignore[arg-type]
         logger.info('Set SVMGA cost (relaxation) epsilon to: %0.3f', self.cost_epsilon)
+        # start the secondary solve from the base solution
+        self.warm_start = bool(svmga_inputs.get('warm_start', False))
 
         logger.info('Initialized SVMGA sequencer.')
 
@@ -79,6 +83,8 @@ class SvMgaSequencer:
             silent=self.config.silent,
             keep_lp_file=self.config.save_lp_file,
             lp_path=lp_path,
+            profile_path=build_profiler.report_path(self.config),
+            validate_elements=not self.config.bulk_validation,
         )
         if self.config.price_check:
             good_prices = price_checker(instance)
@@ -94,12 +100,15 @@ class SvMgaSequencer:
             if self.config.save_duals
             else None
         )
-        instance, res = solve_instance(
-            instance=instance,
+        # the solver keeps the model, so the secondary solve only passes it the changes
+        solver = PersistentSolve(
+            instance,
             solver_name=self.config.solver_name,
             silent=self.config.silent,
             solver_suffixes=suffixes,
+            warm_start=self.warm_start,
         )
+        res = solver.solve()
         status = res.solver.termination_condition
         logger.debug('Termination condition: %s', status.name)
         if not check_optimal_termination(res):
@@ -116,6 +125,7 @@ class SvMgaSequencer:
         # get hook on the expression generator for total cost...
         cost_expression = total_cost_rule(instance)
         instance.cost_cap = Constraint(expr=cost_expression <= (1 + self.cost_epsilon) * tot_cost)
+        solver.add_constraint(instance.cost_cap)
 
         # 3b. remove the old objective
         # instance.total_cost.deactivate()
@@ -144,25 +154,14 @@ class SvMgaSequencer:
             sys.exit(1)
 
         instance.svmga_obj = Objective(expr=new_obj)
+        solver.set_objective(instance.svmga_obj)
         # save it, if requested...
         if self.config.save_lp_file:
             lp_path = self.config.output_path / 'option_model'
             save_lp(instance, lp_path)
 
         # 5. Re-solve and report
-        suffixes = (
-            [
-                'dual',
-            ]
-            if self.config.save_duals
-            else None
-        )
-        instance, res = solve_instance(
-            instance=instance,
-            solver_name=self.config.solver_name,
-            silent=self.config.silent,
-            solver_suffixes=suffixes,
-        )
+        res = solver.solve()
         status = res.solver.termination_condition
         logger.debug('Termination condition: %s', status.name)
         if not check_optimal_termination(res):
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import contextlib
 import logging
 import sqlite3
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any, cast
-from collections.abc import Iterable
+from weakref import WeakKeyDictionary
 
 from mpisppy.utils.sputils import attach_root_node  # type: ignore[import-untyped]
 
@@ -12,30 +14,84 @@ from temoa.components.costs import period_cost_rule
 from temoa.data_io.hybrid_loader import HybridLoader
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from temoa.core.config import TemoaConfig
     from temoa.data_io.hybrid_loader import LoadItem
-    from temoa.extensions.stochastics.stochastic_config import StochasticConfig
+    from temoa.extensions.stochastics.stochastic_config import Perturbation, StochasticConfig
 
 logger = logging.getLogger(__name__)
 
 
-def scenario_creator(scenario_name: str, **kwargs: Any) -> Any:
+class BaseData:
     """
-    Creator for mpi-sppy scenarios.
+    The scenario-independent model data, loaded once per process and shared by all scenarios.
 
-    Args:
-        scenario_name (str): Name of the scenario to create.
-        **kwargs: Must contain 'temoa_config' and 'stoch_config'.
+    Perturbation filters are resolved through a per-(table, column) index of the parameter keys,
+    built lazily on first use, so matching cost scales with the number of matched entries rather
+    than the size of the parameter.
     """
-    if 'temoa_config' not in kwargs or 'stoch_config' not in kwargs:
-        raise ValueError("scenario_creator requires 'temoa_config' and 'stoch_config' in kwargs")
 
-    temoa_config: TemoaConfig = kwargs['temoa_config']
-    stoch_config: StochasticConfig = kwargs['stoch_config']
+    def __init__(self, data_dict: dict[str, object], table_index_map: dict[str, list[str]]):
+        self.data_dict = data_dict
+        self.table_index_map = table_index_map
+        self._column_index: dict[tuple[str, str], dict[Any, list[Any]]] = {}
+
+    def _index_for(self, table: str, column: str) -> dict[Any, list[Any]]:
+        """Map each value of the given index column to the parameter keys holding it."""
+        key = (table, column)
+        if key not in self._column_index:
+            pos = self.table_index_map[table].index(column)
+            target_param = cast('dict[Any, Any]', self.data_dict[table])
+            index: defaultdict[Any, list[Any]] = defaultdict(list)
+            for idx in target_param:
+                idx_tuple = idx if isinstance(idx, tuple) else (idx,)
+                index[idx_tuple[pos]].append(idx)
+            self._column_index[key] = dict(index)
+        return self._column_index[key]
+
+    def matching_keys(self, table: str, row_filter: dict[str, Any]) -> list[Any]:
+        """
+        Find the keys of a parameter whose index columns match all entries of the filter.
+
+        :param table: the table (and parameter) name
+        :param row_filter: mapping of index column name -> required value
+        :return: the matching keys, in parameter order
+        """
+        index_cols = self.table_index_map[table]
+        if not row_filter:
+            return list(cast('dict[Any, Any]', self.data_dict[table]))
+        if any(col not in index_cols for col in row_filter):
+            return []
+        # start from the most selective column and narrow down
+        candidates = sorted(
+            (self._index_for(table, col).get(val, []) for col, val in row_filter.items()), key=len
+        )
+        matches = candidates[0]
+        for other in candidates[1:]:
+            if not matches:
+                break
+            keep = set(other)
+            matches = [idx for idx in matches if idx in keep]
+        return matches
+
+
+# base data, per config object, so repeated calls from mpi-sppy reuse the same load
+_base_data_cache: WeakKeyDictionary[TemoaConfig, BaseData] = WeakKeyDictionary()
+
+
+def load_base_data(temoa_config: TemoaConfig) -> BaseData:
+    """
+    Load (or fetch from the process cache) the unperturbed data for this config.
+
+    :param temoa_config: the run configuration
+    :return: the shared BaseData, which must not be modified by callers
+    """
+    base_data = _base_data_cache.get(temoa_config)
+    if base_data is not None:
+        return base_data
 
-    # 1. Load base data
     try:
-        import contextlib
         with contextlib.closing(sqlite3.connect(temoa_config.input_database)) as con:
             hybrid_loader = HybridLoader(db_connection=con, config=temoa_config)
             data_dict = hybrid_loader.create_data_dict(myopic_index=None)
@@ -50,22 +106,37 @@ def scenario_creator(scenario_name: str, **kwargs: Any) -> Any:
         logger.exception('Failed to connect to database %s', temoa_config.input_database)
         raise RuntimeError(f'Failed to connect to database {temoa_config.input_database}') from e
 
-    # 2. Apply perturbations for this scenario
-    for p in stoch_config.perturbations:
+    base_data = BaseData(data_dict=data_dict, table_index_map=table_index_map)
+    _base_data_cache[temoa_config] = base_data
+    return base_data
+
+
+def apply_perturbations(
+    base_data: BaseData, perturbations: Iterable[Perturbation], scenario_name: str
+) -> dict[str, object]:
+    """
+    Produce the data dictionary for a scenario by applying its perturbations to the base data.
+
+    The base data is not modified:  only the perturbed parameters are copied.
+
+    :param base_data: the shared, unperturbed data
+    :param perturbations: all perturbations; those for other scenarios are ignored
+    :param scenario_name: the scenario to build
+    :return: a data dictionary suitable for a DataPortal
+    """
+    data_dict = dict(base_data.data_dict)
+    copied: set[str] = set()
+    for p in perturbations:
         if p.scenario != scenario_name:
             continue
 
-        target_param = cast(dict[Any, Any] | None, data_dict.get(p.table))
-        if target_param is None:
+        if data_dict.get(p.table) is None:
             logger.warning(
                 'Table %s not found in data_dict for scenario %s', p.table, scenario_name
             )
             continue
 
-        # target_param is {(idx...): value}
-        # We need to find entries matching p.filter
-        index_cols = table_index_map.get(p.table)
-        if index_cols is None:
+        if p.table not in base_data.table_index_map:
             logger.warning(
                 'Table %s not found in manifest; cannot map indices for scenario %s',
                 p.table,
@@ -73,26 +144,40 @@ def scenario_creator(scenario_name: str, **kwargs: Any) -> Any:
             )
             continue
 
-        for idx, current_val in list(target_param.items()):
-            # Map index tuple to names based on table manifest
-            # normalize idx to tuple if it is a single value
-            idx_tuple = idx if isinstance(idx, tuple) else (idx,)
-            index_map = dict(zip(index_cols, idx_tuple, strict=True))
-
-            # Check if filter matches
-            match = True
-            for filter_key, filter_val in p.filter.items():
-                if index_map.get(filter_key) != filter_val:
-                    match = False
-                    break
-
-            if match:
-                if p.action == 'multiply':
-                    target_param[idx] = current_val * p.value
-                elif p.action == 'add':
-                    target_param[idx] = current_val + p.value
-                elif p.action == 'set':
-                    target_param[idx] = p.value
+        if p.table not in copied:
+            data_dict[p.table] = dict(cast('dict[Any, Any]', data_dict[p.table]))
+            copied.add(p.table)
+        target_param = cast('dict[Any, Any]', data_dict[p.table])
+
+        for idx in base_data.matching_keys(p.table, p.filter):
+            if p.action == 'multiply':
+                target_param[idx] = target_param[idx] * p.value
+            elif p.action == 'add':
+                target_param[idx] = target_param[idx] + p.value
+            elif p.action == 'set':
+                target_param[idx] = p.value
+    return data_dict
+
+
+def scenario_creator(scenario_name: str, **kwargs: Any) -> Any:
+    """
+    Creator for mpi-sppy scenarios.
+
+    Args:
+        scenario_name (str): Name of the scenario to create.
+        **kwargs: Must contain 'temoa_config' and 'stoch_config'.
+    """
+    if 'temoa_config' not in kwargs or 'stoch_config' not in kwargs:
+        raise ValueError("scenario_creator requires 'temoa_config' and 'stoch_config' in kwargs")
+
+    temoa_config: TemoaConfig = kwargs['temoa_config']
+    stoch_config: StochasticConfig = kwargs['stoch_config']
+
+    # 1. Load base data (once per process)
+    base_data = load_base_data(temoa_config)
+
+    # 2. Apply perturbations for this scenario
+    data_dict = apply_perturbations(base_data, stoch_config.perturbations, scenario_name)
 
     # 3. Build instance
     data_portal = HybridLoader.data_portal_from_data(data_dict)
@@ -11,28 +11,49 @@ identifies two types of modeling errors:
     but are not connected to a valid source.
 2.  Other Orphans: Technologies that are not connected to any demand chain at all.
 
-The analysis is performed using a depth first search on a directed graph where
-commodities are nodes and technologies are edges.
+The analysis is performed using graph searches on a directed graph where
+commodities are nodes and technologies are edges.  The commodities and techs of
+the region-period are interned as integers and the graph is held in arrays, so
+the searches run on sparse matrices (scipy) rather than on sets of tuples.
 """
 
-from collections import defaultdict
+from collections.abc import Iterable
+from itertools import compress
 from logging import getLogger
 
+import numpy as np
+from scipy.sparse import csr_array  # type: ignore[import-untyped]
+from scipy.sparse.csgraph import breadth_first_order  # type: ignore[import-untyped]
+
 from temoa.model_checking.network_model_data import EdgeTuple, NetworkModelData
 from temoa.types.core_types import Commodity, Period, Region, Technology
 
 logger = getLogger(__name__)
 
-# Represents a technology link: (input_commodity, tech_name)
-type TechLink = tuple[Commodity, Technology]
 # Represents a pair of linked technologies: (driver_tech, driven_tech)
 type LinkedTechPair = tuple[Technology, Technology]
 # Represents a full connection: (input_commodity, tech_name, output_commodity)
 type TechConnection = tuple[Commodity, Technology, Commodity]
-# Adjacency dict mapping: {output_comm: set of (input_comm, tech_name)}
-type ForwardConnections = dict[Commodity, set[TechLink]]
-# Adjacency dict mapping: {input_comm: set of (output_comm, tech_name)}
-type ReverseConnections = dict[Commodity, set[TechLink]]
+
+
+def _reachable(starts: Iterable[int], tails: np.ndarray, heads: np.ndarray, n: int) -> np.ndarray:
+    """
+    The nodes reachable from the start nodes (including them) along the links tail -> head.
+
+    :param starts: the ids of the start nodes
+    :param tails: the tail node of each link
+    :param heads: the head node of each link
+    :param n: the number of nodes
+    :return: a boolean array over the nodes
+    """
+    starts = np.fromiter(starts, dtype=np.intp)
+    # a virtual node (n) links to all of the start nodes, so a single search covers them
+    rows = np.concatenate((tails, np.full(len(starts), n)))
+    cols = np.concatenate((heads, starts))
+    graph = csr_array((np.ones(len(rows), dtype=np.int32), (rows, cols)), shape=(n + 1, n + 1))
+    reached = np.zeros(n + 1, dtype=bool)
+    reached[breadth_first_order(graph, n, directed=True, return_predecessors=False)] = True
+    return reached[:n]
 
 
 class CommodityNetwork:
@@ -42,6 +63,9 @@ class CommodityNetwork:
     This class is blind to vintage; it determines network validity based on connections
     independent of vintage. It is the responsibility of the manager to apply these
     findings across available vintages.
+
+    The commodities and techs are interned as integers, and the network is held as arrays of the
+    distinct (input, tech, output) connections, which are searched as sparse graphs.
     """
 
     def __init__(self, region: Region, period: Period, model_data: NetworkModelData) -> None:
@@ -76,26 +100,73 @@ class CommodityNetwork:
         self.demand_orphans: set[TechConnection] = set()
         self.other_orphans: set[TechConnection] = set()
 
-        # Internal state for the analysis
-        self.tech_inputs: dict[Technology, set[Commodity]] = defaultdict(set)
-        self.tech_outputs: dict[Technology, set[Commodity]] = defaultdict(set)
-        self.connections: ForwardConnections = defaultdict(set)
+        # Internal state for the analysis:  the interned names and the connection arrays
+        self.commodities: list[Commodity] = []
+        self.techs: list[Technology] = []
+        self.commodity_ids: dict[Commodity, int] = {}
+        self.tech_ids: dict[Technology, int] = {}
+        self.edges: list[EdgeTuple] = []
+        self.edge_connection = np.zeros(0, dtype=np.intp)  # the connection of each edge
+        self.input_comm = np.zeros(0, dtype=np.intp)
+        self.tech = np.zeros(0, dtype=np.intp)
+        self.output_comm = np.zeros(0, dtype=np.intp)
+        self.active = np.zeros(0, dtype=bool)  # the connections still in the network
+        self.good = np.zeros(0, dtype=bool)
+        self.demand_orphaned = np.zeros(0, dtype=bool)
+        self.other_orphaned = np.zeros(0, dtype=bool)
         self.viable_linked_tech: set[LinkedTechPair] = set()
 
         self._load_connections()
         self.prescreen_linked_tech()
 
     def _load_connections(self) -> None:
-        """Populate internal connection structures from model_data."""
-        self.tech_inputs.clear()
-        self.tech_outputs.clear()
-        self.connections.clear()
+        """Populate internal connection arrays from model_data."""
+        self.edges = list(self.model_data.available_techs[self.region, self.period])
+        n = len(self.edges)
+        input_comms = [edge.input_comm for edge in self.edges]
+        output_comms = [edge.output_comm for edge in self.edges]
+        techs = [edge.tech for edge in self.edges]
+
+        # intern the names (in order of appearance)
+        self.commodities = list(dict.fromkeys(input_comms + output_comms))
+        self.techs = list(dict.fromkeys(techs))
+        self.commodity_ids = {c: i for i, c in enumerate(self.commodities)}
+        self.tech_ids = {t: i for i, t in enumerate(self.techs)}
+        commodity_codes = np.fromiter(
+            map(self.commodity_ids.__getitem__, input_comms + output_comms),
+            dtype=np.intp,
+            count=2 * n,
+        )
+        tech_codes = np.fromiter(map(self.tech_ids.__getitem__, techs), dtype=np.intp, count=n)
+
+        # the distinct connections (edges differ by vintage, connections do not), as one key
+        n_commodities, n_techs = max(len(self.commodities), 1), max(len(self.techs), 1)
+        keys = (commodity_codes[:n] * n_techs + tech_codes) * n_commodities + commodity_codes[n:]
+        connections, edge_connection = np.unique(keys, return_inverse=True)
+        self.edge_connection = edge_connection.astype(np.intp)
+        ic_tech, self.output_comm = np.divmod(connections, n_commodities)
+        self.input_comm, self.tech = np.divmod(ic_tech, n_techs)
+        self.active = np.ones(len(connections), dtype=bool)
+        self.good = np.zeros(len(connections), dtype=bool)
+        self.demand_orphaned = np.zeros(len(connections), dtype=bool)
+        self.other_orphaned = np.zeros(len(connections), dtype=bool)
+
+    def _connections(self, mask: np.ndarray) -> set[TechConnection]:
+        """The (input, tech, output) names of the connections in the mask"""
+        commodities, techs = self.commodities, self.techs
+        return {
+            (commodities[ic], techs[tech], commodities[oc])
+            for ic, tech, oc in zip(
+                self.input_comm[mask].tolist(),
+                self.tech[mask].tolist(),
+                self.output_comm[mask].tolist(),
+                strict=True,
+            )
+        }
 
-        edge_tuples = self.model_data.available_techs[self.region, self.period]
-        for edge_tuple in edge_tuples:
-            self.connections[edge_tuple.output_comm].add((edge_tuple.input_comm, edge_tuple.tech))
-            self.tech_inputs[edge_tuple.tech].add(edge_tuple.input_comm)
-            self.tech_outputs[edge_tuple.tech].add(edge_tuple.output_comm)
+    def _has_tech(self, tech_name: Technology) -> bool:
+        tech_id = self.tech_ids.get(tech_name)
+        return tech_id is not None and bool(np.any(self.active & (self.tech == tech_id)))
 
     def reload(self, connections: set[EdgeTuple]) -> None:
         """
@@ -114,20 +185,14 @@ class CommodityNetwork:
 
     def remove_tech_by_name(self, tech_name: Technology) -> None:
         """Remove all connections associated with a given technology name."""
-        self.tech_inputs.pop(tech_name, None)
-        self.tech_outputs.pop(tech_name, None)
-
-        removed_connections: set[TechConnection] = set()
-        # Use list() to avoid issues with modifying the dict during iteration
-        for oc, links in list(self.connections.items()):
-            removals = {link for link in links if link[1] == tech_name}
-            if removals:
-                links -= removals
-                for ic, name in removals:
-                    removed_connections.add((ic, name, oc))
-            if not links:
-                self.connections.pop(oc, None)
-
+        tech_id = self.tech_ids.get(tech_name)
+        if tech_id is None:
+            return
+        removals = self.active & (self.tech == tech_id)
+        self.active &= ~removals
+        self.other_orphaned |= removals
+
+        removed_connections = self._connections(removals)
         self.other_orphans.update(removed_connections)
         for r in removed_connections:
             logger.debug('Removed %s via by-name removal', r)
@@ -139,8 +204,8 @@ class CommodityNetwork:
         """
         for r, driver, _, driven in self.model_data.available_linked_techs:
             if r == self.region:
-                driver_exists = driver in self.tech_outputs
-                driven_exists = driven in self.tech_outputs
+                driver_exists = self._has_tech(driver)
+                driven_exists = self._has_tech(driven)
 
                 if driver_exists and driven_exists:
                     logger.debug(
@@ -184,18 +249,9 @@ class CommodityNetwork:
             )
             source_nodes = self.model_data.source_commodities[self.region, self.period]
 
-            (
-                discovered_sources,
-                reverse_connex,
-            ) = self._trace_backward_from_demands(
-                start_nodes=demand_nodes,
-                end_nodes=source_nodes,
-                connections=self.connections,
-            )
-
-            self.good_connections = self._trace_forward_from_sources(
-                start_nodes=discovered_sources, connections=reverse_connex
-            )
+            demand_reachable = self._trace_backward_from_demands(demand_nodes)
+            self.good = self._trace_forward_from_sources(source_nodes, demand_reachable)
+            self.good_connections = self._connections(self.good)
 
             observed_tech_names = {tech for _, tech, _ in self.good_connections}
             sour_links = {
@@ -220,63 +276,47 @@ class CommodityNetwork:
                 self.remove_tech_by_name(driven)
             self.viable_linked_tech -= sour_links
 
-        all_connections = {
-            (ic, name, oc) for oc, links in self.connections.items() for ic, name in links
-        }
-        demand_reachable_connections = {
-            (ic, name, oc) for ic, links in reverse_connex.items() for oc, name in links
-        }
-
-        self.demand_orphans = demand_reachable_connections - self.good_connections
-        self.other_orphans |= all_connections - demand_reachable_connections
+        self.demand_orphaned = demand_reachable & ~self.good
+        self.other_orphaned |= self.active & ~demand_reachable
+        self.demand_orphans = self._connections(self.demand_orphaned)
+        self.other_orphans |= self._connections(self.other_orphaned)
 
         self._log_orphans()
 
-    def _trace_backward_from_demands(
-        self,
-        start_nodes: set[Commodity],
-        end_nodes: set[Commodity],
-        connections: ForwardConnections,
-    ) -> tuple[set[Commodity], ReverseConnections]:
-        """Iterative DFS tracing backward from demand nodes."""
-        stack = list(start_nodes)
-        visited_nodes = set()
-        discovered_sources = set()
-        reachable_subgraph: ReverseConnections = defaultdict(set)
-
-        while stack:
-            current_oc = stack.pop()
-            if current_oc in visited_nodes:
-                continue
-            visited_nodes.add(current_oc)
-
-            for ic, tech in connections.get(current_oc, set()):
-                reachable_subgraph[ic].add((current_oc, tech))
-                if ic in end_nodes:
-                    discovered_sources.add(ic)
-                if ic not in visited_nodes:
-                    stack.append(ic)
-
-        return discovered_sources, reachable_subgraph
-
-    def _trace_forward_from_sources(
-        self, start_nodes: set[Commodity], connections: ReverseConnections
-    ) -> set[TechConnection]:
-        """Iterative DFS tracing forward from discovered source nodes."""
-        stack = list(start_nodes)
-        visited_nodes = set(start_nodes)
-        good_connections: set[TechConnection] = set()
+    def _trace_backward_from_demands(self, demand_nodes: set[Commodity]) -> np.ndarray:
+        """
+        Trace backward from the demand nodes.
 
-        while stack:
-            current_ic = stack.pop()
+        :return: the (active) connections whose output is reached, by connection
+        """
+        ids = self.commodity_ids
+        reached = _reachable(
+            (ids[c] for c in demand_nodes if c in ids),
+            tails=self.output_comm[self.active],
+            heads=self.input_comm[self.active],
+            n=len(ids),
+        )
+        return self.active & reached[self.output_comm]
 
-            for oc, tech in connections.get(current_ic, set()):
-                good_connections.add((current_ic, tech, oc))
-                if oc not in visited_nodes:
-                    visited_nodes.add(oc)
-                    stack.append(oc)
+    def _trace_forward_from_sources(
+        self, source_nodes: set[Commodity], demand_reachable: np.ndarray
+    ) -> np.ndarray:
+        """
+        Trace forward, through the connections reached from the demands, from the sources that
+        feed them.
 
-        return good_connections
+        :return: the good connections, by connection
+        """
+        ids = self.commodity_ids
+        discovered = np.zeros(len(ids), dtype=bool)
+        discovered[self.input_comm[demand_reachable]] = True
+        reached = _reachable(
+            (ids[c] for c in source_nodes if c in ids and discovered[ids[c]]),
+            tails=self.input_comm[demand_reachable],
+            heads=self.output_comm[demand_reachable],
+            n=len(ids),
+        )
+        return demand_reachable & reached[self.input_comm]
 
     def _log_orphans(self) -> None:
         """Helper to log discovered orphaned processes."""
@@ -302,32 +342,21 @@ class CommodityNetwork:
             for orphan in sorted(self.demand_orphans, key=lambda x: x[1]):
                 logger.info('Discovered orphaned process:   %s', orphan)
 
+    def _edges_of(self, mask: np.ndarray) -> set[EdgeTuple]:
+        """The edge tuples (of all vintages) of the connections in the mask"""
+        return set(compress(self.edges, mask[self.edge_connection].tolist()))
+
     def get_valid_tech(self) -> set[EdgeTuple]:
         """Returns the set of Tech objects that are part of a valid connection."""
-        return {
-            edge_tuple
-            for edge_tuple in self.model_data.available_techs[self.region, self.period]
-            if (edge_tuple.input_comm, edge_tuple.tech, edge_tuple.output_comm)
-            in self.good_connections
-        }
+        return self._edges_of(self.good)
 
     def get_demand_side_orphans(self) -> set[EdgeTuple]:
         """Returns Tech objects for demand-side orphans."""
-        return {
-            edge_tuple
-            for edge_tuple in self.model_data.available_techs[self.region, self.period]
-            if (edge_tuple.input_comm, edge_tuple.tech, edge_tuple.output_comm)
-            in self.demand_orphans
-        }
+        return self._edges_of(self.demand_orphaned)
 
     def get_other_orphans(self) -> set[EdgeTuple]:
         """Returns Tech objects for non-demand-side orphans."""
-        return {
-            edge_tuple
-            for edge_tuple in self.model_data.available_techs[self.region, self.period]
-            if (edge_tuple.input_comm, edge_tuple.tech, edge_tuple.output_comm)
-            in self.other_orphans
-        }
+        return self._edges_of(self.other_orphaned)
 
     def unsupported_demands(self) -> set[Commodity]:
         """
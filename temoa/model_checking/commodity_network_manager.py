@@ -11,15 +11,20 @@ by other parts of the Temoa framework to ensure only valid data is used.
 
 from collections import defaultdict
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from logging import getLogger
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 from temoa.core.config import TemoaConfig
 from temoa.model_checking.commodity_graph import visualize_graph
 from temoa.model_checking.commodity_network import CommodityNetwork
 from temoa.model_checking.element_checker import ViableSet
 from temoa.model_checking.network_model_data import EdgeTuple, NetworkModelData
-from temoa.types.core_types import Period, Region
+from temoa.model_checking.trace_cache import TraceCache, trace_inputs
+from temoa.types.core_types import Commodity, Period, Region
+
+if TYPE_CHECKING:
+    from temoa.model_checking.trace_cache import TraceInputs
 
 logger = getLogger(__name__)
 
@@ -27,51 +32,198 @@ logger = getLogger(__name__)
 type RegionPeriodKey = tuple[Region, Period]
 
 
+class RegionPeriodResult(NamedTuple):
+    """The outcome of the network analysis of one region-period."""
+
+    region: Region
+    period: Period
+    unsupported_demands: set[Commodity]
+    demand_orphans: set[EdgeTuple]
+    other_orphans: set[EdgeTuple]
+
+
+def analyze_region_period(
+    region: Region, period: Period, data: NetworkModelData
+) -> RegionPeriodResult:
+    """Analyze the network of a single region-period.  Independent of all other region-periods."""
+    cn = CommodityNetwork(region=region, period=period, model_data=data)
+    cn.analyze_network()
+    return RegionPeriodResult(
+        region=region,
+        period=period,
+        unsupported_demands=cn.unsupported_demands(),
+        demand_orphans=cn.get_demand_side_orphans(),
+        other_orphans=cn.get_other_orphans(),
+    )
+
+
+def log_unsupported_demands(result: RegionPeriodResult) -> None:
+    """Log the demands of a region-period that are not supported back to a source."""
+    for commodity in sorted(result.unsupported_demands):
+        logger.warning(
+            'Demand %s is not supported back to a source in region %s, period %d',
+            commodity,
+            result.region,
+            result.period,
+        )
+
+
+def log_orphans(result: RegionPeriodResult) -> None:
+    """
+    Log the orphaned processes of a region-period, as its analysis does.  For results that are
+    re-used rather than computed.
+    """
+    for kind, orphans in (
+        ("'other' (non-demand)", result.other_orphans),
+        ('demand-side', result.demand_orphans),
+    ):
+        if not orphans:
+            continue
+        logger.info(
+            'Source tracing revealed %s %s orphaned processes in region %s, period %s.',
+            len(orphans),
+            kind,
+            result.region,
+            result.period,
+        )
+        for orphan in sorted(orphans, key=lambda x: x[1]):
+            logger.info('Discovered orphaned process:   %s', orphan)
+
+
+def report_findings(results: Iterable[RegionPeriodResult]) -> bool:
+    """
+    Log the findings of an earlier source trace again (e.g. of one whose data was cached).
+
+    :param results: the results of the region-periods of the trace
+    :return: True if no orphans were found, False otherwise
+    """
+    clean = True
+    for result in results:
+        log_unsupported_demands(result)
+        log_orphans(result)
+        clean = clean and not (result.demand_orphans or result.other_orphans)
+    return clean
+
+
+# the network data snapshot held by each worker process in a parallel analysis
+_worker_data: NetworkModelData | None = None
+
+
+def _init_worker(data: NetworkModelData) -> None:
+    global _worker_data
+    _worker_data = data
+
+
+def _analyze_in_worker(key: RegionPeriodKey) -> RegionPeriodResult:
+    if _worker_data is None:
+        raise RuntimeError('Network analysis worker was not initialized with data.')
+    return analyze_region_period(*key, data=_worker_data)
+
+
 class CommodityNetworkManager:
     """
     Manages the iterative network analysis for all regions across a set of periods.
     """
 
-    def __init__(self, periods: Iterable[str | int], network_data: NetworkModelData) -> None:
+    def __init__(
+        self,
+        periods: Iterable[str | int],
+        network_data: NetworkModelData,
+        num_workers: int = 1,
+        cache: TraceCache | None = None,
+    ) -> None:
+        """
+        :param periods: the periods to analyze
+        :param network_data: the network data for all regions and periods
+        :param num_workers: the number of processes used to analyze the region-periods.  1 (the
+            default) analyzes them serially in this process.
+        :param cache: the results of earlier analyses, re-used for the region-periods whose
+            network is unchanged (and extended with the new results).  None analyzes them all.
+        """
         self.analyzed: bool = False
         self.periods: list[Period] = sorted([Period(int(p)) for p in periods])
         self.orig_data: NetworkModelData = network_data
         self.filtered_data: NetworkModelData | None = None
         self.regions: set[Region] | None = None
+        self.num_workers = max(1, num_workers)
+        self.cache = cache
+        # the inputs of the region-periods being analyzed, to cache their results under
+        self.trace_inputs: dict[RegionPeriodKey, TraceInputs] = {}
 
         # Store a deep copy of the original connections for graphing purposes
         self.orig_tech = {k: v.copy() for k, v in network_data.available_techs.items()}
         # Final collections of all orphans found, organized by (region, period)
         self.demand_orphans: dict[RegionPeriodKey, set[EdgeTuple]] = defaultdict(set)
         self.other_orphans: dict[RegionPeriodKey, set[EdgeTuple]] = defaultdict(set)
+        # the results of the region-periods, in the order recorded
+        self.results: list[RegionPeriodResult] = []
 
-    def _analyze_region(self, region: Region, data: NetworkModelData) -> None:
+    def _reuse_cached(
+        self, keys: list[RegionPeriodKey], data: NetworkModelData
+    ) -> list[RegionPeriodKey]:
         """
-        Iteratively analyzes a region's network until no new orphans are found.
+        Record the cached results of the region-periods whose network is unchanged.
 
-        This process is iterative because removing an orphan technology in one
-        period (e.g., its last available vintage) can have cascading effects,
-        potentially orphaning dependent technologies in earlier periods. The loop
-        continues until a pass over all periods finds no new orphans, signifying
-        a stable, valid network.
+        :return: the region-periods left to analyze
         """
+        if self.cache is None:
+            return keys
+        cache = self.cache
+        inputs = {key: trace_inputs(*key, data=data) for key in keys}
+        remaining = []
+        for key in keys:
+            result = cache.get(inputs[key])
+            if result is None:
+                remaining.append(key)
+            else:
+                log_orphans(result)
+                self._record(result)
+        logger.info(
+            'Re-used the source trace of %d of %d region-periods (unchanged networks)',
+            len(keys) - len(remaining),
+            len(keys),
+        )
+        self.trace_inputs = {key: inputs[key] for key in remaining}
+        return remaining
 
-        for period in self.periods:
-            cn = CommodityNetwork(region=region, period=period, model_data=data)
-            cn.analyze_network()
+    def _record(self, result: RegionPeriodResult) -> None:
+        """Log and collect the findings for one region-period."""
+        log_unsupported_demands(result)
+        self.results.append(result)
 
-            # Log any demands that are not fully supported
-            for commodity in cn.unsupported_demands():
-                logger.warning(
-                    'Demand %s is not supported back to a source in region %s, period %d',
-                    commodity,
-                    region,
-                    period,
-                )
+        # Add to the main collections, ensuring no duplicates
+        self.demand_orphans[result.region, result.period].update(result.demand_orphans)
+        self.other_orphans[result.region, result.period].update(result.other_orphans)
+
+        inputs = self.trace_inputs.pop((result.region, result.period), None)
+        if inputs is not None and self.cache is not None:
+            self.cache.put(inputs, result)
+
+    def _analyze_serial(self, keys: list[RegionPeriodKey], data: NetworkModelData) -> None:
+        """
+        Analyzes the region-periods in this process.
+        """
+        region = None
+        for key in keys:
+            if key[0] != region:
+                region = key[0]
+                logger.info('Starting network analysis for region %s', region)
+            self._record(analyze_region_period(*key, data=data))
 
-            # Add to the main collections, ensuring no duplicates
-            self.demand_orphans[region, period].update(cn.get_demand_side_orphans())
-            self.other_orphans[region, period].update(cn.get_other_orphans())
+    def _analyze_parallel(self, keys: list[RegionPeriodKey], data: NetworkModelData) -> None:
+        """
+        Analyzes the region-periods in a pool of worker processes.  Each worker receives the
+        (read-only) network data once, at start-up.
+        """
+        num_workers = min(self.num_workers, len(keys))
+        logger.info(
+            'Starting network analysis of %d region-periods on %d workers', len(keys), num_workers
+        )
+        with ProcessPoolExecutor(
+            max_workers=num_workers, initializer=_init_worker, initargs=(data,)
+        ) as pool:
+            for result in pool.map(_analyze_in_worker, keys):
+                self._record(result)
 
     def analyze_network(self) -> bool:
         """
@@ -86,9 +238,12 @@ class CommodityNetworkManager:
         # Identify regions to analyze (excluding exchange pseudo-regions)
         self.regions = set({r for (r, p) in self.orig_data.available_techs if '-' not in r})
 
-        for region in self.regions:
-            logger.info('Starting network analysis for region %s', region)
-            self._analyze_region(region, data=self.filtered_data)
+        keys = [(region, period) for region in self.regions for period in self.periods]
+        keys = self._reuse_cached(keys, data=self.filtered_data)
+        if self.num_workers > 1 and len(keys) > 1:
+            self._analyze_parallel(keys, data=self.filtered_data)
+        else:
+            self._analyze_serial(keys, data=self.filtered_data)
 
         self.analyzed = True
         orphans_found = any(self.demand_orphans.values()) or any(self.other_orphans.values())
@@ -2,6 +2,11 @@
 The purpose of this module is to build an Object to hold all of the network data for the entire
 model in a usable format for the commodity_network_manager to use in building the individual
 network.
+
+The build from the database works on the efficiency table as columns:  the liveness of every
+process in every period is computed at once with numpy, each process gets a single EdgeTuple
+(shared by all of the region-periods it is alive in) and the region-period groups are made from
+integer region ids.
 """
 
 from __future__ import annotations
@@ -10,18 +15,19 @@ import copy
 import logging
 import sqlite3
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from itertools import chain
 from typing import TYPE_CHECKING, NamedTuple, Self, TypedDict, cast, overload
 
 import deprecated
+import numpy as np
 from pyomo.core.base import ConcreteModel
 
 from temoa.core.model import TemoaModel
 from temoa.types.core_types import ParameterValue
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable, Sequence
 
     from temoa.extensions.myopic.myopic_index import MyopicIndex
     from temoa.types import Commodity, Period, Region, Sector, Technology, Vintage
@@ -75,6 +81,13 @@ class LookupData(TypedDict):
     neg_cost_techs: set[Technology]
 
 
+class StaticNetworkData(NamedTuple):
+    """The window-independent portion of the network data, reusable across myopic steps."""
+
+    basic: BasicData
+    lookup: LookupData
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -114,8 +127,20 @@ class NetworkModelData:
                     )
 
     def clone(self) -> Self:
-        """Create a deep copy of the current object."""
-        return copy.deepcopy(self)
+        """
+        Create a copy of the current object that may be modified independently.  The contents of
+        the collections (edge tuples, names, attribute values) are immutable, so they are shared
+        and only the collections are copied.
+        """
+        clone = copy.copy(self)
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, defaultdict):
+                value = defaultdict(value.default_factory, {k: v.copy() for k, v in value.items()})
+            else:
+                value = value.copy()
+            setattr(clone, f.name, value)
+        return clone
 
     def update_tech_data(self, tech: Technology, element: str, value: TechAttributeValue) -> None:
         """Update a data element for a tech."""
@@ -142,7 +167,11 @@ class NetworkModelData:
 
 # --- Builder Factory ---
 @overload
-def build(data: DbConnection, myopic_index: MyopicIndex | None = ...) -> NetworkModelData: ...
+def build(
+    data: DbConnection,
+    myopic_index: MyopicIndex | None = ...,
+    static_data: StaticNetworkData | None = ...,
+) -> NetworkModelData: ...
 @overload
 def build(data: ModelBlock, *args: object, **kwargs: object) -> NetworkModelData: ...
 def build(data: ModelBlock | DbConnection, *args: object, **kwargs: object) -> NetworkModelData:
@@ -376,18 +405,97 @@ def _fetch_lookup_data(cur: sqlite3.Cursor) -> LookupData:
     return lookups
 
 
-def _build_from_db(con: DbConnection, myopic_index: MyopicIndex | None = None) -> NetworkModelData:
+def fetch_static_data(con: DbConnection) -> StaticNetworkData:
+    """
+    Fetch the portion of the network data that does not depend on the myopic window.
+
+    The result may be passed back into :func:`build` to avoid re-querying these tables
+    on every myopic step.  It is not modified by the build.
+    """
+    cur = con.cursor()
+    return StaticNetworkData(basic=_fetch_basic_data(cur), lookup=_fetch_lookup_data(cur))
+
+
+def _liveness(
+    vintages: Sequence[Vintage], lifetimes: Sequence[float], periods: Sequence[Period]
+) -> np.ndarray:
+    """
+    The liveness of processes in the periods:  alive in p if v <= p < v + lifetime
+
+    :return: a (processes x periods) boolean array
+    """
+    v = np.fromiter(vintages, dtype=float, count=len(vintages))
+    life = np.fromiter(lifetimes, dtype=float, count=len(lifetimes))
+    p = np.asarray(periods, dtype=float)
+    return (v[:, None] <= p) & (p < (v + life)[:, None])
+
+
+class _RegionPeriodGroups[T: Hashable]:
+    """
+    Collects items (edges, commodities) to be placed in a region, in every period where the
+    process they come from is alive, and groups them into the region-period sets in bulk.
+    """
+
+    def __init__(self, alive: np.ndarray, periods: Sequence[Period]) -> None:
+        """
+        :param alive: the (processes x periods) liveness of the processes
+        :param periods: the periods (columns) of the liveness
+        """
+        self.alive = alive
+        self.periods = periods
+        self.region_ids: dict[Region, int] = {}
+        self.processes: list[int] = []
+        self.regions: list[int] = []
+        self.items: list[T] = []
+
+    def add(self, process: int, region: Region, item: T) -> None:
+        self.processes.append(process)
+        self.regions.append(self.region_ids.setdefault(region, len(self.region_ids)))
+        self.items.append(item)
+
+    def update(self, target: defaultdict[tuple[Region, Period], set[T]]) -> None:
+        """Add the items to the sets of the region-periods where their process is alive."""
+        if not self.items:
+            return
+        n_periods = len(self.periods)
+        placement, period_idx = np.nonzero(self.alive[np.asarray(self.processes)])
+        # one (region, period) key per placement, in groups of the same key
+        keys = np.asarray(self.regions)[placement] * n_periods + period_idx
+        order = np.argsort(keys, kind='stable')
+        keys, placement = keys[order], placement[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], len(keys)]
+
+        region_names = list(self.region_ids)
+        items = self.items
+        for start, end in zip(starts.tolist(), ends.tolist(), strict=True):
+            region_id, period_idx = divmod(int(keys[start]), n_periods)
+            target[region_names[region_id], self.periods[period_idx]].update(
+                map(items.__getitem__, placement[start:end].tolist())
+            )
+
+
+def _build_from_db(
+    con: DbConnection,
+    myopic_index: MyopicIndex | None = None,
+    static_data: StaticNetworkData | None = None,
+) -> NetworkModelData:
     """Build NetworkModelData object from a sqlite database."""
     cur = con.cursor()
     res = NetworkModelData()
 
     # --- 1. Fetch all data from DB ---
-    basic_data = _fetch_basic_data(cur)
+    if static_data is None:
+        static_data = fetch_static_data(con)
+    basic_data = static_data.basic
+    lookup_data = static_data.lookup
     raw_techs = _fetch_all_tech_definitions(cur, myopic_index)
-    lookup_data = _fetch_lookup_data(cur)
 
-    res.physical_commodities = basic_data['physical_commodities']
-    res.demand_commodities = basic_data['demand_commodities']
+    # copies, as these are extended below and the static data may be re-used
+    res.physical_commodities = set(basic_data['physical_commodities'])
+    res.demand_commodities = defaultdict(
+        set, {k: set(v) for k, v in basic_data['demand_commodities'].items()}
+    )
 
     periods: list[Period] = basic_data['periods']
     if myopic_index:
@@ -399,7 +507,16 @@ def _build_from_db(con: DbConnection, myopic_index: MyopicIndex | None = None) -
     living_rtv: set[tuple[Region, Technology, Vintage]] = set()
 
     # --- 2. Process technologies ---
-    for tech_data in raw_techs:
+    alive = _liveness([row[3] for row in raw_techs], [row[5] for row in raw_techs], periods)
+    techs: _RegionPeriodGroups[EdgeTuple] = _RegionPeriodGroups(alive, periods)
+    sources: _RegionPeriodGroups[Commodity] = _RegionPeriodGroups(alive, periods)
+    demands: _RegionPeriodGroups[Commodity] = _RegionPeriodGroups(alive, periods)
+    wastes: _RegionPeriodGroups[Commodity] = _RegionPeriodGroups(alive, periods)
+    # the exchange commodities, one (interned) name for each commodity at each end
+    exchange_names: dict[tuple[Commodity, Region], Commodity] = {}
+
+    for process in np.flatnonzero(alive.any(axis=1)).tolist():
+        tech_data = raw_techs[process]
         logger.debug(tech_data)
         if len(tech_data) == 7:  # Has sector
             r, ic, tech, v, oc, lifetime, sector = tech_data
@@ -407,69 +524,38 @@ def _build_from_db(con: DbConnection, myopic_index: MyopicIndex | None = None) -
             r, ic, tech, v, oc, lifetime = tech_data
             sector = None
 
-        for p in periods:
-            if v <= p < v + lifetime:
-                living_techs.add(tech)
-                living_rtv.add((r, tech, v))
-                if '-' in r and r.count('-') == 1:  # Inter-regional transfer
-                    r1, r2 = (cast('Region', reg) for reg in r.split('-', 1))
-                    source_comm, dest_comm = (
-                        cast('Commodity', f'{ic} ({r1})'),
-                        cast('Commodity', f'{oc} ({r2})'),
-                    )
-                    res.available_techs[r2, p].add(
-                        EdgeTuple(
-                            region=r2,
-                            input_comm=source_comm,
-                            tech=tech,
-                            vintage=v,
-                            output_comm=oc,
-                            lifetime=lifetime,
-                            sector=sector,
-                        )
-                    )
-                    res.available_techs[r1, p].add(
-                        EdgeTuple(
-                            region=r1,
-                            input_comm=ic,
-                            tech=tech,
-                            vintage=v,
-                            output_comm=dest_comm,
-                            lifetime=lifetime,
-                            sector=sector,
-                        )
-                    )
-                    res.available_techs[r, p].add(
-                        EdgeTuple(
-                            region=r,
-                            input_comm=ic,
-                            tech=tech,
-                            vintage=v,
-                            output_comm=oc,
-                            lifetime=lifetime,
-                            sector=sector,
-                        )
-                    )
-                    res.source_commodities[r2, p].add(source_comm)
-                    res.demand_commodities[r1, p].add(dest_comm)
-                    res.physical_commodities.update([source_comm, dest_comm])
-                    res.exchange_commodities.update([source_comm, dest_comm])
-                else:  # Standard technology
-                    res.available_techs[r, p].add(
-                        EdgeTuple(
-                            region=r,
-                            input_comm=ic,
-                            tech=tech,
-                            vintage=v,
-                            output_comm=oc,
-                            lifetime=lifetime,
-                            sector=sector,
-                        )
-                    )
-                    if ic in basic_data['source_commodities_all']:
-                        res.source_commodities[r, p].add(ic)
-                    if oc in basic_data['waste_commodities_all']:
-                        res.waste_commodities[r, p].add(oc)
+        living_techs.add(tech)
+        living_rtv.add((r, tech, v))
+        edge = EdgeTuple(
+            region=r,
+            input_comm=ic,
+            tech=tech,
+            vintage=v,
+            output_comm=oc,
+            lifetime=lifetime,
+            sector=sector,
+        )
+        techs.add(process, r, edge)
+        if '-' in r and r.count('-') == 1:  # Inter-regional transfer
+            r1, r2 = (cast('Region', reg) for reg in r.split('-', 1))
+            source_comm = exchange_names.setdefault((ic, r1), cast('Commodity', f'{ic} ({r1})'))
+            dest_comm = exchange_names.setdefault((oc, r2), cast('Commodity', f'{oc} ({r2})'))
+            techs.add(process, r2, edge._replace(region=r2, input_comm=source_comm))
+            techs.add(process, r1, edge._replace(region=r1, output_comm=dest_comm))
+            sources.add(process, r2, source_comm)
+            demands.add(process, r1, dest_comm)
+            res.physical_commodities.update([source_comm, dest_comm])
+            res.exchange_commodities.update([source_comm, dest_comm])
+        else:  # Standard technology
+            if ic in basic_data['source_commodities_all']:
+                sources.add(process, r, ic)
+            if oc in basic_data['waste_commodities_all']:
+                wastes.add(process, r, oc)
+
+    techs.update(res.available_techs)
+    sources.update(res.source_commodities)
+    demands.update(res.demand_commodities)
+    wastes.update(res.waste_commodities)
 
     for r, tech, v, lifetime in lookup_data['eol']:
         if tech in basic_data['tech_uncap']:
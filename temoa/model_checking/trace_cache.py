@@ -0,0 +1,105 @@
+"""
+A cache of the source-trace analyses of region-periods, so that only the networks whose inputs
+changed are traced again.
+
+The analysis of a region-period (see `commodity_network_manager.analyze_region_period`) depends
+only on that region-period's network:  its edges, its demand, waste and source commodities and
+the linked techs of its region.  Each result is cached under those inputs (as frozensets, which
+hash quickly and are compared in full on a match, so a changed network is never matched), and
+re-used when the same network comes up again in the process:
+
+    - in myopic runs, for the periods carried over from the previous window (and unchanged by
+      the decisions of that window)
+    - across runs, e.g. repeated loads of a database in one session, or the region-periods that
+      an edit of the database did not touch
+
+The cache is shared by the loaders of the process and holds the most recently used entries.  It
+is used only if `source_trace_cache` is set in the config.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from temoa.model_checking.commodity_network_manager import RegionPeriodResult
+    from temoa.model_checking.network_model_data import EdgeTuple, LinkedTechTuple, NetworkModelData
+    from temoa.types.core_types import Commodity, Period, Region
+
+    type TraceInputs = tuple[
+        Region,
+        Period,
+        bool,
+        frozenset[EdgeTuple],
+        frozenset[Commodity],
+        frozenset[Commodity],
+        frozenset[Commodity],
+        frozenset[LinkedTechTuple],
+    ]
+
+logger = getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+def trace_inputs(region: Region, period: Period, data: NetworkModelData) -> TraceInputs:
+    """
+    Collect the inputs to the analysis of a region-period, as the key of its result.
+
+    :param region: the region
+    :param period: the period
+    :param data: the network data
+    :return: the (hashable) inputs
+    """
+    key = (region, period)
+    return (
+        region,
+        period,
+        bool(data.source_commodities),  # the analysis fails if there are none at all
+        frozenset(data.available_techs.get(key, ())),
+        frozenset(data.demand_commodities.get(key, ())),
+        frozenset(data.waste_commodities.get(key, ())),
+        frozenset(data.source_commodities.get(key, ())),
+        frozenset(lt for lt in data.available_linked_techs if lt.region == region),
+    )
+
+
+class TraceCache:
+    """The results of region-period analyses, by their inputs, least recently used first."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        :param max_entries: the number of results to hold.  The least recently used are dropped.
+        """
+        self.max_entries = max_entries
+        self.results: OrderedDict[TraceInputs, RegionPeriodResult] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, inputs: TraceInputs) -> RegionPeriodResult | None:
+        result = self.results.get(inputs)
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.results.move_to_end(inputs)
+        return result
+
+    def put(self, inputs: TraceInputs, result: RegionPeriodResult) -> None:
+        self.results[inputs] = result
+        self.results.move_to_end(inputs)
+        while len(self.results) > self.max_entries:
+            self.results.popitem(last=False)
+
+    def clear(self) -> None:
+        self.results.clear()
+
+
+_shared_cache = TraceCache()
+
+
+def shared_cache() -> TraceCache:
+    """The cache shared by the loaders of the process"""
+    return _shared_cache
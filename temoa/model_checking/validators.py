@@ -13,6 +13,8 @@ import deprecated
 from pyomo.environ import NonNegativeReals
 
 if TYPE_CHECKING:
+    from collections.abc import Container
+
     from pyomo.core import Set
 
     from temoa.core.model import TemoaModel
@@ -137,12 +139,17 @@ def linked_region_check(model: TemoaModel, region_pair: str) -> bool:
     """
     Validate a pair of regions (r-r format where r ∈ M.R )
     """
+    return is_linked_region(region_pair, model.regions)
+
+
+def is_linked_region(region_pair: str, regions: Container[str]) -> bool:
+    """The check of linked_region_check against a collection of regions"""
     linked_regions = re.match(r'([a-zA-Z0-9_]+)\-([a-zA-Z0-9_]+)\Z', region_pair)
     if linked_regions:
         r1 = linked_regions.group(1)
         r2 = linked_regions.group(2)
         if (
-            all(r in model.regions for r in (r1, r2)) and r1 != r2
+            all(r in regions for r in (r1, r2)) and r1 != r2
         ):  # both captured regions are in the set of M.R
             return True
     return False
@@ -152,19 +159,24 @@ def region_group_check(model: TemoaModel, rg: str) -> bool:
     """
     Validate the region-group name (region or regions separated by '+')
     """
+    return is_region_group(rg, model.regions)
+
+
+def is_region_group(rg: str, regions: Container[str]) -> bool:
+    """The check of region_group_check against a collection of regions"""
     if '-' in rg:  # it should just be evaluated as a linked_region
-        return linked_region_check(model, rg)
+        return is_linked_region(rg, regions)
     if re.search(r'\A[a-zA-Z0-9\+_]+\Z', rg):
         # it has legal characters only
         if '+' in rg:
             # break up the group
             contained_regions = rg.strip().split('+')
-            if all(t in model.regions for t in contained_regions) and len(
-                set(contained_regions)
-            ) == len(contained_regions):  # no dupes
+            if all(t in regions for t in contained_regions) and len(set(contained_regions)) == len(
+                contained_regions
+            ):  # no dupes
                 return True
         else:  # it is a singleton
-            return (rg in model.regions) or rg == 'global'
+            return (rg in regions) or rg == 'global'
     return False
 
 
@@ -1475,4 +1475,15 @@ CREATE TABLE time_season_sequential
     CHECK (segment_fraction >= 0 AND segment_fraction <= 1)
 );
 CREATE INDEX region_tech_vintage ON myopic_efficiency (region, tech, vintage);
+CREATE INDEX output_built_capacity_scenario_vintage ON output_built_capacity (scenario, vintage);
+CREATE INDEX output_cost_scenario_period ON output_cost (scenario, period);
+CREATE INDEX output_curtailment_scenario_period ON output_curtailment (scenario, period);
+CREATE INDEX output_dual_variable_scenario ON output_dual_variable (scenario);
+CREATE INDEX output_emission_scenario_period ON output_emission (scenario, period);
+CREATE INDEX output_flow_in_scenario_period ON output_flow_in (scenario, period);
+CREATE INDEX output_flow_out_scenario_period ON output_flow_out (scenario, period);
+CREATE INDEX output_net_capacity_scenario_period ON output_net_capacity (scenario, period);
+CREATE INDEX output_objective_scenario ON output_objective (scenario);
+CREATE INDEX output_retired_capacity_scenario_period ON output_retired_capacity (scenario, period);
+CREATE INDEX output_storage_level_scenario_period ON output_storage_level (scenario, period);
 COMMIT;
@@ -1,5 +1,9 @@
 # Types module for TEMOA
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyomo.core.base.var import VarData
 
 # Define public API for this module
 # ruff: noqa: RUF022
@@ -25,6 +29,8 @@ __all__ = [
     'CommodityStreamProcessDict',
     'CurtailmentVintagesDict',
     'EfficiencyVariableDict',
+    'EmissionActivityProcessesDict',
+    'EmissionCapacityProcessesDict',
     'ExportRegionsDict',
     'ImportRegionsDict',
     'InputSplitAnnualVintagesDict',
@@ -42,6 +48,7 @@ __all__ = [
     'ProcessVintagesDict',
     'RampDownVintagesDict',
     'RampUpVintagesDict',
+    'ReserveExchangeRegionsDict',
     'RetirementPeriodsDict',
     'RetirementProductionProcessesDict',
     'SeasonalStorageDict',
@@ -72,6 +79,7 @@ __all__ = [
     'StorageLevelIndicesSet',
     # Type aliases
     'ExprLike',
+    'LinearTerms',
 ]
 
 # Core type aliases for commonly used dimensions
@@ -101,6 +109,8 @@ from .dict_types import (
     CommodityStreamProcessDict,
     CurtailmentVintagesDict,
     EfficiencyVariableDict,
+    EmissionActivityProcessesDict,
+    EmissionCapacityProcessesDict,
     ExportRegionsDict,
     ImportRegionsDict,
     InputSplitAnnualVintagesDict,
@@ -118,6 +128,7 @@ from .dict_types import (
     ProcessVintagesDict,
     RampDownVintagesDict,
     RampUpVintagesDict,
+    ReserveExchangeRegionsDict,
     RetirementPeriodsDict,
     RetirementProductionProcessesDict,
     SeasonalStorageDict,
@@ -159,3 +170,7 @@ from .set_types import (
 # Type alias for expressions that can be returned from reserve margin functions
 # This covers Pyomo expressions, boolean expressions, and Constraint.Skip
 ExprLike = float | bool | object  # covers Pyomo expressions and Constraint.Skip
+
+# (variable, coefficient) pairs of a linear expression, shared by the constraint rules and the
+# direct assembly of their rows (see temoa._internal.direct_build)
+LinearTerms = list[tuple['VarData', float]]
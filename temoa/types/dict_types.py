@@ -27,6 +27,12 @@ CapacityConsumptionTechsDict = dict[tuple[Region, Period, Commodity], set[Techno
 RetirementProductionProcessesDict = dict[
     tuple[Region, Period, Commodity], set[tuple[Technology, Vintage]]
 ]
+EmissionActivityProcessesDict = dict[
+    tuple[Region, Period, Commodity], list[tuple[Commodity, Technology, Vintage, Commodity]]
+]
+EmissionCapacityProcessesDict = dict[
+    tuple[Region, Period, Commodity], list[tuple[Technology, Vintage]]
+]
 
 
 # Commodity flow dictionary types
@@ -61,6 +67,7 @@ ImportRegionsDict = dict[
     tuple[Region, Period, Commodity], set[tuple[Region, Technology, Vintage, Commodity]]
 ]
 ActiveRegionsForTechDict = dict[tuple[Period, Technology], set[Region]]
+ReserveExchangeRegionsDict = dict[tuple[Region, Period], list[Region]]
 
 
 # Switching/boolean flag dictionary types
@@ -0,0 +1,249 @@
+"""
+Benchmark of the stages of a (perfect foresight) Temoa run on a database, for tracking the
+performance between releases.
+
+Each stage is timed and the peak memory of the process (its resident set high-water mark) is
+recorded at the end of it.  Optionally, the peak of the Python allocations during each stage is
+traced as well (with `tracemalloc`, which slows the run down).  The stages are:
+
+    - source_trace: the network analysis of the source trace (if selected)
+    - load: the data load into a DataPortal (including the source trace, if selected)
+    - build: the construction of the model instance
+    - solve: the solve
+    - poll: the extraction of the results from the solved model
+    - write: the writing of the results to the output tables (which includes its own polling)
+
+The benchmark runs on an existing database or on a synthetic one made to a given size (see
+`synthetic_model`), and the report (versions, model size and stage records) is written as JSON.
+
+Usage:
+    python -m temoa.utilities.benchmark [--db <db file>] [--regions N] [--techs N] ...
+        [--solver <solver>] [--direct-build] [--output <report.json>]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sqlite3
+import sys
+import tempfile
+import tracemalloc
+from contextlib import closing, contextmanager
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from pyomo.environ import value
+
+from temoa.__about__ import __version__
+from temoa._internal.run_actions import build_instance, solve_instance
+from temoa._internal.table_data_puller import (
+    poll_capacity_results,
+    poll_cost_results,
+    poll_emissions,
+    poll_flow_results,
+    poll_objective,
+)
+from temoa._internal.table_writer import TableWriter
+from temoa.core.config import TemoaConfig
+from temoa.core.modes import TemoaMode
+from temoa.data_io.hybrid_loader import HybridLoader
+from temoa.utilities.sqlite_utils import tune_sqlite_connection
+from temoa.utilities.synthetic_model import (
+    SyntheticSpec,
+    add_spec_arguments,
+    make_synthetic_db,
+    spec_from_args,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+MIB = 1024 * 1024
+
+
+class StageRecord(NamedTuple):
+    stage: str
+    seconds: float
+    peak_rss_mib: float | None  # the process high-water mark at the end of the stage
+    traced_peak_mib: float | None  # the peak Python allocation during the stage, if traced
+
+
+def _peak_rss_mib() -> float | None:
+    """The resident set high-water mark of the process (not available on Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # reported in bytes on macOS and in KiB elsewhere
+    return peak / MIB if sys.platform == 'darwin' else peak / 1024
+
+
+class StageTimer:
+    """Collects a `StageRecord` for each stage run in its `stage` context."""
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.records: list[StageRecord] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Generator[None]:
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        tic = perf_counter()
+        try:
+            yield
+        finally:
+            seconds = perf_counter() - tic
+            traced_peak = tracemalloc.get_traced_memory()[1] / MIB if self.trace_memory else None
+            if started_tracing:
+                tracemalloc.stop()
+            self.records.append(StageRecord(name, seconds, _peak_rss_mib(), traced_peak))
+
+
+def run_benchmark(
+    db_path: Path,
+    solver_name: str = 'appsi_highs',
+    source_trace: bool = True,
+    trace_memory: bool = False,
+    output_path: Path | None = None,
+    direct_build: bool = False,
+) -> dict[str, Any]:
+    """
+    Run and time the stages of a perfect foresight run on a database.  The results are written
+    to the output tables of the database (scenario 'benchmark').
+
+    :param db_path: the database to run
+    :param solver_name: the solver to use
+    :param source_trace: run the source trace in the data load
+    :param trace_memory: trace the peak Python allocation of each stage
+    :param output_path: the folder for the run outputs (default: the database folder)
+    :param direct_build: assemble the core families for HiGHS directly (with solver highs_direct)
+    :return: the report
+    """
+    config = TemoaConfig(
+        scenario='benchmark',
+        scenario_mode=TemoaMode.PERFECT_FORESIGHT,
+        input_database=db_path,
+        output_database=db_path,
+        output_path=output_path or db_path.parent,
+        solver_name=solver_name,
+        time_sequencing='seasonal_timeslices',
+        source_trace=source_trace,
+        price_check=False,
+        direct_build=direct_build,
+        silent=True,
+    )
+    timer = StageTimer(trace_memory=trace_memory)
+
+    with closing(sqlite3.connect(db_path)) as con:
+        tune_sqlite_connection(con, config)
+        if source_trace:
+            with timer.stage('source_trace'):
+                HybridLoader(db_connection=con, config=config).source_trace_only()
+        with timer.stage('load'):
+            data_portal = HybridLoader(db_connection=con, config=config).load_data_portal()
+
+    with timer.stage('build'):
+        instance = build_instance(data_portal, silent=True, direct_build=config.direct_build)
+    del data_portal
+
+    with timer.stage('solve'):
+        instance, _ = solve_instance(instance, solver_name, silent=True)
+
+    with timer.stage('poll'):
+        p_0 = min(instance.time_optimize)
+        poll_objective(instance)
+        poll_capacity_results(instance)
+        poll_emissions(instance)
+        poll_cost_results(instance, p_0)
+        poll_flow_results(instance)
+
+    with timer.stage('write'), TableWriter(config) as writer:
+        writer.write_results(instance)
+
+    return {
+        'temoa_version': __version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.now(UTC).isoformat(timespec='seconds'),
+        'database': str(db_path),
+        'solver': solver_name,
+        'source_trace': source_trace,
+        'direct_build': config.direct_build,
+        'variables': instance.nvariables(),
+        'constraints': instance.nconstraints(),
+        'objective': value(instance.total_cost),
+        'stages': [record._asdict() for record in timer.records],
+    }
+
+
+def benchmark_synthetic(spec: SyntheticSpec, work_dir: Path, **kwargs: Any) -> dict[str, Any]:
+    """
+    Run the benchmark on a synthetic database of the given size, made in the work folder.
+
+    :param spec: the size of the synthetic model
+    :param work_dir: the folder for the database and the run outputs
+    :param kwargs: the options of `run_benchmark`
+    :return: the report, including the spec
+    """
+    db_path = make_synthetic_db(work_dir / 'benchmark.sqlite', spec, overwrite=True)
+    report = run_benchmark(db_path, output_path=work_dir, **kwargs)
+    report['spec'] = asdict(spec)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description='Time the stages of a Temoa run on a database or on a synthetic model.'
+    )
+    parser.add_argument(
+        '--db', type=Path, help='Database to benchmark (default: make a synthetic one).'
+    )
+    parser.add_argument('--solver', default='appsi_highs', help='(default: appsi_highs)')
+    parser.add_argument(
+        '--direct-build',
+        action='store_true',
+        help='Assemble the core constraint families directly (with --solver highs_direct).',
+    )
+    parser.add_argument(
+        '--no-source-trace', action='store_true', help='Skip the source trace in the load.'
+    )
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Trace the peak Python allocation of each stage (slows the run).',
+    )
+    parser.add_argument('--output', type=Path, help='JSON report file (default: stdout).')
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+
+    options: dict[str, Any] = {
+        'solver_name': args.solver,
+        'source_trace': not args.no_source_trace,
+        'trace_memory': args.trace_memory,
+        'direct_build': args.direct_build,
+    }
+    if args.db is not None:
+        report = run_benchmark(args.db, **options)
+    else:
+        with tempfile.TemporaryDirectory() as work_dir:
+            report = benchmark_synthetic(spec_from_args(args), Path(work_dir), **options)
+
+    text = json.dumps(report, indent=2)
+    if args.output is None:
+        print(text)
+    else:
+        args.output.write_text(text + '\n')
+
+
+if __name__ == '__main__':
+    main()
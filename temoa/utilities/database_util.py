@@ -225,6 +225,82 @@ class DatabaseUtil:
         else:
             return result.groupby(by='tech').sum().reset_index()
 
+    def get_capacity_by_period(self, region: str | None = None) -> pd.DataFrame:
+        """
+        Retrieves capacity data for all periods in one query, aggregated by period and technology.
+        The per-period equivalent of get_capacity_for_tech_and_period.
+        """
+        if not self.scenario:
+            raise ValueError('A scenario must be set for output-related queries')
+
+        query = (
+            'SELECT tech, period, SUM(capacity), region FROM output_net_capacity WHERE scenario IS '
+            f"'{self.scenario}'"
+        )
+        if region:
+            query += f" AND region LIKE '{region}%'"
+        query += ' GROUP BY tech, region, period, sector;'
+        self.cur.execute(query)
+        result = pd.DataFrame(self.cur.fetchall(), columns=['tech', 'period', 'capacity', 'region'])
+
+        if region is None and not result.empty:
+            mask = result['region'].str.contains('-')
+            result.loc[mask, 'capacity'] /= 2
+
+        return result.groupby(by=['period', 'tech'], as_index=False)[['capacity']].sum()
+
+    def get_output_flow_by_period(
+        self, region: str | None, comm_type: str = 'input'
+    ) -> pd.DataFrame:
+        """
+        Retrieves output flow data for all periods in one query, aggregated by period, technology
+        and commodity.  The per-period equivalent of get_output_flow_for_period.
+        """
+        if not self.scenario:
+            raise ValueError('A scenario must be set for output-related queries')
+        if comm_type == 'input':
+            table = 'output_flow_in'
+        elif comm_type == 'output':
+            table = 'output_flow_out'
+        else:
+            raise ValueError("Invalid comm_type: can only be 'input' or 'output'")
+
+        comm_col = f'{comm_type}_comm'
+        query = (
+            f'SELECT period, {comm_col}, tech, SUM(flow) AS flow FROM {table} WHERE '
+            f"scenario IS '{self.scenario}'"
+        )
+        if region:
+            query += f" AND region LIKE '{region}%'"
+        query += f' GROUP BY period, tech, {comm_col}'
+        self.cur.execute(query)
+        return pd.DataFrame(self.cur.fetchall(), columns=['period', comm_col, 'tech', 'flow'])
+
+    def get_emissions_activity_by_period(self, region: str | None) -> pd.DataFrame:
+        """
+        Retrieves emissions activity data for all periods in one query.  The per-period
+        equivalent of get_emissions_activity_for_period.
+        """
+        if not self.scenario:
+            raise ValueError('A scenario must be set for output-related queries')
+
+        query = f"""
+            SELECT O.period, E.emis_comm, E.tech, SUM(E.activity * O.flow)
+            FROM emission_activity E, output_flow_out O
+            WHERE E.input_comm = O.input_comm
+              AND E.tech = O.tech
+              AND E.vintage = O.vintage
+              AND E.output_comm = O.output_comm
+              AND O.scenario = '{self.scenario}'
+        """
+        if region:
+            query += f" AND E.region LIKE '%{region}%'"
+        query += ' GROUP BY O.period, E.tech, E.emis_comm'
+        self.cur.execute(query)
+        return pd.DataFrame(
+            self.cur.fetchall(), columns=['period', 'emis_comm', 'tech', 'emis_activity']
+        )
+
     def get_output_flow_for_period(
         self,
         period: int,
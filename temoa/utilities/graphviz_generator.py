@@ -1,7 +1,11 @@
 import argparse
 import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import call
-from typing import Any, TextIO
+from typing import Any, TextIO, cast
+
+import pandas as pd
 
 from temoa.utilities.graphviz_formats import (
     commodity_dot_fmt,
@@ -136,6 +140,11 @@ def process_input(args: list[str]) -> dict[str, Any]:
     return vars(options)
 
 
+def _by_period(frame: pd.DataFrame) -> dict[int, pd.DataFrame]:
+    """Split a frame with a period column into a frame per period."""
+    return {int(cast('int', period)): group for period, group in frame.groupby('period')}
+
+
 class GraphvizDiagramGenerator:
     """Generates Graphviz diagrams for Temoa models."""
 
@@ -203,9 +212,18 @@ class GraphvizDiagramGenerator:
         self, dot_format: str, dot_args: dict[str, Any], output_name: str, output_format: str
     ) -> None:
         """Generate a graph from a DOT format string."""
+        self._write_dot(dot_format, dot_args, output_name)
+        self._render(output_name, output_format)
+
+    def _write_dot(self, dot_format: str, dot_args: dict[str, Any], output_name: str) -> None:
+        """Write the DOT file for a graph."""
         dot_args.update(self.colors)
         with open(output_name + '.dot', 'w') as f:
             f.write(dot_format.format(**dot_args))
+
+    @staticmethod
+    def _render(output_name: str, output_format: str) -> None:
+        """Render a DOT file written by _write_dot with Graphviz."""
         cmd = (
             'dot',
             f'-T{output_format}',
@@ -228,12 +246,8 @@ class GraphvizDiagramGenerator:
             f'and splinevar = {self.colors.get("splinevar", "line")}'
         )
 
-    def create_main_results_diagram(
-        self, period: int, region: str | None, output_format: str = 'svg'
-    ) -> tuple[str, str]:
-        """Create the main results diagram for a specific period."""
-        self.__log__(f'CreateMainResultsDiagram: started with period = {period}')
-
+    def _main_results_output_name(self, period: int) -> str:
+        """The output file name (without extension) of the main results diagram for a period."""
         results_dir = os.path.join(self.out_dir, self.folder['results'])
         if not os.path.exists(results_dir):
             os.makedirs(results_dir)
@@ -244,23 +258,43 @@ class GraphvizDiagramGenerator:
         output_name = os.path.join(self.out_dir, output_name)
         if self.grey_flag:
             output_name += '.grey'
+        return output_name
 
+    def _main_results_static_data(
+        self, region: str | None
+    ) -> tuple[set[str], set[str], set[str], set[tuple[str, str]], set[tuple[str, str]]]:
+        """The period-independent data of the main results diagrams."""
         tech_all = self.db_util.get_technologies_for_flags(flags=['r', 'p', 'pb', 'ps'])
         commodity_carrier = self.db_util.get_commodities_for_flags(flags=['d', 'p'])
         commodity_emissions = self.db_util.get_commodities_for_flags(flags=['e'])
         efficiency_input = self.db_util.get_commodities_by_technology(region, comm_type='input')
         efficiency_output = self.db_util.get_commodities_by_technology(region, comm_type='output')
-        v_cap2 = self.db_util.get_capacity_for_tech_and_period(period=period, region=region)
-        ei_2 = self.db_util.get_output_flow_for_period(
-            period=period, region=region, comm_type='input'
-        )
-        eo_2 = self.db_util.get_output_flow_for_period(
-            period=period, region=region, comm_type='output'
-        )
-        emio_2 = self.db_util.get_emissions_activity_for_period(period=period, region=region)
-
-        self.__log__('CreateMainResultsDiagram: database fetched successfully')
+        return tech_all, commodity_carrier, commodity_emissions, efficiency_input, efficiency_output
 
+    def _main_results_args(
+        self,
+        period: int,
+        static_data: tuple[
+            set[str], set[str], set[str], set[tuple[str, str]], set[tuple[str, str]]
+        ],
+        v_cap2: pd.DataFrame,
+        ei_2: pd.DataFrame,
+        eo_2: pd.DataFrame,
+        emio_2: pd.DataFrame,
+    ) -> dict[str, Any]:
+        """
+        The DOT arguments of the main results diagram for a period.
+
+        :param period: the period
+        :param static_data: from _main_results_static_data
+        :param v_cap2: the capacity (tech, capacity) in the period
+        :param ei_2: the input flows (input_comm, tech, flow) in the period
+        :param eo_2: the output flows (output_comm, tech, flow) in the period
+        :param emio_2: the emissions (emis_comm, tech, emis_activity) in the period
+        """
+        tech_all, commodity_carrier, commodity_emissions, efficiency_input, efficiency_output = (
+            static_data
+        )
         tech_attr_fmt = (
             'label="%s\\nCapacity: %.2f", href="#", '
             "onclick=\"loadNextGraphvizGraph('results', '%s', '%s')\""
@@ -279,28 +313,25 @@ class GraphvizDiagramGenerator:
         dflows: set[tuple[str, str, str]] = set()
         usedc, usede = set(), set()  # used carriers, used emissions
 
-        v_cap2.index = v_cap2.tech
-        for tech in set(tech_all) - set(v_cap2.tech):
+        capacity = dict(zip(v_cap2['tech'], v_cap2['capacity'], strict=True))
+        for tech in set(tech_all) - set(capacity):
             dtechs.add((tech, ''))
 
-        for i in range(len(v_cap2)):
-            row = v_cap2.iloc[i]
-            etechs.add(
-                (row['tech'], tech_attr_fmt % (row['tech'], row['capacity'], row['tech'], period))
-            )
+        for tech, cap in capacity.items():
+            etechs.add((tech, tech_attr_fmt % (tech, cap, tech, period)))
 
         udflows: set[tuple[str, str]] = set()
-        for i in range(len(ei_2)):
-            row = ei_2.iloc[i]
-            if row['input_comm'] != 'ethos':
-                eflowsi.add((row['input_comm'], row['tech'], flow_fmt % row['flow']))
-                ecarriers.add((row['input_comm'], commodity_fmt % (row['input_comm'], period)))
-                usedc.add(row['input_comm'])
+        for input_comm, tech, flow in ei_2[['input_comm', 'tech', 'flow']].itertuples(
+            index=False, name=None
+        ):
+            if input_comm != 'ethos':
+                eflowsi.add((input_comm, tech, flow_fmt % flow))
+                ecarriers.add((input_comm, commodity_fmt % (input_comm, period)))
+                usedc.add(input_comm)
             else:
-                tech = row['tech']
-                cap = v_cap2.loc[row['tech']].capacity if tech in v_cap2.tech else 99999
-                xnodes.add((row['tech'], tech_attr_fmt % (row['tech'], cap, row['tech'], period)))
-            udflows.add((row['input_comm'], row['tech']))
+                cap = capacity.get(tech, 99999)
+                xnodes.add((tech, tech_attr_fmt % (tech, cap, tech, period)))
+            udflows.add((input_comm, tech))
 
         for row in set(efficiency_input) - udflows:
             if row[0] != 'ethos':
@@ -309,28 +340,29 @@ class GraphvizDiagramGenerator:
                 xnodes.add((row[1], ''))
 
         udflows = set()
-        for i in range(len(eo_2)):
-            row = eo_2.iloc[i]
-            eflowso.add((row['tech'], row['output_comm'], flow_fmt % row['flow']))
-            ecarriers.add((row['output_comm'], commodity_fmt % (row['output_comm'], period)))
-            usedc.add(row['output_comm'])
-            udflows.add((row['tech'], row['output_comm']))
+        for output_comm, tech, flow in eo_2[['output_comm', 'tech', 'flow']].itertuples(
+            index=False, name=None
+        ):
+            eflowso.add((tech, output_comm, flow_fmt % flow))
+            ecarriers.add((output_comm, commodity_fmt % (output_comm, period)))
+            usedc.add(output_comm)
+            udflows.add((tech, output_comm))
 
         for row in set(efficiency_output) - udflows:
             dflows.add((row[0], row[1], ''))
 
-        for i in range(len(emio_2)):
-            row = emio_2.iloc[i]
-            if row['emis_activity'] >= epsilon:
-                eflowso.add((row['tech'], row['emis_comm'], flow_fmt % row['emis_activity']))
-                eemissions.add((row['emis_comm'], ''))
-                usede.add(row['emis_comm'])
+        for emis_comm, tech, emis_activity in emio_2[
+            ['emis_comm', 'tech', 'emis_activity']
+        ].itertuples(index=False, name=None):
+            if emis_activity >= epsilon:
+                eflowso.add((tech, emis_comm, flow_fmt % emis_activity))
+                eemissions.add((emis_comm, ''))
+                usede.add(emis_comm)
 
         dcarriers = {(cc, '') for cc in commodity_carrier if cc not in usedc and cc != 'ethos'}
         demissions = {(ee, '') for ee in commodity_emissions if ee not in usede}
 
-        self.__log__('CreateMainResultsDiagram: creating diagrams')
-        args = {
+        return {
             'period': period,
             'splinevar': self.colors['splinevar'],
             'dtechs': create_text_nodes(dtechs, indent=2),
@@ -345,11 +377,89 @@ class GraphvizDiagramGenerator:
             'eflowso': create_text_edges(eflowso, indent=3),
         }
 
+    def create_main_results_diagram(
+        self, period: int, region: str | None, output_format: str = 'svg'
+    ) -> tuple[str, str]:
+        """Create the main results diagram for a specific period."""
+        self.__log__(f'CreateMainResultsDiagram: started with period = {period}')
+        output_name = self._main_results_output_name(period)
+
+        static_data = self._main_results_static_data(region)
+        v_cap2 = self.db_util.get_capacity_for_tech_and_period(period=period, region=region)
+        ei_2 = self.db_util.get_output_flow_for_period(
+            period=period, region=region, comm_type='input'
+        )
+        eo_2 = self.db_util.get_output_flow_for_period(
+            period=period, region=region, comm_type='output'
+        )
+        emio_2 = self.db_util.get_emissions_activity_for_period(period=period, region=region)
+        self.__log__('CreateMainResultsDiagram: database fetched successfully')
+
+        self.__log__('CreateMainResultsDiagram: creating diagrams')
+        args = self._main_results_args(
+            period, static_data, cast('pd.DataFrame', v_cap2), ei_2, eo_2, emio_2
+        )
         output_path = output_name + '.' + output_format
         self.__generate_graph__(results_dot_fmt, args, output_name, output_format)
         self.__log__('CreateMainResultsDiagram: graph generated, returning')
         return self.out_dir, output_path
 
+    def create_main_results_diagrams(
+        self,
+        periods: Iterable[int],
+        region: str | None,
+        output_format: str = 'svg',
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """
+        Create the main results diagrams for several periods.  The data for all periods is
+        fetched with one query per output table, and the diagrams are rendered in parallel.
+
+        :param periods: the periods to draw
+        :param region: the region to draw, or None for all
+        :param output_format: the Graphviz output format
+        :param max_workers: the maximum number of diagrams rendered at once (default: the number
+        of CPUs)
+        :return: the paths of the rendered diagrams
+        """
+        periods = list(periods)
+        self.__log__(f'CreateMainResultsDiagrams: started with periods = {periods}')
+
+        static_data = self._main_results_static_data(region)
+        db = self.db_util
+        capacity = _by_period(db.get_capacity_by_period(region=region))
+        flow_in = _by_period(db.get_output_flow_by_period(region, comm_type='input'))
+        flow_out = _by_period(db.get_output_flow_by_period(region, comm_type='output'))
+        emissions = _by_period(db.get_emissions_activity_by_period(region=region))
+        self.__log__('CreateMainResultsDiagrams: database fetched successfully')
+
+        empty = {
+            'capacity': pd.DataFrame(columns=['tech', 'capacity']),
+            'flow_in': pd.DataFrame(columns=['input_comm', 'tech', 'flow']),
+            'flow_out': pd.DataFrame(columns=['output_comm', 'tech', 'flow']),
+            'emissions': pd.DataFrame(columns=['emis_comm', 'tech', 'emis_activity']),
+        }
+        output_names = []
+        for period in periods:
+            output_name = self._main_results_output_name(period)
+            args = self._main_results_args(
+                period,
+                static_data,
+                capacity.get(period, empty['capacity']),
+                flow_in.get(period, empty['flow_in']),
+                flow_out.get(period, empty['flow_out']),
+                emissions.get(period, empty['emissions']),
+            )
+            self._write_dot(results_dot_fmt, args, output_name)
+            output_names.append(output_name)
+
+        # rendering is done by (independent) Graphviz processes, so threads suffice to run them
+        self.__log__('CreateMainResultsDiagrams: rendering diagrams')
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            list(pool.map(lambda name: self._render(name, output_format), output_names))
+        self.__log__('CreateMainResultsDiagrams: graphs generated, returning')
+        return [f'{name}.{output_format}' for name in output_names]
+
     def create_tech_results_diagrams(
         self, period: int, region: str | None, tech: str, output_format: str = 'svg'
     ) -> tuple[str, str]:
@@ -0,0 +1,282 @@
+"""
+Generator of synthetic (v4 schema) Temoa databases of a chosen size, for benchmarking.
+
+The generated system is feasible by construction: in each region, fuels are imported from the
+source commodity without a capacity limit, generators convert the fuels (or, for the renewable
+ones, the source directly, subject to a capacity factor profile) to electricity, storage shifts
+electricity over the time slices, exchange links trade it between regions, and end-use
+technologies serve the demands.  All of the technologies can be built in every optimization
+period, and some generators have existing capacity.
+
+The size of the model grows with the number of regions, generating technologies, vintages
+(optimization periods) and time slices (seasons x times of day).  The values are drawn from a
+seeded random generator, so a spec always gives the same database.
+
+Usage:
+    python -m temoa.utilities.synthetic_model <db file> [--regions N] [--techs N] ...
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+from contextlib import closing
+from dataclasses import asdict, dataclass, fields
+from importlib import resources
+from itertools import combinations
+from pathlib import Path
+from typing import Any
+
+FIRST_PERIOD = 2025
+PERIOD_LENGTH = 5
+EXISTING_VINTAGE = 2020
+SOURCE = 'ethos'
+ELECTRICITY = 'ELC'
+EMISSION = 'co2'
+
+
+@dataclass(frozen=True)
+class SyntheticSpec:
+    """The size (and random seed) of a synthetic database"""
+
+    regions: int = 2
+    techs: int = 10  # generating and storage technologies
+    vintages: int = 3  # optimization periods
+    seasons: int = 4
+    times_of_day: int = 6
+    storage_share: float = 0.2  # share of the techs that are storage
+    exchange_links: int = 1  # (two-way) links between pairs of regions
+    fuels: int = 3
+    demands: int = 2
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        for name in ('regions', 'techs', 'vintages', 'seasons', 'times_of_day', 'fuels', 'demands'):
+            if getattr(self, name) < 1:
+                raise ValueError(f'{name} must be at least 1')
+        if not 0 <= self.storage_share < 1:
+            raise ValueError('storage_share must be in [0, 1)')
+        max_links = self.regions * (self.regions - 1) // 2
+        if not 0 <= self.exchange_links <= max_links:
+            raise ValueError(
+                f'exchange_links must be in [0, {max_links}] for {self.regions} regions'
+            )
+
+    @property
+    def num_storage(self) -> int:
+        return round(self.techs * self.storage_share)
+
+
+def _rows(spec: SyntheticSpec) -> dict[str, list[tuple[Any, ...]]]:
+    """The rows of each table of the synthetic database"""
+    rng = random.Random(spec.seed)
+    rows: dict[str, list[tuple[Any, ...]]] = {}
+
+    regions = [f'R{n + 1}' for n in range(spec.regions)]
+    periods = [FIRST_PERIOD + n * PERIOD_LENGTH for n in range(spec.vintages)]
+    seasons = [f'S{n + 1}' for n in range(spec.seasons)]
+    times_of_day = [f'H{n + 1}' for n in range(spec.times_of_day)]
+    fuels = [f'F{n + 1}' for n in range(spec.fuels)]
+    demands = [f'DEM{n + 1}' for n in range(spec.demands)]
+
+    rows['region'] = [(r, None) for r in regions]
+    # the last future period marks the end of the horizon
+    rows['time_period'] = [(1, EXISTING_VINTAGE, 'e')] + [
+        (n + 2, p, 'f') for n, p in enumerate([*periods, periods[-1] + PERIOD_LENGTH])
+    ]
+    rows['time_season'] = [(n + 1, s, 1 / spec.seasons, None) for n, s in enumerate(seasons)]
+    rows['time_of_day'] = [
+        (n + 1, d, 24 / spec.times_of_day, None) for n, d in enumerate(times_of_day)
+    ]
+    rows['sector_label'] = [(s, None) for s in ('supply', 'electric', 'residential', 'transport')]
+    rows['commodity'] = [
+        (SOURCE, 's', 'source of everything', None),
+        (ELECTRICITY, 'p', 'electricity', None),
+        (EMISSION, 'e', 'CO2 emissions', None),
+        *((f, 'p', 'fuel', None) for f in fuels),
+        *((d, 'd', 'end-use demand', None) for d in demands),
+    ]
+
+    # (tech, flag, sector, unlim_cap, exchange) and the processes (input, tech, output, eff)
+    techs: list[tuple[str, str, str, int, int]] = []
+    processes: list[tuple[str, str, str, float]] = []
+    lifetimes: dict[str, float] = {}
+    generators: list[str] = []
+    renewables: list[str] = []
+    storage: list[str] = []
+    emitting: dict[str, tuple[str, float]] = {}  # generator: (fuel, emission rate)
+
+    for f in fuels:
+        tech = f'IMP_{f}'
+        techs.append((tech, 'p', 'supply', 1, 0))
+        processes.append((SOURCE, tech, f, 1.0))
+        lifetimes[tech] = 100
+    for n in range(spec.techs - spec.num_storage):
+        tech = f'GEN{n + 1}'
+        generators.append(tech)
+        techs.append((tech, 'p', 'electric', 0, 0))
+        lifetimes[tech] = 30
+        if n % 3 == 2:  # every third generator is a renewable
+            renewables.append(tech)
+            processes.append((SOURCE, tech, ELECTRICITY, 1.0))
+        else:
+            fuel = fuels[n % spec.fuels]
+            processes.append((fuel, tech, ELECTRICITY, round(rng.uniform(0.3, 0.6), 3)))
+            emitting[tech] = (fuel, round(rng.uniform(0.01, 0.1), 4))
+    for n in range(spec.num_storage):
+        tech = f'STO{n + 1}'
+        storage.append(tech)
+        techs.append((tech, 'ps', 'electric', 0, 0))
+        processes.append((ELECTRICITY, tech, ELECTRICITY, 0.85))
+        lifetimes[tech] = 15
+    end_uses = []
+    for d in demands:
+        tech = f'USE_{d}'
+        end_uses.append(tech)
+        techs.append((tech, 'p', 'residential', 0, 0))
+        processes.append((ELECTRICITY, tech, d, 1.0))
+        lifetimes[tech] = 20
+    links = list(combinations(regions, 2))[: spec.exchange_links]
+    if links:
+        techs.append(('TX', 'p', 'transport', 0, 1))
+        lifetimes['TX'] = 50
+
+    rows['technology'] = [
+        (t, flag, sector, None, '', unlim, 0, 0, 0, 0, 0, exchange, 0, None)
+        for t, flag, sector, unlim, exchange in techs
+    ]
+
+    efficiency: list[tuple[Any, ...]] = []
+    for r in regions:
+        for i, t, o, eff in processes:
+            efficiency.extend((r, i, t, v, o, eff, None, None) for v in periods)
+        # existing capacity of every other (fuelled) generator
+        efficiency.extend(
+            (r, i, t, EXISTING_VINTAGE, o, eff, None, None)
+            for i, t, o, eff in processes
+            if t in emitting and int(t[3:]) % 2
+        )
+    for r1, r2 in links:
+        for region in (f'{r1}-{r2}', f'{r2}-{r1}'):
+            efficiency.extend(
+                (region, ELECTRICITY, 'TX', v, ELECTRICITY, 0.97, None, None) for v in periods
+            )
+    rows['efficiency'] = efficiency
+
+    existing = {(r, t) for r, _i, t, v, *_ in efficiency if v == EXISTING_VINTAGE}
+    rows['existing_capacity'] = [
+        (r, t, EXISTING_VINTAGE, round(rng.uniform(1, 5), 2), None, None)
+        for r, t in sorted(existing)
+    ]
+    rows['emission_activity'] = [
+        (r, EMISSION, fuel, t, v, ELECTRICITY, rate, None, None)
+        for r, _i, t, v, *_ in efficiency
+        if t in emitting
+        for fuel, rate in (emitting[t],)
+    ]
+    rows['lifetime_tech'] = [
+        (r, t, lifetime, None, None) for r in regions for t, lifetime in lifetimes.items()
+    ]
+    rows['storage_duration'] = [(r, t, 4.0, None) for r in regions for t in storage]
+    rows['capacity_factor_tech'] = [
+        (r, s, d, t, round(rng.uniform(0.1, 1.0), 3), None)
+        for r in regions
+        for t in renewables
+        for s in seasons
+        for d in times_of_day
+    ]
+
+    # the vintages of the processes in each region
+    vintages: dict[tuple[str, str], list[int]] = {}
+    for r, _i, t, v, *_ in efficiency:
+        vintages.setdefault((r, t), []).append(v)
+    built = set(generators) | set(storage) | set(end_uses) | {'TX'}
+    rows['cost_invest'] = [
+        (r, t, v, round(rng.uniform(50, 150), 2), None, None)
+        for (r, t), vs in vintages.items()
+        if t in built
+        for v in vs
+        if v != EXISTING_VINTAGE
+    ]
+    rows['cost_fixed'] = [
+        (r, p, t, v, round(rng.uniform(1, 5), 2), None, None)
+        for (r, t), vs in vintages.items()
+        if t in built
+        for v in vs
+        for p in periods
+        if v <= p < v + lifetimes[t]
+    ]
+    rows['cost_variable'] = [
+        (r, p, t, v, round(rng.uniform(1, 10), 2), None, None)
+        for (r, t), vs in vintages.items()
+        if t not in end_uses and t not in storage
+        for v in vs
+        for p in periods
+        if v <= p < v + lifetimes[t]
+    ]
+    rows['cost_emission'] = [(r, p, EMISSION, 5.0, None, None) for r in regions for p in periods]
+    rows['demand'] = [
+        (r, p, d, round(rng.uniform(50, 100) * 1.02**n, 2), None, None)
+        for r in regions
+        for d in demands
+        for n, p in enumerate(periods)
+    ]
+    return rows
+
+
+def make_synthetic_db(path: Path, spec: SyntheticSpec, overwrite: bool = False) -> Path:
+    """
+    Write a synthetic database of the given size.
+
+    :param path: the database file to create
+    :param spec: the size of the model
+    :param overwrite: replace the database if it exists
+    :return: the database file
+    """
+    if path.exists():
+        if not overwrite:
+            raise FileExistsError(f'{path} exists.  Use overwrite to replace it.')
+        path.unlink()
+    schema = resources.files('temoa.db_schema') / 'temoa_schema_v4.sql'
+    with closing(sqlite3.connect(path)) as con:
+        con.executescript(schema.read_text(encoding='utf-8'))
+        for table, table_rows in _rows(spec).items():
+            if table_rows:
+                marks = ','.join('?' * len(table_rows[0]))
+                con.executemany(f'INSERT INTO {table} VALUES ({marks})', table_rows)
+        con.commit()
+    return path
+
+
+def add_spec_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add an option for each field of the SyntheticSpec to a parser"""
+    for field in fields(SyntheticSpec):
+        parser.add_argument(
+            f'--{field.name.replace("_", "-")}',
+            type=type(field.default),
+            default=field.default,
+            help=f'(default: {field.default})',
+        )
+
+
+def spec_from_args(args: argparse.Namespace) -> SyntheticSpec:
+    return SyntheticSpec(
+        **{field.name: getattr(args, field.name) for field in fields(SyntheticSpec)}
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Write a synthetic Temoa database.')
+    parser.add_argument('db_path', type=Path, help='Path to the SQLite database file to create.')
+    parser.add_argument('--overwrite', action='store_true', help='Replace an existing database.')
+    add_spec_arguments(parser)
+    args = parser.parse_args()
+
+    spec = spec_from_args(args)
+    make_synthetic_db(args.db_path, spec, overwrite=args.overwrite)
+    print(f'Wrote {args.db_path}: {asdict(spec)}')
+
+
+if __name__ == '__main__':
+    main()
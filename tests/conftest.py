@@ -1,4 +1,5 @@
 import logging
+import shutil
 import sqlite3
 from pathlib import Path
 from typing import Any
@@ -218,3 +219,31 @@ def system_test_run(
         sequencer.pf_solved_instance,
         sequencer,
     )
+
+
+@pytest.fixture(scope='session')
+def utopia_config(tmp_path_factory: pytest.TempPathFactory) -> TemoaConfig:
+    """
+    the config of a perfect foresight run of utopia, shared by the tests that only read it.  It
+    runs on a copy of the utopia database, so its results do not collide with other test runs
+    """
+    output_path = tmp_path_factory.mktemp('utopia')
+    config = TemoaConfig.build_config(
+        config_file=Path(__file__).parent / 'testing_configs' / 'config_utopia.toml',
+        output_path=output_path,
+        silent=True,
+    )
+    db = output_path / 'utopia.sqlite'
+    shutil.copy(config.input_database, db)
+    config.input_database = db
+    config.output_database = db
+    return config
+
+
+@pytest.fixture(scope='session')
+def solved_utopia_db(utopia_config: TemoaConfig) -> Path:
+    """
+    solve utopia once per session and hand over the output database holding its results
+    """
+    TemoaSequencer(config=utopia_config).start()
+    return utopia_config.output_database
@@ -0,0 +1,96 @@
+import logging
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from temoa.data_io.build_cache import BuildCache, make_key
+from temoa.model_checking.commodity_network_manager import RegionPeriodResult, report_findings
+from temoa.model_checking.network_model_data import EdgeTuple
+from temoa.types.core_types import Commodity, Period, Region, Technology, Vintage
+
+if TYPE_CHECKING:
+    from temoa.core.config import TemoaConfig
+
+
+def make_config(**kwargs: object) -> 'TemoaConfig':
+    fields: dict[str, object] = {
+        'scenario_mode': 'perfect_foresight',
+        'source_trace': True,
+        'time_sequencing': 'seasonal_timeslices',
+        'days_per_period': 365,
+        'reserve_margin': 'static',
+    }
+    fields.update(kwargs)
+    return cast('TemoaConfig', SimpleNamespace(**fields))
+
+
+def make_db() -> sqlite3.Connection:
+    con = sqlite3.connect(':memory:')
+    con.execute('CREATE TABLE demand (region TEXT, period INTEGER, commodity TEXT, demand REAL)')
+    con.execute('CREATE TABLE output_objective (scenario TEXT, total_system_cost REAL)')
+    con.execute("INSERT INTO demand VALUES ('R1', 2020, 'ELC', 10.0)")
+    return con
+
+
+def test_key_tracks_inputs() -> None:
+    con = make_db()
+    config = make_config()
+    key = make_key(con, config)
+    assert make_key(con, config) == key
+
+    # output tables do not feed the build
+    con.execute("INSERT INTO output_objective VALUES ('s', 1.0)")
+    assert make_key(con, config) == key
+
+    assert make_key(con, make_config(source_trace=False)) != key
+
+    con.execute("UPDATE demand SET demand = 11.0 WHERE region = 'R1'")
+    assert make_key(con, config) != key
+
+
+def test_store_and_load(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / 'cache')
+    data: dict[str, object] = {'demand': {('R1', 2020, 'ELC'): 10.0}, 'time_future': [2020]}
+
+    assert cache.load('abc') is None
+    cache.store('abc', data)
+    entry = cache.load('abc')
+    assert entry is not None
+    assert entry.data == data
+    assert entry.trace_results is None
+
+    # a corrupt entry is treated as a miss
+    (tmp_path / 'cache' / 'def.pkl').write_bytes(b'not a pickle')
+    assert cache.load('def') is None
+
+
+def test_trace_findings_logged_again(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """the findings of the source trace are stored with the data, to be logged on a hit"""
+    orphan = EdgeTuple(
+        region=Region('R1'),
+        input_comm=Commodity('ethos'),
+        tech=Technology('t1'),
+        vintage=Vintage(2020),
+        output_comm=Commodity('c1'),
+    )
+    result = RegionPeriodResult(
+        region=Region('R1'),
+        period=Period(2020),
+        unsupported_demands={Commodity('d1')},
+        demand_orphans=set(),
+        other_orphans={orphan},
+    )
+    cache = BuildCache(tmp_path / 'cache')
+    cache.store('abc', {}, trace_results=[result])
+    entry = cache.load('abc')
+    assert entry is not None
+    assert entry.trace_results == [result]
+
+    with caplog.at_level(logging.INFO):
+        assert not report_findings(entry.trace_results)
+    assert 'Demand d1 is not supported back to a source in region R1, period 2020' in caplog.text
+    assert 'orphaned processes in region R1, period 2020' in caplog.text
+    assert report_findings([result._replace(unsupported_demands=set(), other_orphans=set())])
@@ -0,0 +1,90 @@
+"""
+Test the bulk validation of the model data against the element validators of the model
+"""
+
+import sqlite3
+from collections.abc import Callable
+from contextlib import closing
+
+import pytest
+from pyomo.environ import Param, Set
+
+from temoa._internal.run_actions import build_instance
+from temoa.core.config import TemoaConfig
+from temoa.core.model import abstract_model
+from temoa.data_io.bulk_validation import ELEMENT_VALIDATORS, validate_data
+from temoa.data_io.hybrid_loader import HybridLoader
+
+
+@pytest.fixture(scope='module')
+def utopia_data(utopia_config: TemoaConfig) -> dict[str, object]:
+    with closing(sqlite3.connect(utopia_config.input_database)) as con:
+        return HybridLoader(db_connection=con, config=utopia_config).create_data_dict()
+
+
+def _validator(component: Set | Param) -> Callable[..., bool] | None:
+    """The validation function of a component (Sets wrap it in an initializer)"""
+    validate = getattr(component, '_validate', None)
+    return getattr(validate, '_fcn', validate)
+
+
+def test_covers_model_validators() -> None:
+    """Every element validator of the model should be applied in bulk, and skipped if asked"""
+    validated = {
+        c.name: _validator(c)
+        for c in abstract_model().component_objects((Param, Set))
+        if _validator(c) is not None
+    }
+    assert validated == ELEMENT_VALIDATORS
+
+    unchecked = abstract_model(validate_elements=False)
+    assert not any(_validator(c) for c in unchecked.component_objects((Param, Set)))
+
+
+def _error_from_build(data: dict[str, object]) -> str:
+    with pytest.raises((ValueError, RuntimeError)) as build_error:
+        build_instance(HybridLoader.data_portal_from_data(data), silent=True)
+    return str(build_error.value)
+
+
+@pytest.mark.parametrize(
+    'component, change',
+    [
+        ('capacity_factor_process', lambda value: 1.5),
+        ('efficiency', lambda value: int(value) + 1),
+        ('capacity_factor_tech', lambda value: -0.1),
+    ],
+    ids=['above 1', 'not float', 'below 0'],
+)
+def test_same_errors(
+    utopia_data: dict[str, object], component: str, change: Callable[[float], object]
+) -> None:
+    """The bulk validation should raise the error of the element validators"""
+    validate_data(utopia_data)
+
+    data = dict(utopia_data)
+    values = dict(data[component])  # type: ignore[call-overload]
+    index = list(values)[len(values) // 2]
+    values[index] = change(values[index])
+    data[component] = values
+
+    with pytest.raises(RuntimeError) as bulk_error:
+        validate_data(data)
+    assert str(bulk_error.value) == _error_from_build(data)
+
+
+def test_bad_region(utopia_data: dict[str, object]) -> None:
+    data = dict(utopia_data, regions=['utopia', 'bad/region'])
+    with pytest.raises(ValueError, match='violates the validation rule of Set regions') as error:
+        validate_data(data)
+    assert str(error.value) == _error_from_build(data)
+
+
+def test_build_without_element_validators(utopia_data: dict[str, object]) -> None:
+    """The model built without its element validators should be the same"""
+    portal = HybridLoader.data_portal_from_data(utopia_data)
+    checked = build_instance(portal, silent=True)
+    unchecked = build_instance(portal, silent=True, validate_elements=False)
+    assert unchecked.nvariables() == checked.nvariables()
+    assert unchecked.nconstraints() == checked.nconstraints()
+    assert dict(unchecked.efficiency.items()) == dict(checked.efficiency.items())
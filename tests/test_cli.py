@@ -1,6 +1,9 @@
+import csv
 import re
 import shutil
 import sqlite3
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -59,6 +62,16 @@ def test_cli_version() -> None:
     assert 'Temoa Version' in result.stdout
 
 
+def test_cli_import_is_light() -> None:
+    """The CLI should not import the model stack until a command needs it."""
+    heavy = ('pyomo', 'pandas', 'matplotlib', 'mpisppy')
+    code = f'import sys, temoa.cli; print([m for m in {heavy!r} if m in sys.modules])'
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == '[]'
+
+
 def test_cli_run_command_success_silent(tmp_path: Path) -> None:
     """Test a successful silent run of the `temoa run` command."""
     db_path = Path(__file__).parent / 'testing_outputs' / 'utopia.sqlite'
@@ -85,6 +98,34 @@ def test_cli_run_build_only_silent(tmp_path: Path) -> None:
     assert (tmp_path / 'temoa-run.log').exists()
 
 
+def test_cli_run_build_only_profile(tmp_path: Path) -> None:
+    """Test that `temoa run --build-only --profile-build` writes the construction profile."""
+    db_path = Path(__file__).parent / 'testing_outputs' / 'utopia.sqlite'
+    test_config_path = create_test_config(tmp_path, db_path)
+    args = [
+        'run',
+        str(test_config_path),
+        '--output',
+        str(tmp_path),
+        '--build-only',
+        '--silent',
+        '--profile-build',
+    ]
+    result = runner.invoke(app, args)
+
+    assert result.exit_code == 0, f'CLI crashed with error: {result.exception}'
+    with open(tmp_path / 'build_profile.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    by_name = {row['component']: row for row in rows}
+    assert by_name['commodity_balance_constraint']['type'] == 'Constraint'
+    assert int(by_name['commodity_balance_constraint']['terms']) > 0
+    assert int(by_name['time_optimize']['indices']) > 0
+    assert by_name['create_sparse_dicts']['indices'] == ''
+    # sorted slowest first
+    seconds = [float(row['seconds']) for row in rows]
+    assert seconds == sorted(seconds, reverse=True)
+
+
 # =============================================================================
 # Tests for the `validate` command
 # =============================================================================
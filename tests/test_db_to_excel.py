@@ -0,0 +1,70 @@
+"""
+Test the spreadsheet output of the results (pivoted and written by SQL queries)
+"""
+
+import contextlib
+import sqlite3
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from temoa.data_processing.db_to_excel import make_excel
+
+SCENARIO = 'test run'
+
+
+def test_excel_output(solved_utopia_db: Path, tmp_path: Path) -> None:
+    make_excel(str(solved_utopia_db), tmp_path / 'utopia', {SCENARIO})
+
+    sheets = pd.read_excel(tmp_path / 'utopia.xlsx', sheet_name=None)
+    with contextlib.closing(sqlite3.connect(solved_utopia_db)) as con:
+        sectors = [
+            row[0]
+            for row in con.execute(
+                'SELECT DISTINCT sector FROM output_net_capacity WHERE scenario = ? '
+                'ORDER BY sector',
+                (SCENARIO,),
+            )
+        ]
+        region, tech, period, capacity = con.execute(
+            'SELECT region, tech, period, SUM(capacity) FROM output_net_capacity '
+            "WHERE scenario = ? AND sector = 'electric' GROUP BY region, tech, period",
+            (SCENARIO,),
+        ).fetchone()
+        total_co2 = con.execute(
+            "SELECT SUM(emission) FROM output_emission WHERE scenario = ? AND emis_comm = 'co2'",
+            (SCENARIO,),
+        ).fetchone()[0]
+
+    assert [name for name in sheets if name.startswith('Capacity_')] == [
+        f'Capacity_{sector}' for sector in sectors
+    ]
+    assert {'Emissions', 'Costs'} <= set(sheets)
+
+    # the periods are pivoted into columns
+    electric = sheets['Capacity_electric'].set_index(['Region', 'Technology'])
+    assert electric.loc[(region, tech), period] == pytest.approx(capacity)
+
+    pyam = pd.read_excel(tmp_path / 'utopia_pyam.xlsx')
+    assert pyam.loc[pyam['variable'] == 'Emissions|co2', 'value'].sum() == pytest.approx(total_co2)
+
+
+def test_parallel_csv_output(solved_utopia_db: Path, tmp_path: Path) -> None:
+    """The sheets written to separate files in parallel should match the workbook"""
+    make_excel(str(solved_utopia_db), tmp_path / 'utopia', {SCENARIO})
+    make_excel(
+        str(solved_utopia_db), tmp_path / 'split', {SCENARIO}, output_format='csv', workers=2
+    )
+
+    sheets = pd.read_excel(tmp_path / 'utopia.xlsx', sheet_name=None)
+    for name, sheet in sheets.items():
+        csv_sheet = pd.read_csv(tmp_path / f'split_{name}.csv')
+        sheet.columns = [str(col) for col in sheet.columns]
+        pd.testing.assert_frame_equal(sheet, csv_sheet, check_dtype=False)
+    assert (tmp_path / 'split_pyam.csv').exists()
+
+
+def test_bad_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        make_excel('utopia.sqlite', tmp_path / 'utopia', {SCENARIO}, output_format='ods')
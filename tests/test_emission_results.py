@@ -14,6 +14,7 @@ import pytest
 # Import TemoaConfig, which is now needed to set up the sequencer
 from temoa._internal.temoa_sequencer import TemoaSequencer
 from temoa.core.config import TemoaConfig
+from temoa.core.modes import TemoaMode
 
 logger = logging.getLogger(__name__)
 
@@ -347,3 +348,41 @@ def test_curtailment(solved_connection: SolvedConnection) -> None:
     assert curt == pytest.approx(curt_target), (
         f'{name} curtailment was incorrect. Should be {curt_target}, got {curt}'
     )
+
+
+def test_emission_indices(tmp_path: Path) -> None:
+    """
+    The (r, p, e) emission indices should hold exactly the sources found by a full table scan
+    """
+    config_file = Path(__file__).parent / 'testing_configs' / 'config_emissions.toml'
+    config = TemoaConfig.build_config(config_file=config_file, output_path=tmp_path, silent=True)
+    model = TemoaSequencer(config=config, mode_override=TemoaMode.BUILD_ONLY).build_model()
+
+    activity = {
+        (r, p, e, i, t, v, o)
+        for r, e, i, t, v, o in model.emission_activity.sparse_keys()
+        for p in model.time_optimize
+        if (r, p, t, v) in model.process_inputs
+    }
+    assert activity == {
+        (r, p, e, *itvo)
+        for (r, p, e), sources in model.emission_activity_processes.items()
+        for itvo in sources
+    }
+    embodied = {(r, v, e, t, v) for r, e, t, v in model.emission_embodied.sparse_keys()}
+    assert embodied == {
+        (r, p, e, t, v)
+        for (r, p, e), sources in model.emission_embodied_processes.items()
+        for t, v in sources
+    }
+    end_of_life = {
+        (r, p, e, t, v)
+        for r, e, t, v in model.emission_end_of_life.sparse_keys()
+        for p in model.retirement_periods.get((r, t, v), ())
+    }
+    assert end_of_life == {
+        (r, p, e, t, v)
+        for (r, p, e), sources in model.emission_end_of_life_processes.items()
+        for t, v in sources
+    }
+    assert embodied and end_of_life, 'test database should exercise all emission sources'
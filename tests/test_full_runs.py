@@ -15,7 +15,7 @@ from pyomo.opt import SolverResults
 # from src.temoa_model.temoa_model import temoa_create_model
 from temoa._internal.temoa_sequencer import TemoaSequencer
 from temoa.core.config import TemoaConfig
-from temoa.core.model import TemoaModel
+from temoa.core.model import DIRECT_FAMILIES, TemoaModel
 from tests.legacy_test_values import ExpectedVals, test_vals
 
 if TYPE_CHECKING:
@@ -232,3 +232,57 @@ def test_mc_utopia(
         scenarios = [r[0] for r in res]
         assert 'utopia_mc-1' in scenarios
         assert 'utopia_mc-2' in scenarios
+
+
+@pytest.mark.parametrize(
+    'config_file', legacy_config_files, ids=[d['name'] for d in legacy_config_files]
+)
+def test_highs_direct_against_legacy_outputs(config_file: dict[str, str], tmp_path: Path) -> None:
+    """
+    The direct HiGHS hand-off should reach the legacy objective values and report duals
+    """
+    config = TemoaConfig.build_config(
+        config_file=Path(__file__).parent / 'testing_configs' / config_file['filename'],
+        output_path=tmp_path,
+        silent=True,
+    )
+    config.solver_name = 'highs_direct'
+    config.save_duals = True
+    sequencer = TemoaSequencer(config=config)
+    sequencer.start()
+
+    res, mdl = sequencer.pf_results, sequencer.pf_solved_instance
+    assert res is not None and mdl is not None
+    assert check_optimal_termination(res)
+    expected_vals = test_vals[config_file['name']]
+    assert value(mdl.total_cost) == pytest.approx(expected_vals[ExpectedVals.OBJ_VALUE], 0.00001)
+    assert len(res['Solution'].Constraint) > 0, 'duals should be reported'
+
+
+@pytest.mark.parametrize(
+    'config_file', legacy_config_files, ids=[d['name'] for d in legacy_config_files]
+)
+def test_direct_build_against_legacy_outputs(config_file: dict[str, str], tmp_path: Path) -> None:
+    """
+    A direct build (core families assembled for HiGHS outside of Pyomo) should reach the legacy
+    objective values and report the duals of the assembled rows under their constraint names
+    """
+    config = TemoaConfig.build_config(
+        config_file=Path(__file__).parent / 'testing_configs' / config_file['filename'],
+        output_path=tmp_path,
+        silent=True,
+    )
+    config.solver_name = 'highs_direct'
+    config.direct_build = True
+    config.save_duals = True
+    sequencer = TemoaSequencer(config=config)
+    sequencer.start()
+
+    res, mdl = sequencer.pf_results, sequencer.pf_solved_instance
+    assert res is not None and mdl is not None
+    assert check_optimal_termination(res)
+    assert all(len(mdl.component(name)) == 0 for name in DIRECT_FAMILIES), 'built by Pyomo'
+    expected_vals = test_vals[config_file['name']]
+    assert value(mdl.total_cost) == pytest.approx(expected_vals[ExpectedVals.OBJ_VALUE], 0.00001)
+    duals = res['Solution'].Constraint
+    assert any(name.split('[')[0] in DIRECT_FAMILIES for name in duals)
@@ -0,0 +1,46 @@
+"""
+Test the generation of the Graphviz results diagrams (the DOT sources; rendering needs Graphviz)
+"""
+
+from pathlib import Path
+
+import pytest
+
+from temoa.utilities.graphviz_generator import GraphvizDiagramGenerator
+
+PERIODS = [1990, 2000, 2010]
+
+
+def make_generator(
+    db: Path, out_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> GraphvizDiagramGenerator:
+    monkeypatch.setattr(GraphvizDiagramGenerator, '_render', staticmethod(lambda *_: None))
+    out_dir.mkdir()
+    generator = GraphvizDiagramGenerator(
+        db_file=str(db), scenario='test run', out_dir=str(out_dir), verbose=0
+    )
+    generator.connect()
+    return generator
+
+
+def test_all_periods_match_single_period(
+    solved_utopia_db: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The grouped queries for all periods should draw the same diagrams as one-period queries"""
+    single = make_generator(solved_utopia_db, tmp_path / 'single', monkeypatch)
+    for period in PERIODS:
+        single.create_main_results_diagram(period=period, region=None)
+    single.close()
+
+    multi = make_generator(solved_utopia_db, tmp_path / 'multi', monkeypatch)
+    paths = multi.create_main_results_diagrams(periods=PERIODS, region=None, max_workers=2)
+    multi.close()
+
+    assert [Path(p).name for p in paths] == [f'results{p}.svg' for p in PERIODS]
+    for period in PERIODS:
+        name = Path('whole_system') / f'results{period}.dot'
+        single_dot = (Path(single.out_dir) / name).read_text().splitlines()
+        multi_dot = (Path(multi.out_dir) / name).read_text().splitlines()
+        # the nodes and edges are drawn from sets, so their order is arbitrary
+        assert sorted(single_dot) == sorted(multi_dot)
+        assert any('Capacity' in line for line in multi_dot)
@@ -1,6 +1,15 @@
+from typing import Any
+
 import pytest
 
-from temoa.extensions.monte_carlo.mc_run import RowData, TweakFactory
+from temoa.extensions.monte_carlo.mc_run import (
+    ChangeRecord,
+    IndexLookup,
+    MCRunFactory,
+    RowData,
+    TweakFactory,
+    apply_change_records,
+)
 
 
 @pytest.fixture(scope='module')
@@ -55,3 +64,49 @@ def test__row_parser_fail(row: str, tweak_factory: TweakFactory) -> None:
 def test_make_tweaks(row: str, _: object, num_tweaks: int, tweak_factory: TweakFactory) -> None:
     _, tweaks = tweak_factory.make_tweaks(0, row=row)
     assert len(tweaks) == num_tweaks
+
+
+def test_apply_change_records() -> None:
+    base_data: dict[str, dict[Any, float]] = {
+        'dog': {(1, 2): 3.0, (5, 6): 4.0},
+        'cat': {('a', 'b'): 7.0},
+    }
+    changes = [ChangeRecord('dog', (5, 6), 4.0, 10.0)]
+    run_data = apply_change_records(base_data, changes)
+    assert run_data['dog'] == {(1, 2): 3.0, (5, 6): 10.0}
+    assert base_data['dog'][(5, 6)] == 4.0, 'base data should not be modified'
+    assert run_data['cat'] is base_data['cat'], 'untouched params should be shared'
+
+
+lookup_data = {
+    'cost': {
+        ('R1', 2020, 'coal', 2010): 1.0,
+        ('R1', 2020, 'wind', 2020): 2.0,
+        ('R2', 2020, 'coal', 2020): 3.0,
+        ('R1', 2030, 'coal', 2020): 4.0,
+    },
+}
+
+lookup_params = [
+    pytest.param(('R1', 2020, 'coal', 2010), [('R1', 2020, 'coal', 2010)], id='exact'),
+    pytest.param(
+        ('R1', '*', 'coal', '*'),
+        [('R1', 2020, 'coal', 2010), ('R1', 2030, 'coal', 2020)],
+        id='wildcards',
+    ),
+    pytest.param(('*', '*', '*', '*'), list(lookup_data['cost']), id='all wildcards'),
+    pytest.param(('R3', '*', 'coal', '*'), [], id='no match'),
+]
+
+
+@pytest.mark.parametrize(('target', 'expected'), lookup_params)
+def test_index_lookup(target: tuple[object, ...], expected: list[tuple[object, ...]]) -> None:
+    lookup = IndexLookup(lookup_data)
+    assert lookup.matches('cost', target) == expected
+    assert MCRunFactory.element_locator(lookup_data, 'cost', target) == expected
+    assert lookup.matches('missing', target) == []
+
+
+def test_index_lookup_bad_length() -> None:
+    with pytest.raises(ValueError):
+        IndexLookup(lookup_data).matches('cost', ('R1', '*'))
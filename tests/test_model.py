@@ -2,12 +2,32 @@
 A series of tests focused on the model entity.
 """
 
+import contextlib
 import pathlib
 import pickle
+import shutil
+import sqlite3
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, cast
 
+import pytest
+from pyomo.environ import value
+from pyomo.repn import generate_standard_repn
+
+from temoa._internal.direct_build import assemble
+from temoa._internal.run_actions import build_instance
 from temoa._internal.temoa_sequencer import TemoaSequencer
 from temoa.core.config import TemoaConfig
+from temoa.core.model import DIRECT_FAMILIES, abstract_model
 from temoa.core.modes import TemoaMode
+from temoa.data_io.hybrid_loader import HybridLoader
+
+if TYPE_CHECKING:
+    from pyomo.core.base.objective import ObjectiveData
+    from pyomo.core.base.suffix import Suffix
+    from pyomo.core.base.var import VarData
+
+    from temoa.types.core_types import Region
 
 
 def test_serialization() -> None:
@@ -29,3 +49,109 @@ def test_serialization() -> None:
 
     # The actual test: try to pickle the model
     pickle.dumps(built_instance)
+
+
+def test_reserve_exchange_index(tmp_path: pathlib.Path) -> None:
+    """
+    Exchange techs that are reserve providers should be indexed by the regions they connect
+    """
+    config_file_path = pathlib.Path(__file__).parent / 'testing_configs' / 'config_test_system.toml'
+    config = TemoaConfig.build_config(
+        config_file=config_file_path, output_path=tmp_path, silent=True
+    )
+    db = tmp_path / 'reserve_test.sqlite'
+    shutil.copy(config.input_database, db)
+    with contextlib.closing(sqlite3.connect(db)) as con:
+        con.execute("UPDATE technology SET reserve = 1 WHERE tech IN ('E_NGCC', 'E_TRANS')")
+        con.execute("INSERT INTO planning_reserve_margin VALUES ('R1', 0.15, ''), ('R2', 0.15, '')")
+        con.commit()
+    config.input_database = db
+    config.output_database = db
+
+    model = TemoaSequencer(config=config, mode_override=TemoaMode.BUILD_ONLY).build_model()
+    r1, r2 = cast('Region', 'R1'), cast('Region', 'R2')
+    for p in model.time_optimize:
+        assert model.reserve_exchange_exports[r1, p] == ['R1-R2']
+        assert model.reserve_exchange_imports[r1, p] == ['R2-R1']
+        assert model.reserve_exchange_exports[r2, p] == ['R2-R1']
+        assert model.reserve_exchange_imports[r2, p] == ['R1-R2']
+    assert len(model.reserve_margin_constraint) > 0
+
+
+def test_shared_abstract_model() -> None:
+    """
+    Instances are built from a copy of the shared declaration, which is left unconstructed
+    """
+    config_file_path = pathlib.Path(__file__).parent / 'testing_configs' / 'config_utopia.toml'
+    output_path = pathlib.Path(__file__).parent / 'testing_outputs'
+    config = TemoaConfig.build_config(
+        config_file=config_file_path, output_path=output_path, silent=True
+    )
+    ts = TemoaSequencer(config=config, mode_override=TemoaMode.BUILD_ONLY)
+    first = ts.build_model()
+    second = ts.build_model()
+
+    assert abstract_model() is abstract_model()
+    assert not abstract_model().is_constructed()
+    assert not abstract_model().process_inputs
+    assert first is not second
+    assert len(first.active_flow_rpsditvo) > 0
+    assert first.active_flow_rpsditvo == second.active_flow_rpsditvo
+    assert len(cast('Suffix', first.dual)) == 0  # the suffix is present, awaiting a solve
+
+
+@pytest.mark.parametrize('config_filename', ['config_utopia.toml', 'config_test_system.toml'])
+def test_direct_rows_match_pyomo_rows(config_filename: str, tmp_path: pathlib.Path) -> None:
+    """
+    The directly assembled rows and costs should be those Pyomo generates for the core
+    families and the objective of a regular build
+    """
+    config_file_path = pathlib.Path(__file__).parent / 'testing_configs' / config_filename
+    config = TemoaConfig.build_config(
+        config_file=config_file_path, output_path=tmp_path, silent=True
+    )
+    with contextlib.closing(sqlite3.connect(config.input_database)) as con:
+        portal = HybridLoader(db_connection=con, config=config).load_data_portal(myopic_index=None)
+    regular = build_instance(portal, silent=True)
+    direct = build_instance(portal, silent=True, direct_build=True)
+    assert all(len(direct.component(name)) == 0 for name in DIRECT_FAMILIES)
+
+    columns: list[VarData] = []
+    column_index: dict[int, int] = {}
+
+    def terms(var_names: Iterable[str], coefs: Iterable[float]) -> dict[str, float]:
+        summed: dict[str, float] = {}
+        for name, coef in zip(var_names, coefs, strict=True):
+            summed[name] = summed.get(name, 0.0) + coef
+        return summed
+
+    assembly = assemble(direct, columns, column_index)
+    names = [var.name for var in columns]
+    assembled = {}
+    for n, row in enumerate(assembly.rows):
+        in_row = assembly.a_row == n
+        row_terms = terms((names[col] for col in assembly.a_col[in_row]), assembly.a_value[in_row])
+        assembled[row.name] = (row_terms, assembly.row_lower[n], assembly.row_upper[n])
+
+    for name in DIRECT_FAMILIES:
+        for con in regular.component(name).values():
+            repn = generate_standard_repn(con.body)
+            constant = value(repn.constant)
+            expected = terms((v.name for v in repn.linear_vars), repn.linear_coefs)
+            row_terms, lower, upper = assembled.pop(con.name)
+            assert row_terms == pytest.approx(expected), con.name
+            if con.lower is None:
+                assert lower == -float('inf')
+            else:
+                assert lower == pytest.approx(value(con.lower) - constant)
+            if con.upper is None:
+                assert upper == float('inf')
+            else:
+                assert upper == pytest.approx(value(con.upper) - constant)
+    assert not assembled, 'no rows beyond those of the regular build'
+
+    repn = generate_standard_repn(cast('ObjectiveData', regular.total_cost).expr)
+    expected = terms((v.name for v in repn.linear_vars), repn.linear_coefs)
+    cost_names = (names[col] for col in assembly.cost_col)
+    assert terms(cost_names, assembly.cost_value) == pytest.approx(expected)
+    assert assembly.offset == pytest.approx(value(repn.constant))
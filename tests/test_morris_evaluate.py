@@ -0,0 +1,74 @@
+"""
+Test the in-memory extraction of the Method of Morris outputs from a solved model
+"""
+
+import contextlib
+import logging
+import queue
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from temoa.core.config import TemoaConfig
+from temoa.data_io.hybrid_loader import HybridLoader
+from temoa.extensions.method_of_morris.morris_evaluate import (
+    evaluate,
+    load_base_data,
+    write_base_data,
+)
+
+
+@pytest.mark.parametrize('keep_details', [True, False], ids=['details', 'no details'])
+def test_evaluate_in_memory(tmp_path: Path, keep_details: bool) -> None:
+    config_file = Path(__file__).parent / 'testing_configs' / 'config_utopia.toml'
+    config = TemoaConfig.build_config(config_file=config_file, output_path=tmp_path, silent=True)
+    with contextlib.closing(sqlite3.connect(config.input_database)) as con:
+        data = HybridLoader(db_connection=con, config=config).create_data_dict()
+    with contextlib.closing(sqlite3.connect(config.output_database)) as con:
+        n_objectives = con.execute('SELECT COUNT(*) FROM output_objective').fetchone()[0]
+
+    # perturb a single (marked) value
+    index = next(iter(data['cost_invest']))  # type: ignore[call-overload]
+    param_info = {0: ['cost_invest', *index, 'cost_invest']}
+    new_value = data['cost_invest'][index] * 1.1  # type: ignore[index]
+
+    base_data_path = tmp_path / 'base_data.pkl'
+    write_base_data(data, base_data_path)
+    result = evaluate(
+        param_info,
+        [new_value],
+        base_data_path,
+        3,
+        config,
+        queue.Queue(),
+        logging.WARNING,
+        emission_labels=('co2', 'nox'),
+        emission_threshold=1e-3,
+        keep_details=keep_details,
+    )
+
+    assert result.iteration == 3
+    assert result.objective > 0
+    assert list(result.emission_totals) == ['co2', 'nox']
+    assert result.emission_totals['co2'] > 0
+    assert result.outputs == [result.objective, *result.emission_totals.values()]
+    if keep_details:
+        assert result.obj_data is not None and result.emission_flows is not None
+        assert result.obj_data[0][1] == result.objective
+        co2 = sum(
+            val for ei, val in result.emission_flows.items() if ei.e == 'co2' and abs(val) >= 1e-3
+        )
+        assert co2 == pytest.approx(result.emission_totals['co2'])
+    else:
+        assert result.obj_data is None and result.emission_flows is None
+
+    # the base data is read once and is not modified by the perturbation
+    base_data = load_base_data(base_data_path)
+    assert load_base_data(base_data_path) is base_data
+    assert base_data['cost_invest'][index] == data['cost_invest'][index]  # type: ignore[index]
+    assert base_data['cost_invest'][index] != new_value
+
+    # the workers leave the database alone
+    with contextlib.closing(sqlite3.connect(config.output_database)) as con:
+        assert con.execute('SELECT COUNT(*) FROM output_objective').fetchone()[0] == n_objectives
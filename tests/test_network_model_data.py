@@ -1,11 +1,16 @@
 import sqlite3
+from contextlib import closing
+from pathlib import Path
 from typing import TYPE_CHECKING, TypedDict, cast
 from unittest.mock import MagicMock
 
 import pytest
 
-from temoa.model_checking import network_model_data
+from temoa.core.config import TemoaConfig
+from temoa.data_io.hybrid_loader import HybridLoader
+from temoa.model_checking import network_model_data, trace_cache
 from temoa.model_checking.commodity_network import CommodityNetwork
+from temoa.model_checking.commodity_network_manager import CommodityNetworkManager
 
 if TYPE_CHECKING:
     from temoa.types.core_types import Period, Region
@@ -258,6 +263,27 @@ def test_clone(mock_db_connection: tuple[MagicMock, dict[str, object]]) -> None:
     )
 
 
+@pytest.mark.parametrize(
+    'mock_db_connection', test_scenarios, indirect=True, ids=[d['name'] for d in test_scenarios]
+)
+def test_build_with_static_data(mock_db_connection: tuple[MagicMock, dict[str, object]]) -> None:
+    """Re-used static data should produce the same network and not be altered by the build."""
+    conn, _ = mock_db_connection
+    reference = network_model_data._build_from_db(conn)
+
+    static_data = network_model_data.fetch_static_data(conn)
+    physical_before = set(static_data.basic['physical_commodities'])
+    demands_before = {k: set(v) for k, v in static_data.basic['demand_commodities'].items()}
+    for _ in range(2):
+        network_data = network_model_data._build_from_db(conn, static_data=static_data)
+        assert network_data.available_techs == reference.available_techs
+        assert network_data.demand_commodities == reference.demand_commodities
+        assert network_data.physical_commodities == reference.physical_commodities
+
+    assert static_data.basic['physical_commodities'] == physical_before
+    assert static_data.basic['demand_commodities'] == demands_before
+
+
 def test_sector_handling_with_sectors() -> None:
     """Test that sectors are properly handled when they exist in the database."""
     # Mock database with sector column
@@ -447,3 +473,129 @@ def test_sector_handling_without_sectors() -> None:
     # Fields: region, ic, tech, vintage, oc, lifetime, sector (sector None here)
     assert all(len(tech) == 7 for tech in techs)
     assert all(tech.sector is None for tech in techs)
+
+
+@pytest.mark.parametrize(
+    'mock_db_connection', test_scenarios, indirect=True, ids=[d['name'] for d in test_scenarios]
+)
+def test_parallel_network_analysis(mock_db_connection: tuple[MagicMock, dict[str, object]]) -> None:
+    """Analyzing the region-periods in worker processes gives the same orphans as serially."""
+    conn, _ = mock_db_connection
+    network_data = network_model_data._build_from_db(conn)
+
+    serial = CommodityNetworkManager(periods=[2020, 2025], network_data=network_data)
+    parallel = CommodityNetworkManager(
+        periods=[2020, 2025], network_data=network_data, num_workers=2
+    )
+    assert serial.analyze_network() == parallel.analyze_network()
+    keys = set(serial.demand_orphans) | set(parallel.demand_orphans)
+    for key in keys:
+        assert serial.demand_orphans[key] == parallel.demand_orphans[key]
+        assert serial.other_orphans[key] == parallel.other_orphans[key]
+
+
+exchange_scenario: ScenarioType = {
+    'name': 'exchange',
+    'db_data': {
+        **test_scenarios[0]['db_data'],
+        'FROM time_period': [(2020,), (2025,), (2030,)],
+        'FROM main.demand': [('R1', 2020, 'd1'), ('R2', 2020, 'd1')],
+        'FROM main.efficiency': [
+            ('R1', 's1', 't1', 2020, 'd1', 5),  # alive in 2020 only
+            ('R1-R2', 'd1', 'tx', 2020, 'd1', 100),
+        ],
+    },
+    'expected': {},
+}
+
+
+@pytest.mark.parametrize('mock_db_connection', [exchange_scenario], indirect=True)
+def test_exchange_and_liveness(mock_db_connection: tuple[MagicMock, dict[str, object]]) -> None:
+    """Processes are placed in the periods they live in, exchanges in both of their regions"""
+    conn, _ = mock_db_connection
+    network_data = network_model_data._build_from_db(conn)
+
+    techs = {
+        (r, p): {(e.region, e.input_comm, e.tech, e.output_comm) for e in edges}
+        for (r, p), edges in network_data.available_techs.items()
+        if edges
+    }
+    exchange = {
+        ('R1', 'd1', 'tx', 'd1 (R2)'),
+        ('R2', 'd1 (R1)', 'tx', 'd1'),
+        ('R1-R2', 'd1', 'tx', 'd1'),
+    }
+    r1, r2, r1_r2 = cast('Region', 'R1'), cast('Region', 'R2'), cast('Region', 'R1-R2')
+    for p in (cast('Period', 2020), cast('Period', 2025)):
+        assert techs.pop((r1, p)) >= {e for e in exchange if e[0] == 'R1'}
+        assert techs.pop((r2, p)) == {e for e in exchange if e[0] == 'R2'}
+        assert techs.pop((r1_r2, p)) == {e for e in exchange if e[0] == 'R1-R2'}
+    assert not techs
+    assert ('R1', 's1', 't1', 'd1') in {
+        (e.region, e.input_comm, e.tech, e.output_comm)
+        for e in network_data.available_techs[r1, cast('Period', 2020)]
+    }
+    assert 't1' not in {e.tech for e in network_data.available_techs[r1, cast('Period', 2025)]}
+
+    assert network_data.exchange_commodities == {'d1 (R1)', 'd1 (R2)'}
+    assert 'd1 (R1)' in network_data.source_commodities[cast('Region', 'R2'), cast('Period', 2025)]
+    assert 'd1 (R2)' in network_data.demand_commodities[r1, cast('Period', 2025)]
+
+    # each process has a single edge tuple, shared by the periods it lives in
+    (tx_2020,) = (
+        e for e in network_data.available_techs[r1, cast('Period', 2020)] if e.tech == 'tx'
+    )
+    (tx_2025,) = (
+        e for e in network_data.available_techs[r1, cast('Period', 2025)] if e.tech == 'tx'
+    )
+    assert tx_2020 is tx_2025
+
+
+@pytest.mark.parametrize(
+    'mock_db_connection', test_scenarios, indirect=True, ids=[d['name'] for d in test_scenarios]
+)
+def test_cached_network_analysis(mock_db_connection: tuple[MagicMock, dict[str, object]]) -> None:
+    """Only the region-periods whose network changed are analyzed again"""
+    conn, _ = mock_db_connection
+    network_data = network_model_data._build_from_db(conn)
+    cache = trace_cache.TraceCache()
+
+    first = CommodityNetworkManager(periods=[2020, 2025], network_data=network_data, cache=cache)
+    first_ok = first.analyze_network()
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    again = CommodityNetworkManager(periods=[2020, 2025], network_data=network_data, cache=cache)
+    assert again.analyze_network() == first_ok
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert again.demand_orphans == first.demand_orphans
+    assert again.other_orphans == first.other_orphans
+
+    # drop a process from 2020
+    changed = network_data.clone()
+    key = (cast('Region', 'R1'), cast('Period', 2020))
+    changed.available_techs[key].pop()
+    uncached = CommodityNetworkManager(periods=[2020, 2025], network_data=changed)
+    uncached.analyze_network()
+    cached = CommodityNetworkManager(periods=[2020, 2025], network_data=changed, cache=cache)
+    cached.analyze_network()
+    assert (cache.hits, cache.misses) == (3, 3)
+    assert cached.demand_orphans == uncached.demand_orphans
+    assert cached.other_orphans == uncached.other_orphans
+
+
+@pytest.mark.parametrize('enabled', [False, True], ids=['default', 'source_trace_cache'])
+def test_loader_trace_cache_opt_in(enabled: bool, tmp_path: Path) -> None:
+    """The loaders use the shared trace cache only if the config enables it"""
+    config = TemoaConfig.build_config(
+        config_file=Path(__file__).parent / 'testing_configs' / 'config_utopia.toml',
+        output_path=tmp_path,
+        silent=True,
+    )
+    config.source_trace = True
+    config.source_trace_cache = enabled
+    cache = trace_cache.shared_cache()
+    cache.clear()
+    with closing(sqlite3.connect(config.input_database)) as con:
+        HybridLoader(db_connection=con, config=config).source_trace_only()
+    assert bool(cache.results) == enabled
+    cache.clear()
@@ -0,0 +1,97 @@
+"""
+Test the re-solves of a modified instance with a persistent solver against fresh solves
+"""
+
+import sqlite3
+from contextlib import closing
+
+import pytest
+from pyomo.environ import Constraint, Objective, check_optimal_termination, value
+
+from temoa._internal.persistent_solve import PersistentSolve
+from temoa._internal.run_actions import build_instance, solve_instance
+from temoa.components.costs import total_cost_rule
+from temoa.core.config import TemoaConfig
+from temoa.core.model import TemoaModel
+from temoa.data_io.hybrid_loader import HybridLoader
+from temoa.extensions.single_vector_mga.sv_mga_sequencer import SvMgaSequencer
+
+COST_EPSILON = 0.05
+
+
+def _build(config: TemoaConfig) -> TemoaModel:
+    with closing(sqlite3.connect(config.input_database)) as con:
+        data_portal = HybridLoader(db_connection=con, config=config).load_data_portal()
+    return build_instance(data_portal, silent=True)
+
+
+def _swap_to_emissions_obj(instance: TemoaModel, tot_cost: float) -> tuple[Constraint, Objective]:
+    """
+    Cap the cost of the instance and minimize its emissions instead (as in SVMGA)
+    :return: the cost cap and the emissions objective added to the instance
+    """
+    cost_expression = total_cost_rule(instance)
+    cost_cap = Constraint(expr=cost_expression <= (1 + COST_EPSILON) * tot_cost)
+    instance.cost_cap = cost_cap
+    instance.del_component(instance.total_cost)
+    emissions_obj = Objective(expr=SvMgaSequencer.construct_obj(instance, ['co2', 'nox'], [], []))
+    instance.emissions_obj = emissions_obj
+    return cost_cap, emissions_obj
+
+
+@pytest.fixture(scope='module')
+def fresh_objectives(utopia_config: TemoaConfig) -> tuple[float, float]:
+    """The cost and the capped emissions of utopia from fresh builds and solves"""
+    instance, res = solve_instance(_build(utopia_config), 'appsi_highs', silent=True)
+    assert check_optimal_termination(res)
+    tot_cost = value(instance.total_cost)
+
+    instance = _build(utopia_config)
+    _swap_to_emissions_obj(instance, tot_cost)
+    instance, res = solve_instance(instance, 'appsi_highs', silent=True)
+    assert check_optimal_termination(res)
+    return tot_cost, value(instance.emissions_obj)
+
+
+@pytest.mark.parametrize('warm_start', [False, True], ids=['cold', 'warm'])
+@pytest.mark.parametrize('solver_name', ['appsi_highs', 'highs_direct'])
+def test_resolve_matches_fresh_solve(
+    utopia_config: TemoaConfig,
+    fresh_objectives: tuple[float, float],
+    solver_name: str,
+    warm_start: bool,
+) -> None:
+    """A re-solve with an added constraint and a new objective should match a fresh solve"""
+    fresh_cost, fresh_emissions = fresh_objectives
+    instance = _build(utopia_config)
+    solver = PersistentSolve(instance, solver_name, silent=True, warm_start=warm_start)
+
+    assert check_optimal_termination(solver.solve())
+    tot_cost = value(instance.total_cost)
+    assert tot_cost == pytest.approx(fresh_cost, rel=1e-6)
+
+    cost_cap, emissions_obj = _swap_to_emissions_obj(instance, tot_cost)
+    solver.add_constraint(cost_cap)
+    solver.set_objective(emissions_obj)
+    assert check_optimal_termination(solver.solve())
+    assert value(instance.emissions_obj) == pytest.approx(fresh_emissions, rel=1e-6)
+    # the cost cap should hold in the re-solve
+    assert value(total_cost_rule(instance)) <= (1 + COST_EPSILON) * tot_cost * (1 + 1e-6)
+
+
+def test_highs_direct_solver_options(utopia_config: TemoaConfig) -> None:
+    """The solver options should be set on the HiGHS model on each solve, and bad ones rejected"""
+    solver = PersistentSolve(
+        _build(utopia_config), 'highs_direct', silent=True, solver_options={'time_limit': 1000.0}
+    )
+    assert check_optimal_termination(solver.solve())
+    assert solver._highs is not None
+    assert solver._highs.highs.getOptionValue('time_limit')[1] == 1000.0
+
+    solver.solver_options['time_limit'] = 500.0
+    assert check_optimal_termination(solver.solve())
+    assert solver._highs.highs.getOptionValue('time_limit')[1] == 500.0
+
+    solver.solver_options['LogFile'] = 'gurobi.log'
+    with pytest.raises(ValueError, match='LogFile'):
+        solver.solve()
@@ -0,0 +1,59 @@
+from typing import Any, cast
+
+from temoa.extensions.stochastics.scenario_creator import BaseData, apply_perturbations
+from temoa.extensions.stochastics.stochastic_config import Perturbation
+
+
+def make_base_data() -> BaseData:
+    return BaseData(
+        data_dict={
+            'cost_variable': {
+                ('R1', 2020, 'COAL', 2020): 2.0,
+                ('R1', 2025, 'COAL', 2020): 3.0,
+                ('R1', 2020, 'GAS', 2020): 4.0,
+                ('R2', 2020, 'COAL', 2020): 5.0,
+            },
+            'demand': {('R1', 2020, 'ELC'): 10.0},
+        },
+        table_index_map={
+            'cost_variable': ['region', 'period', 'tech', 'vintage'],
+            'demand': ['region', 'period', 'commodity'],
+        },
+    )
+
+
+def test_matching_keys() -> None:
+    base_data = make_base_data()
+    assert base_data.matching_keys('cost_variable', {'tech': 'COAL', 'region': 'R1'}) == [
+        ('R1', 2020, 'COAL', 2020),
+        ('R1', 2025, 'COAL', 2020),
+    ]
+    assert base_data.matching_keys('cost_variable', {'tech': 'OIL'}) == []
+    assert base_data.matching_keys('cost_variable', {'no_such_column': 'COAL'}) == []
+    assert len(base_data.matching_keys('cost_variable', {})) == 4
+
+
+def test_apply_perturbations() -> None:
+    base_data = make_base_data()
+    perturbations = [
+        Perturbation('high', 'cost_variable', {'tech': 'COAL', 'region': 'R1'}, 'multiply', 2.0),
+        Perturbation('high', 'cost_variable', {'tech': 'GAS'}, 'add', 1.0),
+        Perturbation('low', 'cost_variable', {'tech': 'COAL'}, 'set', 0.0),
+    ]
+
+    data = apply_perturbations(base_data, perturbations, 'high')
+    assert data['cost_variable'] == {
+        ('R1', 2020, 'COAL', 2020): 4.0,
+        ('R1', 2025, 'COAL', 2020): 6.0,
+        ('R1', 2020, 'GAS', 2020): 5.0,
+        ('R2', 2020, 'COAL', 2020): 5.0,
+    }
+    # untouched params are shared, and the base data is not modified
+    assert data['demand'] is base_data.data_dict['demand']
+    base_cost = cast('dict[Any, float]', base_data.data_dict['cost_variable'])
+    assert base_cost[('R1', 2020, 'COAL', 2020)] == 2.0
+
+    data = apply_perturbations(base_data, perturbations, 'low')
+    cost = cast('dict[Any, float]', data['cost_variable'])
+    assert cost[('R2', 2020, 'COAL', 2020)] == 0.0
+    assert cost[('R1', 2020, 'GAS', 2020)] == 4.0
@@ -0,0 +1,50 @@
+"""
+Test the synthetic database generator and the benchmark run on it
+"""
+
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+
+from temoa.utilities.benchmark import benchmark_synthetic
+from temoa.utilities.synthetic_model import SyntheticSpec, make_synthetic_db
+
+SMALL = SyntheticSpec(regions=2, techs=5, vintages=2, seasons=2, times_of_day=2)
+
+
+def _dump(db: Path) -> list[str]:
+    with closing(sqlite3.connect(db)) as con:
+        return list(con.iterdump())
+
+
+def test_reproducible(tmp_path: Path) -> None:
+    """A spec (and seed) should always give the same database"""
+    first = make_synthetic_db(tmp_path / 'first.sqlite', SMALL)
+    second = make_synthetic_db(tmp_path / 'second.sqlite', SMALL)
+    assert _dump(first) == _dump(second)
+
+    with pytest.raises(FileExistsError):
+        make_synthetic_db(first, SMALL)
+
+
+def test_bad_spec() -> None:
+    with pytest.raises(ValueError):
+        SyntheticSpec(regions=2, exchange_links=2)
+
+
+def test_benchmark(tmp_path: Path) -> None:
+    report = benchmark_synthetic(SMALL, tmp_path)
+
+    stages = [record['stage'] for record in report['stages']]
+    assert stages == ['source_trace', 'load', 'build', 'solve', 'poll', 'write']
+    assert all(record['seconds'] >= 0 for record in report['stages'])
+    assert report['objective'] > 0
+    assert report['spec']['regions'] == SMALL.regions
+
+    with closing(sqlite3.connect(tmp_path / 'benchmark.sqlite')) as con:
+        (flows,) = con.execute(
+            "SELECT COUNT(*) FROM output_flow_out WHERE scenario = 'benchmark'"
+        ).fetchone()
+    assert flows > 0
@@ -1,8 +1,16 @@
-from typing import TypedDict
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TypedDict, cast
 
 import pytest
+from pyomo.core import Constraint
 
 from temoa._internal.table_data_puller import loan_costs
+from temoa._internal.table_writer import TableWriter
+from temoa._internal.temoa_sequencer import TemoaSequencer
+from temoa.core.config import TemoaConfig
 
 
 class LoanCostInput(TypedDict):
@@ -102,3 +110,123 @@ def test_loan_costs_with_zero_gdr(test_case: LoanCostTestCase) -> None:
     model_cost, undiscounted_cost = loan_costs(**test_case['input'])
     assert model_cost == pytest.approx(test_case['expected_model_cost'], abs=0.01)
     assert undiscounted_cost == pytest.approx(test_case['expected_undiscounted_cost'], abs=0.01)
+
+
+def test_stream_insert(tmp_path: Path) -> None:
+    """rows are streamed in chunks and columns missing from the schema are dropped"""
+    config = SimpleNamespace(output_database=tmp_path / 'out.sqlite')
+    with TableWriter(cast('TemoaConfig', config)) as writer:
+        writer.connection.execute('CREATE TABLE t (a INTEGER, b TEXT)')
+        rows = ((n, f'b{n}', 'not in schema') for n in range(25))
+        writer._stream_insert('t', ('a', 'b', 'units'), rows, chunk_size=10)
+        res = writer.connection.execute('SELECT a, b FROM t ORDER BY a').fetchall()
+    assert res == [(n, f'b{n}') for n in range(25)]
+
+
+def test_clear_iterative_runs(tmp_path: Path) -> None:
+    """only the iterations of the scenario are cleared, and the bulk load restores indexes"""
+    config = SimpleNamespace(
+        output_database=tmp_path / 'out.sqlite',
+        scenario='test_run',
+        sqlite_rebuild_output_indexes=True,
+    )
+    with TableWriter(cast('TemoaConfig', config)) as writer:
+        con = writer.connection
+        con.execute('CREATE TABLE output_objective (scenario TEXT, total_system_cost REAL)')
+        writer.create_output_indexes()
+        scenarios = ['test_run', 'test_run-1', 'test_run-22', 'test_run_2-1', 'test_runs-1', 'x']
+        con.executemany('INSERT INTO output_objective VALUES (?, 1.0)', [(s,) for s in scenarios])
+        writer.clear_iterative_runs()
+        res = {row[0] for row in con.execute('SELECT scenario FROM output_objective')}
+        assert res == {'test_run', 'test_run_2-1', 'test_runs-1', 'x'}
+
+        def index_names() -> set[str]:
+            return {
+                row[0] for row in con.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+
+        assert 'output_objective_scenario' in index_names()
+        with writer.bulk_load():
+            assert 'output_objective_scenario' not in index_names()
+        assert 'output_objective_scenario' in index_names()
+
+
+def test_output_indexes_created_once(tmp_path: Path) -> None:
+    """the indexes are created on the first clear through a writer, not on every clear"""
+    config = SimpleNamespace(output_database=tmp_path / 'out.sqlite', scenario='test_run')
+    with TableWriter(cast('TemoaConfig', config)) as writer:
+        con = writer.connection
+        con.execute('CREATE TABLE output_objective (scenario TEXT, total_system_cost REAL)')
+        con.commit()
+
+    def index_names() -> set[str]:
+        with closing(sqlite3.connect(config.output_database)) as con:
+            return {
+                row[0] for row in con.execute("SELECT name FROM sqlite_master WHERE type='index'")
+            }
+
+    def drop_index() -> None:
+        with closing(sqlite3.connect(config.output_database)) as con:
+            con.execute('DROP INDEX output_objective_scenario')
+            con.commit()
+
+    assert not index_names()
+    with TableWriter(cast('TemoaConfig', config)) as writer:
+        writer.clear_iterative_runs()
+        assert 'output_objective_scenario' in index_names()
+
+        # later clears through the same writer leave the database alone
+        drop_index()
+        writer.clear_iterative_runs()
+        assert not index_names()
+
+    # a new writer (e.g. on a re-created database) checks the indexes again
+    with TableWriter(cast('TemoaConfig', config)) as writer:
+        writer.clear_iterative_runs()
+    assert 'output_objective_scenario' in index_names()
+    drop_index()
+
+    # a writer that dropped the indexes (as bulk_load does) creates them again
+    with TableWriter(cast('TemoaConfig', config)) as writer:
+        writer.drop_output_indexes()
+        writer.ensure_output_indexes()
+        assert 'output_objective_scenario' in index_names()
+
+
+def test_write_results_releasing_constraints(tmp_path: Path) -> None:
+    """writing the results after deleting the constraints gives the same tables"""
+    config = TemoaConfig.build_config(
+        config_file=Path(__file__).parent / 'testing_configs' / 'config_utopia.toml',
+        output_path=tmp_path,
+        silent=True,
+    )
+    config.solver_name = 'highs_direct'  # (reports the duals in the results)
+    config.save_duals = True
+    sequencer = TemoaSequencer(config=config)
+    sequencer.start()
+    instance = sequencer.pf_solved_instance
+    assert instance is not None
+
+    tables = ('output_flow_out', 'output_cost', 'output_emission', 'output_dual_variable')
+
+    def table_rows() -> dict[str, list[tuple[object, ...]]]:
+        with TableWriter(config) as writer:
+            return {
+                table: sorted(
+                    writer.connection.execute(
+                        f'SELECT * FROM {table} WHERE scenario = ?', (config.scenario,)
+                    )
+                )
+                for table in tables
+            }
+
+    written = table_rows()
+    with TableWriter(config) as writer:
+        writer.write_results(
+            instance, results_with_duals=sequencer.pf_results, release_model_constraints=True
+        )
+        assert not writer.flow_register
+
+    assert not list(instance.component_objects(Constraint))
+    assert written['output_dual_variable']
+    assert table_rows() == written
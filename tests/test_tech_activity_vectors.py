@@ -1,9 +1,14 @@
+from typing import TYPE_CHECKING
+
 import pytest
 
 from temoa.extensions.modeling_to_generate_alternatives.tech_activity_vector_manager import (
     TechActivityVectorManager,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def test__vector_engine() -> None:
     """
@@ -42,3 +47,21 @@ def test__vector_engine() -> None:
         rows.append(matrix.get_nowait())
     for idx, row in enumerate(rows):
         assert row == pytest.approx(res_values[idx], abs=1e-2)
+
+
+def test_process_activity() -> None:
+    """
+    The activity vector from a worker is in var_index order, so the hull point is the sum of the
+    contiguous block of values for each category
+    """
+    manager = TechActivityVectorManager.__new__(TechActivityVectorManager)
+    manager.category_mapping = {'A': ['dog', 'pig'], 'B': ['cat']}
+    manager.technology_size = {'dog': 2, 'pig': 1, 'cat': 3}
+    manager.completed_solves = 0
+    manager.hull_points = None
+    manager.hull_monitor = False
+    assert manager.process_activity([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]) == pytest.approx([6.0, 15.0])
+    assert manager.completed_solves == 1
+    hull_points: np.ndarray | None = manager.hull_points
+    assert hull_points is not None
+    assert hull_points.shape == (1, 2)
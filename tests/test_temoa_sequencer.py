@@ -74,3 +74,46 @@ def test_sequencer_build_model(tmp_path: Path) -> None:
     model = sequencer.build_model()
     assert model is not None, 'sequencer.build_model() should return a model'
     assert isinstance(model, ConcreteModel), 'Should return a Pyomo ConcreteModel'
+
+
+def test_sequencer_build_model_cached(tmp_path: Path) -> None:
+    """
+    A second build from an unchanged database should come from the build cache and produce
+    the same model.
+    """
+    models = []
+    for _ in range(2):
+        config = TemoaConfig.build_config(
+            config_file=UTOPIA_MYOPIC_CONFIG,
+            output_path=tmp_path,
+            silent=True,
+        )
+        config.build_cache_dir = tmp_path / 'build_cache'
+        sequencer = TemoaSequencer(config=config, mode_override=TemoaMode.BUILD_ONLY)
+        models.append(sequencer.build_model())
+
+    assert len(list((tmp_path / 'build_cache').glob('*.pkl'))) == 1
+    first, second = models
+    assert first.nconstraints() == second.nconstraints()
+    assert first.nvariables() == second.nvariables()
+
+
+def test_cached_run_plots_network(tmp_path: Path) -> None:
+    """
+    A run from the build cache that plots the commodity network should still trace the network
+    and draw its graphs.
+    """
+    for plot in (False, True):
+        output_path = tmp_path / f'plot_{plot}'
+        output_path.mkdir()
+        config = TemoaConfig.build_config(
+            config_file=UTOPIA_MYOPIC_CONFIG, output_path=output_path, silent=True
+        )
+        config.build_cache_dir = tmp_path / 'build_cache'
+        config.source_trace = True
+        config.plot_commodity_network = plot
+        TemoaSequencer(config=config, mode_override=TemoaMode.PERFECT_FORESIGHT).start()
+
+    assert len(list((tmp_path / 'build_cache').glob('*.pkl'))) == 1
+    assert not list((tmp_path / 'plot_False').glob('Network_Graph_*.html'))
+    assert list((tmp_path / 'plot_True').glob('Network_Graph_*.html'))